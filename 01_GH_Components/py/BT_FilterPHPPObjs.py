@@ -35,7 +35,7 @@ EM July 10, 2020
 
 ghenv.Component.Name = "BT_FilterPHPPObjs"
 ghenv.Component.NickName = "Filter PHPP Objs"
-ghenv.Component.Message = 'JUL_10_2020'
+ghenv.Component.Message = 'OCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "BT"
 ghenv.Component.SubCategory = "02 | IDF2PHPP"
@@ -70,7 +70,7 @@ if _PHPPObjs.BranchCount >0:
     for srfc in _PHPPObjs.Branch(4):
         if srfc.HostZoneName in zones:
             PHPPObjs_.Add(srfc, GH_Path(4))
-            ZoneGeom_.Add(srfc.Srfc, GH_Path(4))
+            ZoneGeom_.Add(srfc.buildRhinoGeometry()[1], GH_Path(4))
     
     for tfa in _PHPPObjs.Branch(6):
         if tfa.HostZoneName in zones:
@@ -1,281 +1,408 @@
-#
-# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
-# 
-# This component is part of IDF2PHPP.
-# 
-# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
-# IDF2PHPP is free software; you can redistribute it and/or modify 
-# it under the terms of the GNU General Public License as published 
-# by the Free Software Foundation; either version 3 of the License, 
-# or (at your option) any later version. 
-# 
-# IDF2PHPP is distributed in the hope that it will be useful,
-# but WITHOUT ANY WARRANTY; without even the implied warranty of 
-# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
-# GNU General Public License for more details.
-# 
-# For a copy of the GNU General Public License
-# see <http://www.gnu.org/licenses/>.
-# 
-# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
-#
-"""
-Enables the COM interface connecting Rhino to Excel on the user's computer.
-> This should identify a running excel instance or start excel if it is not already running.
-> Copies a file if the target file name doesn't already exist. 
-> Passes the full file name out, along with whether or not a copy was made.
--
-Component by Jack Hymowitz, July 31, 2020
-
-    Args:
-        _run: Set to true to enable the excel application, false saves the open sheet and stops the application
-        visibl_e: Set to true to show the Excel application on the screen. Default true.
-        useUserWorkbook_: Set to true to look for and use an open excel interface instead of starting a new one. For now, should not be used (set to false or disconnected)
-        oldFilename: The full file path to the source file
-        newDirectory: The location to put the new copied file, or a blank string ("") if newFilename should be a relative location or if newFilename is the entire filepath.
-        newFilename: The destination name to copy the file to (can be the full path if newDirectory is a blank string)
-    Returns:
-        excel: The Excel COM interface created, or None if not running
-"""
-
-ghenv.Component.Name = "BT_OpenXLWorkbook"
-ghenv.Component.NickName = "Open XL Workbook"
-ghenv.Component.Message = 'JUL_31_2020'
-ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
-ghenv.Component.Category = "BT"
-ghenv.Component.SubCategory = "02 | IDF2PHPP"
-
-from ghpythonlib.componentbase import executingcomponent as component
-import Grasshopper, GhPython
-import System
-import Rhino
-import rhinoscriptsyntax as rs
-
-import scriptcontext as sc
-import clr
-import os
-clr.AddReferenceByName('Microsoft.Office.Interop.Excel')#, Culture=neutral, PublicKeyToken=71e9bce111e9429c')
-from System.Runtime.InteropServices import Marshal
-from Microsoft.Office.Interop import Excel
-
-from shutil import copyfile
-import Grasshopper.Kernel as ghK
-import inspect
-
-
-class ExcelInstance:
-    """A holder for the methods we use to interact with the Excel COM interface"""
-    
-    #Run once on startup, defines the variables that we will use
-    def __init__(self):
-        self.ex=None
-        self.activeWorkbook=None
-        self.activeWorkbookName=""
-        self.sheetsDict={}
-        self.userOpened=False
-    
-    #Starts a brand new excel instance
-    def startNewInstance(self):
-        """Start a new Excel Application instance"""
-        self.ex = Excel.ApplicationClass()
-        self.ex.DisplayAlerts = False
-        self.ex.EnableEvents = False
-        self.userOpened=False
-    
-    #Not working right now 100%, but should find an already running excel window
-    def findExistingInstance(self):
-        """Find an Excel instance that is already running
-        Returns True if an already running instance was found, False otherwise"""
-        #try:
-        self.userOpened=True
-        self.activeWorkbookName=="NEW_USER_FILE"
-        self.ex=Marshal.GetActiveObject("Excel.Application")
-        print(self.ex)
-        if self.ex==None:
-            return None
-        print(self.ex.Workbooks)
-        print(dir(self.ex.Workbooks))
-        print(self.ex.Workbooks.Count)
-        if(self.ex.Workbooks.Count>0):
-            for workbook in self.ex.Workbooks:
-                self.activeWorkbook=workbook
-                break
-                #there is definitely a better way of doing this
-        else:
-            return None
-        print(self.activeWorkbook==None)
-        if self.activeWorkbook==None:
-            return None
-        self.userOpened=True
-        self.activeWorkbookName="NEW_USER_FILE"
-        self.loadSheets()
-        return True
-        #except:
-        #    return False
-        #Define later...
-    
-    def openWorkbook(self,filename):
-        """Open a workbook in the running excel interface, closing the open one
-        Args:
-            filename: The workbook to open
-        """
-        if self.activeWorkbookName==filename:
-            return False
-        self.close(True)
-        self.activeWorkbookName=filename
-        self.activeWorkbook=self.ex.Workbooks.Open(filename)
-        self.loadSheets()
-        return True
-    
-    #Finds the sheets in the open workbook
-    def loadSheets(self):
-        self.sheetsDict={}
-        for sheet in self.activeWorkbook.Worksheets:
-            self.sheetsDict[sheet.Name]=sheet
-            sheet.Unprotect()
-        
-    def saveAndQuit(self,closeIfUser):
-        """Close the running excel instance, and save first
-        Args:
-            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
-                false to run only if was an instance created here."""
-
-        self.save()
-        self.close(closeIfUser)
-        self.quit(closeIfUser)
-        
-    def save(self):
-        try:
-            self.ex.activeWorkbook.Save()
-            return True
-        except:
-            return False
-            
-    def close(self, closeIfUser):
-        """Close the open excel workbook
-        Args:
-            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
-                false to run only if was an instance created here."""
-        if self.activeWorkbook!=None or (not closeIfUser and self.userOpened):
-            return
-        try:
-            self.ex.activeWorkbook.Close()
-        except:
-            pass
-    def quit(self, closeIfUser):
-        """Stop the running excel instance
-        Args:
-            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
-                false to run only if was an instance created here."""
-        self.activeWorkbook=None
-        self.activeWorkbookName=""
-        if self.ex!=None:
-            self.ex.Quit()
-            ex=None
-        
-    def __unicode__(self):
-        return u"Excel Instance | Active Worksheet: {self.activeWorkbookName}".format(self=self)
-    def __str__(self):
-        return unicode(self).encode("utf-8")
-    def __repr__(self):
-        return "{}( _nm={!r}, _ex={!r}, _activeWorkbook={!r}, _name={!r}".format(
-               self.__class__.__name__,
-               self.ex,
-               self.activeWorkbook,
-               self.activeWorkbookName )
-
-class MyComponent(component):
-    
-    def StartExcel(self,useUserWorkbook):
-        if not "excel" in sc.sticky: #Excel interface isn't already running, so start it
-            excel = ExcelInstance()
-            if useUserWorkbook:
-                excel.findExistingInstance()    #Try looking for a running instance
-            else:
-                excel.startNewInstance()            #If didn't find one, make one
-            sc.sticky["excel"]=excel
-        else:
-            excel = sc.sticky["excel"]
-        return excel
-        
-    def StopExcel(self):
-        if "excel" in sc.sticky:
-            print("Quitting")
-            excel=sc.sticky["excel"]
-            try:
-                excel.saveAndQuit(False)
-            except:
-                pass
-            del sc.sticky["excel"]
-    
-    def doCopy(self, oldFilename,newDirectory,newFilename):
-        
-        if not os.path.exists(newDirectory):
-            os.mkdir(newDirectory)
-        dest=newDirectory+os.path.sep+newFilename+".xlsx"
-        if os.path.exists(dest):
-            msg1 = "File already copied, not overwritten"
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Remark, msg1)
-            return dest
-        try:
-            src=os.path.abspath(oldFilename)
-        except:
-            msg1 = "Source file not found"
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
-            return None
-        try:
-            copyfile(src,dest)
-        except:
-            msg1 = "Unable to copy file"
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
-            return dest
-        return dest
-    
-    def OpenWorkbook(self,excel,useUserWorkbookDefault,oldFilename,newDirectory,newFilename):
-        if excel:
-            """if useUserWorkbookDefault and excel.userOpened and excel.activeWorkbookName=="NEW_USER_FILE": #If a sheet is already open, set it up
-                if "XLSdata" in sc.sticky: 
-                    del sc.sticky["XLSdata"]
-                excel.loadSheets()
-                excel.activeWorkbookName="USER_FILE"
-            elif useUserWorkbookDefault and excel.userOpened:   #If we already set it up, we are OK
-                pass"""
-            if newFilename:
-                filename=self.doCopy(oldFilename,newDirectory,newFilename)
-                if excel.openWorkbook(filename): #If we need to open a new sheet, set it up
-                    if "XLSdata" in sc.sticky: 
-                        del sc.sticky["XLSdata"]
-                    excel.loadSheets()
-            else:
-                return False
-        else:
-            return False
-        return True
-    def RunScript(self,run,visible,useUserWorkbook,oldFilename,newDirectory,newFilename):
-        if not run:
-            self.StopExcel()
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, "Excel Not Started")
-            return None
-        excel=self.StartExcel(useUserWorkbook)
-        if excel==None:
-            return None
-        if not useUserWorkbook:
-            if visible==None:
-                visible=True
-            excel.ex.Visible = visible
-            excel.ex.ScreenUpdating = visible
-        if not excel:
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, "Excel Unable to Start")
-            return None
-        if not (useUserWorkbook or oldFilename and newFilename):
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, "Not running, either run is false or filename not set.")
-            return None
-        #if useUserWorkbookDefault:
-            
-        #outputName=self.doCopy(oldFilename,newDirectory,newFilename)
-        #if not outputName and not useUserWorkbookDefault:
-        #    return (None,"Unable to copy file.")
-        if self.OpenWorkbook(excel,useUserWorkbook,oldFilename,newDirectory,newFilename):
-            return excel
-        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, "Unable to open workbook")
-        return None
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This component is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Enables the COM interface connecting Rhino to Excel on the user's computer.
+> This should identify a running excel instance or start excel if it is not already running.
+> Copies a file if the target file name doesn't already exist. 
+> Passes the full file name out, along with whether or not a copy was made.
+-
+Component by Jack Hymowitz, July 31, 2020
+
+    Args:
+        _run: Set to true to enable the excel application, false saves the open sheet and stops the application
+        visibl_e: Set to true to show the Excel application on the screen. Default true.
+        useUserWorkbook_: Set to true to look for and use an open excel interface instead of starting a new one. For now, should not be used (set to false or disconnected)
+        oldFilename: The full file path to the source file
+        newDirectory: The location to put the new copied file, or a blank string ("") if newFilename should be a relative location or if newFilename is the entire filepath.
+        newFilename: The destination name to copy the file to (can be the full path if newDirectory is a blank string)
+    Returns:
+        excel: The Excel COM interface created, or None if not running
+"""
+
+ghenv.Component.Name = "BT_OpenXLWorkbook"
+ghenv.Component.NickName = "Open XL Workbook"
+ghenv.Component.Message = 'OCT_18_2026'
+ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
+ghenv.Component.Category = "BT"
+ghenv.Component.SubCategory = "02 | IDF2PHPP"
+
+from ghpythonlib.componentbase import executingcomponent as component
+import Grasshopper, GhPython
+import System
+import Rhino
+import rhinoscriptsyntax as rs
+
+import scriptcontext as sc
+import clr
+import os
+clr.AddReferenceByName('Microsoft.Office.Interop.Excel')#, Culture=neutral, PublicKeyToken=71e9bce111e9429c')
+from System.Runtime.InteropServices import Marshal
+from Microsoft.Office.Interop import Excel
+
+from shutil import copyfile
+import Grasshopper.Kernel as ghK
+import inspect
+from idf2phpp.workbook import XL_Workbook
+from idf2phpp.xl_address import parseRange
+
+
+class ExcelInstance(XL_Workbook):
+    """A holder for the methods we use to interact with the Excel COM interface
+    This is the Excel COM backend for the workbook interface (idf2phpp.workbook.XL_Workbook)
+    used by the Write / Read / Save XL Workbook components."""
+    
+    #Run once on startup, defines the variables that we will use
+    def __init__(self):
+        self.ex=None
+        self.activeWorkbook=None
+        self.activeWorkbookName=""
+        self.sheetsDict={}
+        self.sheetOrder=[]
+        self.userOpened=False
+        self.manualCalc=False
+        self.originalCalc=-4105 #= xlCalculationAuto
+    
+    #Starts a brand new excel instance
+    def startNewInstance(self):
+        """Start a new Excel Application instance"""
+        self.ex = Excel.ApplicationClass()
+        self.ex.DisplayAlerts = False
+        self.ex.EnableEvents = False
+        self.userOpened=False
+    
+    #Not working right now 100%, but should find an already running excel window
+    def findExistingInstance(self):
+        """Find an Excel instance that is already running
+        Returns True if an already running instance was found, False otherwise"""
+        #try:
+        self.userOpened=True
+        self.activeWorkbookName=="NEW_USER_FILE"
+        self.ex=Marshal.GetActiveObject("Excel.Application")
+        print(self.ex)
+        if self.ex==None:
+            return None
+        print(self.ex.Workbooks)
+        print(dir(self.ex.Workbooks))
+        print(self.ex.Workbooks.Count)
+        if(self.ex.Workbooks.Count>0):
+            for workbook in self.ex.Workbooks:
+                self.activeWorkbook=workbook
+                break
+                #there is definitely a better way of doing this
+        else:
+            return None
+        print(self.activeWorkbook==None)
+        if self.activeWorkbook==None:
+            return None
+        self.userOpened=True
+        self.activeWorkbookName="NEW_USER_FILE"
+        self.loadSheets()
+        return True
+        #except:
+        #    return False
+        #Define later...
+    
+    def openWorkbook(self,filename):
+        """Open a workbook in the running excel interface, closing the open one
+        Args:
+            filename: The workbook to open
+        """
+        if self.activeWorkbookName==filename:
+            return False
+        self.close(True)
+        self.activeWorkbookName=filename
+        self.activeWorkbook=self.ex.Workbooks.Open(filename)
+        self.loadSheets()
+        return True
+    
+    #Finds the sheets in the open workbook
+    def loadSheets(self):
+        self.sheetsDict={}
+        self.sheetOrder=[]
+        for sheet in self.activeWorkbook.Worksheets:
+            self.sheetsDict[sheet.Name]=sheet
+            self.sheetOrder.append(sheet.Name)
+            sheet.Unprotect()
+    
+    #The workbook interface, see idf2phpp.workbook.XL_Workbook
+    @property
+    def Name(self):
+        return self.activeWorkbookName
+    
+    @property
+    def Path(self):
+        #The user's own (unsaved) workbook has no file, so its writes aren't cached on disk
+        if self.activeWorkbookName in ("","NEW_USER_FILE","USER_FILE"):
+            return None
+        return self.activeWorkbookName
+    
+    def isOpen(self):
+        return self.activeWorkbook!=None and len(self.sheetsDict)>0
+    
+    def sheetNames(self):
+        return list(self.sheetOrder)
+    
+    def hasSheet(self,sheetName):
+        return sheetName in self.sheetsDict
+    
+    def toRows(self,values,address):
+        """Convert a Value2 / Formula result (a single value or a 1-based object[,]) into a list of rows"""
+        firstRow,firstCol,lastRow,lastCol=parseRange(address)
+        numRows,numCols=lastRow-firstRow+1,lastCol-firstCol+1
+        if numRows==1 and numCols==1:
+            return [[values]]
+        r0=values.GetLowerBound(0)
+        c0=values.GetLowerBound(1)
+        return [[values[r0+i,c0+j] for j in range(numCols)] for i in range(numRows)]
+    
+    def readRange(self,sheetName,address):
+        return self.toRows(self.sheetsDict[sheetName].Range[address].Value2,address)
+    
+    def readFormulas(self,sheetName,address):
+        return self.toRows(self.sheetsDict[sheetName].Range[address].Formula,address)
+    
+    def writeBlock(self,block):
+        """Write one block with a single 2-D array assignment
+        Returns the (Worksheet, row, col) of any cells that couldn't be written"""
+        sheet=self.sheetsDict[block.Worksheet]
+        try:
+            values=self.blockValues(block)
+            array=System.Array.CreateInstance(System.Object,block.NumRows,block.NumCols)
+            for i,row in enumerate(values):
+                for j,value in enumerate(row):
+                    array[i,j]=value
+            sheet.Range[block.Address].Value2=array
+            return []
+        except:
+            pass
+        #ie: merged cells in the block. Fall back to writing its cells one at a time
+        failed=[]
+        for i,row in enumerate(block.Values):
+            for j,value in enumerate(row):
+                if not block.Written[i][j]:
+                    continue
+                try:
+                    sheet.Cells[block.FirstRow+i,block.FirstCol+j].Value2=value
+                except:
+                    failed.append((block.Worksheet,block.FirstRow+i,block.FirstCol+j))
+        return failed
+    
+    def highlight(self,sheetName,addresses):
+        sheet=self.sheetsDict[sheetName]
+        for address in addresses:
+            try:
+                sheet.Range[address].Interior.ColorIndex=8
+            except:
+                for part in address.split(","):
+                    try:
+                        sheet.Range[part].Interior.ColorIndex=8
+                    except:
+                        pass
+    
+    def beginWrite(self):
+        if not self.manualCalc:
+            self.originalCalc=self.ex.Calculation #The user's own setting, put back by restoreCalculation()
+        self.ex.Calculation = -4135 #= xlCalculationManual # only works AFTER the workbook is opened
+        self.manualCalc=True
+    
+    def endWrite(self):
+        #Stays on manual until recalculate() (or save / close), so the writes don't each trigger a calculation
+        pass
+    
+    def restoreCalculation(self):
+        if self.manualCalc:
+            self.ex.Calculation = self.originalCalc # only works AFTER the workbook is opened
+            self.manualCalc=False
+    
+    def calculateRange(self,sheetName,address):
+        self.sheetsDict[sheetName].Range[address].Calculate()
+    
+    def calculateSheet(self,sheetName):
+        self.sheetsDict[sheetName].Calculate()
+    
+    def calculateAll(self):
+        self.ex.Calculate()
+    
+    def _noteWritten(self,block):
+        #Excel keeps track of the formulas a write makes dirty itself
+        pass
+    
+    def recalculate(self):
+        """Put the user's calculation mode back. Excel's own recalculation only calculates the formulas
+        the writes made dirty, so the workbook's formulas aren't read to plan it (see idf2phpp.xl_depends)
+        and no Range.Calculate calls are made. If the user had Excel on manual, the dirty formulas are
+        calculated once here, like before"""
+        wasManual=self.manualCalc and self.originalCalc==-4135
+        self.restoreCalculation()
+        if wasManual:
+            self.calculateAll()
+        return None
+        
+    def saveAndQuit(self,closeIfUser):
+        """Close the running excel instance, and save first
+        Args:
+            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
+                false to run only if was an instance created here."""
+
+        self.save()
+        self.close(closeIfUser)
+        self.quit(closeIfUser)
+        
+    def save(self):
+        try:
+            self.restoreCalculation()
+            self.ex.activeWorkbook.Save()
+        except:
+            return False
+        try:
+            self.writeCache().commit()
+        except (EnvironmentError, ValueError):
+            pass
+        return True
+            
+    def close(self, closeIfUser):
+        """Close the open excel workbook
+        Args:
+            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
+                false to run only if was an instance created here."""
+        if self.activeWorkbook!=None or (not closeIfUser and self.userOpened):
+            return
+        try:
+            self.restoreCalculation()
+            self.ex.activeWorkbook.Close()
+        except:
+            pass
+    def quit(self, closeIfUser):
+        """Stop the running excel instance
+        Args:
+            closeIfUser (boolean): Set to true if this method is to run even if this was a user-opened file, 
+                false to run only if was an instance created here."""
+        self.activeWorkbook=None
+        self.activeWorkbookName=""
+        if self.ex!=None:
+            self.ex.Quit()
+            ex=None
+        
+    def __unicode__(self):
+        return u"Excel Instance | Active Worksheet: {self.activeWorkbookName}".format(self=self)
+    def __str__(self):
+        return unicode(self).encode("utf-8")
+    def __repr__(self):
+        return "{}( _nm={!r}, _ex={!r}, _activeWorkbook={!r}, _name={!r}".format(
+               self.__class__.__name__,
+               self.ex,
+               self.activeWorkbook,
+               self.activeWorkbookName )
+
+class MyComponent(component):
+    
+    def StartExcel(self,useUserWorkbook):
+        if not "excel" in sc.sticky: #Excel interface isn't already running, so start it
+            excel = ExcelInstance()
+            if useUserWorkbook:
+                excel.findExistingInstance()    #Try looking for a running instance
+            else:
+                excel.startNewInstance()            #If didn't find one, make one
+            sc.sticky["excel"]=excel
+        else:
+            excel = sc.sticky["excel"]
+        return excel
+        
+    def StopExcel(self):
+        if "excel" in sc.sticky:
+            print("Quitting")
+            excel=sc.sticky["excel"]
+            try:
+                excel.saveAndQuit(False)
+            except:
+                pass
+            del sc.sticky["excel"]
+    
+    def doCopy(self, oldFilename,newDirectory,newFilename):
+        
+        if not os.path.exists(newDirectory):
+            os.mkdir(newDirectory)
+        dest=newDirectory+os.path.sep+newFilename+".xlsx"
+        if os.path.exists(dest):
+            msg1 = "File already copied, not overwritten"
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Remark, msg1)
+            return dest
+        try:
+            src=os.path.abspath(oldFilename)
+        except:
+            msg1 = "Source file not found"
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+            return None
+        try:
+            copyfile(src,dest)
+        except:
+            msg1 = "Unable to copy file"
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+            return dest
+        return dest
+    
+    def OpenWorkbook(self,excel,useUserWorkbookDefault,oldFilename,newDirectory,newFilename):
+        if excel:
+            """if useUserWorkbookDefault and excel.userOpened and excel.activeWorkbookName=="NEW_USER_FILE": #If a sheet is already open, set it up
+                if "XLSdata" in sc.sticky: 
+                    del sc.sticky["XLSdata"]
+                excel.loadSheets()
+                excel.activeWorkbookName="USER_FILE"
+            elif useUserWorkbookDefault and excel.userOpened:   #If we already set it up, we are OK
+                pass"""
+            if newFilename:
+                filename=self.doCopy(oldFilename,newDirectory,newFilename)
+                if excel.openWorkbook(filename): #If we need to open a new sheet, set it up
+                    excel.loadSheets()
+            else:
+                return False
+        else:
+            return False
+        return True
+    def RunScript(self,run,visible,useUserWorkbook,oldFilename,newDirectory,newFilename):
+        if not run:
+            self.StopExcel()
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, "Excel Not Started")
+            return None
+        excel=self.StartExcel(useUserWorkbook)
+        if excel==None:
+            return None
+        if not useUserWorkbook:
+            if visible==None:
+                visible=True
+            excel.ex.Visible = visible
+            excel.ex.ScreenUpdating = visible
+        if not excel:
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, "Excel Unable to Start")
+            return None
+        if not (useUserWorkbook or oldFilename and newFilename):
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, "Not running, either run is false or filename not set.")
+            return None
+        #if useUserWorkbookDefault:
+            
+        #outputName=self.doCopy(oldFilename,newDirectory,newFilename)
+        #if not outputName and not useUserWorkbookDefault:
+        #    return (None,"Unable to copy file.")
+        if self.OpenWorkbook(excel,useUserWorkbook,oldFilename,newDirectory,newFilename):
+            return excel
+        ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, "Unable to open workbook")
+        return None
@@ -21,12 +21,13 @@
 #
 """
 Read a list of fields from an Excel workbook.
+The fields are read in a few rectangular ranges (one call each), instead of one call per cell.
 To configure this module, provide three comma separated lists of the same length for the sheet name, cell name, and the label of the result. Alternatively, use the form entry option.
 -
 Component by Jack Hymowitz, July 31, 2020
 
     Args:
-        excel: A running excel instance
+        excel: A running excel instance, or the full path to a .xlsx / .xlsm file to read from directly (the values saved in the file, without recalculating)
         sheets: A comma separated list of the worksheet to read from for each output.
         fields: A comma separated list of the cells to read for each output
         labels: A comma separated list of what to  label each read cell
@@ -37,7 +38,7 @@ Component by Jack Hymowitz, July 31, 2020
 
 ghenv.Component.Name = "BT_ReadXLWorkbook"
 ghenv.Component.NickName = "Read XL Workbook"
-ghenv.Component.Message = 'JUL_31_2020'
+ghenv.Component.Message = 'OCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "BT"
 ghenv.Component.SubCategory = "02 | IDF2PHPP"
@@ -50,8 +51,17 @@ import rhinoscriptsyntax as rs
 import scriptcontext as sc
 import Grasshopper.Kernel as ghK
 from math import floor,log10
+import os
+from idf2phpp.workbook import XLSX_Workbook
+from idf2phpp.result_reader import VERIFICATION_RESULTS, XL_ResultField, XL_ResultReader, isErrorValue
 
 class MyComponent(component):
+    def getReader(self, labelList):
+        #The reader works out which ranges to read once, and is kept until the fields change
+        fields=[XL_ResultField(cell[0].strip(),cell[1].strip(),cell[2].strip(),"value") for cell in labelList]
+        if getattr(self,"reader",None) is None or self.reader.Fields!=fields:
+            self.reader=XL_ResultReader(fields)
+        return self.reader
     def doRead(self, excel, sheets, fields, labels):
         if sheets:
             sheetsList=sheets.split(",")
@@ -70,38 +80,31 @@ class MyComponent(component):
                 #ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, msg1)
                 #return (None,None)
                 #Default, verification page
-                labelList=[
-                    ["TFA","Verification","I34"],
-                    ["Heating Demand","Verification","I35"],
-                    ["Heating Load","Verification","I36"],
-                    ["Cooling + Dehum Demand","Verification","I38"],
-                    ["Cooling Load","Verification","I39"],
-                    ["Frequency of Overheating","Verification","I40"],
-                    ["Frequency of excessively high humidity","Verification","I41"],
-                    ["Pressurization test result","Verification","I43"],
-                    ["Non-Renewable PE","Verification","I53"],
-                    ["PER Demand","Verification","I55"],
-                    ["PER","Verification","I56"],
-                    ["Heating Total","Heating","O27"],
-                    ["Cooling Total","Cooling","O28"]
-                    ]
+                labelList=[[f.Label,f.Worksheet,f.Address] for f in VERIFICATION_RESULTS]
             else:
                 labelList=sc.sticky["displayFields"]
+        try:
+            reader=self.getReader(labelList)
+        except ValueError as e:
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, str(e))
+            return (None,None)
+        results=reader.read(excel)
         data=[]
         text=""
-        for cell in labelList:
-            label=cell[0].strip()
-            sheet=cell[1].strip()
-            field=cell[2].strip()
-            if sheet in excel.sheetsDict:
-                val=excel.sheetsDict[sheet].Range[field].Value2
-                if(type(val).__name__=="float" and val!=0): #Round to 4 significant figures
-                    val=str(round(val,3-int(floor(log10(abs(val))))))
-                data.append((label,val))
-                text+=str(label)+": "+str(val)+"\n"
+        for field,val in zip(results.Fields,results.Values):
+            if field.Worksheet in results.MissingSheets:
+                continue
+            if isErrorValue(val):
+                val=None
+            if(type(val).__name__=="float" and val!=0): #Round to 4 significant figures
+                val=str(round(val,3-int(floor(log10(abs(val))))))
+            data.append((field.Label,val))
+            text+=str(field.Label)+": "+str(val)+"\n"
         return (data,text)
     def RunScript(self, excel, sheets, fields, labels):
-        if excel and excel.activeWorkbook and excel.sheetsDict:
+        if isinstance(excel, str) and excel.lower().endswith((".xlsx",".xlsm")) and os.path.exists(excel):
+            excel=XLSX_Workbook(excel)
+        if excel and not isinstance(excel, str) and excel.isOpen():
             return self.doRead(excel,sheets,fields,labels)
         msg1 = "No Excel Instance!"
         ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
@@ -1,119 +1,143 @@
-#
-# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
-# 
-# This component is part of IDF2PHPP.
-# 
-# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
-# IDF2PHPP is free software; you can redistribute it and/or modify 
-# it under the terms of the GNU General Public License as published 
-# by the Free Software Foundation; either version 3 of the License, 
-# or (at your option) any later version. 
-# 
-# IDF2PHPP is distributed in the hope that it will be useful,
-# but WITHOUT ANY WARRANTY; without even the implied warranty of 
-# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
-# GNU General Public License for more details.
-# 
-# For a copy of the GNU General Public License
-# see <http://www.gnu.org/licenses/>.
-# 
-# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
-#
-"""
-Writes a series of objects to an excel sheet, then recalculates the sheet.
-These objects should be in a Treemap, and need a Worksheet, Range, and Value variable.
-Optionally only writes the differances from the last execution of this function, to reduce writing time.
--
-Component by Jack Hymowitz, July 31, 2020
-
-    Args:
-        _excel: A running ExcelInterface from OpenExcel Workbook
-        useDiff_: Set to True to only write the differance out to excel, enabled by default.
-        color_: set to True to highlight outputted fields, enabled by default.
-        _XL_Objects: TreeMap of objects to write with Worksheet, Range, and Value
-    Returns:
-        excel: The running ExcelInterface is outputted after this function runs.
-        numWrites: The number of writes that occured, for debugging purposes.
-"""
-ghenv.Component.Name = "BT_WriteXLWorkbook"
-ghenv.Component.NickName = "Write XL Workbook"
-ghenv.Component.Message = 'JUL_31_2020'
-ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
-ghenv.Component.Category = "BT"
-ghenv.Component.SubCategory = "02 | IDF2PHPP"
-
-from ghpythonlib.componentbase import executingcomponent as component
-import Grasshopper, GhPython
-import System
-import Rhino
-import rhinoscriptsyntax as rs
-import Grasshopper.Kernel as ghK
-import scriptcontext as sc
-from System import Object
-from Grasshopper.Kernel.Data import GH_Path
-import clr
-clr.AddReferenceByName('Microsoft.Office.Interop.Excel')#, Culture=neutral, PublicKeyToken=71e9bce111e9429c')
-from Microsoft.Office.Interop import Excel
-
-
-class MyComponent(component):
-    #If useDiff is false, this is used. Simply reads all objects in
-    def doReadObjs(self,objects):
-        diff=[]
-        for eachBranch in objects.Branches:
-            for obj in eachBranch:
-                diff.append((obj.Worksheet,obj.Range,obj.Value))
-        return diff
-    #If useDiff is true (or not set), this is used. Only objects that have changed are written
-    def doDiff(self,objects):
-        newObj={}
-        for eachBranch in objects.Branches:
-            for obj in eachBranch:
-                newObj[(obj.Worksheet,obj.Range)]=obj.Value;
-        diff=[]
-        if "XLSdata" in sc.sticky:    #We are checking diffs
-            oldObj=sc.sticky["XLSdata"]
-            for x in newObj.keys():
-                if not x in oldObj.keys() or oldObj[x]!=newObj[x]: #If the value didn't exist before or was changed, it's a change
-                    diff.append((x[0],x[1],newObj[x]))
-            for x in oldObj.keys():
-                if not x in newObj.keys():                         #If the value existed before and is now gone, it is a change
-                    diff.append((x[0],x[1],""))
-            
-        else:                                       #Not checking diffs
-            for x in newObj.keys():
-                diff.append((x[0],x[1],newObj[x]))
-        sc.sticky["newXLSdata"]=newObj
-        return diff
-        
-    #Write out the data we have found
-    def doWrite(self,excel,border,data):
-        print(excel.ex.Calculation)
-        excel.ex.Calculation = -4135 #= xlCalculationManual # only works AFTER the workbook is opened
-        for eachItem in data:
-            try:
-                #print(eachItem)
-                excel.sheetsDict[eachItem[0]].Range[eachItem[1]].Value2 = eachItem[2]
-                #excel.sheetsDict[eachItem[0]].Range[eachItem[1]].Interior.BorderAround(Weight=Excel.XLBorderWeight.xlThin,Color=(255,0,255))
-                if(border == None or border):
-                    excel.sheetsDict[eachItem[0]].Range[eachItem[1]].Interior.ColorIndex=8
-            except:
-                msg1 = "Sheet not found: "+eachItem[0]
-                ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
-        if "newXLSdata" in sc.sticky:
-            sc.sticky["XLSdata"]=sc.sticky["newXLSdata"]
-        excel.ex.Calculation = -4105 #= xlCalculationAuto # only works AFTER the workbook is opened
-    
-    def RunScript(self, excel, useDiff, border, XL_Objects):
-        if not excel or not excel.activeWorkbook or not XL_Objects:
-            msg1 = "No Excel Instance!"
-            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
-            return (None,0)
-        if useDiff is None or useDiff:
-            diff=self.doDiff(XL_Objects)
-        else:
-            diff=self.doReadObjs(XL_Objects)
-        self.doWrite(excel, border,diff)
-        excel.ex.Calculate()
-        return (excel,len(diff))
-
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+# 
+# This component is part of IDF2PHPP.
+# 
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com> 
+# IDF2PHPP is free software; you can redistribute it and/or modify 
+# it under the terms of the GNU General Public License as published 
+# by the Free Software Foundation; either version 3 of the License, 
+# or (at your option) any later version. 
+# 
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of 
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+# GNU General Public License for more details.
+# 
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+# 
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Writes a series of objects to an excel sheet, then has Excel recalculate the formulas affected by what was written.
+These objects should be in a Treemap, and need a Worksheet, Range, and Value variable.
+Optionally only writes the differances from the last execution of this function, to reduce writing time.
+The values written are remembered in a small file next to the workbook once it is saved, so the differances
+still work after Rhino is restarted. If the workbook was changed outside of IDF2PHPP, everything is written again.
+The cells are written to Excel in rectangular blocks (one call per block instead of one per cell).
+Excel is kept on manual calculation while writing. Afterwards the user's own calculation mode is put back, and
+Excel's recalculation only calculates the formulas the writes made dirty.
+Instead of a running Excel, _excel can also be the full path to a .xlsx / .xlsm file. The values are then
+written straight into the file, without Excel (the file must not be open in Excel at the same time).
+-
+Component by Jack Hymowitz, July 31, 2020
+
+    Args:
+        _excel: A running ExcelInterface from OpenExcel Workbook, or the full path to a .xlsx / .xlsm file to write to directly
+        useDiff_: Set to True to only write the differance out to excel, enabled by default.
+        color_: set to True to highlight outputted fields, enabled by default.
+        _XL_Objects: TreeMap of objects to write with Worksheet, Range, and Value (or packed PHPP_CellArrays)
+    Returns:
+        excel: The running ExcelInterface (or the file path) is outputted after this function runs.
+        numWrites: The number of writes that occured, for debugging purposes.
+"""
+ghenv.Component.Name = "BT_WriteXLWorkbook"
+ghenv.Component.NickName = "Write XL Workbook"
+ghenv.Component.Message = 'OCT_18_2026'
+ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
+ghenv.Component.Category = "BT"
+ghenv.Component.SubCategory = "02 | IDF2PHPP"
+
+from ghpythonlib.componentbase import executingcomponent as component
+import Grasshopper, GhPython
+import System
+import Rhino
+import rhinoscriptsyntax as rs
+import Grasshopper.Kernel as ghK
+import scriptcontext as sc
+from System import Object
+from Grasshopper.Kernel.Data import GH_Path
+import os
+from idf2phpp.workbook import XLSX_Workbook
+from idf2phpp.xlsx_patch import XLSX_PatchError
+from idf2phpp.xl_address import expandRange, formatAddress
+from idf2phpp.write_cache import cellWrites
+from idf2phpp.cell_array import PHPP_CellArray
+
+
+class MyComponent(component):
+    #Collects the values to write: {(Worksheet, row, col): Value}
+    #Objects from the PHPP layout already have their Row and Col, only the others have their Range parsed
+    def doReadObjs(self,objects):
+        newObj={}
+        for eachBranch in objects.Branches:
+            for obj in eachBranch:
+                if isinstance(obj,PHPP_CellArray):   #A packed branch from 'Create Excel Obj - Geom'
+                    newObj.update(obj.toDict())
+                elif getattr(obj,'Row',None) is not None:
+                    newObj[(obj.Worksheet,obj.Row,obj.Col)]=obj.Value
+                else:
+                    for row,col in expandRange(obj.Range):
+                        newObj[(obj.Worksheet,row,col)]=obj.Value
+        return newObj
+    #If useDiff is true (or not set), only the cells that changed since the last write to this workbook are written
+    def doDiff(self,workbook,newObj):
+        return workbook.writeCache().diff(newObj)
+        
+    #Write out the data we have found, grouped into blocks of cells
+    def doWrite(self,excel,border,data):
+        highlight = border == None or border
+        result=excel.write(data,highlight)
+        for sheetName in result.MissingSheets:
+            msg1 = "Sheet not found: "+sheetName
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+        for sheetName,row,col in result.FailedCells:
+            msg1 = "Unable to write to "+sheetName+" "+formatAddress(row,col)
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+        print(str(result.NumCells)+" cells written in "+str(result.NumBlocks)+" blocks")
+        return result
+    
+    #Recalculate the formulas affected by the write (Excel does this itself once the calculation mode is put back)
+    def doRecalculate(self,workbook):
+        plan=workbook.recalculate()
+        if plan is None:
+            return
+        if plan.Ranges:
+            print(str(plan.NumFormulas)+" formulas recalculated in "+str(len(plan.Ranges))+" ranges")
+        elif plan.Sheets:
+            print(str(plan.NumFormulas)+" formulas recalculated on "+str(len(plan.Sheets))+" sheets")
+        elif plan.Full:
+            print("Recalculated the whole workbook")
+        else:
+            print("Nothing to recalculate")
+    
+    def RunScript(self, excel, useDiff, border, XL_Objects):
+        isFile = isinstance(excel, str)
+        if isFile and XL_Objects:   #A file path, write without Excel
+            if not excel.lower().endswith((".xlsx",".xlsm")) or not os.path.exists(excel):
+                ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, "Not a .xlsx / .xlsm file: "+excel)
+                return (None,0)
+            workbook = XLSX_Workbook(excel)
+        else:
+            workbook = excel
+        if not workbook or not XL_Objects or not workbook.isOpen():
+            msg1 = "No Excel Instance!"
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Warning, msg1)
+            return (None,0)
+        newObj=self.doReadObjs(XL_Objects)
+        if useDiff is None or useDiff:
+            diff=self.doDiff(workbook,newObj)
+        else:
+            diff=cellWrites(newObj)
+        try:
+            result=self.doWrite(workbook, border,diff)
+            workbook.writeCache().update(newObj,result.FailedCells)
+            self.doRecalculate(workbook)
+            if isFile:
+                workbook.save()
+        except (XLSX_PatchError, IOError) as e:
+            msg1 = "Unable to write to the file: "+str(e)
+            ghenv.Component.AddRuntimeMessage(ghK.GH_RuntimeMessageLevel.Error, msg1)
+            return (None,0)
+        return (excel,len(diff))
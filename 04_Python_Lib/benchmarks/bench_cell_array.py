@@ -0,0 +1,121 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: packed PHPP_CellArrays against one object per cell (idf2phpp.cell_array).
+
+Builds the PHPP cells for synthetic models of increasing size (see
+synthetic_idf.py and idf2phpp.phpp_export) as PHPP_XL_Obj-like objects, the
+way 'Create Excel Obj - Geom' does, and as PHPP_CellArrays. Prints:
+    - items:  the number of items Grasshopper has to wrap and pass on
+    - MB:     the memory used by each (Python 3 only, with tracemalloc)
+    - concat: the time to join the branches into one
+    - plan:   the time for planWrites() to group them into blocks
+
+    python bench_cell_array.py
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.cell_array import PHPP_CellArray
+from idf2phpp.idf_reader import iterIDFRecords
+from idf2phpp.idf_record import IDF_Record
+from idf2phpp.phpp_export import buildModel, makeCells
+from idf2phpp.write_plan import planWrites
+from synthetic_idf import writeSyntheticIDF
+
+ZONE_COUNTS = (50, 300, 1000)
+
+class XL_Obj(object):
+    """ Stand-in for the components' PHPP_XL_Obj """
+    def __init__(self, _shtNm, _rangeAddress, _val, _row=None, _col=None):
+        self.Worksheet = _shtNm
+        self.Range = _rangeAddress
+        self.Value = _val
+        self.Row = _row
+        self.Col = _col
+
+def measure(_build):
+    """ Returns (result, MB allocated while building it) """
+    if tracemalloc is None:
+        return _build(), float('nan')
+    tracemalloc.start()
+    try:
+        result = _build()
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size / 1e6
+
+def timed(_func, *_args):
+    t0 = time.time()
+    result = _func(*_args)
+    return result, time.time() - t0
+
+def main():
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        print('{:>6} {:>8} | {:>8} {:>7} {:>8} {:>7} | {:>6} {:>7} {:>8} {:>7}'.format(
+              'zones', 'cells', 'items', 'MB', 'concat', 'plan', 'items', 'MB', 'concat', 'plan'))
+
+        for numZones in ZONE_COUNTS:
+            path = os.path.join(tempDir, 'model_{}.idf'.format(numZones))
+            writeSyntheticIDF(path, numZones)
+            cells = makeCells(buildModel([IDF_Record.fromRaw(r) for r in iterIDFRecords(path)]))
+
+            # One branch per worksheet, like the component's output tree
+            sheetNames = []
+            for cell in cells:
+                if cell.Worksheet not in sheetNames:
+                    sheetNames.append(cell.Worksheet)
+            rawBranches = [[c for c in cells if c.Worksheet == nm] for nm in sheetNames]
+
+            objBranches, objMB = measure(lambda: [[XL_Obj(*c) for c in branch] for branch in rawBranches])
+            packedBranches, packedMB = measure(lambda: [PHPP_CellArray.fromObjs(branch) for branch in rawBranches])
+
+            objs, objConcat = timed(lambda: [obj for branch in objBranches for obj in branch])
+            packed, packedConcat = timed(PHPP_CellArray.concat, packedBranches)
+            objBlocks, objPlan = timed(planWrites, objs)
+            packedBlocks, packedPlan = timed(planWrites, packed)
+            assert len(objBlocks) == len(packedBlocks)
+
+            print('{:>6} {:>8} | {:>8} {:>7.2f} {:>7.4f}s {:>6.3f}s | {:>6} {:>7.2f} {:>7.4f}s {:>6.3f}s'.format(
+                  numZones, len(cells),
+                  len(objs), objMB, objConcat, objPlan,
+                  len(packedBranches), packedMB, packedConcat, packedPlan))
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: calculating the PHPP Verification results in Python (idf2phpp.xl_calc).
+
+Uses a synthetic PHPP workbook with result formulas (see synthetic_xlsx.py,
+_withResults=True), whose saved values were worked out independently. For
+each workbook size, with and without NumPy, it times:
+    - loading the formulas from the .xlsx
+    - calculating just the cells the Verification results depend on
+    - calculating every formula in the workbook
+    - changing one input cell and calculating the results again
+and checks every calculated result against the value saved in the file.
+
+    python bench_formula_calc.py [rows ...]
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.xl_calc import XL_Calculator, numpy
+from synthetic_xlsx import writeSyntheticXLSX
+
+def main(_sizes=(500, 2000, 8000)):
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        mismatches = 0
+        print('{:>6} {:<6} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9} {:>8}'.format(
+              'rows', 'numpy', 'formulas', 'needed', 'load s', 'calc s', 'all s', 'again s', 'differ'))
+        for numRows in _sizes:
+            template = os.path.join(tempDir, 'PHPP_{}.xlsx'.format(numRows))
+            writeSyntheticXLSX(template, numRows, _withResults=True)
+
+            for useNumpy in ((True, False) if numpy is not None else (False,)):
+                t0 = time.time()
+                calculator = XL_Calculator.fromXLSX(template, useNumpy)
+                t1 = time.time()
+                numNeeded = calculator.calculate()
+                t2 = time.time()
+                check = calculator.check()
+                mismatches += len(check.Mismatches)
+
+                calculator.setValues([('Ventilation', 'L2', 40)])
+                t3 = time.time()
+                calculator.calculate()
+                t4 = time.time()
+
+                full = XL_Calculator.fromXLSX(template, useNumpy)
+                t5 = time.time()
+                full.calculate(list(full.Formulas))
+                t6 = time.time()
+                fullCheck = full.check(list(full.Formulas))
+                mismatches += len(fullCheck.Mismatches)
+
+                print('{:>6} {:<6} {:>9} {:>9} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>8}'.format(
+                      numRows, 'yes' if useNumpy else 'no', len(calculator.Formulas), numNeeded,
+                      t1 - t0, t2 - t1, t6 - t5, t4 - t3, len(check.Mismatches) + len(fullCheck.Mismatches)))
+
+        print('{} calculated values differ from the saved ones'.format(mismatches))
+        return mismatches
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    sys.exit(1 if main([int(arg) for arg in sys.argv[1:]] or (500, 2000, 8000)) else 0)
@@ -0,0 +1,80 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: serial vs. parallel (idf_parallel.parseIDFParallel) IDF parsing.
+
+Writes synthetic IDF files of increasing size, parses each one with the
+serial reader and with the process pool, checks that both give exactly the
+same records, and prints the times and speedup for each file size.
+
+    python bench_parallel_parse.py [workers]
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.idf_reader import iterIDFRecords
+from idf2phpp.idf_parallel import parseIDFParallel
+from synthetic_idf import writeSyntheticIDF
+
+ZONE_COUNTS = (100, 300, 1000, 3000)
+REPEATS = 3
+
+def bestTime(_func, _repeats=REPEATS):
+    """ Returns (the fastest time of several runs, the result of the last run) """
+    best = None
+    for i in range(_repeats):
+        t0 = time.time()
+        result = _func()
+        elapsed = time.time() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main(_workers=None):
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        print('{:>7} {:>9} {:>9} {:>11} {:>8} {:>6}'.format(
+            'zones', 'size MB', 'serial s', 'parallel s', 'speedup', 'match'))
+
+        for numZones in ZONE_COUNTS:
+            path = os.path.join(tempDir, 'model_{}.idf'.format(numZones))
+            writeSyntheticIDF(path, numZones)
+            sizeMB = os.path.getsize(path) / (1024.0 * 1024.0)
+
+            serialTime, serialRecords = bestTime(lambda: list(iterIDFRecords(path)))
+            parallelTime, parallelRecords = bestTime(lambda: parseIDFParallel(path, _workers=_workers, _minChunkBytes=256 * 1024))
+
+            print('{:>7} {:>9.2f} {:>9.3f} {:>11.3f} {:>7.2f}x {:>6}'.format(
+                numZones, sizeMB, serialTime, parallelTime, serialTime / parallelTime,
+                'yes' if serialRecords == parallelRecords else 'NO'))
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,124 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: recalculating only the formulas downstream of a write (idf2phpp.xl_depends).
+
+Uses a synthetic PHPP workbook with result formulas (see synthetic_xlsx.py,
+_withResults=True) and a few kinds of write, one after the other, from changing one window cell
+to rewriting whole input columns. For each it prints how long planning the
+recalculation took, how many formulas are downstream (out of all of them) and
+the number of calculate calls the Excel COM backend would make, counted with
+an XL_MemoryWorkbook.
+
+It also checks each plan: every formula whose value actually changes (found by
+calculating the whole workbook before and after with idf2phpp.xl_calc) must be
+in one of the ranges the plan calculates.
+
+    python bench_partial_recalc.py [rows]
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.workbook import XL_MemoryWorkbook
+from idf2phpp.xl_address import expandRange
+from idf2phpp.xl_calc import XL_Calculator
+from synthetic_xlsx import INPUT_COLS, writeSyntheticXLSX
+
+def scenarios(_numRows):
+    return [
+        ('label only', [('Windows', 'A3', u'Window 3')]),
+        ('one window', [('Windows', 'L3', 42)]),
+        ('window column', [('Windows', 'M{}'.format(r), r % 7) for r in range(1, 101)]),
+        ('one formula', [('Heating', 'Z5', u'=Windows!L3*2')]),
+        ('areas + components', [(sheetName, '{}{}'.format(col, r), r % 11)
+                                for sheetName in ('Areas', 'Components') for col in INPUT_COLS[:3]
+                                for r in range(1, _numRows + 1)]),
+    ]
+
+def changedResults(_before, _after):
+    """ The formula cells whose values differ between two calculated XL_Calculators """
+    changed = set()
+    for key in _after.Formulas:
+        old = _before.cellValue(*key)
+        new = _after.cellValue(*key)
+        if old != new and not (isinstance(old, float) and isinstance(new, float) and abs(old - new) <= 1e-9 * max(1.0, abs(old))):
+            changed.add(key)
+    return changed
+
+def plannedCells(_plan, _calculator):
+    if _plan.Full:
+        return set(_calculator.Formulas)
+    if _plan.Sheets:
+        return set(key for key in _calculator.Formulas if key[0] in _plan.Sheets)
+    return set((sheetName, row, col) for sheetName, address in _plan.Ranges for row, col in expandRange(address))
+
+def main(_numRows=2000):
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        template = os.path.join(tempDir, 'PHPP.xlsx')
+        writeSyntheticXLSX(template, _numRows, _withResults=True)
+
+        workbook = XL_MemoryWorkbook.fromXLSX(template)
+        t0 = time.time()
+        depends = workbook.dependencyMap()
+        print('{} formulas, dependency map read in {:.3f}s'.format(len(depends), time.time() - t0))
+
+        before = XL_Calculator.fromXLSX(template)
+        before.calculate(list(before.Formulas))
+
+        allWrites = []
+        missed = 0
+        print('{:<20} {:>6} {:>9} {:>10} {:>8} {:>8} {:>8}'.format(
+              'write', 'cells', 'plan ms', 'formulas', 'ranges', 'calls', 'missed'))
+        for name, writes in scenarios(_numRows):
+            workbook.Calls['recalc'] = 0
+            workbook.write(writes, False)
+            t0 = time.time()
+            plan = workbook.recalculate()
+            elapsed = time.time() - t0
+
+            allWrites.extend(writes)
+            after = XL_Calculator.fromXLSX(template)
+            after.setValues(allWrites)
+            after.calculate(list(after.Formulas))
+            notPlanned = changedResults(before, after) - plannedCells(plan, after)
+            missed += len(notPlanned)
+
+            kind = len(plan.Ranges) if plan.Ranges else ('sheets' if plan.Sheets else ('all' if plan.Full else '-'))
+            print('{:<20} {:>6} {:>9.2f} {:>10} {:>8} {:>8} {:>8}'.format(
+                  name, len(writes), elapsed * 1000, plan.NumFormulas, kind, workbook.Calls['recalc'], len(notPlanned)))
+            before = after
+        print('{} changed results missing from the plans'.format(missed))
+        return missed
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    sys.exit(1 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000) else 0)
@@ -0,0 +1,110 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: reading PHPP results in rectangles (idf2phpp.result_reader) vs one cell at a time.
+
+Uses a synthetic PHPP workbook (see synthetic_xlsx.py) and two sets of
+result fields:
+    - 'verification': the default Verification sheet results
+    - 'monthly': a 12 month x 4 column table on each worksheet, plus a few
+      single summary cells below it
+Each set is read with XL_Workbook.readCells() (one read per cell, the way
+'Read XL Workbook' used to) and with an XL_ResultReader, from:
+    - XL_MemoryWorkbook, which counts the reads a COM backend would make
+    - XLSX_Workbook, reading the saved values straight from the file
+It prints the time and the number of reads for each, and checks that both
+ways give the same values.
+
+    python bench_result_reader.py [repeats]
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.result_reader import RESULT_TYPES, VERIFICATION_RESULTS, XL_ResultField, XL_ResultReader
+from idf2phpp.workbook import XLSX_Workbook, XL_MemoryWorkbook
+from idf2phpp.xl_address import formatAddress
+from synthetic_xlsx import INPUT_COLS, SHEET_NAMES, writeSyntheticXLSX
+
+def monthlyFields():
+    fields = []
+    for sheetName in SHEET_NAMES:
+        for month in range(12):
+            for col in INPUT_COLS[1:5]:
+                fields.append( XL_ResultField(u'{} {}{}'.format(sheetName, col, month + 1), sheetName, '{}{}'.format(col, 100 + month)) )
+        for row in (115, 117, 120):
+            fields.append( XL_ResultField(u'{} total {}'.format(sheetName, row), sheetName, 'W{}'.format(row)) )
+    return fields
+
+def readPerCell(_workbook, _fields):
+    raw = _workbook.readCells([(field.Worksheet, field.Address) for field in _fields])
+    return [RESULT_TYPES[field.Type](value) for field, value in zip(_fields, raw)]
+
+def _time(_fn, _repeats):
+    t0 = time.time()
+    for i in range(_repeats):
+        result = _fn()
+    return (time.time() - t0) / _repeats, result
+
+def main(_repeats=20):
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        template = os.path.join(tempDir, 'PHPP.xlsx')
+        writeSyntheticXLSX(template, 200)
+        memory = XL_MemoryWorkbook.fromXLSX(template)
+        xlsx = XLSX_Workbook(template)
+
+        mismatches = 0
+        print('{:<13} {:>6} {:<14} {:>14} {:>7} {:>14} {:>7}'.format(
+              'result set', 'fields', 'backend', 'per cell ms', 'reads', 'reader ms', 'reads'))
+        for name, fields in (('verification', VERIFICATION_RESULTS), ('monthly', monthlyFields())):
+            reader = XL_ResultReader(fields)
+            for backendName, workbook in (('memory', memory), ('xlsx', xlsx)):
+                reader.read(workbook) # The xlsx backend loads each worksheet on its first read
+                calls = getattr(workbook, 'Calls', None)
+                if calls is not None:
+                    calls['read'] = 0
+                tCell, perCell = _time(lambda: readPerCell(workbook, fields), _repeats)
+                cellReads = calls['read'] // _repeats if calls is not None else '-'
+                if calls is not None:
+                    calls['read'] = 0
+                tReader, results = _time(lambda: reader.read(workbook), _repeats)
+                readerReads = calls['read'] // _repeats if calls is not None else '-'
+
+                mismatches += sum(1 for a, b in zip(perCell, results.Values) if a != b)
+                print('{:<13} {:>6} {:<14} {:>14.3f} {:>7} {:>14.3f} {:>7}'.format(
+                      name, len(fields), backendName, tCell * 1000, cellReads, tReader * 1000, readerReads))
+
+        print('{} mismatches between the per-cell and the rectangle reads'.format(mismatches))
+        return mismatches
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    sys.exit(1 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 20) else 0)
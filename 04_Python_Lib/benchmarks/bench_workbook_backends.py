@@ -0,0 +1,117 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: write throughput of the workbook backends (idf2phpp.workbook).
+
+Builds the PHPP cells for a synthetic model (see synthetic_idf.py and
+idf2phpp.phpp_export), then writes them through XL_Workbook.write() with:
+    - XL_MemoryWorkbook, loaded from a synthetic PHPP workbook (synthetic_xlsx.py)
+    - XLSX_Workbook, into a copy of the same workbook (including the save)
+For each one it prints the time, the cells per second and the number of calls
+a COM backend would have made. It then reads every cell back from the saved
+.xlsx file and checks it against the in-memory workbook, so the two backends
+must agree.
+
+    python bench_workbook_backends.py [zones]
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.idf_reader import iterIDFRecords
+from idf2phpp.idf_record import IDF_Record
+from idf2phpp.phpp_export import buildModel, makeCells
+from idf2phpp.workbook import XLSX_Workbook, XL_MemoryWorkbook
+from idf2phpp.xlsx_read import readXLSX
+from synthetic_idf import writeSyntheticIDF
+from synthetic_xlsx import writeSyntheticXLSX
+
+def _asStored(_value):
+    """ The value as it comes back from a .xlsx file: numbers as float, '' as empty """
+    if _value is None or _value == u'':
+        return None
+    if isinstance(_value, bool):
+        return _value
+    if isinstance(_value, (int, float)):
+        return float(_value)
+    if not _value.startswith(u'='):
+        try:
+            return float(_value)
+        except ValueError:
+            pass
+    return _value
+
+def main(_numZones=300):
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        idfPath = os.path.join(tempDir, 'model.idf')
+        writeSyntheticIDF(idfPath, _numZones)
+        cells = makeCells(buildModel([IDF_Record.fromRaw(r) for r in iterIDFRecords(idfPath)]))
+
+        template = os.path.join(tempDir, 'PHPP.xlsx')
+        writeSyntheticXLSX(template, 2000)
+
+        print('{} zones, {} cells'.format(_numZones, len(cells)))
+        print('{:<20} {:>9} {:>10} {:>10}'.format('backend', 'time s', 'cells/s', 'COM calls'))
+
+        memory = XL_MemoryWorkbook.fromXLSX(template)
+        memory.dependencyMap() # Read before timing: it is kept with the open workbook between writes
+        memory.Calls = dict((k, 0) for k in memory.Calls)
+        t0 = time.time()
+        result = memory.write(cells)
+        memory.recalculate()
+        memory.save()
+        elapsed = time.time() - t0
+        print('{:<20} {:>9.3f} {:>10.0f} {:>10}'.format(
+              'XL_MemoryWorkbook', elapsed, result.NumCells / elapsed, sum(memory.Calls.values())))
+
+        outPath = os.path.join(tempDir, 'PHPP_out.xlsx')
+        t0 = time.time()
+        workbook = XLSX_Workbook(template, outPath)
+        result = workbook.write(cells)
+        workbook.save()
+        elapsed = time.time() - t0
+        print('{:<20} {:>9.3f} {:>10.0f} {:>10}'.format('XLSX_Workbook', elapsed, result.NumCells / elapsed, '-'))
+
+        # Every written cell, read back from the file, must match the memory workbook
+        saved = readXLSX(outPath)
+        mismatches = 0
+        for sheetName, _, _, row, col in cells:
+            expected = _asStored(memory.Sheets[sheetName].get((row, col)))
+            if isinstance(expected, (str, type(u''))) and expected.startswith('='):
+                continue # Formulas don't have a value until Excel recalculates
+            if saved[sheetName].get((row, col)) != expected:
+                mismatches += 1
+        print('Read back: {} cells checked, {} mismatches'.format(len(cells), mismatches))
+        return mismatches
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    sys.exit(1 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 300) else 0)
@@ -0,0 +1,73 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: grouping PHPP cell writes into blocks (idf2phpp.write_plan).
+
+Builds the PHPP cells for synthetic models of increasing size (see
+synthetic_idf.py and idf2phpp.phpp_export), groups them with planWrites()
+and prints the time that takes, along with the number of Excel COM calls
+needed to write them (with highlighting): one per cell for each of the value
+and the colour when writing cell by cell, against the calls for the blocks.
+
+    python bench_write_plan.py
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.idf_reader import iterIDFRecords
+from idf2phpp.idf_record import IDF_Record
+from idf2phpp.phpp_export import buildModel, makeCells
+from idf2phpp.write_plan import planWrites, countRoundTrips
+from synthetic_idf import writeSyntheticIDF
+
+ZONE_COUNTS = (50, 300, 1000)
+
+def main():
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        print('{:>6} {:>8} {:>7} {:>10} {:>10} {:>9}'.format(
+              'zones', 'cells', 'blocks', 'per cell', 'blocked', 'plan s'))
+
+        for numZones in ZONE_COUNTS:
+            path = os.path.join(tempDir, 'model_{}.idf'.format(numZones))
+            writeSyntheticIDF(path, numZones)
+            cells = makeCells(buildModel([IDF_Record.fromRaw(r) for r in iterIDFRecords(path)]))
+
+            t0 = time.time()
+            blocks = planWrites(cells)
+            planTime = time.time() - t0
+
+            print('{:>6} {:>8} {:>7} {:>10} {:>10} {:>9.3f}'.format(
+                  numZones, len(cells), len(blocks), 2 * len(cells), countRoundTrips(blocks), planTime))
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    main()
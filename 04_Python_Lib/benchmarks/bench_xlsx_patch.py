@@ -0,0 +1,145 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: writing PHPP cells with idf2phpp.xlsx_patch vs. Excel COM.
+
+Writes a synthetic PHPP style workbook (see synthetic_xlsx.py), then writes
+5,000 to 20,000 cells into copies of it, with the highlighting on, the same
+way the 'Write XL Workbook' component does. For each size it prints the time
+to patch the .xlsx file and checks that every part of the file that didn't
+get new values is still byte-identical.
+
+The COM path (one Range.Value2 and one Interior.ColorIndex call per cell) is
+only timed on Windows, with Excel and the 'pywin32' package installed. It is
+skipped everywhere else.
+
+    python bench_xlsx_patch.py
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
+from idf2phpp.xlsx_patch import patchXLSX, getWorksheetParts
+from synthetic_xlsx import writeSyntheticXLSX, INPUT_COLS, SHEET_NAMES
+
+CELL_COUNTS = (5000, 10000, 20000)
+ROWS_PER_SHEET = 2000
+WRITE_SHEETS = ('U-Values', 'Components', 'Areas', 'Windows', 'Shading', 'Ventilation')
+COM_MAX_CELLS = 5000 # The COM path takes minutes beyond this
+
+def makeCells(_numCells):
+    """ (Worksheet, Range, Value) tuples spread over the input cells of the geometry sheets """
+    cells = []
+    perSheet = _numCells // len(WRITE_SHEETS) + 1
+    for sheetName in WRITE_SHEETS:
+        for i in range(perSheet):
+            row, col = divmod(i, len(INPUT_COLS))
+            value = 'Surface {}'.format(i) if col == 0 else (i % 250) * 0.37
+            cells.append( (sheetName, '{}{}'.format(INPUT_COLS[col], 10 + row), value) )
+    return cells[:_numCells]
+
+def unchangedParts(_srcPath, _outPath, _changedSheets):
+    """ Returns (the number of parts checked, the names of any which aren't byte-identical) """
+    with zipfile.ZipFile(_srcPath) as src, zipfile.ZipFile(_outPath) as out:
+        sheetParts = getWorksheetParts(src)
+        expected = set(['xl/workbook.xml', 'xl/styles.xml', 'xl/calcChain.xml', 'xl/_rels/workbook.xml.rels', '[Content_Types].xml'])
+        expected.update( sheetParts[nm] for nm in _changedSheets )
+
+        outNames = set(out.namelist())
+        checked = 0
+        different = []
+        for name in src.namelist():
+            if name in expected:
+                continue
+            checked += 1
+            if name not in outNames or src.read(name) != out.read(name):
+                different.append(name)
+    return checked, different
+
+def timeCOM(_path, _cells):
+    """ Writes the cells one at a time through Excel COM, like BT_WriteXLWorkbook.doWrite """
+    excel = win32com.client.DispatchEx('Excel.Application')
+    excel.DisplayAlerts = False
+    try:
+        workbook = excel.Workbooks.Open(os.path.abspath(_path))
+        sheets = dict((sheet.Name, sheet) for sheet in workbook.Worksheets)
+        for sheet in sheets.values():
+            sheet.Unprotect()
+        excel.Calculation = -4135 # xlCalculationManual
+
+        t0 = time.time()
+        for sheetName, address, value in _cells:
+            sheets[sheetName].Range(address).Value2 = value
+            sheets[sheetName].Range(address).Interior.ColorIndex = 8
+        elapsed = time.time() - t0
+
+        workbook.Close(False)
+        return elapsed
+    finally:
+        excel.Quit()
+
+def main():
+    tempDir = tempfile.mkdtemp(prefix='idf2phpp_bench_')
+    try:
+        template = os.path.join(tempDir, 'PHPP.xlsx')
+        writeSyntheticXLSX(template, ROWS_PER_SHEET)
+        print('Workbook: {} sheets x {} rows, {:.1f} MB'.format(
+              len(SHEET_NAMES), ROWS_PER_SHEET, os.path.getsize(template) / (1024.0 * 1024.0)))
+        if win32com is None:
+            print("Excel COM: skipped (needs Windows, Excel and the 'pywin32' package)")
+
+        print('{:>7} {:>10} {:>12} {:>9} {:>10}'.format('cells', 'patch s', 'cells/s', 'COM s', 'identical'))
+        for numCells in CELL_COUNTS:
+            cells = makeCells(numCells)
+            outPath = os.path.join(tempDir, 'out_{}.xlsx'.format(numCells))
+
+            t0 = time.time()
+            patchXLSX(template, outPath, cells, _highlight=True)
+            patchTime = time.time() - t0
+
+            checked, different = unchangedParts(template, outPath, WRITE_SHEETS)
+
+            comTime = '-'
+            if win32com is not None and numCells <= COM_MAX_CELLS:
+                comTime = '{:.2f}'.format(timeCOM(template, cells))
+
+            print('{:>7} {:>10.3f} {:>12.0f} {:>9} {:>10}'.format(
+                  numCells, patchTime, numCells / patchTime, comTime,
+                  '{}/{}'.format(checked - len(different), checked)))
+    finally:
+        shutil.rmtree(tempDir)
+
+if __name__ == '__main__':
+    main()
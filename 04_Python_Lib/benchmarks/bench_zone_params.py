@@ -0,0 +1,145 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Benchmark: idf2phpp.zone_params.calcZoneParams on growing models.
+
+Builds plain stand-in objects for the zones, ZoneLists, infiltration rates,
+Honeybee zones and PHPP rooms (ROOMS_PER_ZONE rooms per zone), runs
+calcZoneParams and prints the time per zone. The name-indexed version should
+take about the same time per zone at every size (linear scaling). For
+comparison, the old nested-loop search is also timed up to NESTED_MAX_ZONES.
+
+    python bench_zone_params.py
+
+Run from the '04_Python_Lib' folder (or with it on the PYTHONPATH).
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from idf2phpp.zone_params import calcZoneParams, calcACH50
+
+ZONE_COUNTS = (100, 200, 400, 800, 1600, 3200)
+ROOMS_PER_ZONE = 8
+ZONES_PER_LIST = 20
+NESTED_MAX_ZONES = 800
+REPEATS = 3
+
+class Obj(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+class HBZone(object):
+    def __init__(self, _name, _i):
+        self.name = _name
+        self.Size = 10.0 + _i % 7
+
+    def getExposedArea(self):
+        return self.Size * 4 * 3.0
+
+    def getFloorArea(self):
+        return self.Size * self.Size
+
+    def getZoneVolume(self):
+        return self.Size * self.Size * 3.0
+
+def buildModel(_numZones):
+    zoneNames = ['Zone_{}'.format(i) for i in range(_numZones)]
+    zones = [Obj(ZoneName=nm) for nm in zoneNames]
+    HBZones = [HBZone(nm, i) for i, nm in enumerate(zoneNames)]
+
+    rooms = []
+    for i, nm in enumerate(zoneNames):
+        if i % 2: # Half the zones have PHPP rooms
+            rooms.extend( Obj(HostZoneName=nm, FloorArea_TFA=12.0, RoomNetClearVolume=30.0) for r in range(ROOMS_PER_ZONE) )
+
+    zoneLists = []
+    infilRates = []
+    for i in range(0, _numZones, ZONES_PER_LIST):
+        listName = 'ZoneList_{}'.format(i)
+        zoneLists.append( Obj(Name=listName, ZoneNames=zoneNames[i:i + ZONES_PER_LIST]) )
+        infilRates.append( Obj(ZoneName=listName, FlowRatePerFloorArea=None, FlowRatePerSurfaceArea=0.0003) )
+
+    return zoneLists, infilRates, zones, rooms, HBZones
+
+def calcZoneParamsNested(_zoneLists, _infiltrationRates, _zoneObjs, _rooms, _HBZoneObjs):
+    """ The previous search: nested loops with a name test at every level """
+    for zoneList in _zoneLists:
+        for zoneInfilObj in _infiltrationRates:
+            if zoneInfilObj.ZoneName != zoneList.Name:
+                continue
+            for zoneNameinList in zoneList.ZoneNames:
+                for zoneObj in _zoneObjs:
+                    if zoneObj.ZoneName != zoneNameinList:
+                        continue
+                    for HBzone in _HBZoneObjs:
+                        if HBzone.name == zoneObj.ZoneName:
+                            thisHBZone = HBzone
+                    roomVn50s = [room.RoomNetClearVolume for room in _rooms if room.HostZoneName == zoneObj.ZoneName]
+                    zoneRefVolume = sum(roomVn50s) if roomVn50s else thisHBZone.getZoneVolume()
+                    zoneObj.InfiltrationACH50 = calcACH50(zoneInfilObj, thisHBZone.getFloorArea(),
+                                                          thisHBZone.getExposedArea(), zoneRefVolume)
+                    zoneObj.Volume_Vn50 = zoneRefVolume
+                    zoneObj.TFA = thisHBZone.getFloorArea()
+
+    for zone in _zoneObjs:
+        rooms = [room for room in _rooms if room.HostZoneName == zone.ZoneName]
+        if rooms:
+            zone.TFA = sum(room.FloorArea_TFA for room in rooms)
+            zone.Volume_Vn50 = sum(room.RoomNetClearVolume for room in rooms)
+
+def bestTime(_func, _args, _repeats=REPEATS):
+    best = None
+    for i in range(_repeats):
+        t0 = time.time()
+        _func(*_args)
+        elapsed = time.time() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    print('{:>7} {:>7} {:>10} {:>12} {:>10} {:>12} {:>6}'.format(
+        'zones', 'rooms', 'indexed s', 'us / zone', 'nested s', 'us / zone', 'match'))
+
+    for numZones in ZONE_COUNTS:
+        model = buildModel(numZones)
+        indexedTime = bestTime(calcZoneParams, model)
+        indexedResults = [(z.InfiltrationACH50, z.TFA, z.Volume_Vn50) for z in model[2]]
+
+        nestedCol, perZoneCol, matchCol = '-', '-', '-'
+        if numZones <= NESTED_MAX_ZONES:
+            model = buildModel(numZones)
+            nestedTime = bestTime(calcZoneParamsNested, model, 1)
+            nestedResults = [(z.InfiltrationACH50, z.TFA, z.Volume_Vn50) for z in model[2]]
+            nestedCol = '{:.3f}'.format(nestedTime)
+            perZoneCol = '{:.1f}'.format(nestedTime / numZones * 1e6)
+            matchCol = 'yes' if nestedResults == indexedResults else 'NO'
+
+        print('{:>7} {:>7} {:>10.4f} {:>12.1f} {:>10} {:>12} {:>6}'.format(
+            numZones, len(model[3]), indexedTime, indexedTime / numZones * 1e6,
+            nestedCol, perZoneCol, matchCol))
+
+if __name__ == '__main__':
+    main()
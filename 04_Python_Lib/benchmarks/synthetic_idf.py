@@ -0,0 +1,90 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Writes a synthetic, Honeybee style IDF file for the benchmarks.
+
+Each zone is a 5m x 5m x 3m box with six BuildingSurface:Detailed objects, one
+window, three Schedule:Compact objects and four Output:Variable requests, so
+the mix of object classes is close to a real Honeybee in.idf.
+
+    python synthetic_idf.py out.idf 300
+"""
+
+import random
+import sys
+
+def writeSyntheticIDF(_path, _numZones=300, _seed=1):
+    """ Writes the test IDF file
+
+    Args:
+        _path (str): The .idf file to write
+        _numZones (int): The number of zones in the model
+        _seed (int): Seed for the random schedule values, so the file is always the same
+    """
+    random.seed(_seed)
+    nZones = _numZones
+    with open(_path, 'w') as out:
+        w = out.write
+        w("Version,\n    8.9;                     !- Version Identifier\n\n")
+        w("Building,\n    Bldg,                    !- Name\n    15,                      !- North Axis {deg}\n    City,                    !- Terrain\n    0.04,                    !- Loads Convergence Tolerance Value\n    0.4,                     !- Temperature Convergence Tolerance Value {deltaC}\n    FullExterior,            !- Solar Distribution\n    25,                      !- Maximum Number of Warmup Days\n    6;                       !- Minimum Number of Warmup Days\n\n")
+        w("Site:Location,\n    New York-Kennedy Intl AP,  !- Name\n    40.65,                   !- Latitude {deg}\n    -73.8,                   !- Longitude {deg}\n    -5,                      !- Time Zone {hr}\n    5;                       !- Elevation {m}\n\n")
+        w("Material,\n    Concrete,                !- Name\n    Rough,                   !- Roughness\n    0.2,                     !- Thickness {m}\n    1.7,                     !- Conductivity {W/m-K}\n    2300,                    !- Density {kg/m3}\n    900;                     !- Specific Heat {J/kg-K}\n\n")
+        w("Material:NoMass,\n    Insul,                   !- Name\n    Rough,                   !- Roughness\n    5.0;                     !- Thermal Resistance {m2-K/W}\n\n")
+        w("Material:AirGap,\n    Gap,                     !- Name\n    0.18;                    !- Thermal Resistance {m2-K/W}\n\n")
+        w("WindowMaterial:SimpleGlazingSystem,\n    SimpleGlz,               !- Name\n    0.8,                     !- U-Factor {W/m2-K}\n    0.5,                     !- Solar Heat Gain Coefficient\n    0.7;                     !- Visible Transmittance\n\n")
+        w("WindowMaterial:Glazing,\n    Clear3mm,                !- Name\n    SpectralAverage,         !- Optical Data Type\n    ,                        !- Window Glass Spectral Data Set Name\n    0.003,                   !- Thickness {m}\n    0.837,                   !- Solar Transmittance at Normal Incidence\n    0.075,                   !- Front Side Solar Reflectance at Normal Incidence\n    0.075,                   !- Back Side Solar Reflectance at Normal Incidence\n    0.898,                   !- Visible Transmittance at Normal Incidence\n    0.081,                   !- Front Side Visible Reflectance at Normal Incidence\n    0.081,                   !- Back Side Visible Reflectance at Normal Incidence\n    0,                       !- Infrared Transmittance at Normal Incidence\n    0.84,                    !- Front Side Infrared Hemispherical Emissivity\n    0.84,                    !- Back Side Infrared Hemispherical Emissivity\n    0.9;                     !- Conductivity {W/m-K}\n\n")
+        w("WindowMaterial:Gas,\n    Argon13,                 !- Name\n    Argon,                   !- Gas Type\n    0.013;                   !- Thickness {m}\n\n")
+        w("Construction,\n    Ext Wall,                !- Name\n    Concrete,                !- Outside Layer\n    Insul,                   !- Layer 2\n    Concrete;                !- Layer 3\n\n")
+        w("Construction,\n    Ext Window,              !- Name\n    SimpleGlz;               !- Outside Layer\n\n")
+        w("Construction,\n    Dbl Window,              !- Name\n    Clear3mm,                !- Outside Layer\n    Argon13,                 !- Layer 2\n    Clear3mm;                !- Layer 3\n\n")
+        w("ZoneList,\n    All Zones,               !- Name\n")
+        for z in range(nZones):
+            w("    Zone_%d%s                  !- Zone %d Name\n" % (z, ';' if z == nZones - 1 else ',', z + 1))
+        w("\nZoneInfiltration:DesignFlowRate,\n    Infil,                   !- Name\n    All Zones,               !- Zone or ZoneList Name\n    Always On,               !- Schedule Name\n    Flow/ExteriorArea,       !- Design Flow Rate Calculation Method\n    ,                        !- Design Flow Rate {m3/s}\n    ,                        !- Flow per Zone Floor Area {m3/s-m2}\n    0.0003,                  !- Flow per Exterior Surface Area {m3/s-m2}\n    ;                        !- Air Changes per Hour {1/hr}\n\n")
+        for z in range(nZones):
+            ox = (z % 20) * 6.0; oy = (z // 20) * 6.0
+            w("Zone,\n    Zone_%d,                  !- Name\n    0,                       !- Direction of Relative North {deg}\n    0,                       !- X Origin {m}\n    0,                       !- Y Origin {m}\n    0,                       !- Z Origin {m}\n    1,                       !- Type\n    1;                       !- Multiplier\n\n" % z)
+            faces = [('Floor', 'Ground', [(0,0,0),(0,5,0),(5,5,0),(5,0,0)]),
+                     ('Roof', 'Outdoors', [(0,0,3),(5,0,3),(5,5,3),(0,5,3)]),
+                     ('Wall', 'Outdoors', [(0,0,3),(0,0,0),(5,0,0),(5,0,3)]),
+                     ('Wall', 'Outdoors', [(5,0,3),(5,0,0),(5,5,0),(5,5,3)]),
+                     ('Wall', 'Outdoors', [(5,5,3),(5,5,0),(0,5,0),(0,5,3)]),
+                     ('Wall', 'Outdoors', [(0,5,3),(0,5,0),(0,0,0),(0,0,3)])]
+            for i, (typ, bc, verts) in enumerate(faces):
+                w("BuildingSurface:Detailed,\n    Zone_%d_Srfc_%d,           !- Name\n    %s,                    !- Surface Type\n    Ext Wall,                !- Construction Name\n    Zone_%d,                  !- Zone Name\n    %s,                !- Outside Boundary Condition\n    ,                        !- Outside Boundary Condition Object\n    %s,                !- Sun Exposure\n    %s,                !- Wind Exposure\n    autocalculate,           !- View Factor to Ground\n    4,                       !- Number of Vertices\n" % (z, i, typ, z, bc, 'SunExposed' if bc == 'Outdoors' else 'NoSun', 'WindExposed' if bc == 'Outdoors' else 'NoWind'))
+                for j, v in enumerate(verts):
+                    w("    %s, %s, %s%s                !- X,Y,Z Vertex %d {m}\n" % (v[0]+ox, v[1]+oy, v[2], ';' if j == 3 else ',', j + 1))
+                w("\n")
+            w("FenestrationSurface:Detailed,\n    Zone_%d_Srfc_2_glz,       !- Name\n    Window,                  !- Surface Type\n    Ext Window,              !- Construction Name\n    Zone_%d_Srfc_2,            !- Building Surface Name\n    ,                        !- Outside Boundary Condition Object\n    autocalculate,           !- View Factor to Ground\n    ,                        !- Shading Control Name\n    ,                        !- Frame and Divider Name\n    1,                       !- Multiplier\n    4,                       !- Number of Vertices\n" % (z, z))
+            for j, v in enumerate([(1,0,2),(1,0,1),(4,0,1),(4,0,2)]):
+                w("    %s, %s, %s%s                !- X,Y,Z Vertex %d {m}\n" % (v[0]+ox, v[1]+oy, v[2], ';' if j == 3 else ',', j + 1))
+            w("\n")
+            for k in range(3):
+                w("Schedule:Compact,\n    Sched_%d_%d,               !- Name\n    Fraction,                !- Schedule Type Limits Name\n    Through: 12/31,          !- Field 1\n" % (z, k))
+                for h in range(24):
+                    w("    Until: %02d:00, %s,       !- Field %d\n" % (h + 1, round(random.random(), 3), h + 2))
+                w("    For: AllOtherDays, Until: 24:00, 0;  !- Field 30\n\n")
+            for v in ['Zone Mean Air Temperature', 'Zone Air Relative Humidity', 'Zone Ideal Loads Supply Air Total Heating Energy', 'Zone Ideal Loads Supply Air Total Cooling Energy']:
+                w("Output:Variable,\n    Zone_%d,                  !- Key Value\n    %s,  !- Variable Name\n    hourly;                  !- Reporting Frequency\n\n" % (z, v))
+
+if __name__ == '__main__':
+    writeSyntheticIDF(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 300)
@@ -0,0 +1,299 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Writes a synthetic, PHPP style .xlsx workbook for the benchmarks.
+
+The workbook has the PHPP worksheet names. Each worksheet has a label column
+(shared strings), a block of formatted input cells, and a column of formulas
+using them, so the file has the same kinds of parts as a PHPP: sharedStrings,
+styles, a calcChain, and sheet XML with formulas and cached values.
+
+With _withResults=True it also gets 'Heating' and 'Cooling' worksheets and
+formulas in the Verification result cells (see
+idf2phpp.result_reader.VERIFICATION_RESULTS). They use the things a PHPP's
+formulas do: references to other worksheets (some quoted), defined names
+(one local to a worksheet), shared and array formulas, a circular reference
+and functions like SUMPRODUCT, SUMIF, INDEX / MATCH and VLOOKUP. Their cached
+values are worked out here in plain Python, the way Excel would calculate
+them, so idf2phpp.xl_calc can be checked against them.
+
+    python synthetic_xlsx.py out.xlsx 2000 [--results]
+"""
+
+import sys
+import zipfile
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+from xml.sax.saxutils import escape
+
+SHEET_NAMES = ('Verification', 'Climate', 'U-Values', 'Ground', 'Components', 'Areas',
+               'Windows', 'Shading', 'Ventilation', 'Additional Vent', 'DHW+Distribution', 'Electricity')
+INPUT_COLS = 'LMNOPQRSTUV' # Formatted input cells, like the PHPP's yellow fields
+FORMULA_COL = 'W'
+RESULT_SHEETS = ('Heating', 'Cooling')
+
+def inputValue(_row, _i):
+    """ The value of input column INPUT_COLS[_i] on a row, or None if the cell is left empty """
+    if (_row + _i) % 3:
+        return float((_row * (_i + 1)) % 97)
+    return None
+
+def formulaValue(_sheetNum, _row):
+    """ The cached value of the FORMULA_COL cell: SUM(L:V) * sheet number """
+    return sum(inputValue(_row, i) or 0.0 for i in range(len(INPUT_COLS))) * _sheetNum
+
+def _contentTypes(_numSheets):
+    sheets = ''.join('<Override PartName="/xl/worksheets/sheet{}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'.format(i + 1) for i in range(_numSheets))
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + sheets +
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '<Override PartName="/xl/calcChain.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.calcChain+xml"/>'
+            '</Types>')
+
+_ROOT_RELS = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+              '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+              '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+              '</Relationships>')
+
+_STYLES = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+           '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+           '<numFmts count="1"><numFmt numFmtId="164" formatCode="0.000"/></numFmts>'
+           '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+           '<fills count="3"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill>'
+           '<fill><patternFill patternType="solid"><fgColor rgb="FFFFFF99"/><bgColor indexed="64"/></patternFill></fill></fills>'
+           '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+           '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+           '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+           '<xf numFmtId="164" fontId="0" fillId="2" borderId="0" xfId="0" applyNumberFormat="1" applyFill="1" applyProtection="1"><protection locked="0"/></xf>'
+           '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+           '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+           '</styleSheet>')
+
+def _numberXML(_value):
+    return repr(float(_value))
+
+def _sheetXML(_sheetNum, _numRows, _extra=None):
+    """ The worksheet XML. _extra is {row: {col: '<c .../>'}} of other cells (which replace the normal ones) """
+    extra = _extra or {}
+    rows = []
+    lastCol = len(INPUT_COLS) + 12
+    for r in sorted(set(range(1, _numRows + 1)) | set(extra)):
+        cells = {}
+        if r <= _numRows:
+            cells[1] = '<c r="A{}" t="s"><v>{}</v></c>'.format(r, r - 1)
+            for i, col in enumerate(INPUT_COLS):
+                value = inputValue(r, i)
+                if value is not None:
+                    cells[12 + i] = '<c r="{}{}" s="1"><v>{}</v></c>'.format(col, r, int(value))
+                else:
+                    cells[12 + i] = '<c r="{}{}" s="1"/>'.format(col, r) # Empty, formatted input cell
+            cells[23] = '<c r="{0}{1}" s="2"><f>SUM(L{1}:V{1})*{2}</f><v>{3}</v></c>'.format(
+                        FORMULA_COL, r, _sheetNum, _numberXML(formulaValue(_sheetNum, r)))
+        cells.update( extra.get(r, {}) )
+        lastCol = max([lastCol] + list(cells))
+        rows.append( '<row r="{}">{}</row>'.format(r, ''.join(cells[c] for c in sorted(cells))) )
+
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<dimension ref="A1:{}{}"/><sheetViews><sheetView workbookViewId="0"/></sheetViews>'
+            '<sheetFormatPr defaultRowHeight="15"/><sheetData>{}</sheetData>'
+            '<sheetProtection sheet="1" objects="1" scenarios="1"/>'
+            '<pageMargins left="0.7" right="0.7" top="0.75" bottom="0.75" header="0.3" footer="0.3"/>'
+            '</worksheet>').format(_colName(lastCol), max([_numRows] + list(extra)), ''.join(rows))
+
+def _colName(_n):
+    col = ''
+    while _n:
+        _n, rem = divmod(_n - 1, 26)
+        col = chr(65 + rem) + col
+    return col
+
+def _formulaCell(_ref, _formula, _value, _fAttrs=''):
+    """ A formula <c> with its cached value. _formula None for a shared formula's other cells """
+    f = '<f{}/>'.format(_fAttrs) if _formula is None else '<f{}>{}</f>'.format(_fAttrs, escape(_formula))
+    if isinstance(_value, bool):
+        return '<c r="{}" t="b">{}<v>{}</v></c>'.format(_ref, f, int(_value))
+    if isinstance(_value, str):
+        return '<c r="{}" t="str">{}<v>{}</v></c>'.format(_ref, f, escape(_value))
+    return '<c r="{}" s="2">{}<v>{}</v></c>'.format(_ref, f, _numberXML(_value))
+
+def _excelRound(_value, _digits, _mode=ROUND_HALF_UP):
+    return float(Decimal('{:.15g}'.format(_value)).quantize(Decimal(1).scaleb(-_digits), rounding=_mode))
+
+def resultCells(_numRows, _sheetNames):
+    """ The result formulas and their cached values. None of them are in the INPUT_COLS
+
+    Returns:
+        (cells, names): cells is {worksheet: {row: {col: '<c .../>'}}}, names the <definedName> elements
+    """
+    n = _numRows
+    num = dict( (nm, i + 1) for i, nm in enumerate(_sheetNames) )
+    W = lambda sheet, r: formulaValue(num[sheet], r) if r <= n else 0.0
+    cells = dict( (nm, {}) for nm in ('Verification', 'Areas', 'Heating', 'Cooling') )
+
+    def put(_sheet, _ref, _formula, _value, _fAttrs=''):
+        col = ''.join(ch for ch in _ref if ch.isalpha())
+        row = int(_ref[len(col):])
+        colNum = 0
+        for ch in col:
+            colNum = colNum * 26 + ord(ch) - 64
+        cells[_sheet].setdefault(row, {})[colNum] = _formulaCell(_ref, _formula, _value, _fAttrs)
+        return _value
+
+    # Areas: a shared formula down column X, summed through a defined name
+    areas = []
+    for r in range(1, n + 1):
+        w = W('Areas', r)
+        x = w / 2 if w > 100 else w
+        areas.append( x )
+        if r == 1:
+            put('Areas', 'X1', 'IF(W1>100,W1/2,W1)', x, ' t="shared" ref="X1:X{}" si="0"'.format(n))
+        else:
+            put('Areas', 'X{}'.format(r), None, x, ' t="shared" si="0"')
+    tfa = put('Verification', 'I34', 'ROUND(SUM(AreaCol)/100,2)', _excelRound(sum(areas) / 100, 2))
+
+    # Heating: monthly losses (SUMPRODUCT across two worksheets), gains (a global name) and the balance
+    gainFactor = 0.01
+    losses, gains, balance = [], [], []
+    for m in range(1, 13):
+        loss = sum((inputValue(m, i) or 0.0) * (inputValue(m, i) or 0.0) for i in range(len(INPUT_COLS))) / 1000
+        gain = W('Windows', m) * gainFactor
+        losses.append( loss )
+        gains.append( gain )
+        balance.append( max(0.0, loss - gain) )
+        shared = ' t="shared" ref="{}1:{}12" si="{}"'
+        first = m == 1
+        put('Heating', 'B{}'.format(m), "SUMPRODUCT(Components!L1:V1,'U-Values'!L1:V1)/1000" if first else None, loss,
+            shared.format('B', 'B', 1) if first else ' t="shared" si="1"')
+        put('Heating', 'C{}'.format(m), 'Windows!W1*GainFactor' if first else None, gain,
+            shared.format('C', 'C', 2) if first else ' t="shared" si="2"')
+        put('Heating', 'D{}'.format(m), 'MAX(0,B1-C1)' if first else None, balance[-1],
+            shared.format('D', 'D', 3) if first else ' t="shared" si="3"')
+    peak = put('Heating', 'Y26', 'MAX(HeatLosses)', max(losses))
+    heating = put('Heating', 'Y27', 'SUM(D1:D12)', sum(balance))
+    demand = put('Verification', 'I35', 'IFERROR(Heating!Y27/I34,0)', heating / tfa if tfa else 0.0)
+    put('Verification', 'I36', 'IF(I34>0,Heating!Y26*1000/I34,"")', peak * 1000 / tfa if tfa > 0 else '')
+
+    # Cooling: SUMIF over a column, an array formula and a circular reference
+    cooling = sum(inputValue(r, 1) or 0.0 for r in range(1, n + 1) if (inputValue(r, 0) or 0.0) > 50) / 1000
+    put('Cooling', 'Y28', 'SUMIF(Shading!L1:L{0},">50",Shading!M1:M{0})/1000'.format(n), cooling)
+    arraySum = put('Cooling', 'Y29', 'SUM(Heating!B1:B12*Heating!C1:C12)', sum(a * b for a, b in zip(losses, gains)),
+                   ' t="array" ref="Y29"')
+    put('Verification', 'I38', '(Cooling!Y28+Cooling!Y29/1000000)/I34', (cooling + arraySum / 1000000) / tfa)
+    put('Cooling', 'Y1', 'Y2*0.5+1', 4.0 / 3.0)
+    put('Cooling', 'Y2', 'Y1*0.5', 2.0 / 3.0)
+
+    # Single cells given to range functions: text, "" and TRUE in a reference are skipped, as they are in a range
+    put('Cooling', 'Z1', 'IF(Y28<0,1,"")', '')
+    put('Cooling', 'Z2', 'Y28>=0', True)
+    put('Cooling', 'Z3', 'IF(Y28<0,1,"text")', 'text')
+    put('Cooling', 'Z4', 'Z2*1', 1.0)
+    put('Cooling', 'Z10', 'SUM(Z4,Z1)', 1.0)
+    put('Cooling', 'Z11', 'MAX(Z3,Z4)', 1.0)
+    put('Cooling', 'Z12', 'SUM(Z4:Z4,Z3:Z3,Z4:Z4)', 2.0)
+    put('Cooling', 'Z13', 'SUM(Z2,Z4)', 1.0)
+    put('Cooling', 'Z14', 'COUNT(Z3)+COUNTA(Z1)+COUNTIFS(Z1:Z4,">0",Z1:Z4,"<2")', 2.0)
+
+    # Lookups
+    climate = [inputValue(r, 0) for r in range(1, 21)]
+    peakRow = climate.index(max(v for v in climate if v is not None)) + 1
+    put('Verification', 'I39', 'INDEX(Climate!W1:W{0},MATCH(MAX(Climate!L1:L20),Climate!L1:L20,0))/I34'.format(n),
+        W('Climate', peakRow) / tfa)
+    limit = inputValue(2, 0)
+    over = sum(1 for r in range(1, n + 1) if W('Additional Vent', r) > limit)
+    put('Verification', 'I40', "COUNTIF('Additional Vent'!W1:W{0},\">\"&Ventilation!L2)/ROWS('Additional Vent'!W1:W{0})*100".format(n),
+        over * 100.0 / n)
+    ground = [inputValue(r, 0) for r in range(1, 51) if inputValue(r, 0) is not None]
+    put('Verification', 'I41', 'ROUNDDOWN(AVERAGE(Ground!L1:L50),1)+ROUND(Cooling!Y1,3)',
+        _excelRound(sum(ground) / len(ground), 1, ROUND_DOWN) + _excelRound(4.0 / 3.0, 3))
+    lookupRow = [r for r in range(1, 51) if inputValue(r, 0) == 4.0][0]
+    put('Verification', 'I43', 'VLOOKUP(4,Electricity!L1:N50,3,FALSE)+0.6', (inputValue(lookupRow, 2) or 0.0) + 0.6)
+
+    pe = put('Verification', 'I53', "('DHW+Distribution'!W5+Electricity!W5)*2.75/I34",
+             (W('DHW+Distribution', 5) + W('Electricity', 5)) * 2.75 / tfa)
+    per = put('Verification', 'I55', 'I53*0.6^2+I35%', pe * 0.6 ** 2 + demand / 100)
+    put('Verification', 'I56', 'IF(AND(I55>0,NOT(ISBLANK(I34))),I55*2,-1)', per * 2 if per > 0 else -1.0)
+
+    names = ['<definedName name="AreaCol">Areas!$X$1:$X${}</definedName>'.format(n),
+             '<definedName name="GainFactor">{}</definedName>'.format(gainFactor),
+             '<definedName name="HeatLosses" localSheetId="{}">Heating!$B$1:$B$12</definedName>'.format(num['Heating'] - 1)]
+    return cells, names
+
+def writeSyntheticXLSX(_path, _numRows=2000, _sheetNames=SHEET_NAMES, _withResults=False):
+    """ Writes the test workbook
+
+    Args:
+        _path (str): The .xlsx file to write
+        _numRows (int): The number of rows on each worksheet
+        _sheetNames (list): The worksheet names
+        _withResults (bool): Add the result formulas (and the 'Heating' and 'Cooling' worksheets)
+    """
+    extra, names = {}, []
+    if _withResults:
+        _sheetNames = list(_sheetNames) + [nm for nm in RESULT_SHEETS if nm not in _sheetNames]
+        extra, names = resultCells(_numRows, _sheetNames)
+
+    numSheets = len(_sheetNames)
+    workbook = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+                '<bookViews><workbookView/></bookViews><sheets>{}</sheets>{}<calcPr calcId="191029"{}/></workbook>').format(
+                ''.join('<sheet name="{}" sheetId="{}" r:id="rId{}"/>'.format(nm.replace('&', '&amp;'), i + 1, i + 1)
+                        for i, nm in enumerate(_sheetNames)),
+                '<definedNames>{}</definedNames>'.format(''.join(names)) if names else '',
+                ' iterate="1" iterateCount="100" iterateDelta="0.001"' if _withResults else '')
+    rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{}'
+            '<Relationship Id="rId{}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+            '<Relationship Id="rId{}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+            '<Relationship Id="rId{}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/calcChain" Target="calcChain.xml"/>'
+            '</Relationships>').format(
+            ''.join('<Relationship Id="rId{0}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{0}.xml"/>'.format(i + 1)
+                    for i in range(numSheets)),
+            numSheets + 1, numSheets + 2, numSheets + 3)
+    strings = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+               '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="{0}" uniqueCount="{0}">{1}</sst>').format(
+               _numRows, ''.join('<si><t>Label {}</t></si>'.format(r + 1) for r in range(_numRows)))
+    calcChain = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                 '<calcChain xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">{}</calcChain>').format(
+                 ''.join('<c r="{}{}" i="{}"/>'.format(FORMULA_COL, r + 1, s + 1) for s in range(numSheets) for r in range(_numRows)))
+
+    with zipfile.ZipFile(_path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml', _contentTypes(numSheets))
+        z.writestr('_rels/.rels', _ROOT_RELS)
+        z.writestr('xl/workbook.xml', workbook)
+        z.writestr('xl/_rels/workbook.xml.rels', rels)
+        z.writestr('xl/styles.xml', _STYLES)
+        z.writestr('xl/sharedStrings.xml', strings)
+        z.writestr('xl/calcChain.xml', calcChain)
+        for i in range(numSheets):
+            z.writestr('xl/worksheets/sheet{}.xml'.format(i + 1), _sheetXML(i + 1, _numRows, extra.get(_sheetNames[i])))
+
+if __name__ == '__main__':
+    writeSyntheticXLSX(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 and sys.argv[2].isdigit() else 2000,
+                       _withResults='--results' in sys.argv)
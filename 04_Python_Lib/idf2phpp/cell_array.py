@@ -0,0 +1,183 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+A packed container for PHPP cell writes.
+
+'Create Excel Obj - Geom' makes one PHPP_XL_Obj per cell, each with its
+own worksheet and address strings, and Grasshopper wraps every one of them
+separately to pass it on to the next component. For a large model that is
+tens of thousands of objects.
+
+A PHPP_CellArray holds the same writes as parallel arrays instead: a sheet
+id, row and column per cell (in array.array's) and a list of the values.
+The worksheet names are only stored once. The cells keep the
+order they were added in, so later writes to the same cell still win.
+
+Iterating a PHPP_CellArray gives PHPP_Cell objects (or any class with the
+PHPP_XL_Obj arguments, see ItemClass), so code which reads .Worksheet,
+.Range and .Value off each item works with it unchanged.
+
+Highlighting is set for the whole write (ie: XL_Workbook.write(_highlight)),
+not per cell, so it isn't stored here.
+"""
+
+from array import array
+from collections import namedtuple
+
+from idf2phpp.xl_address import expandRange, formatAddress
+
+PHPP_Cell = namedtuple('PHPP_Cell', ['Worksheet', 'Range', 'Value', 'Row', 'Col'])
+PHPP_Cell.__new__.__defaults__ = (None, None)
+
+class PHPP_CellArray(object):
+    """ PHPP cell writes, stored as parallel arrays of sheet id, row, col and value """
+    __slots__ = ('SheetNames', 'SheetIds', 'Rows', 'Cols', 'Values', 'ItemClass', '_sheetIndex')
+
+    def __init__(self, _itemClass=None):
+        """
+        Args:
+            _itemClass (class): <Optional> What iterating gives, built as
+                _itemClass(Worksheet, Range, Value, Row, Col). Default is PHPP_Cell.
+        """
+        self.SheetNames = []           # Sheet id --> Worksheet name
+        self.SheetIds = array('H')
+        self.Rows = array('l')
+        self.Cols = array('l')
+        self.Values = []
+        self.ItemClass = _itemClass
+        self._sheetIndex = {}          # Worksheet name --> sheet id
+
+    def sheetId(self, _sheetName):
+        """ Returns the id for a worksheet name, adding it if it's new """
+        i = self._sheetIndex.get(_sheetName)
+        if i is None:
+            i = len(self.SheetNames)
+            self.SheetNames.append(_sheetName)
+            self._sheetIndex[_sheetName] = i
+        return i
+
+    def add(self, _sheetName, _row, _col, _value):
+        self.SheetIds.append(self.sheetId(_sheetName))
+        self.Rows.append(_row)
+        self.Cols.append(_col)
+        self.Values.append(_value)
+
+    def addCell(self, _cell, _value):
+        """ Adds a write to an XL_Cell from the PHPP layout (see idf2phpp.phpp_layout) """
+        self.add(_cell.Worksheet, _cell.Row, _cell.Col, _value)
+
+    def addObj(self, _obj):
+        """ Adds a PHPP_XL_Obj (or PHPP_Cell). A multi-cell Range adds every cell in it """
+        row = getattr(_obj, 'Row', None)
+        if row is not None:
+            self.add(_obj.Worksheet, row, _obj.Col, _obj.Value)
+            return
+        for row, col in expandRange(_obj.Range):
+            self.add(_obj.Worksheet, row, col, _obj.Value)
+
+    @classmethod
+    def fromObjs(cls, _objs, _itemClass=None):
+        """ Packs a list of PHPP_XL_Objs / PHPP_Cells, in order """
+        cells = cls(_itemClass)
+        for obj in _objs:
+            cells.addObj(obj)
+        return cells
+
+    def extend(self, _other):
+        """ Adds all the cells of another PHPP_CellArray to the end of this one """
+        remap = [self.sheetId(nm) for nm in _other.SheetNames]
+        if remap == list(range(len(remap))):
+            self.SheetIds.extend(_other.SheetIds)
+        elif len(remap) == 1:
+            self.SheetIds.extend(array('H', remap) * len(_other))
+        else:
+            self.SheetIds.extend(array('H', [remap[i] for i in _other.SheetIds]))
+        self.Rows.extend(_other.Rows)
+        self.Cols.extend(_other.Cols)
+        self.Values.extend(_other.Values)
+
+    @classmethod
+    def concat(cls, _arrays, _itemClass=None):
+        """ Joins several PHPP_CellArrays into a new one, in the order given """
+        cells = cls(_itemClass)
+        for other in _arrays:
+            cells.extend(other)
+        return cells
+
+    def _subset(self, _indexes):
+        cells = self.__class__(self.ItemClass)
+        ids = self.SheetIds
+        for i in _indexes:
+            cells.add(self.SheetNames[ids[i]], self.Rows[i], self.Cols[i], self.Values[i])
+        return cells
+
+    def forSheets(self, *_sheetNames):
+        """ Returns a new PHPP_CellArray with just the cells on the named worksheets, in the same order """
+        wanted = set(self._sheetIndex[nm] for nm in _sheetNames if nm in self._sheetIndex)
+        return self._subset(i for i, sheetId in enumerate(self.SheetIds) if sheetId in wanted)
+
+    def sortedByCell(self):
+        """ Returns a copy sorted by worksheet (in the order first used), row and column
+
+        The sort is stable, so if a cell is written more than once the writes
+        stay in the order they were added.
+        """
+        ids, rows, cols = self.SheetIds, self.Rows, self.Cols
+        return self._subset(sorted(range(len(self)), key=lambda i: (ids[i], rows[i], cols[i])))
+
+    def writeParts(self):
+        """ Yields (Worksheet, ((row, col),), Value) for each cell, the same as write_plan._writeParts() """
+        names = self.SheetNames
+        for sheetId, row, col, value in zip(self.SheetIds, self.Rows, self.Cols, self.Values):
+            yield names[sheetId], ((row, col),), value
+
+    def toDict(self):
+        """ {(Worksheet, row, col): Value}, ie: for the XL_WriteCache. Later writes to a cell win """
+        names = self.SheetNames
+        return dict( ((names[sheetId], row, col), value)
+                     for sheetId, row, col, value in zip(self.SheetIds, self.Rows, self.Cols, self.Values) )
+
+    def __len__(self):
+        return len(self.Values)
+
+    def __getitem__(self, _i):
+        itemClass = self.ItemClass or PHPP_Cell
+        row, col = self.Rows[_i], self.Cols[_i]
+        return itemClass(self.SheetNames[self.SheetIds[_i]], formatAddress(row, col), self.Values[_i], row, col)
+
+    def __iter__(self):
+        itemClass = self.ItemClass or PHPP_Cell
+        names = self.SheetNames
+        for sheetId, row, col, value in zip(self.SheetIds, self.Rows, self.Cols, self.Values):
+            yield itemClass(names[sheetId], formatAddress(row, col), value, row, col)
+
+    def __unicode__(self):
+        return u'PHPP Cell Array: {} cells on {} worksheets'.format(len(self), len(self.SheetNames))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( <{} cells>, _sheetNames={!r} )".format(
+               self.__class__.__name__,
+               len(self),
+               self.SheetNames)
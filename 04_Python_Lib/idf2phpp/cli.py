@@ -0,0 +1,265 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Command-line IDF --> PHPP exporter, without Rhino, Grasshopper or Excel.
+
+Reads one or more EnergyPlus IDF files and writes a filled-in copy of a PHPP
+template for each one, using the cells from idf2phpp.phpp_export. Several
+files are converted at the same time in a process pool, and the time spent
+in each stage (reading the IDF, converting it, building the cells, writing
+the workbook) is printed for each file.
+
+Usage:
+    python -m idf2phpp.cli model_a.idf model_b.idf --template PHPP.xlsx --out-dir results
+
+The values are written straight into the template's XML (see
+idf2phpp.workbook.XLSX_Workbook), so the formulas and formatting are left as they were.
+Use '--cells-only' to write the cells to a .csv file next to the output
+instead (no template needed), ie: to check a model or to load the values some
+other way.
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+from idf2phpp.idf_cache import loadIDFRecords
+from idf2phpp.idf_index import PHPP_IDF_CLASSES
+from idf2phpp.idf_record import IDF_Record
+from idf2phpp.phpp_export import buildModel, makeCells
+from idf2phpp.phpp_layout import DEFAULT_VERSION, getLayout, layoutVersions
+from idf2phpp.workbook import XLSX_Workbook
+
+STAGES = ('read', 'convert', 'cells', 'write')
+
+def writeCellsXLSX(_cells, _templatePath, _outPath, _highlight=False):
+    """ Writes the cells into a copy of the PHPP template
+
+    Args:
+        _cells (list): PHPP_Cells
+        _templatePath (str): The PHPP .xlsx / .xlsm file to start from. It is not changed.
+        _outPath (str): Where to save the filled-in workbook
+        _highlight (bool): Set True to highlight the cells written
+    """
+    workbook = XLSX_Workbook(_templatePath, _outPath)
+    result = workbook.write(_cells, _highlight)
+    if result.MissingSheets:
+        raise ValueError("Worksheet(s) not found in the PHPP template: {}".format(', '.join(result.MissingSheets)))
+    workbook.save()
+
+def writeCellsCSV(_cells, _outPath):
+    """ Writes the cells to a .csv file: Worksheet, Range, Value """
+    if sys.version_info[0] < 3:
+        f = open(_outPath, 'wb')
+    else:
+        f = io.open(_outPath, 'w', newline='', encoding='utf-8')
+    with f:
+        writer = csv.writer(f)
+        writer.writerow(['Worksheet', 'Range', 'Value'])
+        for cell in _cells:
+            row = [cell.Worksheet, cell.Range, cell.Value]
+            if sys.version_info[0] < 3:
+                row = [v.encode('utf-8') if isinstance(v, type(u'')) else v for v in row]
+            writer.writerow(row)
+
+def outputPath(_idfPath, _outDir, _ext, _prefix=''):
+    """ 'C:/models/house.idf' --> '<_outDir>/house_PHPP.xlsx' (or '<_outDir>/<_prefix>house_PHPP.xlsx') """
+    stem = os.path.splitext(os.path.basename(_idfPath))[0]
+    return os.path.join(_outDir or os.path.dirname(os.path.abspath(_idfPath)), '{}{}_PHPP{}'.format(_prefix, stem, _ext))
+
+def outputPaths(_idfPaths, _outDir, _ext):
+    """ The outputPath() for each IDF file, made unique so no two files are written to the same place
+
+    Honeybee always names its IDF 'in.idf', so with an _outDir several files can
+    have the same name. Those are prefixed with the name of the folder they are
+    in ('run_a/in.idf' --> 'run_a_in_PHPP.xlsx'), and numbered if that is the
+    same as well.
+    """
+    def key(_path):
+        return os.path.normcase(os.path.abspath(_path))
+
+    paths = [outputPath(idfPath, _outDir, _ext) for idfPath in _idfPaths]
+    counts = {}
+    for path in paths:
+        counts[key(path)] = counts.get(key(path), 0) + 1
+
+    used = set()
+    for i, idfPath in enumerate(_idfPaths):
+        if counts[key(paths[i])] > 1:
+            folder = os.path.basename(os.path.dirname(os.path.abspath(idfPath)))
+            paths[i] = outputPath(idfPath, _outDir, _ext, folder + '_' if folder else '')
+        n = 1
+        path = paths[i]
+        while key(path) in used:
+            n += 1
+            path = '{}_{}{}'.format(os.path.splitext(paths[i])[0], n, _ext)
+        paths[i] = path
+        used.add(key(path))
+    return paths
+
+def exportIDF(_args):
+    """ Converts one IDF file and writes the result. Runs in the worker processes
+
+    Args:
+        _args (tuple): (idfPath, templatePath, outPath, useCache, cellsOnly, highlight, phppVersion)
+    Returns:
+        result (tuple): (idfPath, outPath, number of cells, {stage: seconds}, error message or None,
+            [the records skipped, see buildModel()])
+    """
+    idfPath, templatePath, outPath, useCache, cellsOnly, highlight, phppVersion = _args
+    timings = {}
+    numCells = 0
+    warnings = []
+
+    try:
+        t0 = time.time()
+        # Only the classes buildModel() uses, the same as the 'Read IDF File' component
+        rawRecords = loadIDFRecords(idfPath, PHPP_IDF_CLASSES + ('Version',), ['Construction'], useCache)
+        version = next((r[1][0] for r in rawRecords if r[0].lower() == 'version' and r[1]), None)
+        records = [IDF_Record.fromRaw(r, _version=version) for r in rawRecords]
+        t1 = time.time()
+        model = buildModel(records)
+        warnings = model.Warnings
+        t2 = time.time()
+        cells = makeCells(model, _phppVersion=phppVersion)
+        numCells = len(cells)
+        t3 = time.time()
+
+        if cellsOnly:
+            writeCellsCSV(cells, outPath)
+        else:
+            writeCellsXLSX(cells, templatePath, outPath, highlight)
+        t4 = time.time()
+
+        timings = {'read': t1 - t0, 'convert': t2 - t1, 'cells': t3 - t2, 'write': t4 - t3}
+    except Exception as e:
+        return idfPath, outPath, numCells, timings, '{}: {}'.format(e.__class__.__name__, e), warnings
+
+    return idfPath, outPath, numCells, timings, None, warnings
+
+def exportMany(_idfPaths, _templatePath, _outDir=None, _workers=None, _useCache=True, _cellsOnly=False,
+               _highlight=False, _phppVersion=None):
+    """ Converts several IDF files, in parallel if there is more than one worker
+
+    Args:
+        _idfPaths (list): The .idf files to convert
+        _templatePath (str): The PHPP template workbook (not needed if _cellsOnly)
+        _outDir (str): <Optional> The folder for the output. Default is next to each IDF file.
+            IDF files with the same name get unique output names, see outputPaths()
+        _workers (int): <Optional> The number of processes to use. Default is the number of CPUs
+        _useCache (bool): Set False to skip the parsed-IDF cache (see idf2phpp.idf_cache)
+        _cellsOnly (bool): Write the cells to .csv files instead of filling in the template
+        _highlight (bool): Highlight the cells written in the workbooks
+        _phppVersion (str): <Optional> The PHPP version of the template, for the cell layout. Default is '9.6a'
+    Returns:
+        results (list): The exportIDF() results, in the same order as _idfPaths
+    """
+    ext = '.csv' if _cellsOnly else os.path.splitext(_templatePath)[1]
+    jobs = [(path, _templatePath, outPath, _useCache, _cellsOnly, _highlight, _phppVersion)
+            for path, outPath in zip(_idfPaths, outputPaths(_idfPaths, _outDir, ext))]
+
+    workers = _workers
+    if workers is None:
+        workers = multiprocessing.cpu_count() if multiprocessing else 1
+    workers = min(workers, len(jobs))
+
+    if multiprocessing is None or workers < 2:
+        return [exportIDF(job) for job in jobs]
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        return pool.map(exportIDF, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+def formatReport(_results, _totalTime):
+    """ The per-file, per-stage timing table printed at the end """
+    # The file names, or the paths as given if the same name is used more than once
+    names = [os.path.basename(r[0]) for r in _results]
+    names = [r[0] if names.count(name) > 1 else name for r, name in zip(_results, names)]
+    nameWidth = max([len(name) for name in names] + [4])
+    header = '{:<{w}}  {:>7}'.format('File', 'Cells', w=nameWidth)
+    header += ''.join('  {:>8}'.format(stage) for stage in STAGES) + '  {:>8}'.format('total')
+    lines = [header, '-' * len(header)]
+
+    for name, (idfPath, outPath, numCells, timings, error, warnings) in zip(names, _results):
+        line = '{:<{w}}  {:>7}'.format(name, numCells, w=nameWidth)
+        if error:
+            lines.append( line + '  FAILED: ' + error )
+        else:
+            line += ''.join('  {:>7.3f}s'.format(timings[stage]) for stage in STAGES)
+            line += '  {:>7.3f}s'.format(sum(timings.values()))
+            lines.append( line )
+        lines.extend( '    Warning: ' + warning for warning in warnings )
+
+    failed = sum(1 for r in _results if r[4])
+    warned = sum(1 for r in _results if r[5])
+    lines.append( '{} file(s) in {:.2f}s, {} failed, {} with warnings'.format(len(_results), _totalTime, failed, warned) )
+    return '\n'.join(lines)
+
+def main(_argv=None):
+    parser = argparse.ArgumentParser(prog='idf2phpp', description='Export EnergyPlus IDF files to PHPP workbooks, without Excel.')
+    parser.add_argument('idf', nargs='+', help='The .idf file(s) to convert')
+    parser.add_argument('-t', '--template', help='The PHPP workbook to fill in (.xlsx or .xlsm). It is not changed.')
+    parser.add_argument('-o', '--out-dir', help='Folder for the output. Default is next to each IDF file. '
+                        'IDF files with the same name (ie: in.idf) are prefixed with their folder name')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='Number of processes. Default is the number of CPUs')
+    parser.add_argument('--no-cache', action='store_true', help="Don't use the parsed-IDF cache")
+    parser.add_argument('--highlight', action='store_true', help='Highlight the cells written, like the Write XL Workbook component')
+    parser.add_argument('--cells-only', action='store_true', help='Write the cells to <name>_PHPP.csv instead of a workbook')
+    parser.add_argument('--phpp-version', default=None, help='The PHPP version of the template. Default is {} (one of: {})'.format(
+                        DEFAULT_VERSION, ', '.join(layoutVersions())))
+    args = parser.parse_args(_argv)
+
+    if not args.cells_only and not args.template:
+        parser.error('a PHPP --template is needed (or use --cells-only)')
+    if args.template and not os.path.isfile(args.template):
+        parser.error('PHPP template not found: {}'.format(args.template))
+    missing = [path for path in args.idf if not os.path.isfile(path)]
+    if missing:
+        parser.error('IDF file(s) not found: {}'.format(', '.join(missing)))
+    if args.phpp_version:
+        try:
+            getLayout(args.phpp_version)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.out_dir and not os.path.isdir(args.out_dir):
+        os.makedirs(args.out_dir)
+
+    start = time.time()
+    results = exportMany(args.idf, args.template, args.out_dir, args.workers, not args.no_cache, args.cells_only, args.highlight,
+                         args.phpp_version)
+    print(formatReport(results, time.time() - start))
+
+    return 1 if any(r[4] for r in results) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
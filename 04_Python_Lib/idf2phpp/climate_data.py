@@ -0,0 +1,98 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The PHPP climate dataset catalogue.
+
+The list of PHPP climate datasets (name, country, region, lat / long...) is
+kept in 'data/PHPP_Climate_Datasets.csv', one dataset per row, so it can be
+updated without changing any code. The file is only read the first time
+getClimateData() (or getClimateIndex()) is called, then kept in memory.
+
+Each dataset is a dict with the CSV's column names as keys. 'Latitude' and
+'Longitude' are floats, all the other values are text.
+"""
+
+import csv
+import io
+import os
+import sys
+
+DEFAULT_CLIMATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'PHPP_Climate_Datasets.csv')
+
+_FLOAT_COLUMNS = ('Latitude', 'Longitude')
+
+def _readCSVRows(_path):
+    with io.open(_path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+
+    if str is bytes and sys.platform != 'cli':
+        # CPython 2's csv module only reads byte strings
+        rows = csv.reader(text.encode('utf-8').splitlines())
+        return [[cell.decode('utf-8') for cell in row] for row in rows]
+
+    return list(csv.reader(text.splitlines()))
+
+def loadClimateData(_path=DEFAULT_CLIMATE_PATH):
+    """ Reads a climate dataset CSV file
+
+    Args:
+        _path (str): The full path to the .csv file. The first row is the column names.
+    Returns:
+        climateData (list): A dict for each dataset, in file order
+    """
+    rows = _readCSVRows(_path)
+    if not rows:
+        return []
+
+    header = rows[0]
+    climateData = []
+    for row in rows[1:]:
+        if not row:
+            continue
+
+        dataset = dict(zip(header, row))
+        for column in _FLOAT_COLUMNS:
+            try:
+                dataset[column] = float(dataset[column])
+            except (KeyError, ValueError):
+                dataset[column] = None
+        climateData.append(dataset)
+
+    return climateData
+
+_CLIMATE_DATA = None
+_CLIMATE_INDEX = None
+
+def getClimateData():
+    """ Returns the PHPP climate datasets, reading the CSV file the first time only """
+    global _CLIMATE_DATA
+    if _CLIMATE_DATA is None:
+        _CLIMATE_DATA = loadClimateData()
+    return _CLIMATE_DATA
+
+def getClimateIndex():
+    """ Returns the ClimateIndex of the PHPP climate datasets, built the first time only """
+    global _CLIMATE_INDEX
+    if _CLIMATE_INDEX is None:
+        from idf2phpp.climate_index import ClimateIndex
+        _CLIMATE_INDEX = ClimateIndex(getClimateData())
+    return _CLIMATE_INDEX
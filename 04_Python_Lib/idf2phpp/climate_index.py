@@ -0,0 +1,154 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Nearest PHPP climate dataset to a site.
+
+The distance is the same great-circle distance the PHPP 'Climate' worksheet
+uses (see greatCircleKm). To avoid working it out for every dataset on every
+run, ClimateIndex puts the datasets into a KD-tree once, using their
+positions on the unit sphere. The straight-line (chord) distance between two
+points on the sphere always ranks them in the same order as the great-circle
+distance, so the tree finds exactly the same nearest datasets.
+
+The climate data passed in is never changed, so one index can be shared by
+every component (and every site in a batch export).
+"""
+
+import heapq
+import math
+
+EARTH_RADIUS_KM = 6378 # The value used in the PHPP
+
+def greatCircleKm(_lat1, _long1, _lat2, _long2):
+    """ Returns the distance (km) between two lat / long points (Degrees), as the PHPP works it out """
+    rad = math.pi / 180
+    a = (math.sin(rad * _lat1) * math.sin(rad * _lat2) +
+         math.cos(rad * _lat1) * math.cos(rad * _lat2) * math.cos(rad * (_long1 - _long2)))
+    return EARTH_RADIUS_KM * math.acos(min(1, max(-1, a)))
+
+def unitSpherePoint(_lat, _long):
+    """ Returns the (x, y, z) position of a lat / long (Degrees) on a sphere of radius 1 """
+    lat, lon = math.radians(_lat), math.radians(_long)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+class ClimateIndex(object):
+    """ KD-tree of the PHPP climate datasets, for nearest-dataset lookups """
+
+    def __init__(self, _climateData):
+        """
+        Args:
+            _climateData (list): The climate dataset dicts, each with 'Latitude' and
+                'Longitude' (Degrees, as numbers or text). Datasets without a valid
+                location are left out.
+        """
+        self.Entries = []
+        self.Points = []
+        for entry in _climateData:
+            try:
+                lat = float(entry.get('Latitude', 0))
+                lon = float(entry.get('Longitude', 0))
+            except (TypeError, ValueError):
+                continue
+            self.Entries.append( (lat, lon, entry) )
+            self.Points.append( unitSpherePoint(lat, lon) )
+
+        self.Tree = self._build(list(range(len(self.Points))), 0)
+
+    def _build(self, _indexes, _depth):
+        """ Returns the tree node (index, axis, left, right) for these points, or None """
+        if not _indexes:
+            return None
+
+        axis = _depth % 3
+        _indexes.sort(key=lambda i: (self.Points[i][axis], i))
+        mid = len(_indexes) // 2
+        return (_indexes[mid], axis,
+                self._build(_indexes[:mid], _depth + 1),
+                self._build(_indexes[mid + 1:], _depth + 1))
+
+    def _search(self, _node, _point, _k, _heap):
+        """ Adds the _k closest points under _node to _heap (a max-heap of (-distSq, -index)) """
+        if _node is None:
+            return
+
+        index, axis, left, right = _node
+        p = self.Points[index]
+        dx, dy, dz = p[0] - _point[0], p[1] - _point[1], p[2] - _point[2]
+        item = (-(dx * dx + dy * dy + dz * dz), -index) # Ties go to the dataset listed first
+
+        if len(_heap) < _k:
+            heapq.heappush(_heap, item)
+        elif item > _heap[0]:
+            heapq.heapreplace(_heap, item)
+
+        diff = _point[axis] - p[axis]
+        near, far = (left, right) if diff < 0 else (right, left)
+        self._search(near, _point, _k, _heap)
+        if len(_heap) < _k or diff * diff <= -_heap[0][0]:
+            self._search(far, _point, _k, _heap)
+
+    def nearest(self, _lat, _long, _k=1):
+        """ Finds the closest climate datasets to a site
+
+        Args:
+            _lat (float): The site latitude (Degrees)
+            _long (float): The site longitude (Degrees)
+            _k (int): How many datasets to return
+        Returns:
+            results (list): [(distanceKm, dataset), ...] the _k closest datasets, closest first
+        """
+        if _k < 1:
+            return []
+
+        heap = []
+        self._search(self.Tree, unitSpherePoint(_lat, _long), _k, heap)
+
+        results = []
+        for negDistSq, negIndex in sorted(heap, reverse=True):
+            lat, lon, entry = self.Entries[-negIndex]
+            results.append( (greatCircleKm(lat, lon, _lat, _long), entry) )
+        return results
+
+    def nearestMany(self, _sites, _k=1):
+        """ Finds the closest climate datasets for a whole list of sites
+
+        Args:
+            _sites (iterable): (latitude, longitude) pairs (Degrees)
+            _k (int): How many datasets to return for each site
+        Returns:
+            results (list): One list of [(distanceKm, dataset), ...] for each site, in order
+        """
+        return [self.nearest(lat, lon, _k) for lat, lon in _sites]
+
+    def __len__(self):
+        return len(self.Entries)
+
+    def __unicode__(self):
+        return u'PHPP Climate Index: {} datasets'.format(len(self.Entries))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _climateData=[...{} datasets] )".format(
+               self.__class__.__name__,
+               len(self.Entries))
@@ -0,0 +1,254 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Plain-Python geometry for the planar polygons in an IDF file.
+
+EnergyPlus surfaces are flat polygons, given as a list of (x, y, z) vertices
+in counter-clockwise order when viewed from the outside. Everything the PHPP
+needs from them (area, centroid, normal, tilt, orientation and the width /
+height of windows) can be worked out directly from the vertices, without
+building any Rhino geometry.
+
+Vectors are plain (x, y, z) tuples. Anything with .X / .Y / .Z attributes
+(ie: a Rhino Vector3d) can be passed in as well.
+
+calcOrientations() works out the azimuth and tilt of every surface in a model
+in one go. It uses NumPy if it is installed, otherwise (ie: IronPython in
+Rhino) it loops over the surfaces in plain Python and gives the same results.
+"""
+
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TOLERANCE = 1e-9
+
+def asTuple(_vec):
+    """ Returns the vector / point as an (x, y, z) tuple """
+    if hasattr(_vec, 'X'):
+        return (_vec.X, _vec.Y, _vec.Z)
+    return tuple(_vec)
+
+def vecLength(_v):
+    return math.sqrt(_v[0] * _v[0] + _v[1] * _v[1] + _v[2] * _v[2])
+
+def vecUnit(_v):
+    length = vecLength(_v)
+    if length < TOLERANCE:
+        return (0.0, 0.0, 0.0)
+    return (_v[0] / length, _v[1] / length, _v[2] / length)
+
+def vecCross(_a, _b):
+    return (_a[1] * _b[2] - _a[2] * _b[1],
+            _a[2] * _b[0] - _a[0] * _b[2],
+            _a[0] * _b[1] - _a[1] * _b[0])
+
+def vecDot(_a, _b):
+    return _a[0] * _b[0] + _a[1] * _b[1] + _a[2] * _b[2]
+
+def newellNormal(_vertices):
+    """ Returns the (not unitized) Newell normal of a polygon
+
+    The length of the vector is twice the polygon's area. This works for any
+    simple polygon, convex or not, and is not thrown off by collinear vertices.
+
+    Args:
+        _vertices (list): The (x, y, z) vertices, in order
+    Returns:
+        normal (tuple): (x, y, z). Points to the side the vertices go counter-clockwise around
+    """
+    nx = ny = nz = 0.0
+    count = len(_vertices)
+    for i in range(count):
+        x1, y1, z1 = _vertices[i]
+        x2, y2, z2 = _vertices[(i + 1) % count]
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return (nx, ny, nz)
+
+def polygonArea(_vertices):
+    """ Returns the area of a planar polygon """
+    return vecLength(newellNormal(_vertices)) / 2.0
+
+def polygonCentroid(_vertices, _unitNormal=None):
+    """ Returns the area centroid of a planar polygon, as an (x, y, z) tuple
+
+    Args:
+        _vertices (list): The (x, y, z) vertices, in order
+        _unitNormal (tuple): <Optional> The polygon's unit normal, if already known
+    Returns:
+        centroid (tuple): (x, y, z). The average of the vertices if the polygon has no area.
+    """
+    if _unitNormal is None:
+        _unitNormal = vecUnit(newellNormal(_vertices))
+
+    # Fan of triangles from the first vertex, weighted by their (signed) area
+    ax, ay, az = _vertices[0]
+    totalWeight = cx = cy = cz = 0.0
+    for i in range(1, len(_vertices) - 1):
+        bx, by, bz = _vertices[i]
+        dx, dy, dz = _vertices[i + 1]
+        cross = vecCross((bx - ax, by - ay, bz - az), (dx - ax, dy - ay, dz - az))
+        weight = vecDot(cross, _unitNormal)
+        totalWeight += weight
+        cx += weight * (ax + bx + dx)
+        cy += weight * (ay + by + dy)
+        cz += weight * (az + bz + dz)
+
+    if abs(totalWeight) < TOLERANCE:
+        count = float(len(_vertices))
+        return (sum(v[0] for v in _vertices) / count,
+                sum(v[1] for v in _vertices) / count,
+                sum(v[2] for v in _vertices) / count)
+
+    totalWeight *= 3.0
+    return (cx / totalWeight, cy / totalWeight, cz / totalWeight)
+
+def tiltFromNormal(_unitNormal):
+    """ Returns the angle off horizontal: 0=facing up, 90=vertical, 180=facing down (Degrees) """
+    z = max(-1.0, min(1.0, _unitNormal[2]))
+    return math.degrees(math.acos(z))
+
+def azimuthFromNormal(_normal, _northVector=(0.0, 1.0, 0.0)):
+    """ Returns the orientation of a surface's normal, off the project's north (Degrees)
+
+    Same as BT_CORE's phpp_calcNorthAngle: 0=north, 90=east, 180=south, 270=west
+
+    Args:
+        _normal (tuple): The surface normal
+        _northVector (tuple): The project's north direction
+    Returns:
+        angle (float): 0 <= angle < 360
+    """
+    north = asTuple(_northVector)
+    angle = math.degrees(math.atan2(north[1], north[0]) - math.atan2(_normal[1], _normal[0]))
+    if angle < 0:
+        angle = angle + 360
+    return angle
+
+def boundingRectangle(_vertices, _unitNormal):
+    """ Returns the (width, height) of the smallest upright rectangle around a planar polygon
+
+    'Width' is measured horizontally in the plane of the polygon and 'height'
+    up the slope of the plane. For horizontal polygons the world X and Y
+    directions are used.
+
+    Args:
+        _vertices (list): The (x, y, z) vertices
+        _unitNormal (tuple): The polygon's unit normal
+    Returns:
+        (width, height) (tuple): Both floats
+    """
+    nx, ny, nz = _unitNormal
+    if math.sqrt(nx * nx + ny * ny) < 1e-6:
+        xAxis = (1.0, 0.0, 0.0)
+        yAxis = (0.0, 1.0, 0.0)
+    else:
+        xAxis = vecUnit((-ny, nx, 0.0)) # Horizontal, in the plane
+        yAxis = vecCross(_unitNormal, xAxis)
+
+    us = [vecDot(v, xAxis) for v in _vertices]
+    vs = [vecDot(v, yAxis) for v in _vertices]
+    return max(us) - min(us), max(vs) - min(vs)
+
+class Polygon3D(object):
+    """ A planar polygon from an IDF surface, with its basic properties computed once """
+    __slots__ = ('Vertices', 'Normal', 'Area', 'Centroid')
+
+    def __init__(self, _vertices):
+        """
+        Args:
+            _vertices (list): The (x, y, z) vertices, in order
+        """
+        self.Vertices = [asTuple(v) for v in _vertices]
+        newell = newellNormal(self.Vertices)
+        self.Area = vecLength(newell) / 2.0
+        self.Normal = vecUnit(newell)
+        self.Centroid = polygonCentroid(self.Vertices, self.Normal)
+
+    def getTilt(self):
+        return tiltFromNormal(self.Normal)
+
+    def getAzimuth(self, _northVector=(0.0, 1.0, 0.0)):
+        return azimuthFromNormal(self.Normal, _northVector)
+
+    def getBoundingRectangle(self):
+        return boundingRectangle(self.Vertices, self.Normal)
+
+    def __unicode__(self):
+        return u'Polygon3D: {} vertices, {:.3f} m2'.format(len(self.Vertices), self.Area)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _vertices={!r} )".format(
+               self.__class__.__name__,
+               self.Vertices)
+
+def _calcOrientationsNumpy(_normals, _northVector):
+    normals = numpy.asarray(_normals, dtype=float).reshape(-1, 3)
+
+    azimuths = numpy.degrees(math.atan2(_northVector[1], _northVector[0]) - numpy.arctan2(normals[:, 1], normals[:, 0]))
+    azimuths[azimuths < 0] += 360
+
+    lengths = numpy.sqrt((normals * normals).sum(axis=1))
+    z = numpy.zeros(len(normals))
+    numpy.divide(normals[:, 2], lengths, out=z, where=lengths >= TOLERANCE)
+    tilts = numpy.degrees(numpy.arccos(numpy.clip(z, -1.0, 1.0)))
+
+    return azimuths.tolist(), tilts.tolist()
+
+def _calcOrientationsPython(_normals, _northVector):
+    azimuths = []
+    tilts = []
+    for normal in _normals:
+        normal = asTuple(normal)
+        azimuths.append( azimuthFromNormal(normal, _northVector) )
+        tilts.append( tiltFromNormal(vecUnit(normal)) )
+    return azimuths, tilts
+
+def calcOrientations(_normals, _northVector=(0.0, 1.0, 0.0), _useNumpy=True):
+    """ Works out the azimuth and tilt for a whole list of surface normals at once
+
+    Args:
+        _normals: The surface normals. An (N, 3) array, or a list of (x, y, z) vectors
+        _northVector (tuple): The project's north direction, ie: IDF_Obj_building.NorthVector
+        _useNumpy (bool): Set False to always use the plain Python version
+    Returns:
+        (azimuths, tilts) (tuple): Two lists of N floats (Degrees), in the same
+            order as the normals. See azimuthFromNormal() and tiltFromNormal()
+    """
+    northVector = asTuple(_northVector)
+    if len(_normals) == 0:
+        return [], []
+
+    if numpy is not None and _useNumpy:
+        if not hasattr(_normals, 'shape'):
+            _normals = [asTuple(n) for n in _normals]
+        return _calcOrientationsNumpy(_normals, northVector)
+
+    return _calcOrientationsPython(_normals, northVector)
@@ -0,0 +1,102 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Lookup of window host surfaces by name.
+
+Windows only know the name of their host surface ('HostSrfc'). Finding the
+host by scanning every zone and surface for each window is O(windows x
+surfaces), so the surfaces are put into a HostSurfaceIndex once per export
+and each window then finds its host's zone, surface object and PHPP UD name
+with a single dict lookup.
+
+The index is built either from the Honeybee zones (fromZones) or, one
+surface at a time with add(), from the surfaces written to the PHPP 'Areas'
+worksheet.
+"""
+
+from collections import namedtuple
+
+HostSurface = namedtuple('HostSurface', ['Name', 'Zone', 'Surface', 'UDName'])
+
+class HostSurfaceIndex(object):
+    """ Host surface name --> HostSurface(Name, Zone, Surface, UDName) """
+
+    def __init__(self):
+        self.Entries = {}
+        self.Order = [] # Names, in the order added, for the partial-name search
+
+    def add(self, _name, _zone=None, _surface=None, _udName=None):
+        """ Adds a surface to the index. A later surface with the same name replaces an earlier one
+
+        Args:
+            _name (str): The surface name, as used by the windows' 'HostSrfc'
+            _zone: <Optional> The surface's zone (a zone object or a zone name)
+            _surface: <Optional> The surface object
+            _udName (str): <Optional> The surface's PHPP 'Areas' UD name, ie: '3-Wall_North'
+        """
+        if _name not in self.Entries:
+            self.Order.append(_name)
+        self.Entries[_name] = HostSurface(_name, _zone, _surface, _udName)
+
+    @classmethod
+    def fromZones(cls, _zones):
+        """ Builds the index from Honeybee zones (anything with a 'surfaces' list of objects with a 'name') """
+        index = cls()
+        for zone in _zones:
+            for surface in zone.surfaces:
+                index.add(surface.name, zone, surface)
+        return index
+
+    def get(self, _hostName, _default=None):
+        """ Returns the HostSurface with exactly this name, or _default """
+        return self.Entries.get(_hostName, _default)
+
+    def findHost(self, _hostName):
+        """ Returns the HostSurface for a window's host name, or None
+
+        Looks for the exact name first. If there is no exact match, falls back
+        to the first surface whose name is part of _hostName (the way the
+        host surfaces used to be matched).
+        """
+        entry = self.Entries.get(_hostName)
+        if entry is not None:
+            return entry
+
+        for name in self.Order:
+            if name in _hostName:
+                return self.Entries[name]
+        return None
+
+    def __contains__(self, _hostName):
+        return _hostName in self.Entries
+
+    def __len__(self):
+        return len(self.Entries)
+
+    def __unicode__(self):
+        return u'Host Surface Index: {} surfaces'.format(len(self.Entries))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}()".format(self.__class__.__name__)
@@ -0,0 +1,252 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+On-disk cache of parsed IDF records.
+
+Grasshopper re-runs the IDF reader on every recompute, even when Honeybee
+didn't touch the in.idf. The parsed records are stored here, zlib-compressed
+marshal data, so an unchanged file can be loaded without tokenizing it again.
+
+Each IDF path gets a small 'stamp' file with the size, mtime and content hash
+seen the last time it was read. If the size and mtime still match, the stored
+hash is trusted. If not, the file is hashed again and, if the content didn't
+actually change, the existing entry is still used.
+
+Set the 'IDF2PHPP_NO_CACHE' environment variable (or pass _useCache=False)
+to always read the IDF directly. If the cache folder can't be written to
+(ie: it is read-only), the IDF is also just read directly.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import zlib
+
+from idf2phpp.idf_reader import IDF_RawRecord
+from idf2phpp.idf_index import IDF_LazyReader
+
+CACHE_FORMAT_VERSION = 2
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+_MAGIC = b'IDF2PHPP'
+_ENTRY_EXT = '.idfc'
+_STAMP_EXT = '.stamp'
+
+def getCacheDir():
+    """ Returns the folder to keep the cache files in (created if needed)
+
+    Uses the 'IDF2PHPP_CACHE_DIR' environment variable if it is set, otherwise
+    the normal per-user cache location for the platform.
+    """
+    cacheDir = os.environ.get('IDF2PHPP_CACHE_DIR')
+    if not cacheDir:
+        if os.name == 'nt':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        cacheDir = os.path.join(base, 'idf2phpp', 'idf_cache')
+
+    if not os.path.isdir(cacheDir):
+        os.makedirs(cacheDir)
+
+    return cacheDir
+
+def cacheEnabled(_useCache=True):
+    return bool(_useCache) and not os.environ.get('IDF2PHPP_NO_CACHE')
+
+def hashFile(_path, _blockSize=1024 * 1024):
+    h = hashlib.sha1()
+    with open(_path, 'rb') as f:
+        while True:
+            block = f.read(_blockSize)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+def _textKey(_text):
+    return hashlib.sha1(_text.encode('utf-8')).hexdigest()
+
+def _selectionKey(_classNames, _classesLike):
+    """ The records stored depend on which classes were read, and by which Python """
+    return _textKey(u'{}|{}|{}|{}|{}'.format(
+        CACHE_FORMAT_VERSION,
+        sys.version_info[:2],
+        sys.platform,
+        u','.join(sorted(_classNames)) if _classNames is not None else u'*',
+        u','.join(sorted(_classesLike))))
+
+def _readStamp(_stampPath):
+    try:
+        with open(_stampPath, 'r') as f:
+            size, mtime, digest = f.read().split()
+        return int(size), mtime, digest
+    except (EnvironmentError, ValueError):
+        return None
+
+def _writeStamp(_stampPath, _size, _mtime, _digest):
+    try:
+        with open(_stampPath, 'w') as f:
+            f.write('{} {} {}'.format(_size, _mtime, _digest))
+    except EnvironmentError:
+        pass # The hash is worked out again next time
+
+def _contentDigest(_path, _cacheDir):
+    """ Returns the content hash of the file, re-hashing only if size or mtime changed """
+    st = os.stat(_path)
+    mtime = repr(st.st_mtime)
+    stampPath = os.path.join(_cacheDir, _textKey(os.path.abspath(_path)) + _STAMP_EXT)
+
+    stamp = _readStamp(stampPath)
+    if stamp and stamp[0] == st.st_size and stamp[1] == mtime:
+        return stamp[2]
+
+    digest = hashFile(_path)
+    _writeStamp(stampPath, st.st_size, mtime, digest)
+    return digest
+
+def dumpRecords(_records):
+    """ Packs a list of IDF_RawRecords into the compact binary cache format """
+    payload = [(r[0], r[1], r[2]) for r in _records]
+    return _MAGIC + zlib.compress(marshal.dumps(payload), 1)
+
+def loadRecords(_data):
+    """ Unpacks records written by dumpRecords(). Returns None if the data isn't valid """
+    if not _data.startswith(_MAGIC):
+        return None
+    try:
+        payload = marshal.loads(zlib.decompress(_data[len(_MAGIC):]))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None
+    return [IDF_RawRecord(nm, fields, comments) for nm, fields, comments in payload]
+
+def evictCache(_cacheDir, _maxBytes=DEFAULT_MAX_CACHE_BYTES):
+    """ Deletes the least-recently used entries until the cache fits in _maxBytes
+
+    The stamp files of any IDF files whose entries are all gone are deleted too.
+    """
+    entries = []
+    stamps = []
+    total = 0
+    for nm in os.listdir(_cacheDir):
+        if nm.endswith(_STAMP_EXT):
+            stamps.append( os.path.join(_cacheDir, nm) )
+        if not nm.endswith(_ENTRY_EXT):
+            continue
+        path = os.path.join(_cacheDir, nm)
+        try:
+            st = os.stat(path)
+        except EnvironmentError:
+            continue
+        entries.append( (st.st_mtime, st.st_size, path) )
+        total += st.st_size
+
+    entries.sort()
+    kept = set()
+    for mtime, size, path in entries:
+        if total > _maxBytes:
+            try:
+                os.remove(path)
+                total -= size
+                continue
+            except EnvironmentError:
+                pass
+        kept.add( os.path.basename(path).split('-', 1)[0] )
+
+    for stampPath in stamps:
+        stamp = _readStamp(stampPath)
+        if stamp is None or stamp[2] not in kept:
+            try:
+                os.remove(stampPath)
+            except EnvironmentError:
+                pass
+
+def _readFromIDF(_path, _classNames, _classesLike):
+    with IDF_LazyReader(_path) as idfReader:
+        if _classNames is None:
+            classesToRead = None
+        else:
+            classesToRead = list(_classNames)
+            for text in _classesLike:
+                classesToRead.extend( idfReader.classNamesLike(text) )
+        return list(idfReader.iterRecords(classesToRead))
+
+def loadIDFRecords(_path, _classNames=None, _classesLike=(), _useCache=True,
+                   _cacheDir=None, _maxCacheBytes=DEFAULT_MAX_CACHE_BYTES):
+    """ Reads the records from an IDF file, using the on-disk cache when the file hasn't changed
+
+    Args:
+        _path (str): The full path to the .idf file
+        _classNames (iterable): The IDF classes to read. None to read every object.
+        _classesLike (iterable): Also read any class whose name contains one of these, ie: ['Construction']
+        _useCache (bool): Set False to skip the cache and always read the IDF file
+        _cacheDir (str): Optional folder to keep the cache in. Default is getCacheDir()
+        _maxCacheBytes (int): The cache is trimmed to this size after a new entry is written
+    Returns:
+        records (list): IDF_RawRecords, in file order
+    """
+    if not cacheEnabled(_useCache):
+        return _readFromIDF(_path, _classNames, _classesLike)
+
+    try:
+        cacheDir = _cacheDir or getCacheDir()
+    except EnvironmentError:
+        return _readFromIDF(_path, _classNames, _classesLike)
+    digest = _contentDigest(_path, cacheDir)
+    entryPath = os.path.join(cacheDir, '{}-{}{}'.format(digest, _selectionKey(_classNames, _classesLike)[:12], _ENTRY_EXT))
+
+    if os.path.exists(entryPath):
+        with open(entryPath, 'rb') as f:
+            records = loadRecords(f.read())
+        if records is not None:
+            os.utime(entryPath, None) # Mark as recently used
+            return records
+
+    records = _readFromIDF(_path, _classNames, _classesLike)
+
+    # Several processes can be reading the same file (see idf2phpp.cli), so
+    # each writes its own temp file. If another one got there first, that
+    # entry is just as good.
+    # A cache which can't be written to (read-only, no permission, disk full)
+    # just means the file is parsed again next time.
+    tempPath = '{}.{}.tmp'.format(entryPath, os.getpid())
+    try:
+        with open(tempPath, 'wb') as f:
+            f.write(dumpRecords(records))
+        if os.path.exists(entryPath):
+            os.remove(entryPath)
+        os.rename(tempPath, entryPath)
+    except EnvironmentError:
+        try:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+        except EnvironmentError:
+            pass
+        return records
+
+    try:
+        evictCache(cacheDir, _maxCacheBytes)
+    except EnvironmentError:
+        pass
+
+    return records
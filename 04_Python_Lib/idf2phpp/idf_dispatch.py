@@ -0,0 +1,105 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Sorts IDF records into groups by their object class, in a single pass.
+
+The conversion code registers a handler for each IDF class it knows about
+(ie: 'Zone' -> IDF_Zone). IDF_Dispatcher.classify() then goes through the
+records once and, with one dict lookup per record, runs the record through
+its class's handler and adds the result to that class's group. Class names
+are matched without regard to case, same as EnergyPlus. Records of classes
+without a handler are skipped, and counted in IDF_Dispatcher.Unmatched so
+the caller can report them.
+
+Plugins can add handlers for other IDF classes, or replace the built-in
+ones, with register().
+"""
+
+# All the 'Construction' classes which have a Name and (optionally) material
+# layers, for registering to the same group as plain 'Construction'.
+CONSTRUCTION_CLASSES = (
+    'Construction',
+    'Construction:InternalSource',
+    'Construction:CfactorUndergroundWall',
+    'Construction:FfactorGroundFloor',
+    'Construction:AirBoundary',
+    'Construction:WindowDataFile',
+    'Construction:WindowEquivalentLayer',
+    'Construction:ComplexFenestrationState',
+)
+
+class IDF_Dispatcher(object):
+    """ A table of IDF class name --> (group name, handler) """
+
+    def __init__(self):
+        self.Handlers = {}
+        self.Unmatched = {}
+
+    def register(self, _className, _groupName, _handler=None):
+        """ Adds (or replaces) the handler for an IDF object class
+
+        Args:
+            _className (str): The IDF class name, ie: 'BuildingSurface:Detailed' (any case)
+            _groupName (str): The group to put the results in, ie: 'opaqueSurfaces'.
+                Several classes can share the same group.
+            _handler (callable): <Optional> Called with each record, its return value is
+                what goes in the group. If None, the record itself is added.
+        """
+        self.Handlers[_className.lower()] = (_groupName, _handler)
+
+    def unregister(self, _className):
+        self.Handlers.pop(_className.lower(), None)
+
+    def classify(self, _records):
+        """ Runs each record through the handler for its class, in one pass
+
+        Args:
+            _records (iterable): IDF records (anything with an 'objName')
+        Returns:
+            groups (dict): {groupName: [handler results, in record order], ...}.
+                Every registered group is included, even if it is empty. The records
+                without a handler are counted in self.Unmatched: {class name: count}
+        """
+        groups = dict((groupName, []) for groupName, handler in self.Handlers.values())
+        handlers = self.Handlers
+        unmatched = self.Unmatched = {}
+
+        for record in _records:
+            objName = getattr(record, 'objName', None) or ''
+            entry = handlers.get(objName.lower())
+            if entry is None:
+                unmatched[objName] = unmatched.get(objName, 0) + 1
+                continue
+
+            groupName, handler = entry
+            groups[groupName].append( handler(record) if handler else record )
+
+        return groups
+
+    def __unicode__(self):
+        return u'IDF Dispatcher: {} IDF classes'.format(len(self.Handlers))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}()".format(self.__class__.__name__)
@@ -0,0 +1,215 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Lazy, indexed access to the objects in an IDF file.
+
+A Honeybee IDF is mostly schedules and output requests, but the IDF->PHPP
+conversion only needs a handful of object classes. IDF_LazyReader maps the
+file into memory, finds where every object starts and ends in a single scan,
+and only tokenizes the objects of the classes that are actually asked for.
+
+Class names are matched without regard to case, the same as EnergyPlus, so
+'MATERIAL,' and 'Material,' are the same class. The index is keyed on the
+upper-case name, the records themselves keep the name as written.
+"""
+
+import re
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+from idf2phpp.idf_reader import iterRecordsFromLines
+
+# The IDF object classes read by the 'IDF-->PHPP Objs' component
+PHPP_IDF_CLASSES = (
+    'Building',
+    'Site:Location',
+    'Zone',
+    'ZoneList',
+    'ZoneInfiltration:DesignFlowRate',
+    'BuildingSurface:Detailed',
+    'FenestrationSurface:Detailed',
+    'Material',
+    'Material:AirGap',
+    'Material:NoMass',
+    'WindowMaterial:SimpleGlazingSystem',
+    'WindowMaterial:Glazing',
+    'WindowMaterial:Gas',
+    'Construction',
+    )
+
+# Whitespace and comment lines, then the class name up to its first terminator
+_reHeader = re.compile(br'(?:\s|![^\n]*)*([^,;!]*)')
+
+def _findObjectEnd(_buffer, _pos):
+    """ Returns the position of the next ';' which is not inside a '!' comment (or -1) """
+    semi = _buffer.find(b';', _pos)
+    while semi != -1:
+        lineStart = _buffer.rfind(b'\n', 0, semi) + 1
+        if _buffer.find(b'!', lineStart, semi) == -1:
+            return semi
+
+        # That one was in a comment, try again from the next line
+        lineEnd = _buffer.find(b'\n', semi)
+        if lineEnd == -1:
+            return -1
+        semi = _buffer.find(b';', lineEnd)
+
+    return -1
+
+def buildOffsetIndex(_buffer):
+    """ Scans the raw bytes of an IDF once and finds where each object is
+
+    Args:
+        _buffer: The file contents (bytes, or an mmap of the file)
+    Returns:
+        index (dict): {'ZONE': [(start, end), ...], ...} with byte offsets for
+            each object, in file order, keyed on the upper-case class name. 'end' is
+            the end of the line with the object's ';'
+    """
+    index = {}
+    size = len(_buffer)
+    pos = 0
+
+    while pos < size:
+        header = _reHeader.match(_buffer, pos)
+        objName = header.group(1).strip()
+        if not objName:
+            # Trailing comments / whitespace, or a stray terminator
+            pos = header.end() + 1
+            continue
+
+        semi = _findObjectEnd(_buffer, header.end())
+        if semi == -1:
+            semi = size # Last object is missing its ';'
+
+        # Keep the rest of the line so the last field gets its '!-' comment
+        end = _buffer.find(b'\n', semi)
+        if end == -1:
+            end = size
+
+        index.setdefault(objName.decode('ascii', 'replace').upper(), []).append( (header.start(1), end) )
+        pos = semi + 1
+
+    return index
+
+class IDF_LazyReader:
+    """ Memory maps an IDF file and decodes its objects on demand """
+
+    def __init__(self, _path, _encoding='utf-8'):
+        """
+        Args:
+            _path (str): The full path to the .idf file
+            _encoding (str): The text encoding of the IDF file
+        """
+        self.Path = _path
+        self.Encoding = _encoding
+        self._file = open(_path, 'rb')
+        self._buffer = self._mapFile(self._file)
+        self._decoded = {}
+        self.Index = buildOffsetIndex(self._buffer)
+
+    @staticmethod
+    def _mapFile(_file):
+        if mmap is not None:
+            try:
+                return mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError):
+                pass # Empty file, or mmap not supported here
+        return _file.read()
+
+    @property
+    def ClassNames(self):
+        """ The (upper-case) class names found in the file """
+        return list(self.Index.keys())
+
+    def count(self, _className):
+        return len(self.Index.get(_className.upper(), []))
+
+    def classNamesLike(self, _text):
+        """ Returns any (upper-case) class names found in the file which contain the text, ie: 'Construction' """
+        text = _text.upper()
+        return [nm for nm in self.Index if text in nm]
+
+    def _decode(self, _start, _end):
+        text = self._buffer[_start:_end].decode(self.Encoding, 'replace')
+        for record in iterRecordsFromLines(text.splitlines()):
+            return record
+
+    def getRecords(self, _className):
+        """ Returns the records for one IDF class, decoding them the first time they are asked for
+
+        Args:
+            _className (str): The IDF object class, ie: 'BuildingSurface:Detailed' (any case)
+        Returns:
+            records (list): IDF_RawRecords, in file order
+        """
+        key = _className.upper()
+        if key not in self._decoded:
+            self._decoded[key] = [self._decode(s, e) for s, e in self.Index.get(key, [])]
+        return self._decoded[key]
+
+    def iterRecords(self, _classNames=None):
+        """ Yields the records for the given classes, in the order they appear in the file
+
+        Args:
+            _classNames (iterable): The IDF classes to include (any case). None for all of them.
+        Yields:
+            record (IDF_RawRecord): Each matching record
+        """
+        if _classNames is None:
+            _classNames = self.Index.keys()
+
+        tagged = []
+        for nm in set(nm.upper() for nm in _classNames):
+            for (start, end), record in zip(self.Index.get(nm, []), self.getRecords(nm)):
+                tagged.append( (start, record) )
+        tagged.sort(key=lambda x: x[0])
+
+        for start, record in tagged:
+            yield record
+
+    def close(self):
+        if mmap is not None and isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b''
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __unicode__(self):
+        return u'IDF Lazy Reader: {} ({} object classes)'.format(self.Path, len(self.Index))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _path={!r}, _encoding={!r} )".format(
+               self.__class__.__name__,
+               self.Path,
+               self.Encoding)
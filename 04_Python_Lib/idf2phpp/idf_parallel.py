@@ -0,0 +1,164 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Parallel parsing for very large IDF files.
+
+The file is split into byte ranges that each start and end between two
+objects. Each range is then tokenized in its own process with the normal
+serial tokenizer (idf_reader.iterRecordsFromLines), and the results are put
+back together in file order. The records are the same as
+list(iterIDFRecords(path)).
+
+This needs the 'multiprocessing' module, so it is for use from a normal
+Python interpreter (ie: the command line tools). IronPython inside Rhino
+doesn't have it, and parseIDFParallel() then just reads the file serially.
+Small files are also read serially, since starting the worker processes
+takes longer than parsing them.
+"""
+
+import io
+import marshal
+import os
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+from idf2phpp.idf_reader import IDF_RawRecord, iterIDFRecords, iterRecordsFromLines
+from idf2phpp.idf_index import _findObjectEnd
+
+DEFAULT_MIN_CHUNK_BYTES = 1024 * 1024
+
+def _isCleanBreak(_buffer, _semi):
+    """ True if nothing but whitespace / a comment follows the ';' on its line """
+    lineEnd = _buffer.find(b'\n', _semi)
+    if lineEnd == -1:
+        lineEnd = len(_buffer)
+    code = _buffer[_semi + 1:lineEnd].split(b'!', 1)[0]
+    return not code.strip()
+
+def findChunkBoundaries(_buffer, _numChunks):
+    """ Splits the file contents into byte ranges which each hold only whole objects
+
+    Each range starts at the beginning of a line, right after the line with
+    an object's ';' terminator, so a range can be tokenized on its own.
+
+    Args:
+        _buffer (bytes): The raw file contents
+        _numChunks (int): The number of ranges wanted. Fewer may be returned
+    Returns:
+        ranges (list): [(start, end), ...] byte offsets, in file order, covering the whole file
+    """
+    size = len(_buffer)
+    boundaries = [0]
+
+    for i in range(1, _numChunks):
+        pos = max(size * i // _numChunks, boundaries[-1])
+        while pos < size:
+            semi = _findObjectEnd(_buffer, pos)
+            if semi == -1:
+                pos = size
+                break
+
+            lineEnd = _buffer.find(b'\n', semi)
+            if lineEnd == -1:
+                pos = size
+                break
+
+            if _isCleanBreak(_buffer, semi):
+                pos = lineEnd + 1
+                break
+            pos = lineEnd # Another object starts on the same line, keep looking
+
+        if pos >= size:
+            break
+        if pos > boundaries[-1]:
+            boundaries.append(pos)
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def parseChunk(_args):
+    """ Tokenizes one byte range of an IDF file. Runs in the worker processes
+
+    Args:
+        _args (tuple): (path, start, end, encoding, classNames). classNames is
+            a set of the classes to keep, or None to keep them all
+    Returns:
+        records (bytes): The (objName, fields, comments) tuples, in file order,
+            packed with marshal. That is much quicker to send back to the main
+            process than pickling the records.
+    """
+    path, start, end, encoding, classNames = _args
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding, 'replace')
+    text = io.StringIO(text, newline=None).read() # Same newline handling as io.open() in the serial reader
+
+    records = []
+    for record in iterRecordsFromLines(text.split(u'\n')):
+        if classNames is None or record[0] in classNames:
+            records.append( (record[0], record[1], record[2]) )
+    return marshal.dumps(records)
+
+def parseIDFParallel(_path, _classNames=None, _workers=None, _encoding='utf-8',
+                     _minChunkBytes=DEFAULT_MIN_CHUNK_BYTES):
+    """ Reads an IDF file using several processes. Gives the same records as the serial reader
+
+    Args:
+        _path (str): The full path to the .idf file
+        _classNames (iterable): <Optional> Only keep the objects of these classes. Default is all of them.
+        _workers (int): <Optional> The number of processes to use. Default is the number of CPUs
+        _encoding (str): The text encoding of the IDF file
+        _minChunkBytes (int): Files are only split into chunks at least this big
+    Returns:
+        records (list): IDF_RawRecords, in file order
+    """
+    classNames = set(_classNames) if _classNames is not None else None
+
+    workers = _workers
+    if workers is None:
+        workers = multiprocessing.cpu_count() if multiprocessing else 1
+    workers = min(workers, os.path.getsize(_path) // max(_minChunkBytes, 1))
+
+    if multiprocessing is None or workers < 2:
+        return [record for record in iterIDFRecords(_path, _encoding=_encoding)
+                if classNames is None or record[0] in classNames]
+
+    with open(_path, 'rb') as f:
+        buffer = f.read()
+    ranges = findChunkBoundaries(buffer, workers * 2) # A few extra chunks, to even out the load
+    del buffer
+
+    jobs = [(_path, start, end, _encoding, classNames) for start, end in ranges]
+    pool = multiprocessing.Pool(workers)
+    try:
+        results = pool.map(parseChunk, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+    records = []
+    for chunkRecords in results:
+        records.extend( IDF_RawRecord(nm, fields, comments) for nm, fields, comments in marshal.loads(chunkRecords) )
+    return records
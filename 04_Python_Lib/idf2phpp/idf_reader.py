@@ -0,0 +1,202 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Streaming reader for EnergyPlus IDF files.
+
+The IDF grammar is simple: an object is a class name followed by its fields,
+each field ended by a ',' and the last one ended by a ';'. Anything after a
+'!' is a comment. The '!- ' comments are the field descriptions that
+Honeybee / OpenStudio write next to each value. Several fields can share a
+single line (and a single comment), for instance the 'X,Y,Z Vertex' lines.
+"""
+
+import io
+import re
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_reTerminators = re.compile(r'([,;])')
+
+class IDF_RawRecord(tuple):
+    """ One IDF object as it was found in the file: (objName, fields, comments)
+
+    'comments' is the same length as 'fields'. Each entry is the '!-' field
+    description found on the line where that field was terminated (or None).
+    Fields that shared a line also share the same comment.
+    """
+    __slots__ = ()
+
+    def __new__(cls, _objName, _fields, _comments):
+        return tuple.__new__(cls, (_objName, _fields, _comments))
+
+    @property
+    def objName(self):
+        return self[0]
+
+    @property
+    def fields(self):
+        return self[1]
+
+    @property
+    def comments(self):
+        return self[2]
+
+    def __repr__(self):
+        return "{}( _objName={!r}, _fields={!r}, _comments={!r} )".format(
+               self.__class__.__name__,
+               self[0],
+               self[1],
+               self[2])
+
+def iterLines(_file, _chunkSize=DEFAULT_CHUNK_SIZE):
+    """ Reads an open (text) file in fixed size chunks and yields it line by line
+
+    Args:
+        _file: An open, text-mode file-like object
+        _chunkSize (int): The number of characters to read per chunk
+    Yields:
+        line (str): Each line, without the line-ending
+    """
+    remainder = u''
+    while True:
+        chunk = _file.read(_chunkSize)
+        if not chunk:
+            break
+
+        lines = (remainder + chunk).split(u'\n')
+        remainder = lines.pop()
+        for line in lines:
+            yield line
+
+    if remainder:
+        yield remainder
+
+def iterRecordsFromLines(_lines):
+    """ The actual IDF tokenizer. Takes in lines of IDF text and yields each object
+
+    Args:
+        _lines (iterable): The lines of an IDF file
+    Yields:
+        record (IDF_RawRecord): One record for each IDF object found
+    """
+    objName = None
+    fields = []
+    comments = []
+    pending = u'' # Any text found before a terminator, if a field runs over a line break
+
+    for line in _lines:
+        code, bang, comment = line.partition(u'!')
+        if not code.strip():
+            continue # Blank or comment-only line
+
+        if bang and comment.startswith(u'-'):
+            comment = comment[1:].strip()
+        else:
+            comment = None
+
+        tokens = _reTerminators.split(code)
+        # split() with a capture group gives [text, sep, text, sep, ..., text]
+        for i in range(0, len(tokens) - 1, 2):
+            value = (pending + tokens[i]).strip()
+            pending = u''
+
+            if objName is None:
+                objName = value
+            else:
+                fields.append(value)
+                comments.append(comment)
+
+            if tokens[i + 1] == u';':
+                yield IDF_RawRecord(objName, fields, comments)
+                objName = None
+                fields = []
+                comments = []
+
+        leftover = tokens[-1].strip()
+        if leftover:
+            pending += leftover + u' '
+
+    if objName is not None:
+        # File ended without the final ';'
+        if pending.strip():
+            fields.append(pending.strip())
+            comments.append(None)
+        yield IDF_RawRecord(objName, fields, comments)
+
+def iterIDFRecords(_source, _chunkSize=DEFAULT_CHUNK_SIZE, _encoding='utf-8'):
+    """ Reads an IDF file once, in chunks, and yields each object found.
+
+    Args:
+        _source: Either the path to the .idf file, or an already open text file-like object
+        _chunkSize (int): The number of characters to read from disk at a time
+        _encoding (str): The text encoding of the IDF file
+    Yields:
+        record (IDF_RawRecord): One record for each IDF object, in file order
+    """
+    if hasattr(_source, 'read'):
+        for record in iterRecordsFromLines(iterLines(_source, _chunkSize)):
+            yield record
+        return
+
+    with io.open(_source, 'r', encoding=_encoding, errors='replace') as f:
+        for record in iterRecordsFromLines(iterLines(f, _chunkSize)):
+            yield record
+
+def legacyKey(_comment):
+    """ The original reader used the '!-' comment, with any ',' or ';' removed, as the key """
+    return _comment.replace(u',', u'').replace(u';', u'').rstrip()
+
+def legacyAttrDict(_record):
+    """ Builds the {key: value} dict the original 'IDF_Class' objects were built from
+
+    Fields that were written on the same line (ie: 'X,Y,Z Vertex 1 {m}') are
+    joined into a single space separated value, the same as the old line-based
+    reader did, so the existing consumers in BT_CORE keep working.
+
+    Args:
+        _record (IDF_RawRecord): The record to convert
+    Returns:
+        attrs (dict): {'Name': 'Zone 1', 'XYZ Vertex 1 {m}': '0 0 3', ...}
+    """
+    attrs = {}
+    prevComment = None
+    values = []
+
+    def _addEntry(_comment, _values, _i):
+        key = legacyKey(_comment) if _comment else u'Field {}'.format(_i)
+        attrs[key] = u' '.join(_values)
+
+    for i, (value, comment) in enumerate(zip(_record[1], _record[2])):
+        if values and comment is not None and comment == prevComment:
+            values.append(value)
+            continue
+
+        if values:
+            _addEntry(prevComment, values, i)
+
+        values = [value]
+        prevComment = comment
+
+    if values:
+        _addEntry(prevComment, values, len(_record[1]))
+
+    return attrs
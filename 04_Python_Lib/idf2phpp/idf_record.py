@@ -0,0 +1,194 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The IDF object passed from the 'Read IDF File' component to 'IDF-->PHPP Objs'.
+
+An IDF_Record keeps the field values in a tuple, in IDF order, and shares a
+single IDF_ClassSchema with every other record of the same class to find
+fields by name. There is no per-object __dict__.
+
+For the existing code, fields can still be read with getattr() using their
+'!-' description, ie: getattr(record, 'North Axis {deg}'). The units and
+case are ignored when matching names.
+
+Records built with fromRaw() have their values decoded once, using the IDD
+schema (see idf2phpp.idf_schema): numbers are floats / ints, blanks have
+their IDD default, and so on. Code using the records shouldn't need to
+call float() on them.
+"""
+
+from idf2phpp.idf_schema import getSchema
+
+class IDF_Record(object):
+    """ One IDF object: its class name and its field values, by position """
+    __slots__ = ('objName', 'Fields', 'Schema')
+
+    def __init__(self, _objName, _fields, _schema=None):
+        """
+        Args:
+            _objName (str): The IDF object class, ie: 'BuildingSurface:Detailed'
+            _fields (iterable): The field values, in IDF order
+            _schema (IDF_ClassSchema): <Optional> The field layout. Default is getSchema(_objName)
+        """
+        self.objName = _objName
+        self.Fields = tuple(_fields)
+        self.Schema = _schema or getSchema(_objName)
+
+    @classmethod
+    def fromRaw(cls, _rawRecord, _decode=True, _version=None):
+        """ Builds the record from an IDF_RawRecord from the reader
+
+        The record's '!-' comments (or the _version, if it has none) pick
+        the field layout, so files from newer EnergyPlus versions than the
+        IDD are decoded with the right field at each position.
+
+        Args:
+            _rawRecord (IDF_RawRecord): The record, as read from the file
+            _decode (bool): Set False to keep the values as the text found in the file
+            _version (str): <Optional> The file's EnergyPlus 'Version', ie: '9.1'
+        Returns:
+            record (IDF_Record): The new record
+        """
+        objName, fields, comments = _rawRecord
+        schema = getSchema(objName, comments, _version)
+        if _decode:
+            fields = schema.decode(fields)
+        return cls(objName, fields, schema)
+
+    @property
+    def Name(self):
+        return self.Fields[0] if self.Fields else u''
+
+    def index(self, _fieldName):
+        """ Returns the position of the named field in this record, or None if it doesn't have one """
+        i = self.Schema.indexOf(_fieldName)
+        if i is None or i >= len(self.Fields):
+            return None
+        return i
+
+    def get(self, _fieldName, _default=None):
+        """ Returns the value of the named field, ie: record.get('Construction Name') """
+        i = self.index(_fieldName)
+        return _default if i is None else self.Fields[i]
+
+    def __getitem__(self, _key):
+        if isinstance(_key, (int, slice)):
+            return self.Fields[_key]
+
+        i = self.index(_key)
+        if i is None:
+            raise KeyError(_key)
+        return self.Fields[i]
+
+    def __getattr__(self, _attrName):
+        # Only called when the normal lookup fails. Lets the older
+        # getattr(obj, '!- comment text') style keep working.
+        if _attrName.startswith('__') or _attrName in IDF_Record.__slots__:
+            raise AttributeError(_attrName)
+
+        i = self.index(_attrName)
+        if i is None:
+            raise AttributeError("'{}' object has no field '{}'".format(self.objName, _attrName))
+        return self.Fields[i]
+
+    def __len__(self):
+        return len(self.Fields)
+
+    def items(self):
+        """ Returns a list of (fieldName, value) pairs, in IDF order """
+        return [(self.Schema.fieldName(i), v) for i, v in enumerate(self.Fields)]
+
+    def getGroup(self, _firstFieldName, _size=1):
+        """ Returns the values of a repeated group of fields, from the named field to the end
+
+        Groups with all blank (or None) values are left out.
+
+        Args:
+            _firstFieldName (str): The first field of the group, ie: 'Zone 1 Name'
+            _size (int): The number of fields in each group, ie: 3 for X,Y,Z vertices
+        Returns:
+            values (list): The values if _size is 1, otherwise a tuple of values for each group
+        """
+        start = self.index(_firstFieldName)
+        if start is None:
+            return []
+
+        values = self.Fields[start:]
+        if _size == 1:
+            return [v for v in values if v != u'' and v is not None]
+
+        groups = []
+        for i in range(0, len(values) - _size + 1, _size):
+            group = values[i:i + _size]
+            if any(v != u'' and v is not None for v in group):
+                groups.append(group)
+        return groups
+
+    def getVertices(self):
+        """ Returns the surface's vertices as a list of (x, y, z) float tuples, in order """
+        return [(float(x), float(y), float(z)) for x, y, z in self.getGroup('Vertex 1 X-coordinate', 3)]
+
+    def getLayers(self):
+        """ Returns a Construction's layers as a list of (fieldName, materialName), outside to inside """
+        start = self.index('Outside Layer')
+        if start is None:
+            return []
+
+        return [(self.Schema.fieldName(i), v) for i, v in enumerate(self.Fields[start:], start) if v != u'']
+
+    def withVertices(self, _vertices, _name=None):
+        """ Returns a copy of the record with new vertices (and optionally a new name)
+
+        Args:
+            _vertices (list): The new (x, y, z) vertices, in order
+            _name (str): <Optional> A new name for the copy
+        Returns:
+            record (IDF_Record): The new record. This record is not changed.
+        """
+        start = self.index('Vertex 1 X-coordinate')
+        if start is None:
+            raise ValueError("'{}' objects don't have vertices".format(self.objName))
+
+        fields = list(self.Fields[:start])
+        for vertex in _vertices:
+            fields.extend( float(v) for v in vertex )
+
+        if _name is not None:
+            fields[0] = _name
+
+        numOfVerts = self.index('Number of Vertices')
+        if numOfVerts is not None:
+            fields[numOfVerts] = len(_vertices)
+
+        return IDF_Record(self.objName, fields, self.Schema)
+
+    def __unicode__(self):
+        return u'IDF Object: {} [{}]'.format(self.objName, self.Name)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _objName={!r}, _fields={!r} )".format(
+               self.__class__.__name__,
+               self.objName,
+               self.Fields)
@@ -0,0 +1,453 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Field layouts for the IDF object classes, read from an EnergyPlus IDD file.
+
+The project ships a subset of the Energy+.idd with just the object classes
+the IDF->PHPP conversion uses ('data/Energy+_PHPP.idd'). Each class gets an
+IDF_ClassSchema with its field names in order, so a record's values can be
+found by position instead of by searching its '!-' comments.
+
+The IDD is from EnergyPlus 8.9, and later versions have dropped some fields
+(ie: 'Shading Control Name' is gone from 9.x FenestrationSurface:Detailed).
+So a record's '!-' comments are still checked against the IDD: if a comment
+names an IDD field at a different position, the schema is re-aligned to the
+comments (see alignToComments). Records without comments use the IDF
+'Version' instead, where the caller passes it in.
+
+Classes which aren't in the IDD get a schema built from the '!-' comments of
+the first record of that class found.
+
+The schema also has a converter for each field, built once per class from
+the IDD '\type', '\key', '\default' and '\autosizable' / '\autocalculatable'
+properties. IDF_ClassSchema.decode() uses these to turn a record's text into
+typed values when the file is read:
+    - Numeric fields become float (or int for 'integer' fields)
+    - 'Autosize' / 'Autocalculate' become the AUTOSIZE / AUTOCALCULATE constants
+    - 'choice' fields use the IDD spelling of the key, ie: 'outdoors' -> 'Outdoors'
+    - Blank fields get the IDD default, or None for numeric fields without one
+Values which don't match the IDD are left as they were found.
+"""
+
+import io
+import os
+import re
+
+DEFAULT_IDD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'Energy+_PHPP.idd')
+
+_reFieldLine = re.compile(r'^([AN])(\d+)\s*([,;])(.*)$')
+_reUnits = re.compile(r'\{.*?\}')
+_reFirstNumber = re.compile(r'\d+')
+
+AUTOSIZE = u'Autosize'
+AUTOCALCULATE = u'Autocalculate'
+
+def normFieldName(_name):
+    """ Field names are matched without units or case, ie: 'North Axis {deg}' -> 'north axis' """
+    return u' '.join(_reUnits.sub(u'', _name).lower().split())
+
+def _noConversion(_value):
+    return _value
+
+def makeConverter(_field):
+    """ Builds the function used to decode the text values of one field
+
+    Args:
+        _field (IDD_Field): The field definition from the IDD
+    Returns:
+        converter (function): Takes in the text value and returns the typed value
+    """
+    props = _field.Props
+
+    if _field.IsNumeric:
+        isInteger = props.get('type') == 'integer'
+        special = {}
+        if 'autosizable' in props:
+            special[u'autosize'] = AUTOSIZE
+        if 'autocalculatable' in props:
+            special[u'autocalculate'] = AUTOCALCULATE
+
+        def _toNumber(_value):
+            try:
+                number = float(_value)
+            except ValueError:
+                return special.get(_value.lower(), _value)
+            if isInteger and number.is_integer():
+                return int(number)
+            return number
+
+        blank = _toNumber(props['default']) if 'default' in props else None
+
+        def _convertNumeric(_value):
+            if _value == u'' or _value is None:
+                return blank
+            if not isinstance(_value, (str, type(u''))):
+                return _value # Already decoded
+            return _toNumber(_value)
+        return _convertNumeric
+
+    keys = dict((k.lower(), k) for k in _field.Keys)
+    default = props.get('default')
+    if not keys and default is None:
+        return _noConversion
+
+    blank = keys.get(default.lower(), default) if default is not None else u''
+
+    def _convertAlpha(_value):
+        if _value == u'':
+            return blank
+        return keys.get(_value.lower(), _value)
+    return _convertAlpha
+
+class IDD_Field(object):
+    """ One field definition from the IDD: its name and its '\\' properties """
+    __slots__ = ('Name', 'Code', 'Props', 'Keys')
+
+    def __init__(self, _name, _code):
+        self.Name = _name
+        self.Code = _code  # 'A1', 'N3', etc...
+        self.Props = {}    # {'type': 'real', 'units': 'm', ...}
+        self.Keys = []     # The allowed values for a 'choice' field
+
+    @property
+    def IsNumeric(self):
+        return self.Code.startswith('N')
+
+    def __repr__(self):
+        return "{}( _name={!r}, _code={!r} )".format(
+               self.__class__.__name__,
+               self.Name,
+               self.Code)
+
+class IDF_ClassSchema(object):
+    """ The field layout of one IDF object class """
+
+    def __init__(self, _className, _fields, _extensibleSize=0, _extensibleStart=None):
+        """
+        Args:
+            _className (str): The IDF object class, ie: 'BuildingSurface:Detailed'
+            _fields (list): IDD_Field objects, in order (not including the class name)
+            _extensibleSize (int): The number of fields in each repeated group (0 if none)
+            _extensibleStart (int): The index of the first field of the repeated group
+        """
+        self.ClassName = _className
+        self.Fields = _fields
+        self.ExtensibleSize = _extensibleSize
+        self.ExtensibleStart = _extensibleStart
+
+        self.FieldIndex = {}
+        for i, field in enumerate(_fields):
+            self.FieldIndex.setdefault(normFieldName(field.Name), i)
+
+        self.Converters = [makeConverter(field) for field in _fields]
+
+    @classmethod
+    def fromComments(cls, _className, _comments):
+        """ Builds a schema from one record's '!-' comments, for classes not in the IDD """
+        fields = []
+        for i, comment in enumerate(_comments):
+            name = comment.replace(u',', u'').replace(u';', u'').strip() if comment else u'Field {}'.format(i + 1)
+            fields.append( IDD_Field(name, '') )
+        return cls(_className, fields)
+
+    def indexOf(self, _fieldName):
+        """ Returns the position of the named field (or None)
+
+        Fields in a repeated group past the ones listed in the IDD can be
+        found as well, ie: 'Vertex 12 X-coordinate' or 'Zone 30 Name'
+        """
+        key = normFieldName(_fieldName)
+        i = self.FieldIndex.get(key)
+        if i is not None or not self.ExtensibleSize:
+            return i
+
+        match = _reFirstNumber.search(key)
+        if not match:
+            return None
+
+        i = self.FieldIndex.get(key[:match.start()] + u'1' + key[match.end():])
+        if i is None or i < self.ExtensibleStart:
+            return None
+
+        return i + (int(match.group()) - 1) * self.ExtensibleSize
+
+    def fieldName(self, _i):
+        """ Returns the name of the field at position _i """
+        if _i < len(self.Fields):
+            return self.Fields[_i].Name
+
+        if self.ExtensibleSize and _i >= self.ExtensibleStart:
+            group, offset = divmod(_i - self.ExtensibleStart, self.ExtensibleSize)
+            name = self.Fields[self.ExtensibleStart + offset].Name
+            return _reFirstNumber.sub(str(group + 1), name, 1)
+
+        return u'Field {}'.format(_i + 1)
+
+    def fieldDef(self, _i):
+        """ Returns the IDD_Field for position _i (the group's field for repeated groups), or None """
+        if _i < len(self.Fields):
+            return self.Fields[_i]
+
+        if self.ExtensibleSize and _i >= self.ExtensibleStart:
+            return self.Fields[self.ExtensibleStart + (_i - self.ExtensibleStart) % self.ExtensibleSize]
+
+        return None
+
+    def decode(self, _values):
+        """ Converts a record's text values to typed values, using each field's converter
+
+        Args:
+            _values (iterable): The text field values, in IDF order
+        Returns:
+            values (tuple): The decoded values
+        """
+        converters = self.Converters
+        numConverters = len(converters)
+        start, size = self.ExtensibleStart, self.ExtensibleSize
+
+        decoded = []
+        for i, value in enumerate(_values):
+            if i < numConverters:
+                decoded.append( converters[i](value) )
+            elif size:
+                decoded.append( converters[start + (i - start) % size](value) )
+            else:
+                decoded.append( value )
+        return tuple(decoded)
+
+    def __unicode__(self):
+        return u'IDF Class Schema: {} ({} fields)'.format(self.ClassName, len(self.Fields))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _className={!r}, _fields={!r}, _extensibleSize={!r}, _extensibleStart={!r} )".format(
+               self.__class__.__name__,
+               self.ClassName,
+               self.Fields,
+               self.ExtensibleSize,
+               self.ExtensibleStart)
+
+def parseIDD(_lines):
+    """ Reads the object class definitions from the lines of an IDD file
+
+    Args:
+        _lines (iterable): The lines of an Energy+.idd file (or a subset of one)
+    Returns:
+        schemas (dict): {'buildingsurface:detailed': IDF_ClassSchema, ...} keyed
+            by the lower-case class name, since IDF class names are not case sensitive
+    """
+    schemas = {}
+    className = None
+    fields = []
+    extensibleSize = 0
+    extensibleStart = None
+
+    def _addClass():
+        if className:
+            schemas[className.lower()] = IDF_ClassSchema(className, fields, extensibleSize, extensibleStart)
+
+    for line in _lines:
+        line = line.strip()
+        if not line or line.startswith(u'!'):
+            continue
+
+        if line.startswith(u'\\'):
+            prop, _, value = line[1:].partition(u' ')
+            value = value.strip()
+
+            if prop.startswith(u'extensible:'):
+                extensibleSize = int(prop.split(u':')[1])
+            elif not fields or prop in (u'group', u'memo'):
+                continue # Class level properties
+            elif prop == u'begin-extensible':
+                extensibleStart = len(fields) - 1
+            elif prop == u'key':
+                fields[-1].Keys.append(value)
+            else:
+                fields[-1].Props[prop] = value if value else True
+            continue
+
+        fieldMatch = _reFieldLine.match(line)
+        if fieldMatch:
+            code, rest = fieldMatch.group(1) + fieldMatch.group(2), fieldMatch.group(4).strip()
+            if rest.startswith(u'\\field'):
+                fields.append( IDD_Field(rest[len(u'\\field'):].strip(), code) )
+            else:
+                fields.append( IDD_Field(u'Field {}'.format(len(fields) + 1), code) )
+            continue
+
+        # A new class definition: 'BuildingSurface:Detailed,'
+        _addClass()
+        className = re.split(r'[,;]', line, 1)[0].strip()
+        fields = []
+        extensibleSize = 0
+        extensibleStart = None
+
+    _addClass()
+
+    return schemas
+
+def _commentName(_comment):
+    return normFieldName(_comment.replace(u',', u'').replace(u';', u'')) if _comment else u''
+
+def matchesComments(_schema, _comments):
+    """ Returns False if any of the '!-' comments names a schema field at a different position
+
+    Comments which aren't a field name (ie: 'X,Y,Z Vertex 1 {m}') are ignored.
+    """
+    fieldIndex = _schema.FieldIndex
+    for i, comment in enumerate(_comments):
+        j = fieldIndex.get(_commentName(comment))
+        if j is not None and j != i:
+            return False
+    return True
+
+def alignToComments(_schema, _comments):
+    """ Returns a copy of the schema with its fields moved to where the '!-' comments put them
+
+    For files from a newer EnergyPlus than the IDD, which has dropped (or
+    added) fields. Comments which name an IDD field use that field's
+    definition. The others keep following on from the last one found, or get
+    an unconverted field named after the comment if the IDD field they'd line
+    up with is named by a later comment (ie: one the IDD doesn't have).
+
+    Args:
+        _schema (IDF_ClassSchema): The IDD schema for the class
+        _comments (list): A record's '!-' comments, one per field
+    Returns:
+        schema (IDF_ClassSchema): The re-aligned schema
+    """
+    fieldIndex = _schema.FieldIndex
+    names = [_commentName(c) for c in _comments]
+    named = set(n for n in names if n in fieldIndex)
+    extensibleStart = _schema.ExtensibleStart if _schema.ExtensibleSize else None
+
+    fields = []
+    j = 0
+    for i, name in enumerate(names):
+        if extensibleStart is not None and j >= extensibleStart:
+            break
+
+        k = fieldIndex.get(name)
+        if k is not None:
+            if extensibleStart is not None and k >= extensibleStart:
+                break
+            j = k
+        else:
+            field = _schema.fieldDef(j)
+            if field is None or normFieldName(field.Name) in named:
+                label = _comments[i].replace(u',', u'').replace(u';', u'').strip() if _comments[i] else u'Field {}'.format(i + 1)
+                fields.append( IDD_Field(label, '') )
+                continue
+        fields.append( _schema.fieldDef(j) )
+        j += 1
+
+    if extensibleStart is None:
+        fields.extend( _schema.Fields[j:] )
+        return IDF_ClassSchema(_schema.ClassName, fields)
+
+    fields.extend( _schema.Fields[j:extensibleStart] )
+    start = len(fields)
+    return IDF_ClassSchema(_schema.ClassName, fields + _schema.Fields[extensibleStart:],
+                           _schema.ExtensibleSize, start)
+
+# Fields dropped from the IDD classes in later EnergyPlus versions, for files without '!-' comments
+_REMOVED_FIELDS = {
+    'fenestrationsurface:detailed': [((9, 0), u'Shading Control Name')],
+}
+
+def parseVersion(_version):
+    """ Returns an IDF 'Version' string as a tuple of ints, ie: '9.1.0' -> (9, 1, 0) (or None) """
+    try:
+        return tuple(int(part) for part in str(_version).strip().split(u'.') if part)
+    except (TypeError, ValueError):
+        return None
+
+def schemaForVersion(_schema, _version):
+    """ Returns the schema without the fields the EnergyPlus _version no longer has """
+    version = parseVersion(_version)
+    removed = set(normFieldName(name) for since, name in _REMOVED_FIELDS.get(_schema.ClassName.lower(), [])
+                  if version and version >= since)
+    if not removed:
+        return _schema
+
+    keep = [i for i, field in enumerate(_schema.Fields) if normFieldName(field.Name) not in removed]
+    start = _schema.ExtensibleStart
+    if _schema.ExtensibleSize:
+        start -= sum(1 for i in range(start) if i not in keep)
+    return IDF_ClassSchema(_schema.ClassName, [_schema.Fields[i] for i in keep], _schema.ExtensibleSize, start)
+
+def loadIDD(_path=DEFAULT_IDD_PATH):
+    """ Reads an IDD file and returns the {className: IDF_ClassSchema} dict (see parseIDD) """
+    with io.open(_path, 'r', encoding='latin-1') as f:
+        return parseIDD(f)
+
+_SCHEMAS = None
+_ALIGNED = {}
+
+def getSchema(_className, _comments=None, _version=None):
+    """ Returns the IDF_ClassSchema for an IDF class. Each schema is only built once
+
+    The shipped IDD subset is read the first time this is called. Classes not
+    in the IDD use the _comments of the first record seen (see
+    IDF_ClassSchema.fromComments), or have no named fields if there are none.
+
+    For classes in the IDD, the _comments are checked against it and a
+    re-aligned schema is used if they don't match (see alignToComments).
+    Without comments, the fields a newer _version has dropped are left out.
+
+    Args:
+        _className (str): The IDF object class, ie: 'Construction'
+        _comments (list): <Optional> A record's '!-' comments, one per field
+        _version (str): <Optional> The file's EnergyPlus 'Version', ie: '9.1'
+    Returns:
+        schema (IDF_ClassSchema): The field layout for the class
+    """
+    global _SCHEMAS
+    if _SCHEMAS is None:
+        _SCHEMAS = loadIDD()
+
+    key = _className.lower()
+    schema = _SCHEMAS.get(key)
+    if schema is None:
+        schema = IDF_ClassSchema.fromComments(_className, _comments or [])
+        _SCHEMAS[key] = schema
+        return schema
+
+    hasComments = _comments and any(_comments)
+    if not hasComments and not _version:
+        return schema
+
+    alignedKey = (key, tuple(_comments)) if hasComments else (key, parseVersion(_version))
+    aligned = _ALIGNED.get(alignedKey)
+    if aligned is None:
+        if not hasComments:
+            aligned = schemaForVersion(schema, _version)
+        elif matchesComments(schema, _comments):
+            aligned = schema
+        else:
+            aligned = alignToComments(schema, _comments)
+        _ALIGNED[alignedKey] = aligned
+
+    return aligned
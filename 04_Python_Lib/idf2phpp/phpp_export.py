@@ -0,0 +1,520 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Headless IDF --> PHPP conversion: the cell values for the PHPP worksheets.
+
+This is the part of the 'IDF-->PHPP Objs' and 'Create Excel Obj - Geom'
+components which only needs the IDF file, redone without Rhino or Honeybee
+so it can run from the command line (see idf2phpp.cli). It gives the same
+cells as the components for:
+    - 'U-Values': the opaque constructions and their material layers
+    - 'Components': the window glass and frame types
+    - 'Areas': the exposed opaque surfaces
+    - 'Windows' and 'Shading': the windows (triangulated windows are merged)
+    - 'Ventilation': the airtightness (ACH50 and Vn50)
+    - 'Climate': the nearest PHPP climate dataset to the Site:Location
+
+Things which only come from the Honeybee zones in Grasshopper (PHPP rooms,
+ventilation systems, DHW, ground, user TFA) are not included. The zone floor
+areas and volumes for the airtightness are worked out from the IDF surfaces
+instead of the Honeybee zones.
+
+Each cell is a PHPP_Cell(Worksheet, Range, Value, Row, Col), which has the
+same attributes as the components' PHPP_XL_Obj. The addresses come from the
+PHPP layout (see idf2phpp.phpp_layout), 9.6a unless another is given.
+"""
+
+import math
+from collections import namedtuple
+
+from idf2phpp.cell_array import PHPP_Cell
+from idf2phpp.climate_data import getClimateIndex
+from idf2phpp.geometry import Polygon3D, calcOrientations, vecDot
+from idf2phpp.host_index import HostSurfaceIndex
+from idf2phpp.idf_dispatch import CONSTRUCTION_CLASSES, IDF_Dispatcher
+from idf2phpp.phpp_layout import getLayout
+from idf2phpp.polygon_union import unionCoplanarPolygons
+from idf2phpp.zone_params import calcZoneParams
+
+def layoutCell(_cell, _value):
+    """ The PHPP_Cell for an XL_Cell from the layout, with its Row and Col already filled in """
+    return PHPP_Cell(_cell.Worksheet, _cell.Address, _value, _cell.Row, _cell.Col)
+
+GAS_CONDUCTIVITIES = {'Air': 0.0262, 'Argon': 0.0179, 'Krypton': 0.0095, 'Xenon': 0.0055}
+
+def makeDispatcher():
+    """ Returns the IDF_Dispatcher which sorts the records for buildModel() (the records are kept as-is) """
+    dispatcher = IDF_Dispatcher()
+    for className, groupName in (
+            ('Building', 'building'),
+            ('Site:Location', 'location'),
+            ('Zone', 'zones'),
+            ('ZoneList', 'zoneLists'),
+            ('ZoneInfiltration:DesignFlowRate', 'infiltration'),
+            ('BuildingSurface:Detailed', 'surfaces'),
+            ('FenestrationSurface:Detailed', 'windows'),
+            ('Material', 'materials'),
+            ('Material:AirGap', 'materials'),
+            ('Material:NoMass', 'materials'),
+            ('WindowMaterial:SimpleGlazingSystem', 'windowMaterialsSimple'),
+            ('WindowMaterial:Gas', 'windowMaterialsGas'),
+            ('WindowMaterial:Glazing', 'windowMaterialsGlazing')):
+        dispatcher.register(className, groupName)
+    for className in CONSTRUCTION_CLASSES:
+        dispatcher.register(className, 'constructions')
+    return dispatcher
+
+def northVectorFromAngle(_northAngle):
+    """ The project north for the 'Building' North Axis (Degrees, clockwise), same as IDF_Obj_building """
+    angle = math.radians(_northAngle or 0.0)
+    return (math.sin(angle), math.cos(angle), 0.0)
+
+def surfaceGroupNumber(_srfcType, _exposure):
+    """ The PHPP 'Areas' group number for an EnergyPlus surface type and boundary condition (or None) """
+    if _exposure == 'Surface':
+        return None
+    groups = {('Wall', 'Outdoors'): 8, ('Wall', 'Ground'): 9, ('Roof', 'Outdoors'): 10,
+              ('Floor', 'Ground'): 11, ('Floor', 'Outdoors'): 12}
+    if (_srfcType, _exposure) in groups:
+        return groups[(_srfcType, _exposure)]
+    if _exposure == 'Adiabatic':
+        return 18
+    return 13
+
+def cleanName(_name, _prefix):
+    """ 'PHPP_CONST_Ext_Wall' --> 'Ext Wall' """
+    if _prefix in _name:
+        _name = _name.split(_prefix)[1]
+    return _name.replace('_', ' ')
+
+class IDF_ModelSurface(object):
+    """ An opaque IDF surface (BuildingSurface:Detailed), with its geometry worked out """
+    __slots__ = ('Name', 'AssemblyName', 'SurfaceType', 'Exposure', 'HostZoneName', 'GroupNum',
+                 'Polygon', 'AngleFromNorth', 'AngleFromHoriz')
+
+    def __init__(self, _record):
+        self.Name = _record.Name
+        self.AssemblyName = _record.get('Construction Name')
+        self.SurfaceType = _record.get('Surface Type')
+        self.Exposure = _record.get('Outside Boundary Condition')
+        self.HostZoneName = _record.get('Zone Name')
+        self.GroupNum = surfaceGroupNumber(self.SurfaceType, self.Exposure)
+        self.Polygon = Polygon3D(_record.getVertices())
+        self.AngleFromNorth = None
+        self.AngleFromHoriz = None
+
+    def __repr__(self):
+        return "{}( _record=<{}> )".format(self.__class__.__name__, self.Name)
+
+class IDF_ModelWindow(object):
+    """ A window (FenestrationSurface:Detailed) with its simple glazing values """
+    __slots__ = ('Name', 'HostSrfc', 'ConstructionName', 'uValue', 'gValue', 'Polygon', 'Width', 'Height')
+
+    def __init__(self, _record, _uValue, _gValue):
+        self.Name = _record.Name
+        self.HostSrfc = _record.get('Building Surface Name')
+        self.ConstructionName = _record.get('Construction Name')
+        self.uValue = _uValue
+        self.gValue = _gValue
+        self.Polygon = Polygon3D(_record.getVertices())
+        self.Width, self.Height = self.Polygon.getBoundingRectangle()
+
+    def __repr__(self):
+        return "{}( _record=<{}> )".format(self.__class__.__name__, self.Name)
+
+class IDF_ModelZone(object):
+    """ An IDF Zone, with the floor area, exposed area and volume from its surfaces
+
+    Has the same methods as the Honeybee zones, so it can be used with
+    idf2phpp.zone_params.calcZoneParams
+    """
+
+    def __init__(self, _name):
+        self.name = _name
+        self.ZoneName = _name
+        self.FloorArea = 0.0
+        self.ExposedArea = 0.0
+        self.Volume = 0.0
+        self.InfiltrationACH50 = None
+        self.FloorArea_Gross = None
+        self.Volume_Vn50 = None
+
+    def addSurface(self, _surface):
+        polygon = _surface.Polygon
+        if _surface.SurfaceType == 'Floor':
+            self.FloorArea += polygon.Area
+        if _surface.Exposure == 'Outdoors':
+            self.ExposedArea += polygon.Area
+        # Divergence theorem, using the outward surface normals
+        self.Volume += vecDot(polygon.Centroid, polygon.Normal) * polygon.Area / 3.0
+
+    def getFloorArea(self):
+        return self.FloorArea
+
+    def getExposedArea(self):
+        return self.ExposedArea
+
+    def getZoneVolume(self):
+        return abs(self.Volume)
+
+    def __repr__(self):
+        return "{}( _name={!r} )".format(self.__class__.__name__, self.name)
+
+class IDF_Model(object):
+    """ Everything from the IDF file that goes into the PHPP """
+
+    def __init__(self):
+        self.NorthVector = (0.0, 1.0, 0.0)
+        self.Location = None          # (latitude, longitude), or None
+        self.Materials = {}           # Opaque: {name: (conductivity, thickness)}
+        self.Constructions = []       # Opaque: [(name, layers, intInsul)]
+        self.WindowMaterials = {}     # {construction name: (uValue, gValue)}
+        self.Surfaces = []            # Exposed IDF_ModelSurfaces
+        self.Windows = []             # IDF_ModelWindows
+        self.Zones = []               # IDF_ModelZones
+        self.Warnings = []            # The records which were skipped, and why
+
+def _opaqueMaterial(_record):
+    """ (conductivity, thickness) for a Material, Material:AirGap or Material:NoMass, as IDF_Obj_MaterialLayer """
+    resistance = _record.get('Thermal Resistance')
+    objName = _record.objName.lower()
+    if objName in ('material:nomass', 'material:airgap'):
+        if not resistance:
+            return None, (0.1 if objName == 'material:airgap' else None)
+        return 1.0 / resistance, 1.0
+
+    thickness = _record.get('Thickness') or 0.1
+    return _record.get('Conductivity'), thickness
+
+def _builtUpWindowU(_layerNames, _glazing, _gas):
+    """ Approximate Ug of a layered window construction, as materialWindowSimpleFromLayers """
+    resistances = [0.04, 0.13] # Surface film resistances
+    for layerName in _layerNames:
+        if layerName in _glazing:
+            resistances.append( 1.0 / _glazing[layerName] )
+        elif layerName in _gas:
+            resistances.append( 1.0 / _gas[layerName] * 0.5 )
+    return 1.0 / sum(resistances)
+
+def _mergeTriangulatedWindows(_records, _warnings):
+    """ Honeybee's '..._glzP_0, _glzP_1...' triangles --> one window record each (see getIDFWindowObjects)
+
+    If the triangles can't be joined (ie: they are all degenerate) they are kept
+    as they are, and a note is added to the _warnings list.
+    """
+    windows = []
+    triangulated = {}
+    order = []
+    for record in _records:
+        if '_glzP_' in record.Name and len(record.getVertices()) == 3:
+            key = record.Name.split('_glzP_')[0]
+            if key not in triangulated:
+                triangulated[key] = []
+                order.append(key)
+            triangulated[key].append(record)
+        else:
+            windows.append(record)
+
+    for key in order:
+        triangles = triangulated[key]
+        perims = unionCoplanarPolygons([t.getVertices() for t in triangles])
+        if not perims:
+            _warnings.append( "Couldn't join the triangles of window '{}', they are used as they are".format(key) )
+            windows.extend(triangles)
+            continue
+        for i, perim in enumerate(perims):
+            windows.append( triangles[0].withVertices(perim, key if i == 0 else '{}_{}'.format(key, i)) )
+    return windows
+
+def buildModel(_records):
+    """ Sorts the IDF records and works out everything the PHPP cells need
+
+    Records which can't be used (ie: a surface without a construction, a gas
+    layer with an unknown Gas Type) are left out and noted in model.Warnings,
+    the same as the components skip them, instead of stopping the export.
+
+    Args:
+        _records (iterable): IDF_Records (ie: from IDF_Record.fromRaw)
+    Returns:
+        model (IDF_Model): The model
+    """
+    groups = makeDispatcher().classify(_records)
+    model = IDF_Model()
+
+    if groups['building']:
+        model.NorthVector = northVectorFromAngle(groups['building'][-1].get('North Axis'))
+
+    if groups['location']:
+        location = groups['location'][-1]
+        model.Location = (location.get('Latitude'), location.get('Longitude'))
+
+    # Materials
+    for record in groups['materials']:
+        model.Materials[record.Name.replace('__Int__', '')] = _opaqueMaterial(record)
+
+    simple = dict( (r.Name, (r.get('U-Factor'), r.get('Solar Heat Gain Coefficient'))) for r in groups['windowMaterialsSimple'] )
+
+    glazing = {}
+    for record in groups['windowMaterialsGlazing']:
+        conductivity, thickness = record.get('Conductivity'), record.get('Thickness')
+        if not conductivity or not thickness:
+            model.Warnings.append( "Skipped WindowMaterial:Glazing '{}': no Conductivity or Thickness".format(record.Name) )
+            continue
+        glazing[record.Name] = conductivity / thickness
+
+    gas = {}
+    for record in groups['windowMaterialsGas']:
+        gasType, thickness = record.get('Gas Type'), record.get('Thickness')
+        gasType = gasType.capitalize() if gasType else gasType
+        if gasType not in GAS_CONDUCTIVITIES:
+            model.Warnings.append( "Skipped WindowMaterial:Gas '{}': unknown Gas Type '{}'".format(record.Name, record.get('Gas Type')) )
+            continue
+        if not thickness:
+            model.Warnings.append( "Skipped WindowMaterial:Gas '{}': no Thickness".format(record.Name) )
+            continue
+        gas[record.Name] = GAS_CONDUCTIVITIES[gasType] / thickness
+    windowMaterialNames = set(simple) | set(glazing) | set(gas)
+
+    # Constructions: split into opaque / window (see filterConstructions)
+    uValueCache = {}
+    for record in groups['constructions']:
+        name = record.Name
+        intInsul = None
+        if '__Int__' in name:
+            intInsul = 'x'
+            name = name.replace('__Int__', '')
+        layers = [[fieldName, layerName.replace('__Int__', '')] for fieldName, layerName in record.getLayers()]
+        layerNames = [layerName for fieldName, layerName in layers]
+
+        if windowMaterialNames.isdisjoint(layerNames):
+            model.Constructions.append( (name, layers, intInsul) )
+        elif len(layers) > 1:
+            stack = tuple(layerNames)
+            if stack not in uValueCache:
+                uValueCache[stack] = _builtUpWindowU(stack, glazing, gas)
+            model.WindowMaterials[name] = (uValueCache[stack], 0.4)
+        elif layerNames[0] in simple:
+            model.WindowMaterials[name] = simple[layerNames[0]]
+
+    # Surfaces
+    surfaces = [IDF_ModelSurface(record) for record in groups['surfaces']]
+    windowRecords = _mergeTriangulatedWindows(groups['windows'], model.Warnings)
+    windows = []
+    for record in windowRecords:
+        uValue, gValue = model.WindowMaterials.get(record.get('Construction Name'), (None, None))
+        windows.append( IDF_ModelWindow(record, uValue, gValue) )
+
+    everything = surfaces + windows
+    azimuths, tilts = calcOrientations([s.Polygon.Normal for s in everything], model.NorthVector)
+    for srfc, azimuth, tilt in zip(everything, azimuths, tilts):
+        if isinstance(srfc, IDF_ModelSurface):
+            srfc.AngleFromNorth, srfc.AngleFromHoriz = azimuth, tilt
+
+    model.Surfaces = []
+    for srfc in surfaces:
+        if srfc.Exposure == 'Surface':
+            continue
+        if not srfc.AssemblyName:
+            model.Warnings.append( "Skipped BuildingSurface:Detailed '{}': no Construction Name".format(srfc.Name) )
+            continue
+        model.Surfaces.append(srfc)
+    model.Windows = windows
+
+    # Zones, with the airtightness from the IDF infiltration objects
+    zonesByName = {}
+    for record in groups['zones']:
+        zonesByName[record.Name] = IDF_ModelZone(record.Name)
+        model.Zones.append(zonesByName[record.Name])
+    for srfc in surfaces:
+        if srfc.HostZoneName in zonesByName:
+            zonesByName[srfc.HostZoneName].addSurface(srfc)
+
+    zoneLists = [_ZoneList(r.Name, r.getGroup('Zone 1 Name')) for r in groups['zoneLists']]
+    zoneLists.extend( _ZoneList(z.name, [z.name]) for z in model.Zones ) # Infiltration can name a single Zone
+    infiltration = [_Infiltration(r) for r in groups['infiltration']]
+    calcZoneParams(zoneLists, infiltration, model.Zones, [], model.Zones)
+
+    return model
+
+_ZoneList = namedtuple('_ZoneList', ['Name', 'ZoneNames'])
+
+class _Infiltration(object):
+    __slots__ = ('ZoneName', 'FlowRatePerFloorArea', 'FlowRatePerSurfaceArea')
+
+    def __init__(self, _record):
+        self.ZoneName = _record.get('Zone or ZoneList Name')
+        self.FlowRatePerFloorArea = _record.get('Flow per Zone Floor Area')
+        self.FlowRatePerSurfaceArea = _record.get('Flow per Exterior Surface Area')
+
+def uValueCells(_model, _layout=None):
+    """ The 'U-Values' worksheet cells (see getUvalues). Returns (cells, the UD names of the constructions) """
+    table = (_layout or getLayout()).table('U-Values Constructions')
+    cells = []
+    udNames = []
+    for name, layers, intInsul in _model.Constructions:
+        layers = sorted(layers)
+        if layers and layers[0][1] not in _model.Materials:
+            continue # Not an opaque construction
+
+        i = len(udNames)
+        constName = cleanName(name, 'PHPP_CONST_')
+        udNames.append( '{:02d}ud-{}'.format(i + 1, constName) )
+
+        cells.append( layoutCell(table.cell(i, 'Name'), constName) )
+        cells.append( layoutCell(table.cell(i, 'Rsi'), 0) )
+        cells.append( layoutCell(table.cell(i, 'Rse'), 0) )
+        if intInsul is not None:
+            cells.append( layoutCell(table.cell(i, 'IntInsul'), 'x') )
+
+        layerCount = 0
+        for layerNum, layerName in layers:
+            if layerName not in _model.Materials or layerName == 'MASSLAYER':
+                continue
+            conductivity, thickness = _model.Materials[layerName]
+            cells.append( layoutCell(table.cell(i, 'LayerName', layerCount), cleanName(layerName, 'PHPP_MAT_')) )
+            cells.append( layoutCell(table.cell(i, 'LayerConductivity', layerCount), conductivity) )
+            cells.append( layoutCell(table.cell(i, 'LayerThickness', layerCount), thickness * 1000 if thickness is not None else None) )
+            layerCount += 1
+    return cells, udNames
+
+FRAME_FIELDS = ('Name', 'Uf_Left', 'Uf_Right', 'Uf_Bottom', 'Uf_Top',
+                'Width_Left', 'Width_Right', 'Width_Bottom', 'Width_Top',
+                'PsiG_Left', 'PsiG_Right', 'PsiG_Bottom', 'PsiG_Top',
+                'PsiInst_Left', 'PsiInst_Right', 'PsiInst_Bottom', 'PsiInst_Top')
+
+def componentCells(_model, _layout=None):
+    """ The 'Components' worksheet glass and frame cells (see getComponents). Returns (cells, {name: udName}) """
+    layout = _layout or getLayout()
+    glazing = layout.table('Components Glazing')
+    frames = layout.table('Components Frames')
+    cells = []
+    udNames = {}
+    for window in _model.Windows:
+        name = window.ConstructionName
+        if name in udNames:
+            continue
+        i = len(udNames)
+        udNames[name] = '{:02d}ud-{}'.format(i + 1, name)
+
+        cells.append( layoutCell(glazing.cell(i, 'Name'), name) )
+        cells.append( layoutCell(glazing.cell(i, 'gValue'), window.gValue) )
+        cells.append( layoutCell(glazing.cell(i, 'uValue'), window.uValue) )
+
+        frameValues = [name] + [window.uValue] * 4 + [0.12] * 4 + [0.0] * 8
+        for field, value in zip(FRAME_FIELDS, frameValues):
+            cells.append( layoutCell(frames.cell(i, field), value) )
+    return cells, udNames
+
+def areaCells(_model, _uValueUDNames, _layout=None):
+    """ The 'Areas' worksheet cells (see getAreas). Returns (cells, HostSurfaceIndex of the surfaces written) """
+    layout = _layout or getLayout()
+    table = layout.table('Areas Surfaces')
+    cells = []
+    surfacesIncluded = HostSurfaceIndex()
+    for i, srfc in enumerate(_model.Surfaces):
+        assemblyName = srfc.AssemblyName.replace('_', ' ')
+        for udName in _uValueUDNames:
+            if assemblyName in udName[5:] or udName[5:] in assemblyName:
+                assemblyName = udName
+
+        for field, value in (('Name', srfc.Name), ('GroupNum', srfc.GroupNum), ('Quantity', 1),
+                             ('Area', srfc.Polygon.Area), ('Assembly', assemblyName),
+                             ('AngleFromNorth', srfc.AngleFromNorth), ('AngleFromHoriz', srfc.AngleFromHoriz),
+                             ('ShadingFactor', 0.5), ('Absorptivity', 0.6), ('Emissivity', 0.9)):
+            cells.append( layoutCell(table.cell(i, field), value) )
+
+        surfacesIncluded.add(srfc.Name, srfc.HostZoneName, srfc, '{:d}-{}'.format(i + 1, srfc.Name))
+
+    cells.append( layoutCell(layout.cell('Areas', 'SuspendedFloorName'), 'Suspended Floor') )
+    return cells, surfacesIncluded
+
+def windowCells(_model, _surfacesIncluded, _componentUDNames, _layout=None):
+    """ The 'Windows' and 'Shading' worksheet cells (see getWindows and getShading) """
+    layout = _layout or getLayout()
+    windows = layout.table('Windows')
+    shading = layout.table('Shading')
+    cells = []
+    count = 0
+    for window in _model.Windows:
+        host = _surfacesIncluded.get(window.HostSrfc)
+        if host is None:
+            continue
+
+        udName = _componentUDNames[window.ConstructionName]
+        for field, value in (('Variant', 'a'), ('Quantity', 1), ('Name', window.Name),
+                             ('Width', window.Width), ('Height', window.Height),
+                             ('Host', host.UDName), ('Glazing', udName), ('Frame', udName),
+                             ('Install_Left', 1.0), ('Install_Right', 1.0), ('Install_Bottom', 1.0), ('Install_Top', 1.0)):
+            cells.append( layoutCell(windows.cell(count, field), value) )
+
+        cells.append( layoutCell(shading.cell(count, 'WinterFactor'), 0.75) )
+        cells.append( layoutCell(shading.cell(count, 'SummerFactor'), 0.75) )
+        count += 1
+    return cells
+
+def airtightnessCells(_model, _layout=None):
+    """ The 'Ventilation' worksheet airtightness cells (see getInfiltration) """
+    floorArea = 0.0
+    weightedACH = 0.0
+    vn50 = 0.0
+    for zone in _model.Zones:
+        if zone.InfiltrationACH50 is None or not zone.FloorArea_Gross:
+            continue
+        floorArea += zone.FloorArea_Gross
+        weightedACH += zone.InfiltrationACH50 * zone.FloorArea_Gross
+        vn50 += zone.Volume_Vn50
+
+    layout = _layout or getLayout()
+    return [layoutCell(layout.cell('Ventilation', 'WindCoeffE'), 0.07),
+            layoutCell(layout.cell('Ventilation', 'WindCoeffF'), 15),
+            layoutCell(layout.cell('Ventilation', 'ACH50'), weightedACH / floorArea if floorArea else 0.6),
+            layoutCell(layout.cell('Ventilation', 'Vn50'), vn50 if floorArea else '=N9*1.2')]
+
+def climateCells(_model, _layout=None):
+    """ The 'Climate' worksheet cells for the nearest PHPP climate dataset (see getLocation) """
+    lat, lon = _model.Location if _model.Location else (51.30, 9.44)
+    nearest = getClimateIndex().nearest(lat, lon, 1)
+    dataset = nearest[0][1] if nearest else {}
+    layout = _layout or getLayout()
+    return [layoutCell(layout.cell('Climate', 'Country'), dataset.get('Country', 'US-United States of America')),
+            layoutCell(layout.cell('Climate', 'Region'), dataset.get('Region', 'New York')),
+            layoutCell(layout.cell('Climate', 'DataSet'), dataset.get('Dataset', 'US0055b-New York')),
+            layoutCell(layout.cell('Climate', 'Altitude'), '=J23')]
+
+def makeCells(_model, _startRows=None, _phppVersion=None):
+    """ Builds all the PHPP cells for the model
+
+    Args:
+        _model (IDF_Model): From buildModel()
+        _startRows (dict): <Optional> Layout tables to move to other start rows, ie: {'Areas Surfaces': 50}
+        _phppVersion (str): <Optional> The PHPP version to use the layout of. Default is '9.6a'
+    Returns:
+        cells (list): PHPP_Cells, in worksheet order
+    """
+    layout = getLayout(_phppVersion).withStartRows(_startRows)
+
+    uValues, uValueUDNames = uValueCells(_model, layout)
+    components, componentUDNames = componentCells(_model, layout)
+    areas, surfacesIncluded = areaCells(_model, uValueUDNames, layout)
+    windows = windowCells(_model, surfacesIncluded, componentUDNames, layout)
+
+    return uValues + components + areas + windows + airtightnessCells(_model, layout) + climateCells(_model, layout)
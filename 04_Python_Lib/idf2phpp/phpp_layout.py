@@ -0,0 +1,515 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Where things go in the PHPP, for each PHPP version.
+
+The cell addresses used to be typed into the components ('M{}'.format(row + 1),
+'Verification', 'R78', ...) and the table start rows kept in a dict in
+'Create Excel Obj - Geom'. They are all in one layout definition here instead,
+so a PHPP version with a different layout only needs a new definition.
+
+A definition has two parts:
+    - 'tables': the repeated rows (or columns) of a worksheet, ie: the Areas
+      surfaces. Each field is given as its address for the first item, and
+      'step' is the (rows, cols) to the next item. 'start' is the row which
+      'udRowStarts_' moves, if that isn't the first field's row.
+    - 'cells': single cells, in named groups, each on one worksheet.
+
+getLayout() compiles a definition into a PHPP_Layout once. The addresses are
+turned into (row, col) numbers at that point, and the XL_Cells returned carry
+them, so the Excel writer doesn't have to parse the 'A1' text again.
+
+Only the PHPP 9.6a layout is registered, since it is the only one checked
+against a workbook. Other versions (9.7, 10.3, ...) need their differences
+from it entered with registerLayout(); until then getLayout() raises a
+ValueError for them, instead of writing to the 9.6a cells.
+"""
+
+import copy
+from collections import namedtuple
+
+from idf2phpp.xl_address import formatAddress, parseAddress
+
+DEFAULT_VERSION = '9.6a'
+
+class XL_Cell(namedtuple('XL_Cell', ['Worksheet', 'Row', 'Col'])):
+    """ One cell on a worksheet, with its row and column as numbers (from 1) """
+    __slots__ = ()
+
+    @property
+    def Address(self):
+        """ 'M11' """
+        return formatAddress(self.Row, self.Col)
+
+    @property
+    def Reference(self):
+        """ The cell as seen from a formula on another sheet, ie: "'Additional Vent'!F97" """
+        sheetName = self.Worksheet
+        if not sheetName.replace('_', '').isalnum():
+            sheetName = "'{}'".format(sheetName.replace("'", "''"))
+        return '{}!{}'.format(sheetName, self.Address)
+
+    def offset(self, _rows=0, _cols=0):
+        return XL_Cell(self.Worksheet, self.Row + _rows, self.Col + _cols)
+
+class PHPP_Table(object):
+    """ A repeated block of cells on one worksheet, ie: the 'Areas' surface rows """
+
+    def __init__(self, _name, _worksheet, _fields, _step=(1, 0), _startRow=None, _size=None):
+        """
+        Args:
+            _name (str): The table name, ie: 'Areas Surfaces'
+            _worksheet (str): The worksheet the table is on
+            _fields (dict): {fieldName: (row, col)} of the first item
+            _step (tuple): The (rows, cols) from one item to the next
+            _startRow (int): The table's start row. Default is the first field's row.
+            _size (int): <Optional> The number of items the PHPP has room for
+        """
+        self.Name = _name
+        self.Worksheet = _worksheet
+        self.Fields = _fields
+        self.Step = tuple(_step)
+        if _startRow is None and _fields:
+            _startRow = min(row for row, col in _fields.values())
+        self.StartRow = _startRow
+        self.Size = _size
+
+    def cell(self, _i, _field, _rowOffset=0, _colOffset=0):
+        """ Returns the XL_Cell of a field for item _i (from 0)
+
+        Args:
+            _i (int): The item number, from 0
+            _field (str): The field name, ie: 'Name'
+            _rowOffset (int): Rows to move from the field, ie: for the U-Values layers
+            _colOffset (int): Columns to move from the field
+        Returns:
+            cell (XL_Cell): The cell
+        """
+        row, col = self.Fields[_field]
+        return XL_Cell(self.Worksheet,
+                       row + _i * self.Step[0] + _rowOffset,
+                       col + _i * self.Step[1] + _colOffset)
+
+    def row(self, _i):
+        """ The sheet row of item _i (for tables going down the sheet) """
+        return self.StartRow + _i * self.Step[0]
+
+    def movedTo(self, _startRow):
+        """ Returns a copy of the table with every field moved so it starts on _startRow """
+        shift = _startRow - self.StartRow
+        fields = dict((nm, (row + shift, col)) for nm, (row, col) in self.Fields.items())
+        return PHPP_Table(self.Name, self.Worksheet, fields, self.Step, _startRow, self.Size)
+
+    def __unicode__(self):
+        return u'PHPP Table: {} | Worksheet: {} | Start Row: {}'.format(self.Name, self.Worksheet, self.StartRow)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _name={!r}, _worksheet={!r}, _fields={!r}, _step={!r}, _startRow={!r}, _size={!r} )".format(
+               self.__class__.__name__,
+               self.Name,
+               self.Worksheet,
+               self.Fields,
+               self.Step,
+               self.StartRow,
+               self.Size)
+
+class PHPP_Layout(object):
+    """ The compiled cell layout for one PHPP version """
+
+    def __init__(self, _version, _tables, _cells, _verified=True):
+        """
+        Args:
+            _version (str): The PHPP version, ie: '9.6a'
+            _tables (dict): {tableName: PHPP_Table}
+            _cells (dict): {groupName: {cellName: XL_Cell}}
+            _verified (bool): False if the addresses haven't been checked for this version
+        """
+        self.Version = _version
+        self.Tables = _tables
+        self.Cells = _cells
+        self.Verified = _verified
+
+    def table(self, _name):
+        try:
+            return self.Tables[_name]
+        except KeyError:
+            raise KeyError("No table '{}' in the PHPP {} layout".format(_name, self.Version))
+
+    def cell(self, _group, _name):
+        """ Returns the XL_Cell for a single named cell, ie: layout.cell('Verification', 'BldgName') """
+        try:
+            return self.Cells[_group][_name]
+        except KeyError:
+            raise KeyError("No cell '{}, {}' in the PHPP {} layout".format(_group, _name, self.Version))
+
+    def withStartRows(self, _startRows):
+        """ Returns a copy of the layout with some tables moved to new start rows
+
+        Args:
+            _startRows (dict): {tableName: startRow}, ie: {'Areas Surfaces': 50}
+        Returns:
+            layout (PHPP_Layout): The new layout. This one is not changed.
+        """
+        if not _startRows:
+            return self
+
+        tables = dict(self.Tables)
+        for name, startRow in _startRows.items():
+            tables[name] = self.table(name).movedTo(int(startRow))
+        return PHPP_Layout(self.Version, tables, self.Cells, self.Verified)
+
+    def __unicode__(self):
+        return u'PHPP Layout: {} ({} tables{})'.format(self.Version, len(self.Tables), '' if self.Verified else ', not verified')
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _version={!r}, _tables=<{} tables>, _cells=<{} groups>, _verified={!r} )".format(
+               self.__class__.__name__,
+               self.Version,
+               len(self.Tables),
+               len(self.Cells),
+               self.Verified)
+
+def compileLayout(_version, _definition, _verified=True):
+    """ Turns a layout definition (see PHPP_9_6a) into a PHPP_Layout, parsing every address once """
+    tables = {}
+    for name, tableDef in _definition['tables'].items():
+        fields = dict((nm, parseAddress(address)) for nm, address in tableDef['fields'].items())
+        tables[name] = PHPP_Table(name, tableDef['sheet'], fields, tableDef.get('step', (1, 0)),
+                                  tableDef.get('start'), tableDef.get('size'))
+
+    cells = {}
+    for group, groupDef in _definition['cells'].items():
+        sheetName = groupDef['sheet']
+        cells[group] = dict((nm, XL_Cell(sheetName, *parseAddress(address)))
+                            for nm, address in groupDef['cells'].items())
+
+    return PHPP_Layout(_version, tables, cells, _verified)
+
+#-------------------------------------------------------------------------------
+# PHPP 9.6a, the version the components were written for
+
+PHPP_9_6a = {
+    'tables': {
+        'U-Values Constructions': {
+            'sheet': 'U-Values', 'step': (21, 0), 'start': 10,
+            'fields': {
+                'Name': 'M11', 'IntInsul': 'S11', 'Rsi': 'M13', 'Rse': 'M14',
+                'LayerName': 'L17', 'LayerConductivity': 'M17', 'LayerThickness': 'S17',
+                'VariantConductivity': 'F17', 'VariantThickness': 'G17',
+                },
+            },
+        'Components Assemblies': {
+            'sheet': 'Components',
+            'fields': {'Name': 'D15'},
+            },
+        'Components Glazing': {
+            'sheet': 'Components',
+            'fields': {'Name': 'IE15', 'gValue': 'IF15', 'uValue': 'IG15'},
+            },
+        'Components Frames': {
+            'sheet': 'Components',
+            'fields': {
+                'Name': 'IL15',
+                'Uf_Left': 'IM15', 'Uf_Right': 'IN15', 'Uf_Bottom': 'IO15', 'Uf_Top': 'IP15',
+                'Width_Left': 'IQ15', 'Width_Right': 'IR15', 'Width_Bottom': 'IS15', 'Width_Top': 'IT15',
+                'PsiG_Left': 'IU15', 'PsiG_Right': 'IV15', 'PsiG_Bottom': 'IW15', 'PsiG_Top': 'IX15',
+                'PsiInst_Left': 'IY15', 'PsiInst_Right': 'IZ15', 'PsiInst_Bottom': 'JA15', 'PsiInst_Top': 'JB15',
+                },
+            },
+        'Components Ventilator': {
+            'sheet': 'Components',
+            'fields': {
+                'Name': 'JH15', 'HR_Eff': 'JI15', 'MR_Eff': 'JJ15', 'ElecEff': 'JK15',
+                'MinFlow': 'JL15', 'MaxFlow': 'JM15',
+                },
+            },
+        'Areas Surfaces': {
+            'sheet': 'Areas', 'size': 100,
+            'fields': {
+                'Name': 'L41', 'GroupNum': 'M41', 'Quantity': 'P41', 'Area': 'V41',
+                'Assembly': 'AC41', 'AngleFromNorth': 'AG41', 'AngleFromHoriz': 'AH41',
+                'ShadingFactor': 'AJ41', 'Absorptivity': 'AK41', 'Emissivity': 'AL41',
+                },
+            },
+        'Areas TB': {
+            'sheet': 'Areas',
+            'fields': {'Name': 'L145', 'GroupNum': 'M145', 'Quantity': 'P145', 'Length': 'R145', 'PsiValue': 'X145'},
+            },
+        'Windows': {
+            'sheet': 'Windows', 'size': 151,
+            'fields': {
+                'Variant': 'F24', 'VariantGlazing': 'G24', 'VariantFrame': 'H24',
+                'Quantity': 'L24', 'Name': 'M24', 'Width': 'Q24', 'Height': 'R24',
+                'Host': 'S24', 'Glazing': 'T24', 'Frame': 'U24',
+                'Install_Left': 'AA24', 'Install_Right': 'AB24', 'Install_Bottom': 'AC24', 'Install_Top': 'AD24',
+                },
+            },
+        'Shading': {
+            'sheet': 'Shading',
+            'fields': {'WinterFactor': 'AF17', 'SummerFactor': 'AG17'},
+            },
+        'Additional Ventilation Rooms': {
+            'sheet': 'Additional Vent', 'size': 30,
+            'fields': {
+                'Quantity': 'D56', 'Name': 'E56', 'VentUnit': 'F56', 'Area': 'G56', 'RoomHeight': 'H56',
+                'SupplyAir': 'J56', 'ExtractAir': 'K56', 'TransferAir': 'L56',
+                'UtilHours': 'N56', 'UtilDays': 'O56', 'Holidays': 'P56',
+                'Speed_High': 'Q56', 'Time_High': 'R56', 'Speed_Med': 'S56', 'Time_Med': 'T56',
+                'Speed_Low': 'U56', 'Time_Low': 'V56',
+                },
+            },
+        'Additional Ventilation Vent Unit Selection': {
+            'sheet': 'Additional Vent', 'size': 10,
+            'fields': {
+                'Quantity': 'D97', 'Name': 'E97', 'Unit': 'F97',
+                'Exterior': 'Q97', 'FrostType': 'X97', 'FrostTemp': 'Y97',
+                },
+            },
+        'Additional Ventilation Vent Ducts': {
+            # The average exterior temperature sits above the duct table and moves with it
+            'sheet': 'Additional Vent', 'start': 127,
+            'fields': {
+                'AvgExtTemp': 'F116',
+                'Quantity': 'D127', 'Width': 'E127', 'InsulThickness': 'H127', 'InsulConductivity': 'I127',
+                'Reflective': 'J127', 'Length': 'L127', 'Supply': 'M127', 'Extract': 'N127',
+                'AssignedUnits': 'Q127',
+                },
+            },
+        'Electricity non-res Lighting': {
+            'sheet': 'Electricity non-res', 'size': 22,
+            'fields': {
+                'ZoneName': 'C19', 'Area': 'D19', 'RoomUse': 'F19', 'DeviationNorth': 'H19',
+                'GlazingTransmission': 'J19', 'RoomDepth': 'M19', 'RoomWidth': 'N19', 'RoomHeight': 'O19',
+                'LintelHeight': 'P19', 'WindowWidth': 'Q19', 'LightingControl': 'W19', 'MotionDetector': 'X19',
+                },
+            },
+        'Electricity non-res Office Equip': {
+            'sheet': 'Electricity non-res', 'start': 62,
+            'fields': {},
+            },
+        'Electricity non-res Kitchen': {
+            'sheet': 'Electricity non-res', 'start': 77,
+            'fields': {},
+            },
+        'Ground': {
+            # One column group per floor element: C/H/P, W/AB/AJ, AQ/AV/BD
+            'sheet': 'Ground', 'step': (0, 20), 'size': 3,
+            'fields': {
+                'SoilConductivity': 'H9', 'SoilHeatCapacity': 'H10',
+                'FloorUValue': 'P17', 'FloorArea': 'H18', 'FloorPerimeter': 'H19', 'PerimPsiL': 'P18',
+                'Type_SlabOnGrade': 'C24', 'PerimInsulDepth': 'H25', 'PerimInsulThickness': 'H26',
+                'PerimInsulConductivity': 'H27', 'PerimInsulOrientation': 'P25',
+                'Type_HeatedBasement': 'C29', 'HeatedBasementWallHeightBG': 'H30', 'HeatedBasementWallU_BG': 'P30',
+                'Type_UnheatedBasement': 'C31', 'UnheatedBasementWallHeightAG': 'H33', 'UnheatedBasementWallU_AG': 'P33',
+                'UnheatedBasementWallHeightBG': 'H34', 'UnheatedBasementWallU_BG': 'P34',
+                'UnheatedBasementFloorU': 'P35', 'UnheatedBasementACH': 'H35', 'UnheatedBasementVolume': 'H36',
+                'Type_Crawlspace': 'C38', 'CrawlspaceFloorU': 'H39', 'CrawlspaceWallHeight': 'H40',
+                'CrawlspaceWallU': 'H41', 'CrawlspaceVentArea': 'P39', 'CrawlspaceWindVelocity': 'P40',
+                'CrawlspaceWindFactor': 'P41',
+                'GroundWaterDepth': 'H49', 'GroundWaterFlow': 'H50',
+                },
+            },
+        'DHW Recirculation': {
+            'sheet': 'DHW+Distribution', 'step': (0, 1), 'size': 5,
+            'fields': {
+                'Length': 'J149', 'Diameter': 'J150', 'InsulThickness': 'J151', 'InsulReflective': 'J152',
+                'InsulConductivity': 'J153', 'InsulQuality': 'J155', 'DailyOperation': 'J159',
+                },
+            },
+        'DHW Branches': {
+            'sheet': 'DHW+Distribution', 'step': (0, 1), 'size': 5,
+            'fields': {
+                'Diameter': 'J167', 'Length': 'J168', 'TapPoints': 'J169',
+                'TapOpenings': 'J171', 'Utilisation': 'J172',
+                },
+            },
+        'DHW Tanks': {
+            # Tank 1, Tank 2, Buffer tank
+            'sheet': 'DHW+Distribution', 'step': (0, 3), 'size': 3,
+            'fields': {
+                'Type': 'J186', 'Solar': 'J189', 'HeatLossRate': 'J191', 'Volume': 'J192',
+                'StandbyFraction': 'J193', 'Location': 'J195', 'LocationTemp': 'J198',
+                },
+            },
+        'Variants Assemblies': {
+            'sheet': 'Variants', 'step': (2, 0),
+            'fields': {'Name': 'B410'},
+            },
+        },
+
+    'cells': {
+        'Areas': {
+            'sheet': 'Areas',
+            'cells': {'SuspendedFloorName': 'L19', 'TFA': 'V34'},
+            },
+        'Climate': {
+            'sheet': 'Climate',
+            'cells': {'Country': 'D9', 'Region': 'D10', 'DataSet': 'D12', 'Altitude': 'D18'},
+            },
+        'Verification': {
+            'sheet': 'Verification',
+            'cells': {
+                'BldgName': 'K4', 'BldgCountry': 'M7',
+                'BldgType': 'R20', 'IHG_Type': 'R24', 'IHG_Values': 'R25',
+                'NumResUnits': 'F28', 'SpecCapacity': 'K29', 'MechCooling': 'N29',
+                'Occupancy': 'Q29', 'OccupancyMethod': 'R29',
+                'CertStandard': 'R78', 'CertClass': 'R80', 'CertPE': 'R82',
+                'CertEnerPHit': 'R85', 'CertRetrofit': 'R87',
+                },
+            },
+        'Ventilation': {
+            'sheet': 'Ventilation',
+            'cells': {
+                'VariantUnitType': 'D12', 'UnitType': 'L12', 'VariantACH50': 'D27',
+                'WindCoeffE': 'N25', 'WindCoeffF': 'N26', 'ACH50': 'N27', 'Vn50': 'P27',
+                'AddnlVent': 'H42',
+                'UnitSelection': 'K88', 'FrostTemp': 'R90',
+                'SupplyDuctLength': 'N91', 'ExtractDuctLength': 'N93',
+                'SupplyDuctWidth': 'L106', 'SupplyDuctInsulThickness': 'L107',
+                'SupplyDuctReflective': 'L109', 'SupplyDuctInsulConductivity': 'L112',
+                'ExtractDuctWidth': 'Q106', 'ExtractDuctInsulThickness': 'Q107',
+                'ExtractDuctReflective': 'Q109', 'ExtractDuctInsulConductivity': 'Q112',
+                },
+            },
+        'Variants': {
+            'sheet': 'Variants',
+            'cells': {
+                'VentUnit': 'D856', 'DuctLength': 'D857', 'DuctInsulThickness': 'D858',
+                'CertStandard': 'D927', 'CertClass': 'D928', 'CertPE': 'D929',
+                'CertEnerPHit': 'D930', 'CertRetrofit': 'D931', 'TBLength': 'D933',
+                },
+            },
+        'PER': {
+            'sheet': 'PER',
+            'cells': {
+                'HeatPrimary': 'P10', 'HeatSecondary': 'P12', 'HeatFracPrimary': 'S10', 'DHWFracPrimary': 'T10',
+                'VariantHeatPrimary': 'H10', 'VariantHeatSecondary': 'H12',
+                'VariantHeatFracPrimary': 'I10', 'VariantDHWFracPrimary': 'J10',
+                },
+            },
+        'Boiler': {
+            'sheet': 'Boiler',
+            'cells': {'Type': 'N21', 'Fuel': 'N22', 'UseTypical': 'M31'},
+            },
+        'Cooling units': {
+            'sheet': 'Cooling units',
+            'cells': {
+                'SupplyAir': 'I15', 'SupplyAirOnOff': 'P17', 'SupplyAirMaxPower': 'P18', 'SupplyAirSEER': 'P20',
+                'Recirc': 'I22', 'RecircOnOff': 'P24', 'RecircMaxPower': 'P25', 'RecircVolume': 'P26',
+                'RecircVariableVolume': 'P28', 'RecircSEER': 'P29',
+                'Dehumid': 'I32', 'DehumidWasteHeat': 'P34', 'DehumidSEER': 'P35',
+                'Panel': 'I37', 'PanelSEER': 'P39',
+                },
+            },
+        'SummVent': {
+            'sheet': 'SummVent',
+            'cells': {
+                # The four HRV summer bypass options. Bypass2 is the temperature difference control
+                'VentACH': 'L20', 'Bypass1': 'R21', 'Bypass2': 'R22', 'Bypass3': 'R23', 'Bypass4': 'R24',
+                'DayACH': 'L31', 'NightACH': 'P59',
+                },
+            },
+        'DHW': {
+            'sheet': 'DHW+Distribution',
+            'cells': {
+                # P29 and P145 are cleared (set to 0) by the DHW components
+                'Clear_P29': 'P29', 'Clear_P145': 'P145', 'RecircTemp': 'J146',
+                'ShowerDemand': 'J47', 'OtherDemand': 'J48', 'DaysPerYear': 'J58',
+                'UseShowers': 'J62', 'UseHandWashing': 'J63', 'UseWashStand': 'J64', 'UseBidets': 'J65',
+                'UseBathing': 'J66', 'UseToothBrushing': 'J67', 'UseCooking': 'J68',
+                'UseDishwashing': 'J74', 'UseCleanKitchen': 'J75', 'UseCleanRooms': 'J76',
+                },
+            },
+        'Aux Electricity': {
+            'sheet': 'Aux Electricity',
+            'cells': {'CirculationPump': 'H29'},
+            },
+        },
+    }
+
+#-------------------------------------------------------------------------------
+# The layout registry
+
+_DEFINITIONS = {}
+_LAYOUTS = {}
+
+def _mergeDefinition(_base, _changes):
+    """ The base definition with _changes applied: tables / cell groups are merged field by field """
+    merged = copy.deepcopy(_base)
+    for part in ('tables', 'cells'):
+        for name, groupDef in _changes.get(part, {}).items():
+            if groupDef is None:
+                merged[part].pop(name, None)
+                continue
+            target = merged[part].setdefault(name, {'fields': {}} if part == 'tables' else {'cells': {}})
+            for key, value in groupDef.items():
+                if key in ('fields', 'cells'):
+                    target.setdefault(key, {}).update(value)
+                else:
+                    target[key] = value
+    return merged
+
+def registerLayout(_version, _definition, _base=None, _verified=True):
+    """ Adds a PHPP version's layout to the registry
+
+    Args:
+        _version (str): The PHPP version, ie: '9.6a'
+        _definition (dict): The layout (see PHPP_9_6a). With a _base, only what is different.
+        _base (str): <Optional> The version this one is changed from
+        _verified (bool): False if the addresses haven't been checked against that PHPP version
+    """
+    if _base is not None:
+        _definition = _mergeDefinition(_DEFINITIONS[_base][0], _definition)
+    _DEFINITIONS[_version] = (_definition, _verified)
+    _LAYOUTS.pop(_version, None)
+
+def layoutVersions():
+    """ The registered PHPP versions, ie: ['9.6a'] """
+    return sorted(_DEFINITIONS)
+
+def getLayout(_version=None):
+    """ Returns the compiled PHPP_Layout for a PHPP version. Each is only compiled once
+
+    Args:
+        _version (str): <Optional> The PHPP version. Default is DEFAULT_VERSION
+    Returns:
+        layout (PHPP_Layout): The layout
+    """
+    version = str(_version).strip() if _version else DEFAULT_VERSION
+    if version.upper().startswith('PHPP'):
+        version = version[4:].strip()
+
+    if version not in _LAYOUTS:
+        if version not in _DEFINITIONS:
+            raise ValueError("No layout for PHPP version '{}', its cell locations haven't been entered yet. "
+                             "Use one of: {}".format(version, ', '.join(layoutVersions())))
+        definition, verified = _DEFINITIONS[version]
+        _LAYOUTS[version] = compileLayout(version, definition, verified)
+    return _LAYOUTS[version]
+
+registerLayout('9.6a', PHPP_9_6a)
@@ -0,0 +1,320 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Union of coplanar polygons, used to put Honeybee's triangulated windows back together.
+
+Honeybee splits some windows into triangles ('..._glzP_0', '..._glzP_1', ...).
+To rebuild the original window outline, unionCoplanarPolygons() first tries
+the quick way: the triangles of one window share whole edges, so every edge
+used by two triangles (in opposite directions) is inside the window and the
+edges used only once form its outline.
+
+If the pieces don't fit together like that (T-junctions, overlaps, gaps...)
+it falls back to a general union: the polygons are projected onto their
+plane, every edge is split where it meets the other polygons, and only the
+pieces which are not inside another polygon are kept and chained back into
+outlines.
+
+Vertices are plain (x, y, z) tuples, in the same order convention as the
+IDF: counter-clockwise when seen from the outside. The result keeps the
+orientation of the first polygon passed in.
+"""
+
+from idf2phpp.geometry import newellNormal, vecDot, vecLength, vecCross
+
+DEFAULT_TOLERANCE = 1e-5 # m
+
+def _snapKey(_point, _tolerance):
+    return tuple(int(round(c / _tolerance)) for c in _point)
+
+def removeCollinear(_loop, _tolerance=DEFAULT_TOLERANCE):
+    """ Removes the vertices which sit on a straight line between their neighbours
+
+    Args:
+        _loop (list): The polygon's vertices, in order
+        _tolerance (float): How far off the line (m) a vertex can be and still be removed
+    Returns:
+        loop (list): The remaining vertices, in the same order
+    """
+    loop = list(_loop)
+    i = 0
+    while len(loop) > 3 and i < len(loop):
+        a, b, c = loop[i - 1], loop[i], loop[(i + 1) % len(loop)]
+        ab = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+        ac = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+        lengthAC = vecLength(ac)
+        if lengthAC < _tolerance or vecLength(vecCross(ab, ac)) / lengthAC < _tolerance:
+            del loop[i]
+            i = max(i - 1, 0)
+        else:
+            i += 1
+    return loop
+
+def _orientLike(_polygons):
+    """ Returns the polygons with each one's vertex order flipped if needed to match the first """
+    reference = newellNormal(_polygons[0])
+    oriented = []
+    for polygon in _polygons:
+        if vecDot(newellNormal(polygon), reference) < 0:
+            polygon = list(reversed(polygon))
+        oriented.append(list(polygon))
+    return oriented, reference
+
+def _chainEdges(_edges):
+    """ Joins directed (startKey, endKey) edges end to start into closed loops of keys
+
+    Returns None if the edges don't make simple loops (a vertex used by more
+    than one outgoing edge, or a chain which doesn't close).
+    """
+    nextKey = {}
+    for start, end in _edges:
+        if start in nextKey:
+            return None
+        nextKey[start] = end
+
+    loops = []
+    while nextKey:
+        start, key = nextKey.popitem()
+        loop = [start]
+        while key != start:
+            loop.append(key)
+            key = nextKey.pop(key, None)
+            if key is None:
+                return None
+        loops.append(loop)
+    return loops
+
+def mergeBySharedEdges(_polygons, _tolerance=DEFAULT_TOLERANCE):
+    """ Merges polygons which fit together along whole shared edges (ie: a fan of triangles)
+
+    Args:
+        _polygons (list): Lists of (x, y, z) vertices, all with the same orientation
+        _tolerance (float): Vertices closer than this (m) are the same vertex
+    Returns:
+        loops (list): The outlines (lists of vertices), or None if the polygons
+            don't fit together edge to edge
+    """
+    points = {}
+    edges = {}
+    for polygon in _polygons:
+        keys = []
+        for vertex in polygon:
+            key = _snapKey(vertex, _tolerance)
+            points.setdefault(key, vertex)
+            if not keys or keys[-1] != key:
+                keys.append(key)
+        if len(keys) > 1 and keys[0] == keys[-1]:
+            keys.pop()
+
+        for i in range(len(keys)):
+            edge = (keys[i], keys[(i + 1) % len(keys)])
+            if edge in edges:
+                return None # The same edge twice in the same direction: overlapping
+            edges[edge] = True
+
+    boundary = [edge for edge in edges if (edge[1], edge[0]) not in edges]
+    if not boundary:
+        return None
+
+    loops = _chainEdges(boundary)
+    if loops is None:
+        return None
+
+    return [[points[key] for key in loop] for loop in loops]
+
+def _projectionAxes(_normal):
+    """ The two world axes to keep when projecting onto the plane, ordered so the
+    projected polygon is counter-clockwise when the normal points along the dropped axis """
+    dropped = max(range(3), key=lambda i: abs(_normal[i]))
+    return dropped, ((1, 2), (2, 0), (0, 1))[dropped]
+
+def _signedArea2D(_loop):
+    area = 0.0
+    for i in range(len(_loop)):
+        x1, y1 = _loop[i - 1]
+        x2, y2 = _loop[i]
+        area += x1 * y2 - x2 * y1
+    return area / 2.0
+
+def _pointInPolygon2D(_point, _polygon):
+    """ True if the point is inside the polygon (points on the edges may go either way) """
+    x, y = _point
+    inside = False
+    for i in range(len(_polygon)):
+        x1, y1 = _polygon[i - 1]
+        x2, y2 = _polygon[i]
+        if (y1 > y) != (y2 > y):
+            if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
+
+def _splitParams(_a, _b, _otherEdges, _tolerance):
+    """ Returns the positions (0 to 1) along the segment a->b where other edges cross or touch it """
+    dx, dy = _b[0] - _a[0], _b[1] - _a[1]
+    lengthSq = dx * dx + dy * dy
+    params = [0.0, 1.0]
+    if lengthSq < _tolerance * _tolerance:
+        return params
+
+    for c, d in _otherEdges:
+        ex, ey = d[0] - c[0], d[1] - c[1]
+        denom = dx * ey - dy * ex
+        if abs(denom) > 1e-12:
+            # Crossing segments
+            t = ((c[0] - _a[0]) * ey - (c[1] - _a[1]) * ex) / denom
+            u = ((c[0] - _a[0]) * dy - (c[1] - _a[1]) * dx) / denom
+            if 0.0 < t < 1.0 and -1e-9 <= u <= 1.0 + 1e-9:
+                params.append(t)
+        else:
+            # Parallel: split at the other edge's ends, if they lie on this one
+            for p in (c, d):
+                t = ((p[0] - _a[0]) * dx + (p[1] - _a[1]) * dy) / lengthSq
+                off = abs((p[0] - _a[0]) * dy - (p[1] - _a[1]) * dx) / lengthSq ** 0.5
+                if 0.0 < t < 1.0 and off < _tolerance:
+                    params.append(t)
+
+    return sorted(set(params))
+
+def unionPolygons2D(_polygons, _tolerance=DEFAULT_TOLERANCE):
+    """ General union of simple 2D polygons (all counter-clockwise)
+
+    Args:
+        _polygons (list): Lists of (x, y) vertices
+        _tolerance (float): Points closer than this are the same point
+    Returns:
+        loops (list): The outlines of the union (lists of (x, y) points, counter-clockwise).
+            Holes, if any, come back clockwise.
+    """
+    edgesByPolygon = [[(polygon[i - 1], polygon[i]) for i in range(len(polygon))] for polygon in _polygons]
+
+    # Split every edge where the other polygons' edges meet it
+    pieces = []
+    for i, edges in enumerate(edgesByPolygon):
+        otherEdges = [edge for j, others in enumerate(edgesByPolygon) if j != i for edge in others]
+        for a, b in edges:
+            params = _splitParams(a, b, otherEdges, _tolerance)
+            for t0, t1 in zip(params[:-1], params[1:]):
+                p0 = (a[0] + (b[0] - a[0]) * t0, a[1] + (b[1] - a[1]) * t0)
+                p1 = (a[0] + (b[0] - a[0]) * t1, a[1] + (b[1] - a[1]) * t1)
+                k0, k1 = _snapKey(p0, _tolerance), _snapKey(p1, _tolerance)
+                if k0 != k1:
+                    pieces.append( (i, k0, k1, p0, p1) )
+
+    # Keep the pieces on the outside of the union
+    directed = {}
+    for i, k0, k1, p0, p1 in pieces:
+        directed.setdefault((k0, k1), []).append(i)
+
+    points = {}
+    kept = []
+    for i, k0, k1, p0, p1 in pieces:
+        if (k1, k0) in directed:
+            continue # Shared by two polygons facing each other: inside
+        if directed[(k0, k1)][0] != i:
+            continue # The same piece from an overlapping polygon, keep only one
+
+        mid = ((p0[0] + p1[0]) / 2.0, (p0[1] + p1[1]) / 2.0)
+        if any(_pointInPolygon2D(mid, _polygons[j]) for j in range(len(_polygons)) if j != i):
+            continue
+
+        points.setdefault(k0, p0)
+        points.setdefault(k1, p1)
+        kept.append( (k0, k1) )
+
+    loops = _chainEdges(kept) or []
+    return [[points[key] for key in loop] for loop in loops]
+
+def _unionByProjection(_polygons, _normal, _tolerance):
+    """ Projects the polygons onto their plane, unions them in 2D and lifts the result back """
+    dropped, (u, v) = _projectionAxes(_normal)
+    flip = _normal[dropped] < 0 # So the projected polygons come out counter-clockwise
+
+    flat = []
+    for polygon in _polygons:
+        points = [(p[u], p[v]) for p in polygon]
+        if flip:
+            points.reverse()
+        if abs(_signedArea2D(points)) > _tolerance * _tolerance:
+            flat.append(points)
+
+    # The plane: normal . p = d
+    origin = _polygons[0][0]
+    d = vecDot(_normal, origin)
+
+    loops = []
+    for loop in unionPolygons2D(flat, _tolerance):
+        if flip:
+            loop.reverse()
+        loop3D = []
+        for pu, pv in loop:
+            point = [0.0, 0.0, 0.0]
+            point[u], point[v] = pu, pv
+            point[dropped] = (d - _normal[u] * pu - _normal[v] * pv) / _normal[dropped]
+            loop3D.append(tuple(point))
+        loops.append(loop3D)
+    return loops
+
+def unionCoplanarPolygons(_polygons, _tolerance=DEFAULT_TOLERANCE):
+    """ Returns the outline(s) of a set of coplanar polygons joined together
+
+    Args:
+        _polygons (list): Lists of (x, y, z) vertices, ie: the triangles of one window
+        _tolerance (float): Vertices closer than this (m) are the same vertex
+    Returns:
+        loops (list): The outlines (lists of (x, y, z) vertices, without any
+            collinear vertices), largest first. Normally just one. Each has the
+            same orientation as the first polygon passed in. Empty if the polygons
+            are all degenerate (ie: collinear points).
+    """
+    polygons = [[tuple(float(c) for c in vertex) for vertex in polygon] for polygon in _polygons if len(polygon) >= 3]
+    if not polygons:
+        return []
+
+    polygons, normal = _orientLike(polygons)
+
+    loops = mergeBySharedEdges(polygons, _tolerance)
+    if loops is None or len(loops) > 1:
+        length = vecLength(normal)
+        if length == 0:
+            return []
+        loops = _unionByProjection(polygons, tuple(c / length for c in normal), _tolerance)
+
+    # Start each outline at the vertex which comes first in the input, so the result doesn't
+    # depend on the dict ordering
+    inputOrder = {}
+    for polygon in polygons:
+        for vertex in polygon:
+            inputOrder.setdefault(_snapKey(vertex, _tolerance), len(inputOrder))
+
+    results = []
+    for loop in loops:
+        loop = removeCollinear(loop, _tolerance)
+        if len(loop) < 3 or vecDot(newellNormal(loop), normal) <= 0:
+            continue # Degenerate, or a hole
+
+        ranks = [inputOrder.get(_snapKey(vertex, _tolerance), len(inputOrder)) for vertex in loop]
+        start = ranks.index(min(ranks))
+        loop = loop[start:] + loop[:start]
+        results.append( [tuple(c + 0.0 for c in vertex) for vertex in loop] ) # -0.0 --> 0.0
+
+    results.sort(key=lambda loop: -vecLength(newellNormal(loop)))
+    return results
@@ -0,0 +1,302 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Reads named PHPP results (TFA, heating demand, PER, ...) in a few range reads.
+
+Reading the results one cell at a time costs one COM call into Excel for
+each value, and a variant study reads them after every recalculation. An
+XL_ResultReader is built once from a list of XL_ResultFields. It works out,
+for each worksheet, a few rectangles which cover all of the cells:
+
+    - The cells on each row are split into runs, and runs covering the same
+      columns on following rows are stacked (like idf2phpp.write_plan).
+    - Rectangles are then merged, closest first, as long as the merged
+      rectangle doesn't read more than _maxWaste cells that weren't asked for.
+      Reading a few extra cells in a 2-D Value2 read is much quicker than
+      another call into Excel.
+
+read() then makes one readRange() call per rectangle, with any XL_Workbook
+backend, and returns an XL_Results with each value converted to its field's
+type.
+"""
+
+from collections import namedtuple
+
+from idf2phpp.write_plan import _stackRuns
+from idf2phpp.xl_address import formatRange, parseAddress
+
+DEFAULT_MAX_WASTE = 64
+
+XL_ResultField = namedtuple('XL_ResultField', ['Label', 'Worksheet', 'Address', 'Type'])
+XL_ResultField.__new__.__defaults__ = ('number',)
+
+# The values Range.Value2 gives for error cells (#DIV/0!, #N/A, #NAME?, #NULL!, #NUM!, #REF!, #VALUE!)
+_XL_ERROR_CODES = frozenset([-2146826281, -2146826246, -2146826259, -2146826288,
+                             -2146826252, -2146826265, -2146826273])
+
+def isErrorValue(_value):
+    """ True for an Excel error value, from COM (an int code) or from a .xlsx file (ie: '#DIV/0!') """
+    if isinstance(_value, bool):
+        return False
+    if isinstance(_value, int):
+        return _value in _XL_ERROR_CODES
+    return isinstance(_value, (str, type(u''))) and _value.startswith(u'#')
+
+def _toNumber(_value):
+    if _value is None or _value == u'' or isErrorValue(_value):
+        return None
+    try:
+        return float(_value)
+    except (TypeError, ValueError):
+        return None
+
+def _toText(_value):
+    if _value is None or isErrorValue(_value):
+        return None
+    if isinstance(_value, float) and _value.is_integer():
+        _value = int(_value)
+    return u'{}'.format(_value)
+
+def _noConversion(_value):
+    return _value
+
+RESULT_TYPES = {
+    'number': _toNumber, # float, or None if the cell is empty or an error
+    'text': _toText,
+    'value': _noConversion, # As read
+    }
+
+VERIFICATION_RESULTS = [
+    XL_ResultField('TFA', 'Verification', 'I34'),
+    XL_ResultField('Heating Demand', 'Verification', 'I35'),
+    XL_ResultField('Heating Load', 'Verification', 'I36'),
+    XL_ResultField('Cooling + Dehum Demand', 'Verification', 'I38'),
+    XL_ResultField('Cooling Load', 'Verification', 'I39'),
+    XL_ResultField('Frequency of Overheating', 'Verification', 'I40'),
+    XL_ResultField('Frequency of excessively high humidity', 'Verification', 'I41'),
+    XL_ResultField('Pressurization test result', 'Verification', 'I43'),
+    XL_ResultField('Non-Renewable PE', 'Verification', 'I53'),
+    XL_ResultField('PER Demand', 'Verification', 'I55'),
+    XL_ResultField('PER', 'Verification', 'I56'),
+    XL_ResultField('Heating Total', 'Heating', 'O27'),
+    XL_ResultField('Cooling Total', 'Cooling', 'O28'),
+    ]
+
+def _asField(_field):
+    if isinstance(_field, XL_ResultField):
+        return _field
+    return XL_ResultField(*_field)
+
+def _seedRects(_cells):
+    """ {(row, col), ...} --> [firstRow, firstCol, lastRow, lastCol, numCells] rectangles with no empty cells """
+    rowCols = {}
+    for row, col in _cells:
+        rowCols.setdefault(row, []).append(col)
+
+    rowRuns = []
+    for row in sorted(rowCols):
+        cols = sorted(rowCols[row])
+        start = prev = cols[0]
+        for col in cols[1:]:
+            if col != prev + 1:
+                rowRuns.append( (row, start, prev) )
+                start = col
+            prev = col
+        rowRuns.append( (row, start, prev) )
+
+    return [[r1, c1, r2, c2, (r2 - r1 + 1) * (c2 - c1 + 1)] for r1, c1, r2, c2 in _stackRuns(rowRuns)]
+
+def _overlaps(_a, _b):
+    return _a[0] <= _b[2] and _b[0] <= _a[2] and _a[1] <= _b[3] and _b[1] <= _a[3]
+
+def _merged(_rects, _i, _j):
+    """ The rectangle around _rects[_i] and _rects[_j], grown until it doesn't cut through any other one
+
+    Returns:
+        (rect, members): The [firstRow, firstCol, lastRow, lastCol, numCells] rectangle and
+            the indexes of the rectangles inside it
+    """
+    a, b = _rects[_i], _rects[_j]
+    box = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+    members = set([_i, _j])
+    changed = True
+    while changed:
+        changed = False
+        for k, rect in enumerate(_rects):
+            if k not in members and _overlaps(box, rect):
+                box = [min(box[0], rect[0]), min(box[1], rect[1]), max(box[2], rect[2]), max(box[3], rect[3])]
+                members.add(k)
+                changed = True
+    box.append( sum(_rects[k][4] for k in members) )
+    return box, members
+
+def _waste(_rect):
+    return (_rect[2] - _rect[0] + 1) * (_rect[3] - _rect[1] + 1) - _rect[4]
+
+def coverCells(_cells, _maxWaste=DEFAULT_MAX_WASTE):
+    """ Finds a few rectangles which cover all the cells on one worksheet
+
+    Args:
+        _cells (iterable): The (row, col) cells to read
+        _maxWaste (int): The most cells, not in _cells, a merged rectangle may cover
+    Returns:
+        rects (list): (firstRow, firstCol, lastRow, lastCol) rectangles, sorted. They don't overlap.
+    """
+    rects = _seedRects(set(_cells))
+
+    while len(rects) > 1:
+        best = None
+        for i in range(len(rects)):
+            for j in range(i + 1, len(rects)):
+                rect, members = _merged(rects, i, j)
+                waste = _waste(rect)
+                if waste <= _maxWaste and (best is None or waste < best[0]):
+                    best = (waste, rect, members)
+        if best is None:
+            break
+        rects = [rect for k, rect in enumerate(rects) if k not in best[2]] + [best[1]]
+
+    return sorted(tuple(rect[:4]) for rect in rects)
+
+class XL_Results(object):
+    """ The values read by an XL_ResultReader, by label, in the order the fields were given """
+
+    def __init__(self, _fields, _values, _missingSheets=()):
+        """
+        Args:
+            _fields (list): The XL_ResultFields
+            _values (list): The typed value for each field. None if it couldn't be read
+            _missingSheets (list): The worksheets which weren't found in the workbook
+        """
+        self.Fields = tuple(_fields)
+        self.Values = tuple(_values)
+        self.MissingSheets = list(_missingSheets)
+        self._index = dict( (field.Label, i) for i, field in enumerate(self.Fields) )
+
+    @property
+    def Labels(self):
+        return [field.Label for field in self.Fields]
+
+    @property
+    def Missing(self):
+        """ The fields on worksheets which weren't found """
+        return [field for field in self.Fields if field.Worksheet in self.MissingSheets]
+
+    def get(self, _label, _default=None):
+        i = self._index.get(_label)
+        return _default if i is None else self.Values[i]
+
+    def __getitem__(self, _key):
+        if isinstance(_key, (int, slice)):
+            return self.Values[_key]
+        return self.Values[self._index[_key]]
+
+    def __contains__(self, _label):
+        return _label in self._index
+
+    def __len__(self):
+        return len(self.Fields)
+
+    def items(self):
+        """ Returns a list of (label, value) pairs, in field order """
+        return [(field.Label, value) for field, value in zip(self.Fields, self.Values)]
+
+    def __unicode__(self):
+        return u'PHPP Results: {} values'.format(len(self.Fields))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _fields={!r}, _values={!r}, _missingSheets={!r} )".format(
+               self.__class__.__name__,
+               self.Fields,
+               self.Values,
+               self.MissingSheets)
+
+class XL_ResultReader(object):
+    """ Reads a fixed list of named result cells from a workbook, one range read per rectangle """
+
+    def __init__(self, _fields=VERIFICATION_RESULTS, _maxWaste=DEFAULT_MAX_WASTE):
+        """
+        Args:
+            _fields (list): XL_ResultFields, or (Label, Worksheet, Address[, Type]) tuples.
+                Address is a single cell. Type is one of RESULT_TYPES, default 'number'.
+            _maxWaste (int): Passed on to coverCells()
+        """
+        self.Fields = [_asField(field) for field in _fields]
+
+        sheets = {}
+        self.Order = [] # The worksheets, in the order first used
+        self._cells = []
+        for field in self.Fields:
+            if field.Type not in RESULT_TYPES:
+                raise ValueError("Unknown result type '{}' for '{}'".format(field.Type, field.Label))
+            cell = parseAddress(field.Address)
+            if field.Worksheet not in sheets:
+                sheets[field.Worksheet] = []
+                self.Order.append(field.Worksheet)
+            sheets[field.Worksheet].append(cell)
+            self._cells.append(cell)
+
+        self.Rects = dict( (sheetName, coverCells(cells, _maxWaste)) for sheetName, cells in sheets.items() )
+
+    @property
+    def NumReads(self):
+        """ The number of range reads read() makes """
+        return sum(len(rects) for rects in self.Rects.values())
+
+    def read(self, _workbook):
+        """ Reads the results
+
+        Args:
+            _workbook (XL_Workbook): The workbook to read from (any backend)
+        Returns:
+            results (XL_Results): The typed values
+        """
+        values = {} # {(Worksheet, row, col): value}
+        missing = []
+        for sheetName in self.Order:
+            if not _workbook.hasSheet(sheetName):
+                missing.append(sheetName)
+                continue
+            for r1, c1, r2, c2 in self.Rects[sheetName]:
+                rows = _workbook.readRange(sheetName, formatRange(r1, c1, r2, c2))
+                for i, row in enumerate(rows):
+                    for j, value in enumerate(row):
+                        values[(sheetName, r1 + i, c1 + j)] = value
+
+        typed = []
+        for field, (row, col) in zip(self.Fields, self._cells):
+            typed.append( RESULT_TYPES[field.Type]( values.get((field.Worksheet, row, col)) ) )
+        return XL_Results(self.Fields, typed, missing)
+
+    def __unicode__(self):
+        return u'PHPP Result Reader: {} fields in {} reads'.format(len(self.Fields), self.NumReads)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _fields={!r} )".format(
+               self.__class__.__name__,
+               self.Fields)
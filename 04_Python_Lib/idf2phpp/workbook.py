@@ -0,0 +1,491 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+The workbook interface used by the 'Open / Write / Read / Save XL Workbook'
+components.
+
+The components only use the methods of XL_Workbook, so the PHPP can be
+written through different backends:
+    - The Excel COM backend, ExcelInstance in the 'Open XL Workbook' component
+    - XLSX_Workbook: reads and writes the .xlsx / .xlsm file directly, without
+      Excel (see idf2phpp.xlsx_read and idf2phpp.xlsx_patch). With _calculate
+      it also works out the formula results (see idf2phpp.xl_calc)
+    - XL_MemoryWorkbook: keeps the cells in dicts. For tests and benchmarks,
+      it counts the calls made the same way a COM backend would make them.
+
+A backend needs sheetNames(), readRange(), writeBlock(), highlight() and
+save(). XL_Workbook.write() does the rest: it groups the writes into blocks
+(see idf2phpp.write_plan), writes them, and highlights them.
+
+Each workbook with a Path also has an XL_WriteCache (see
+idf2phpp.write_cache) with the values last written to it. Backends call
+writeCache().commit() once the workbook has been saved.
+
+write() also remembers the cells it wrote, so recalculate() only has to
+calculate the formulas downstream of them (see idf2phpp.xl_depends), using
+the backend's calculateRange(), calculateSheet() or calculateAll(). If none
+of the cells written feed a formula nothing is recalculated at all.
+XLSX_Workbook does the same with its calculator (see idf2phpp.xl_calc). The
+Excel COM backend leaves this to Excel, which already only recalculates the
+formulas a write made dirty.
+"""
+
+import os
+import zipfile
+from collections import namedtuple
+
+from idf2phpp.write_cache import XL_WriteCache
+from idf2phpp.write_plan import DEFAULT_MAX_GAP, planWrites
+from idf2phpp.xl_calc import XL_Calculator
+from idf2phpp.xl_depends import planRecalc
+from idf2phpp.xl_address import expandRange, parseRange
+from idf2phpp.xlsx_patch import KEEP_VALUE, getWorksheetParts, patchXLSXSheets
+from idf2phpp.xlsx_read import readSharedStrings, readSheetValues, readXLSX
+
+XL_WriteResult = namedtuple('XL_WriteResult', ['NumCells', 'NumBlocks', 'MissingSheets', 'FailedCells'])
+
+class XL_Workbook(object):
+    """ An open PHPP workbook. Subclasses do the actual reading and writing """
+
+    Name = u''
+    Path = None # The workbook's file, if it has one
+    _writeCache = None
+    _written = None      # {(Worksheet, row, col): value} written since the last recalculate()
+    _dependencies = None # (path, XL_Calculator, XL_DependencyMap) of the workbook's formulas
+
+    def isOpen(self):
+        """ True if the workbook can be read / written """
+        return True
+
+    def sheetNames(self):
+        """ The names of the worksheets, in tab order """
+        raise NotImplementedError
+
+    def hasSheet(self, _sheetName):
+        return _sheetName in self.sheetNames()
+
+    def readRange(self, _sheetName, _address):
+        """ Returns the values (as Range.Value2) of a range, as a list of rows. Empty cells are None """
+        raise NotImplementedError
+
+    def readFormulas(self, _sheetName, _address):
+        """ Like readRange, but formula cells give their formula (ie: '=J23'). Used to fill in the gaps of write blocks """
+        return self.readRange(_sheetName, _address)
+
+    def readCells(self, _cells):
+        """ Returns the values of several single cells
+
+        Args:
+            _cells (iterable): (Worksheet, Address) pairs, ie: [('Verification', 'I34'), ...]
+        Returns:
+            values (list): The values in the same order. None for cells on missing worksheets.
+        """
+        values = []
+        for sheetName, address in _cells:
+            values.append( self.readRange(sheetName, address)[0][0] if self.hasSheet(sheetName) else None )
+        return values
+
+    def blockValues(self, _block):
+        """ The values to write for an XL_WriteBlock, with its gaps filled in from the workbook """
+        if not _block.HasGaps:
+            return _block.Values
+        return _block.fillGaps( self.readFormulas(_block.Worksheet, _block.Address) )
+
+    def writeBlock(self, _block):
+        """ Writes one XL_WriteBlock. Returns a list of the (Worksheet, row, col) cells that couldn't be written """
+        raise NotImplementedError
+
+    def highlight(self, _sheetName, _addresses):
+        """ Highlights cells (like Interior.ColorIndex = 8). _addresses are (multi-area) range addresses """
+        raise NotImplementedError
+
+    def beginWrite(self):
+        """ Called before write() writes the blocks, ie: to turn off Excel's automatic calculation """
+        pass
+
+    def endWrite(self):
+        """ Called after write() is done (even if it failed) """
+        pass
+
+    def write(self, _writes, _highlight=True, _maxGap=DEFAULT_MAX_GAP):
+        """ Writes cell values to the workbook
+
+        Args:
+            _writes (iterable): PHPP_XL_Objs, PHPP_Cells or (Worksheet, Range, Value) tuples
+            _highlight (bool): Highlight the cells written
+            _maxGap (int): Passed on to planWrites()
+        Returns:
+            result (XL_WriteResult): The number of cells and blocks written, the worksheets which
+                weren't found, and any (Worksheet, row, col) cells which couldn't be written
+        """
+        blocks = planWrites(_writes, _maxGap)
+        numCells = 0
+        missing = []
+        failed = []
+
+        self.beginWrite()
+        try:
+            for block in blocks:
+                if not self.hasSheet(block.Worksheet):
+                    if block.Worksheet not in missing:
+                        missing.append(block.Worksheet)
+                    continue
+                failed.extend( self.writeBlock(block) or [] )
+                self._noteWritten(block)
+                numCells += block.NumWritten
+                if _highlight:
+                    self.highlight(block.Worksheet, block.highlightAddresses())
+        finally:
+            self.endWrite()
+
+        return XL_WriteResult(numCells - len(failed), len(blocks) - len(missing), missing, failed)
+
+    def writeCache(self):
+        """ The XL_WriteCache with the values last written to this workbook (kept in memory if there is no Path) """
+        path = os.path.abspath(self.Path) if self.Path else None
+        if self._writeCache is None or self._writeCache.WorkbookPath != path:
+            self._writeCache = XL_WriteCache(path)
+        return self._writeCache
+
+    def _noteWritten(self, _block):
+        if self._written is None:
+            self._written = {}
+        for i, (values, written) in enumerate(zip(_block.Values, _block.Written)):
+            for j, (value, w) in enumerate(zip(values, written)):
+                if w:
+                    self._written[(_block.Worksheet, _block.FirstRow + i, _block.FirstCol + j)] = value
+
+    def formulaPath(self):
+        """ The .xlsx / .xlsm file the workbook's formulas can be read from. None if there isn't one """
+        return self.Path
+
+    def dependencyMap(self):
+        """ The XL_DependencyMap of the workbook's formulas (see idf2phpp.xl_depends)
+
+        It is read from formulaPath() the first time, and then kept up to date
+        with the formulas written. None if the formulas can't be read.
+        """
+        path = self.formulaPath()
+        path = os.path.abspath(path) if path else None
+        if self._dependencies is None or self._dependencies[0] != path:
+            book = depends = None
+            if path and path.lower().endswith(('.xlsx', '.xlsm')) and os.path.exists(path):
+                try:
+                    book = XL_Calculator.fromXLSX(path, False)
+                    depends = book.dependencyMap()
+                except (EnvironmentError, zipfile.BadZipfile, KeyError, ValueError):
+                    book = depends = None
+            self._dependencies = (path, book, depends)
+        return self._dependencies[2]
+
+    def recalcPlan(self):
+        """ What recalculate() would calculate now (an XL_RecalcPlan, see idf2phpp.xl_depends.planRecalc) """
+        written = self._written or {}
+        depends = self.dependencyMap() if written else None
+        if depends is not None:
+            book = self._dependencies[1]
+            for key, value in written.items():
+                if isinstance(value, (str, type(u''))) and value.startswith(u'=') and len(value) > 1:
+                    precedents, dynamic = book.formulaPrecedents(key, value)
+                    depends.add(key, precedents, dynamic)
+                else:
+                    depends.remove(key)
+        return planRecalc(depends, written)
+
+    def recalculate(self):
+        """ Brings the formula results up to date, if the backend can
+
+        Only the formulas downstream of the cells written since the last call
+        are calculated, and nothing at all if there aren't any.
+
+        Returns:
+            plan (XL_RecalcPlan): What was calculated. None if the backend doesn't calculate.
+        """
+        plan = self.recalcPlan()
+        self._written = None
+        if plan.Ranges:
+            for sheetName, address in plan.Ranges:
+                self.calculateRange(sheetName, address)
+        elif plan.Sheets:
+            for sheetName in plan.Sheets:
+                self.calculateSheet(sheetName)
+        elif plan.Full:
+            self.calculateAll()
+        return plan
+
+    def calculateRange(self, _sheetName, _address):
+        """ Calculates the formulas in one range (only it: the cells it refers to are already up to date) """
+        pass
+
+    def calculateSheet(self, _sheetName):
+        """ Calculates the formulas on one worksheet """
+        pass
+
+    def calculateAll(self):
+        """ Calculates every formula """
+        pass
+
+    def save(self):
+        """ Saves the workbook. Returns True if it worked """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __unicode__(self):
+        return u'{} | Workbook: {}'.format(self.__class__.__name__, self.Name)
+
+    def __str__(self):
+        return self.__unicode__()
+
+def _splitAddresses(_addresses):
+    """ ['A1:B2,D4', 'F6'] --> all the (row, col) cells """
+    cells = []
+    for address in _addresses:
+        for part in address.split(','):
+            cells.extend( expandRange(part) )
+    return cells
+
+class XLSX_Workbook(XL_Workbook):
+    """ Reads and writes a .xlsx / .xlsm file directly, without Excel
+
+    The writes are kept until save(), which patches them all into the file
+    at once. Reads give the values saved in the file (with the unsaved
+    writes on top): formulas aren't recalculated, unless the workbook was
+    opened with _calculate. Then recalculate() works out the formula results
+    in Python and later reads give those instead of the saved ones.
+    """
+
+    def __init__(self, _path, _outPath=None, _calculate=False):
+        """
+        Args:
+            _path (str): The workbook to open
+            _outPath (str): <Optional> Where save() writes to. Default is _path (changed in place)
+            _calculate (bool): <Optional> Calculate the formulas on recalculate() (see idf2phpp.xl_calc)
+        """
+        self.Path = _path
+        self.OutPath = _outPath or _path
+        self.Name = _path
+        self.Calculate = _calculate
+        self.Pending = {}   # {worksheet name: {(row, col): (value, highlight)}}
+        self._values = {}   # {worksheet name: {(row, col): value}}, read as needed
+        self._sharedStrings = None
+        self._calculator = None
+
+        with zipfile.ZipFile(_path) as z:
+            self.SheetParts = getWorksheetParts(z)
+
+    def sheetNames(self):
+        return list(self.SheetParts)
+
+    def hasSheet(self, _sheetName):
+        return _sheetName in self.SheetParts
+
+    def _sheetValues(self, _sheetName):
+        if _sheetName not in self._values:
+            with zipfile.ZipFile(self.Path) as z:
+                if self._sharedStrings is None:
+                    self._sharedStrings = readSharedStrings(z)
+                self._values[_sheetName] = readSheetValues(z, self.SheetParts[_sheetName], self._sharedStrings)
+        return self._values[_sheetName]
+
+    def readRange(self, _sheetName, _address):
+        pending = self.Pending.get(_sheetName, {})
+        r1, c1, r2, c2 = parseRange(_address)
+        if self._calculator is not None:
+            calculated = self._calculator.readRange(_sheetName, _address)
+            saved = dict( ((r1 + i, c1 + j), value) for i, values in enumerate(calculated) for j, value in enumerate(values) )
+        else:
+            saved = self._sheetValues(_sheetName)
+
+        rows = []
+        for row in range(r1, r2 + 1):
+            values = []
+            for col in range(c1, c2 + 1):
+                value = pending.get((row, col), (KEEP_VALUE,))[0]
+                if value is KEEP_VALUE:
+                    value = saved.get((row, col))
+                elif value == u'':
+                    value = None
+                values.append(value)
+            rows.append(values)
+        return rows
+
+    def writeBlock(self, _block):
+        pending = self.Pending.setdefault(_block.Worksheet, {})
+        for i, (values, written) in enumerate(zip(_block.Values, _block.Written)):
+            for j, (value, w) in enumerate(zip(values, written)):
+                if w:
+                    cell = (_block.FirstRow + i, _block.FirstCol + j)
+                    pending[cell] = (value, pending.get(cell, (None, False))[1])
+        return []
+
+    def highlight(self, _sheetName, _addresses):
+        pending = self.Pending.setdefault(_sheetName, {})
+        for cell in _splitAddresses(_addresses):
+            pending[cell] = (pending.get(cell, (KEEP_VALUE,))[0], True)
+
+    def dependencyMap(self):
+        """ With _calculate, the calculator's formulas (with the writes so far), instead of reading the file again """
+        if self._calculator is None:
+            return super(XLSX_Workbook, self).dependencyMap()
+        if self._dependencies is None or self._dependencies[1] is not self._calculator:
+            self._dependencies = (os.path.abspath(self.Path), self._calculator, self._calculator.dependencyMap())
+        return self._dependencies[2]
+
+    def recalculate(self):
+        """ With _calculate, brings the calculated formula results up to date with the writes so far
+
+        Only the cells written since the last call are given to the calculator,
+        and only the results downstream of them (see XL_Workbook.recalcPlan())
+        are worked out again, when they're next read.
+
+        Returns:
+            plan (XL_RecalcPlan): The formulas the writes affect. None without _calculate.
+        """
+        if not self.Calculate:
+            self._written = None
+            return None
+        if self._calculator is None:
+            self._calculator = XL_Calculator.fromXLSX(self.Path)
+        plan = self.recalcPlan()
+        written = self._written or {}
+        self._written = None
+        if written:
+            self._calculator.setValues([(sheetName, None, value, row, col)
+                                        for (sheetName, row, col), value in written.items()])
+        return plan
+
+    def save(self):
+        cache = self.writeCache()
+        if self.Pending or self.OutPath != self.Path:
+            patchXLSXSheets(self.Path, self.OutPath, self.Pending)
+        self.Path = self.OutPath
+        self.Pending = {}
+        self._values = {}
+        self._sharedStrings = None
+
+        if cache.Current is not None and cache.WorkbookPath != os.path.abspath(self.Path):
+            self._writeCache = XL_WriteCache(self.Path) # Saved to a new file: the values go with it
+            self._writeCache.Current = cache.Current
+        self.writeCache().commit()
+        return True
+
+    def __repr__(self):
+        return "{}( _path={!r}, _outPath={!r}, _calculate={!r} )".format(
+               self.__class__.__name__,
+               self.Path,
+               self.OutPath,
+               self.Calculate)
+
+class XL_MemoryWorkbook(XL_Workbook):
+    """ A workbook kept in memory, for tests and benchmarks
+
+    The Calls dict counts the backend calls ('read', 'write', 'style',
+    'recalc', 'save'), one for each Excel COM call a real backend would make.
+    Made with fromXLSX(), recalculate() knows the file's formulas, so it
+    counts one 'recalc' for each range or worksheet it would calculate.
+    """
+
+    def __init__(self, _sheets=None, _name=u'memory'):
+        """
+        Args:
+            _sheets (dict): <Optional> The starting values: {worksheet name: {(row, col): value}}
+            _name (str): <Optional> A name for the messages
+        """
+        self.Name = _name
+        self.Sheets = dict( (nm, dict(cells)) for nm, cells in (_sheets or {}).items() )
+        self.SheetOrder = list(_sheets or {})
+        self.Highlighted = dict( (nm, set()) for nm in self.Sheets )
+        self.Calls = {'read': 0, 'write': 0, 'style': 0, 'recalc': 0, 'save': 0}
+        self.FormulaFile = None
+
+    @classmethod
+    def fromXLSX(cls, _path, _sheetNames=None):
+        """ Loads the saved values of a .xlsx / .xlsm file (see idf2phpp.xlsx_read.readXLSX) """
+        with zipfile.ZipFile(_path) as z:
+            order = [nm for nm in getWorksheetParts(z) if _sheetNames is None or nm in _sheetNames]
+        sheets = readXLSX(_path, order)
+        workbook = cls(sheets, _path)
+        workbook.SheetOrder = order
+        workbook.FormulaFile = _path
+        return workbook
+
+    def addSheet(self, _sheetName):
+        if _sheetName not in self.Sheets:
+            self.Sheets[_sheetName] = {}
+            self.Highlighted[_sheetName] = set()
+            self.SheetOrder.append(_sheetName)
+
+    def sheetNames(self):
+        return list(self.SheetOrder)
+
+    def hasSheet(self, _sheetName):
+        return _sheetName in self.Sheets
+
+    def readRange(self, _sheetName, _address):
+        self.Calls['read'] += 1
+        cells = self.Sheets[_sheetName]
+        r1, c1, r2, c2 = parseRange(_address)
+        return [[cells.get((row, col)) for col in range(c1, c2 + 1)] for row in range(r1, r2 + 1)]
+
+    def writeBlock(self, _block):
+        self.Calls['write'] += 1
+        if _block.HasGaps:
+            self.Calls['read'] += 1 # A COM backend reads the gaps first
+        cells = self.Sheets[_block.Worksheet]
+        for i, (values, written) in enumerate(zip(_block.Values, _block.Written)):
+            for j, (value, w) in enumerate(zip(values, written)):
+                if not w:
+                    continue
+                cell = (_block.FirstRow + i, _block.FirstCol + j)
+                if value is None or value == u'':
+                    cells.pop(cell, None)
+                else:
+                    cells[cell] = value
+        return []
+
+    def highlight(self, _sheetName, _addresses):
+        self.Calls['style'] += len(_addresses)
+        self.Highlighted[_sheetName].update( _splitAddresses(_addresses) )
+
+    def formulaPath(self):
+        return self.FormulaFile
+
+    def calculateRange(self, _sheetName, _address):
+        self.Calls['recalc'] += 1
+
+    def calculateSheet(self, _sheetName):
+        self.Calls['recalc'] += 1
+
+    def calculateAll(self):
+        self.Calls['recalc'] += 1
+
+    def save(self):
+        self.Calls['save'] += 1
+        return True
+
+    def __repr__(self):
+        return "{}( _sheets=<{} sheets>, _name={!r} )".format(
+               self.__class__.__name__,
+               len(self.Sheets),
+               self.Name)
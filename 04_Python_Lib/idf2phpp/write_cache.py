@@ -0,0 +1,192 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Remembers what was last written to a PHPP workbook, so only the changes
+need to be written next time.
+
+The 'Write XL Workbook' component used to keep the last values written in
+sc.sticky, which is lost when Rhino restarts or another workbook is opened.
+XL_WriteCache keeps them in a small file next to the workbook instead
+('.<workbook name>.idf2phpp_writes.json'), along with the size, modified time
+and content hash of the workbook as it was saved.
+
+    - diff() gives the cells which changed since the last write (or all of
+      them if nothing is known about the workbook)
+    - update() records the values just written (not saved to disk yet)
+    - commit() is called after the workbook itself is saved. It writes the
+      cache file, with the hash of the saved workbook.
+
+When the cache file is loaded, the workbook's hash must still match. If the
+workbook was changed some other way (saved from Excel by hand, replaced,
+etc...) the cache is ignored and the next write is a full write. Writes which
+were never saved are also forgotten, since they aren't in the file either.
+"""
+
+import hashlib
+import json
+import os
+
+CACHE_FORMAT_VERSION = 2
+_CACHE_SUFFIX = '.idf2phpp_writes.json'
+
+def cellWrites(_values):
+    """ {(Worksheet, row, col): Value} --> (Worksheet, None, Value, row, col) writes for XL_Workbook.write() """
+    return [(sheet, None, value, row, col) for (sheet, row, col), value in _values.items()]
+
+def cachePathFor(_workbookPath):
+    """ 'C:/PHPP/house.xlsx' --> 'C:/PHPP/.house.xlsx.idf2phpp_writes.json' """
+    folder, name = os.path.split(os.path.abspath(_workbookPath))
+    return os.path.join(folder, '.' + name + _CACHE_SUFFIX)
+
+def _fileStamp(_path):
+    st = os.stat(_path)
+    return st.st_size, repr(st.st_mtime)
+
+def _hashFile(_path, _blockSize=1024 * 1024):
+    h = hashlib.sha1()
+    with open(_path, 'rb') as f:
+        while True:
+            block = f.read(_blockSize)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+class XL_WriteCache(object):
+    """ The values last written to one workbook: {(Worksheet, row, col): Value} """
+
+    def __init__(self, _workbookPath=None):
+        """
+        Args:
+            _workbookPath (str): The workbook's file. None keeps the cache in memory only.
+        """
+        self.WorkbookPath = os.path.abspath(_workbookPath) if _workbookPath else None
+        self.CachePath = cachePathFor(_workbookPath) if _workbookPath else None
+        self.Current = None   # The values in the open workbook, or None if unknown
+        self.Committed = None # The values in the saved workbook file
+        self.load()
+
+    def load(self):
+        """ Reads the cache file. Leaves the cache empty if it doesn't match the workbook file """
+        self.Current = None
+        self.Committed = None
+        if not self.CachePath or not os.path.exists(self.CachePath) or not os.path.exists(self.WorkbookPath):
+            return False
+
+        try:
+            with open(self.CachePath, 'r') as f:
+                state = json.load(f)
+            if state.get('version') != CACHE_FORMAT_VERSION or state.get('workbook') != self.WorkbookPath:
+                return False
+
+            size, mtime = _fileStamp(self.WorkbookPath)
+            if (size, mtime) != (state.get('size'), state.get('mtime')):
+                if _hashFile(self.WorkbookPath) != state.get('sha1'):
+                    return False # Changed outside of IDF2PHPP
+                self._writeState(state['cells'], state['sha1']) # Same contents, just touched
+
+            cells = dict( ((sheet, row, col), value) for sheet, row, col, value in state['cells'] )
+        except (EnvironmentError, ValueError, KeyError, TypeError):
+            return False
+
+        self.Committed = cells
+        self.Current = dict(cells)
+        return True
+
+    def diff(self, _values):
+        """ The writes needed to get from the last values written to _values
+
+        Args:
+            _values (dict): The new values: {(Worksheet, row, col): Value}
+        Returns:
+            diff (list): (Worksheet, None, Value, row, col) writes (see cellWrites). Cells
+                written before but not in _values any more are cleared (Value '').
+        """
+        if self.Current is None:
+            return cellWrites(_values)
+
+        diff = []
+        for key, value in _values.items():
+            if key not in self.Current or self.Current[key] != value:
+                diff.append( (key[0], None, value, key[1], key[2]) )
+        for key in self.Current:
+            if key not in _values:
+                diff.append( (key[0], None, u'', key[1], key[2]) )
+        return diff
+
+    def update(self, _values, _failed=()):
+        """ Records the values just written to the open workbook
+
+        Args:
+            _values (dict): All the values now in the workbook: {(Worksheet, row, col): Value}
+            _failed (iterable): <Optional> (Worksheet, row, col) keys which didn't get written,
+                so they are tried again next time
+        """
+        self.Current = dict(_values)
+        for key in _failed:
+            self.Current.pop(key, None)
+
+    def commit(self):
+        """ Call after the workbook has been saved: the file now has the Current values """
+        if self.Current is None:
+            return
+        self.Committed = dict(self.Current)
+        if self.CachePath and os.path.exists(self.WorkbookPath):
+            cells = [[sheet, row, col, value] for (sheet, row, col), value in self.Committed.items()]
+            self._writeState(cells, _hashFile(self.WorkbookPath))
+
+    def clear(self):
+        """ Forgets everything, so the next write is a full write """
+        self.Current = None
+        self.Committed = None
+        if self.CachePath and os.path.exists(self.CachePath):
+            os.remove(self.CachePath)
+
+    def _writeState(self, _cells, _sha1):
+        size, mtime = _fileStamp(self.WorkbookPath)
+        state = {'version': CACHE_FORMAT_VERSION, 'workbook': self.WorkbookPath,
+                 'size': size, 'mtime': mtime, 'sha1': _sha1, 'cells': _cells}
+
+        tempPath = '{}.{}.tmp'.format(self.CachePath, os.getpid())
+        try:
+            with open(tempPath, 'w') as f:
+                json.dump(state, f, default=str)
+            if os.path.exists(self.CachePath):
+                os.remove(self.CachePath)
+            os.rename(tempPath, self.CachePath)
+        except EnvironmentError:
+            if os.path.exists(tempPath):
+                os.remove(tempPath) # Read-only folder, etc... Just do a full write next time
+
+    def __len__(self):
+        return len(self.Current or {})
+
+    def __unicode__(self):
+        return u'XL Write Cache | Workbook: {}  |  Cells: {}'.format(self.WorkbookPath, len(self))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _workbookPath={!r} )".format(
+               self.__class__.__name__,
+               self.WorkbookPath)
@@ -0,0 +1,257 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Groups single-cell Excel writes into rectangular blocks.
+
+Every Range[...].Value2 assignment through COM is a call into the Excel
+process, so writing one cell at a time is slow. planWrites() takes the
+(Worksheet, Range, Value) writes and groups them, per worksheet, into
+rectangles which can each be written with a single 2-D array assignment:
+
+    - The cells written on each row are split into runs. Small gaps (up to
+      _maxGap cells) between the written cells are bridged.
+    - Runs covering the same columns on following rows are stacked into one
+      block, so a PHPP table (ie: the 'Areas' surfaces) is usually one block.
+
+The gap cells of a block aren't meant to change. The writer reads them once
+(see XL_WriteBlock.fillGaps) and writes their contents back as they were.
+Read them with Range.Formula, not Value2, so any formulas are kept.
+
+The highlighting can be done per block as well: highlightAddresses() gives
+the written cells (without the gaps) as a few multi-area addresses.
+"""
+
+from idf2phpp.xl_address import expandRange, formatRange
+
+DEFAULT_MAX_GAP = 2
+MAX_ADDRESS_LENGTH = 255 # Excel's limit for a multi-area Range address
+
+class XL_WriteBlock(object):
+    """ A rectangle of cells on one worksheet, to be written with one 2-D assignment """
+    __slots__ = ('Worksheet', 'FirstRow', 'FirstCol', 'Values', 'Written')
+
+    def __init__(self, _worksheet, _firstRow, _firstCol, _values, _written):
+        """
+        Args:
+            _worksheet (str): The Worksheet name
+            _firstRow (int): The block's top row (from 1)
+            _firstCol (int): The block's left column (from 1)
+            _values (list): The new values, a list of rows
+            _written (list): For each cell: True if it gets a new value, False for a gap cell
+        """
+        self.Worksheet = _worksheet
+        self.FirstRow = _firstRow
+        self.FirstCol = _firstCol
+        self.Values = _values
+        self.Written = _written
+
+    @property
+    def NumRows(self):
+        return len(self.Values)
+
+    @property
+    def NumCols(self):
+        return len(self.Values[0])
+
+    @property
+    def LastRow(self):
+        return self.FirstRow + self.NumRows - 1
+
+    @property
+    def LastCol(self):
+        return self.FirstCol + self.NumCols - 1
+
+    @property
+    def Address(self):
+        """ ie: 'L41:AL120' """
+        return formatRange(self.FirstRow, self.FirstCol, self.LastRow, self.LastCol)
+
+    @property
+    def NumWritten(self):
+        return sum(sum(1 for w in row if w) for row in self.Written)
+
+    @property
+    def HasGaps(self):
+        return any(not w for row in self.Written for w in row)
+
+    def fillGaps(self, _existing):
+        """ Returns the block's values, with the gap cells taken from _existing
+
+        Args:
+            _existing (list): The block's current contents, a list of rows (ie: from Range.Formula)
+        Returns:
+            values (list): The values to write, a list of rows
+        """
+        return [[new if written else old for new, written, old in zip(newRow, writtenRow, oldRow)]
+                for newRow, writtenRow, oldRow in zip(self.Values, self.Written, _existing)]
+
+    def highlightAddresses(self, _maxLength=MAX_ADDRESS_LENGTH):
+        """ The written cells as multi-area addresses, ie: ['L41:M120,P41:P120,V41:V120']
+
+        A block without gaps is just its own Address. Each address is at
+        most _maxLength characters long, so there may be several.
+        """
+        if not self.HasGaps:
+            return [self.Address]
+
+        rects = _stackRuns( (self.FirstRow + i, self.FirstCol + j, self.FirstCol + k)
+                            for i, row in enumerate(self.Written) for j, k in _runs(row) )
+
+        addresses = []
+        current = ''
+        for r1, c1, r2, c2 in rects:
+            address = formatRange(r1, c1, r2, c2)
+            if current and len(current) + 1 + len(address) > _maxLength:
+                addresses.append(current)
+                current = ''
+            current = '{},{}'.format(current, address) if current else address
+        if current:
+            addresses.append(current)
+        return addresses
+
+    def __unicode__(self):
+        return u'XL Write Block | Worksheet: {}  |  Range: {}  |  Cells Written: {}'.format(
+               self.Worksheet, self.Address, self.NumWritten)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _worksheet={!r}, _firstRow={!r}, _firstCol={!r}, _values={!r}, _written={!r} )".format(
+               self.__class__.__name__,
+               self.Worksheet,
+               self.FirstRow,
+               self.FirstCol,
+               self.Values,
+               self.Written)
+
+def _runs(_written):
+    """ [True, True, False, True] --> [(0, 1), (3, 3)]: the (first, last) index of each run of True """
+    runs = []
+    start = None
+    for i, w in enumerate(_written):
+        if w and start is None:
+            start = i
+        elif not w and start is not None:
+            runs.append( (start, i - 1) )
+            start = None
+    if start is not None:
+        runs.append( (start, len(_written) - 1) )
+    return runs
+
+def _stackRuns(_rowRuns):
+    """ (row, firstCol, lastCol) runs, in row order --> (firstRow, firstCol, lastRow, lastCol) rectangles
+
+    A run is added to the rectangle above it if that covers exactly the same
+    columns and ends on the row just before.
+    """
+    rects = []
+    open_ = {} # {(firstCol, lastCol): index in rects}
+    for row, c1, c2 in _rowRuns:
+        i = open_.get( (c1, c2) )
+        if i is not None and rects[i][2] == row - 1:
+            rects[i][2] = row
+        else:
+            open_[(c1, c2)] = len(rects)
+            rects.append( [row, c1, row, c2] )
+    return [tuple(rect) for rect in rects]
+
+def _writeParts(_write):
+    """ (Worksheet, [(row, col), ...], Value) from a PHPP_XL_Obj, PHPP_Cell or plain tuple
+
+    Tuples can be (Worksheet, Range, Value) or (Worksheet, Range, Value, Row, Col).
+
+    Objects built from the PHPP layout already have their Row and Col, so
+    only the others need their Range text parsed.
+    """
+    if hasattr(_write, 'Worksheet'):
+        row = getattr(_write, 'Row', None)
+        if row is not None:
+            return _write.Worksheet, ((row, _write.Col),), _write.Value
+        return _write.Worksheet, expandRange(_write.Range), _write.Value
+    if len(_write) > 3 and _write[3] is not None:
+        return _write[0], ((_write[3], _write[4]),), _write[2]
+    return _write[0], expandRange(_write[1]), _write[2]
+
+def planWrites(_writes, _maxGap=DEFAULT_MAX_GAP):
+    """ Groups cell writes into rectangular blocks
+
+    Args:
+        _writes (iterable): PHPP_XL_Objs, PHPP_Cells or (Worksheet, Range, Value) tuples
+            (optionally with the Row and Col of a single cell added). Multi-cell ranges ('A1:B2') set every cell to the value. If a cell
+            is written more than once, the last value is used. Can also be a PHPP_CellArray (see idf2phpp.cell_array).
+        _maxGap (int): The most cells in a row to bridge between two written cells
+    Returns:
+        blocks (list): XL_WriteBlocks. Worksheets in the order first written, then by row and column.
+    """
+    sheets = {}
+    order = []
+    if hasattr(_writes, 'writeParts'):
+        parts = _writes.writeParts() # A PHPP_CellArray, the rows and cols are already known
+    else:
+        parts = (_writeParts(write) for write in _writes)
+
+    for sheetName, rowCols, value in parts:
+        if sheetName not in sheets:
+            sheets[sheetName] = {}
+            order.append(sheetName)
+        cells = sheets[sheetName]
+        for cell in rowCols:
+            cells[cell] = value
+
+    blocks = []
+    for sheetName in order:
+        cells = sheets[sheetName]
+
+        rowCols = {}
+        for row, col in cells:
+            rowCols.setdefault(row, []).append(col)
+
+        rowRuns = []
+        for row in sorted(rowCols):
+            cols = sorted(rowCols[row])
+            start = prev = cols[0]
+            for col in cols[1:]:
+                if col - prev > _maxGap + 1:
+                    rowRuns.append( (row, start, prev) )
+                    start = col
+                prev = col
+            rowRuns.append( (row, start, prev) )
+
+        for r1, c1, r2, c2 in sorted(_stackRuns(rowRuns)):
+            values = []
+            written = []
+            for row in range(r1, r2 + 1):
+                values.append( [cells.get((row, col)) for col in range(c1, c2 + 1)] )
+                written.append( [(row, col) in cells for col in range(c1, c2 + 1)] )
+            blocks.append( XL_WriteBlock(sheetName, r1, c1, values, written) )
+
+    return blocks
+
+def countRoundTrips(_blocks, _highlight=True):
+    """ The number of COM calls needed to write the blocks: 1 write, +1 read if it has gaps, +1 per highlight address """
+    calls = 0
+    for block in _blocks:
+        calls += 2 if block.HasGaps else 1
+        if _highlight:
+            calls += len(block.highlightAddresses())
+    return calls
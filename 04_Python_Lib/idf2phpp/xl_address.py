@@ -0,0 +1,79 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Excel 'A1' style cell addresses <--> (row, column) numbers.
+
+Rows and columns are both counted from 1, the same as Excel: 'A1' is (1, 1)
+and 'AB12' is (12, 28). '$' signs are ignored.
+"""
+
+import re
+
+_reAddress = re.compile(r'^\$?([A-Za-z]{1,3})\$?(\d+)$')
+
+def colToIndex(_col):
+    """ 'A' --> 1, 'AB' --> 28 """
+    n = 0
+    for ch in _col.upper():
+        n = n * 26 + ord(ch) - 64
+    return n
+
+def indexToCol(_n):
+    """ 1 --> 'A', 28 --> 'AB' """
+    col = ''
+    while _n:
+        _n, rem = divmod(_n - 1, 26)
+        col = chr(65 + rem) + col
+    return col
+
+def parseAddress(_address):
+    """ 'M11' --> (11, 13) as (row, col). Raises ValueError if it isn't a single cell address """
+    match = _reAddress.match(_address.strip())
+    if not match:
+        raise ValueError("Not a cell address: '{}'".format(_address))
+    return int(match.group(2)), colToIndex(match.group(1))
+
+def parseRange(_range):
+    """ 'M11' --> (11, 13, 11, 13). 'B2:A1' --> (1, 1, 2, 2) as (firstRow, firstCol, lastRow, lastCol) """
+    if ':' not in _range:
+        row, col = parseAddress(_range)
+        return row, col, row, col
+    first, last = _range.split(':', 1)
+    r1, c1 = parseAddress(first)
+    r2, c2 = parseAddress(last)
+    return min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2)
+
+def expandRange(_range):
+    """ 'M11' --> [(11, 13)]. 'A1:B2' --> all four cells, row by row """
+    r1, c1, r2, c2 = parseRange(_range)
+    return [(r, c) for r in range(r1, r2 + 1) for c in range(c1, c2 + 1)]
+
+def formatAddress(_row, _col):
+    """ (11, 13) --> 'M11' """
+    return '{}{}'.format(indexToCol(_col), _row)
+
+def formatRange(_firstRow, _firstCol, _lastRow, _lastCol):
+    """ (41, 12, 120, 38) --> 'L41:AL120'. A single cell gives just 'L41' """
+    first = formatAddress(_firstRow, _firstCol)
+    if (_firstRow, _firstCol) == (_lastRow, _lastCol):
+        return first
+    return '{}:{}'.format(first, formatAddress(_lastRow, _lastCol))
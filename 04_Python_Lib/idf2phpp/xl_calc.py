@@ -0,0 +1,1120 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Evaluates a PHPP's formulas in Python, without Excel.
+
+XL_Calculator.fromXLSX() loads the cell values, formulas, defined names and
+calculation settings of a .xlsx / .xlsm file. calculate() then evaluates
+only the formulas which the result cells depend on (by default the
+Verification results, see idf2phpp.result_reader.VERIFICATION_RESULTS):
+
+    - Each formula is parsed (idf2phpp.xl_formula) and compiled into nested
+      Python closures the first time it is needed. Defined names are
+      substituted in when the formula is compiled.
+    - The cells a formula refers to are its precedents. Following them back
+      from the result cells gives the part of the workbook's dependency graph
+      which has to be calculated. It is put in order (dependencies first)
+      without recursion, since chains of thousands of cells are normal in
+      a PHPP.
+    - Circular references are found the same way (as strongly connected
+      parts of the graph) and iterated like Excel's iterative calculation,
+      using the workbook's iteration count and maximum change, starting from
+      the values saved in the file.
+
+The calculator has the same hasSheet() / readRange() methods as an
+XL_Workbook, so an XL_ResultReader can read the results from it. New input
+values are set with setValues() (PHPP_XL_Objs, PHPP_Cells, tuples or a
+PHPP_CellArray, the same as XL_Workbook.write()).
+
+check() compares the results with the values Excel saved with the file,
+which is how to find out if a template uses something the calculator gets
+wrong. Functions it doesn't know give #NAME? and are listed in Unsupported
+(see idf2phpp.xl_functions for the ones it does). The range functions use
+NumPy when it is installed; set _useNumpy=False to use plain Python only.
+
+    python -m idf2phpp.xl_calc PHPP.xlsx [--check]
+"""
+
+import argparse
+import sys
+import time
+import zipfile
+from collections import OrderedDict, namedtuple
+
+from idf2phpp.result_reader import VERIFICATION_RESULTS, XL_ResultReader
+from idf2phpp.write_plan import _writeParts
+from idf2phpp.xl_depends import XL_CellIndex, XL_DependencyMap, orderCells
+from idf2phpp.xl_address import formatAddress, parseRange
+from idf2phpp.xl_formula import XL_FormulaError, parseFormula, parseRef, walkRefs
+from idf2phpp.xl_functions import (DYNAMIC_FUNCTIONS, ERR_DIV0, ERR_NA, ERR_NAME, ERR_NUM, ERR_REF, ERR_VALUE,
+                                   FUNCTIONS, OPERATORS, XL_Array, XL_Error, XL_Range, argMode, errorValue, isMulti,
+                                   negate, numpy, percent, toBool, toInt, valueRows)
+from idf2phpp.xlsx_patch import KEEP_VALUE, _reNumber, getWorksheetParts
+from idf2phpp.xlsx_read import readCalcSettings, readDefinedNames, readSharedStrings, readSheetCells
+
+DEFAULT_ITERATE = (100, 0.001) # Excel's defaults: max iterations, max change
+NUMPY_MIN_CELLS = 64 # Ranges smaller than this are quicker in plain Python
+MAX_NAME_DEPTH = 32
+
+XL_Mismatch = namedtuple('XL_Mismatch', ['Worksheet', 'Address', 'Cached', 'Computed'])
+XL_CheckResult = namedtuple('XL_CheckResult', ['NumChecked', 'Mismatches', 'Unsupported', 'Circular'])
+
+_MISSING = object()
+_TEXT = (str, type(u''))
+
+class _XL_Context(object):
+    """ Where a formula is, for ROW(), implicit intersection, etc... """
+
+    __slots__ = ('Book', 'Sheet', 'Row', 'Col')
+
+    def __init__(self, _book, _sheet, _row, _col):
+        self.Book = _book
+        self.Sheet = _sheet
+        self.Row = _row
+        self.Col = _col
+
+    def scalar(self, _value):
+        """ A multi-cell value reduced to one, the way Excel does outside of array formulas """
+        if isinstance(_value, XL_Range):
+            if _value.NumRows == 1 and _value.NumCols == 1:
+                return _value.cell(0, 0)
+            if _value.NumCols == 1 and _value.FirstRow <= self.Row <= _value.LastRow:
+                return self.Book.cellValue(_value.Sheet, self.Row, _value.FirstCol)
+            if _value.NumRows == 1 and _value.FirstCol <= self.Col <= _value.LastCol:
+                return self.Book.cellValue(_value.Sheet, _value.FirstRow, self.Col)
+            return ERR_VALUE
+        if isinstance(_value, XL_Array):
+            return _value.Rows[0][0] if _value.Rows and _value.Rows[0] else ERR_VALUE
+        return _value
+
+    def reference(self, _text):
+        """ 'Sheet1!A1:B2' --> an XL_Range, for INDIRECT() """
+        sheet = self.Sheet
+        text = _text.strip()
+        if u'!' in text:
+            sheetText, text = text.rsplit(u'!', 1)
+            sheet = self.Book._sheetKeys.get(sheetText.strip(u"'").replace(u"''", u"'").upper())
+        try:
+            ref = parseRef(text)
+        except XL_FormulaError:
+            raise ERR_REF
+        if sheet is None:
+            raise ERR_REF
+        return XL_Range(self.Book, sheet, ref.FirstRow, ref.FirstCol, ref.LastRow, ref.LastCol)
+
+class _XL_FormulaCell(object):
+    """ A compiled formula cell """
+
+    __slots__ = ('Key', 'Fn', 'Precedents', 'Dynamic', 'Edges', 'ArrayRef')
+
+    def __init__(self, _key, _fn, _precedents, _dynamic=False, _arrayRef=None):
+        self.Key = _key
+        self.Fn = _fn
+        self.Precedents = _precedents # [(sheet, firstRow, firstCol, lastRow, lastCol), ...]
+        self.Dynamic = _dynamic       # Uses OFFSET() / INDIRECT(), so can read cells not in Precedents (see _precedents())
+        self.Edges = None             # The formula cells in Precedents, found when first needed
+        self.ArrayRef = _arrayRef
+
+def _normalize(_value):
+    """ A value being stored in a cell: numbers as float, text as unicode """
+    if _value is None or isinstance(_value, (bool, float, XL_Error)):
+        return _value
+    if isinstance(_value, _TEXT):
+        return _value if isinstance(_value, type(u'')) else _value.decode('utf-8')
+    try:
+        return float(_value)
+    except (TypeError, ValueError):
+        return _value
+
+def _sameValue(_computed, _cached, _relTol, _absTol):
+    if isinstance(_computed, XL_Error):
+        return isinstance(_cached, _TEXT) and _cached == _computed.Code
+    if _cached is None:
+        return _computed is None or _computed == u''
+    if isinstance(_computed, bool) or isinstance(_cached, bool):
+        return isinstance(_computed, bool) and isinstance(_cached, bool) and _computed == _cached
+    if isinstance(_computed, float) and isinstance(_cached, float):
+        return abs(_computed - _cached) <= max(_absTol, _relTol * max(abs(_computed), abs(_cached)))
+    return _computed == _cached
+
+def _cellKeys(_cells):
+    """ (Worksheet, Address) pairs, XL_ResultFields or (sheet, row, col) keys --> (sheet, row, col) keys """
+    keys = []
+    for cell in _cells:
+        if hasattr(cell, 'Worksheet'):
+            sheet, address = cell.Worksheet, cell.Address
+        elif len(cell) == 3 and not isinstance(cell[1], _TEXT):
+            keys.append( tuple(cell) )
+            continue
+        else:
+            sheet, address = cell[0], cell[1]
+        r1, c1, r2, c2 = parseRange(address)
+        keys.extend( (sheet, r, c) for r in range(r1, r2 + 1) for c in range(c1, c2 + 1) )
+    return keys
+
+class XL_Calculator(object):
+    """ The values and formulas of a workbook, evaluated in Python """
+
+    def __init__(self, _values, _formulas, _names=None, _cached=None, _iterate=DEFAULT_ITERATE, _useNumpy=True):
+        """
+        Args:
+            _values (dict): {worksheet name: {(row, col): value}} of the cells without a formula, in tab order
+            _formulas (dict): {worksheet name: {(row, col): formula}}. A formula is its text (without
+                the '=') or an XL_CellFormula (see idf2phpp.xlsx_read) for array formulas.
+            _names (list): <Optional> The defined names, [(name, worksheet or None, formula text)]
+            _cached (dict): <Optional> {worksheet name: {(row, col): value}} the values Excel saved
+                for the formula cells, used by check() and as the starting point for circular references
+            _iterate (tuple): (max iterations, max change) for circular references
+            _useNumpy (bool): Set False to not use NumPy, even if it is installed
+        """
+        self.SheetOrder = list(_values)
+        for sheet in _formulas:
+            if sheet not in self.SheetOrder:
+                self.SheetOrder.append(sheet)
+        self._sheetKeys = dict( (nm.upper(), nm) for nm in self.SheetOrder )
+
+        self.Values = dict( (nm, dict(_values.get(nm, {}))) for nm in self.SheetOrder )
+        self.Formulas = {}     # {(sheet, row, col): formula text}
+        self.ArrayRanges = {}  # {(sheet, row, col) of an array formula: (firstRow, firstCol, lastRow, lastCol)}
+        self._arrayMembers = {} # {(sheet, row, col): the array formula's cell} for the other cells it fills
+        for sheet, formulas in _formulas.items():
+            for (row, col), formula in formulas.items():
+                self._addFormula((sheet, row, col), formula)
+
+        self.Names = {}
+        for name, sheet, text in (_names or []):
+            self.Names[(sheet, name.upper())] = text
+
+        self.Cached = {}
+        for sheet, cells in (_cached or {}).items():
+            for (row, col), value in cells.items():
+                self.Cached[(sheet, row, col)] = value
+
+        self.Iterate = _iterate
+        self.UseNumpy = bool(_useNumpy) and numpy is not None
+
+        self.Unsupported = {}       # {function / name / reference: number of formulas}
+        self.Circular = set()       # The formula cells found in circular references
+        self._entries = {}          # {(sheet, row, col): _XL_FormulaCell}
+        self._dependents = XL_DependencyMap() # Of the compiled formulas, to know which results a change affects
+        self._results = {}          # {(sheet, row, col): value} of the formula cells calculated
+        self._arrayResults = {}     # {(sheet, row, col): the whole result} of multi-cell array formulas
+        self._rangeCache = {}
+        self._evaluating = set()
+        self._index = None
+        self._extent = None
+
+    @classmethod
+    def fromXLSX(cls, _path, _useNumpy=True):
+        """ Loads a .xlsx / .xlsm file
+
+        Args:
+            _path (str): The workbook
+            _useNumpy (bool): Set False to not use NumPy, even if it is installed
+        Returns:
+            calculator (XL_Calculator)
+        """
+        values = OrderedDict()
+        formulas = {}
+        cached = {}
+        with zipfile.ZipFile(_path) as z:
+            sharedStrings = readSharedStrings(z)
+            for sheet, part in getWorksheetParts(z).items():
+                sheetValues, sheetFormulas = readSheetCells(z, part, sharedStrings)
+                formulas[sheet] = {}
+                cached[sheet] = {}
+                for cell, formula in sheetFormulas.items():
+                    if formula.Type == 'dataTable':
+                        continue # Left as the values Excel saved
+                    formulas[sheet][cell] = formula
+                    if cell in sheetValues:
+                        cached[sheet][cell] = sheetValues.pop(cell)
+                for r1, c1, r2, c2 in [parseRange(f.Ref) for f in sheetFormulas.values() if f.Type == 'array' and f.Ref]:
+                    for row in range(r1, r2 + 1):
+                        for col in range(c1, c2 + 1):
+                            if (row, col) in sheetValues:
+                                cached[sheet][(row, col)] = sheetValues.pop((row, col))
+                values[sheet] = sheetValues
+            names = readDefinedNames(z)
+            settings = readCalcSettings(z)
+
+        iterate = (int(settings.get('iterateCount', DEFAULT_ITERATE[0])),
+                   float(settings.get('iterateDelta', DEFAULT_ITERATE[1])))
+        return cls(values, formulas, names, cached, iterate, _useNumpy)
+
+    #---------------------------------------------------------------------------
+    # Workbook contents
+
+    def _addFormula(self, _key, _formula):
+        text = getattr(_formula, 'Text', _formula)
+        self.Formulas[_key] = text[1:] if text.startswith(u'=') else text
+        ref = getattr(_formula, 'Ref', None) if getattr(_formula, 'Type', None) == 'array' else None
+        if ref:
+            r1, c1, r2, c2 = parseRange(ref)
+            self.ArrayRanges[_key] = (r1, c1, r2, c2)
+            for row in range(r1, r2 + 1):
+                for col in range(c1, c2 + 1):
+                    if (row, col) != _key[1:]:
+                        self._arrayMembers[(_key[0], row, col)] = _key
+        elif getattr(_formula, 'Type', None) == 'array':
+            self.ArrayRanges[_key] = _key[1:] * 2
+
+    def _removeFormula(self, _key):
+        self.Formulas.pop(_key, None)
+        area = self.ArrayRanges.pop(_key, None)
+        if area:
+            for member in [k for k, master in self._arrayMembers.items() if master == _key]:
+                del self._arrayMembers[member]
+
+    def isFormula(self, _key):
+        return _key in self.Formulas or _key in self._arrayMembers
+
+    def sheetNames(self):
+        return list(self.SheetOrder)
+
+    def hasSheet(self, _sheetName):
+        return _sheetName in self.Values
+
+    def _sheet(self, _name):
+        return self._sheetKeys.get(_name.upper())
+
+    def _formulaIndex(self):
+        if self._index is None:
+            self._index = XL_CellIndex(list(self.Formulas) + list(self._arrayMembers))
+        return self._index
+
+    def formulaCellsIn(self, _sheet, _firstRow, _firstCol, _lastRow, _lastCol):
+        """ The (sheet, row, col) formula cells inside a rectangle """
+        return self._formulaIndex().cellsIn(_sheet, _firstRow, _firstCol, _lastRow, _lastCol)
+
+    def _usedExtent(self):
+        """ The last used (row, col) of the workbook. Whole-column / row references stop there """
+        if self._extent is None:
+            maxRow = maxCol = 1
+            for cells in self.Values.values():
+                for row, col in cells:
+                    maxRow = max(maxRow, row)
+                    maxCol = max(maxCol, col)
+            for sheet, row, col in list(self.Formulas) + list(self._arrayMembers):
+                maxRow = max(maxRow, row)
+                maxCol = max(maxCol, col)
+            self._extent = (maxRow, maxCol)
+        return self._extent
+
+    def _structureChanged(self, _keys):
+        """ Formulas were added / removed: those cells are compiled again and the graph is rebuilt """
+        for key in _keys:
+            self._entries.pop(key, None)
+            self._dependents.remove(key)
+        for entry in self._entries.values():
+            entry.Edges = None
+        self._index = None
+        self._extent = None
+
+    def invalidate(self):
+        """ Forgets the calculated values, so the next calculate() starts over """
+        self._results = {}
+        self._arrayResults = {}
+        self._rangeCache = {}
+
+    def setValues(self, _writes):
+        """ Sets cell values, the same way XL_Workbook.write() would write them
+
+        Numbers (and text that looks like a number) are stored as numbers, text
+        starting with '=' as a formula, and None or '' clears the cell.
+
+        Args:
+            _writes (iterable): PHPP_XL_Objs, PHPP_Cells, (Worksheet, Range, Value) tuples or a PHPP_CellArray
+        Returns:
+            missing (list): The worksheets which weren't found
+        """
+        parts = _writes.writeParts() if hasattr(_writes, 'writeParts') else (_writeParts(w) for w in _writes)
+        missing = []
+        changed = []
+        written = []
+        for sheetName, rowCols, value in parts:
+            sheet = self._sheet(sheetName)
+            if sheet is None:
+                if sheetName not in missing:
+                    missing.append(sheetName)
+                continue
+            if value is KEEP_VALUE:
+                continue
+            for row, col in rowCols:
+                written.append( (sheet, row, col) )
+                if self._setCell((sheet, row, col), value):
+                    changed.append( (sheet, row, col) )
+
+        # Only the results downstream of the written cells are calculated again
+        stale = self._dependents.dependents(written)
+        if changed:
+            self._structureChanged(changed)
+        for key in stale.union(written):
+            self._results.pop(key, None)
+            self._arrayResults.pop(key, None)
+        self._rangeCache = {}
+        return missing
+
+    def _setCell(self, _key, _value):
+        """ Sets one cell. Returns True if a formula was added or removed """
+        sheet, row, col = _key
+        if isinstance(_value, bytes) and not isinstance(_value, str):
+            _value = _value.decode('utf-8')
+        structure = False
+        if self.isFormula(_key):
+            master = self._arrayMembers.get(_key, _key)
+            self._removeFormula(master)
+            structure = True
+
+        if isinstance(_value, _TEXT) and _value.startswith(u'=') and len(_value) > 1:
+            self.Values[sheet].pop((row, col), None)
+            self._addFormula(_key, _value)
+            return True
+
+        if isinstance(_value, _TEXT) and _reNumber.match(_value):
+            _value = float(_value)
+        _value = _normalize(_value)
+        if _value is None or _value == u'':
+            self.Values[sheet].pop((row, col), None)
+        else:
+            self.Values[sheet][(row, col)] = _value
+            if self._extent is not None and (row > self._extent[0] or col > self._extent[1]):
+                self._extent = (max(row, self._extent[0]), max(col, self._extent[1]))
+        return structure
+
+    #---------------------------------------------------------------------------
+    # Compiling
+
+    def _note(self, _item):
+        self.Unsupported[_item] = self.Unsupported.get(_item, 0) + 1
+
+    def _nameNode(self, _name, _sheet, _depth):
+        """ The syntax tree of a defined name, as seen from a formula on _sheet. None if it isn't defined """
+        text = self.Names.get((_sheet, _name))
+        if text is None:
+            text = self.Names.get((None, _name))
+        if text is None or _depth > MAX_NAME_DEPTH:
+            return None
+        try:
+            return self._resolve(parseFormula(text), _sheet, _depth + 1)
+        except XL_FormulaError:
+            return None
+
+    def _resolve(self, _node, _sheet, _depth=0):
+        """ The syntax tree with the defined names replaced by what they refer to """
+        kind = _node[0]
+        if kind == 'name':
+            node = self._nameNode(_node[1], self._sheet(_node[2]) if _node[2] else _sheet, _depth)
+            if node is None:
+                self._note(u'Name: {}'.format(_node[1]))
+                return ('err', u'#NAME?')
+            return node
+        if kind == 'func':
+            return ('func', _node[1], [self._resolve(arg, _sheet, _depth) for arg in _node[2]])
+        if kind == 'bin':
+            return ('bin', _node[1], self._resolve(_node[2], _sheet, _depth), self._resolve(_node[3], _sheet, _depth))
+        if kind == 'range':
+            return ('range', self._resolve(_node[1], _sheet, _depth), self._resolve(_node[2], _sheet, _depth))
+        if kind in ('neg', 'pct'):
+            return (kind, self._resolve(_node[1], _sheet, _depth))
+        return _node
+
+    def _refSheet(self, _ref, _context):
+        if _ref.Sheet is None:
+            return _context.Sheet
+        if _ref.Sheet.startswith(u'['):
+            self._note(u'External reference')
+            return None
+        return self._sheet(_ref.Sheet)
+
+    def _precedents(self, _node, _context):
+        """ The rectangles a (resolved) formula refers to, and if it uses OFFSET() / INDIRECT(), the
+        sheets those can read (True if it could be any sheet). False if it doesn't use them """
+        rects = []
+        for node in walkRefs(_node):
+            ref = node[1]
+            sheet = self._refSheet(ref, _context)
+            if sheet is not None:
+                rects.append( (sheet, ref.FirstRow, ref.FirstCol, ref.LastRow, ref.LastCol) )
+
+        # A range between two references, ie: A1:INDEX(B:B, n), can cover anything in between
+        dynamic = False
+        stack = [_node]
+        while stack:
+            node = stack.pop()
+            if node[0] == 'func':
+                if node[1] in DYNAMIC_FUNCTIONS and dynamic is not True:
+                    dynamic = dynamic or set()
+                    named = self._indirectSheets(node[2][0]) if node[1] == u'INDIRECT' and node[2] else ()
+                    if named is None:
+                        dynamic = True
+                    else:
+                        dynamic.update(named)
+                stack.extend( node[2] )
+            elif node[0] == 'bin':
+                stack.extend( node[2:] )
+            elif node[0] in ('neg', 'pct'):
+                stack.append( node[1] )
+            elif node[0] == 'range':
+                inner = [n[1] for n in walkRefs(node)]
+                sheets = set(self._refSheet(ref, _context) for ref in inner)
+                if len(sheets) == 1 and None not in sheets:
+                    rects.append( (sheets.pop(), min(r.FirstRow for r in inner), min(r.FirstCol for r in inner),
+                                   max(r.LastRow for r in inner), max(r.LastCol for r in inner)) )
+                stack.extend( node[1:] )
+        if isinstance(dynamic, set):
+            dynamic = frozenset(dynamic.union([_context.Sheet], (rect[0] for rect in rects)))
+        return rects, dynamic
+
+    def _indirectSheets(self, _node):
+        """ The sheets INDIRECT()'s text can name (besides the formula's own). None if it could be any """
+        texts = []
+        computed = False
+        stack = [_node]
+        while stack:
+            node = stack.pop()
+            if node[0] == 'str':
+                texts.append( node[1] )
+            elif node[0] == 'bin':
+                stack.extend( node[2:] )
+            elif node[0] not in ('num', 'bool', 'err', 'missing'):
+                computed = True # ie: "'" & A1 & "'!B2"
+
+        sheets = set()
+        for text in texts:
+            if u'!' in text:
+                sheet = self._sheet(text.rsplit(u'!', 1)[0].strip().strip(u"'").replace(u"''", u"'"))
+                if sheet is None:
+                    return None
+                sheets.add(sheet)
+        if computed and not sheets:
+            return None
+        return sheets
+
+    def _entry(self, _key):
+        """ The compiled formula of a cell """
+        entry = self._entries.get(_key)
+        if entry is not None:
+            return entry
+
+        master = self._arrayMembers.get(_key)
+        if master is not None:
+            entry = self._memberEntry(_key, master)
+        else:
+            sheet, row, col = _key
+            context = _XL_Context(self, sheet, row, col)
+            isArray = _key in self.ArrayRanges
+            try:
+                node = self._resolve(parseFormula(self.Formulas[_key]), sheet)
+                precedents, dynamic = self._precedents(node, context)
+                fn = self._compile(node, context, 'r', isArray)
+            except XL_FormulaError as e:
+                self._note(u'Formula syntax: {}'.format(e))
+                precedents, dynamic = [], False
+                fn = lambda: ERR_NAME
+            entry = _XL_FormulaCell(_key, self._cellFn(fn, context, _key if isArray else None), precedents, dynamic,
+                                    self.ArrayRanges.get(_key))
+        self._entries[_key] = entry
+        self._dependents.add(_key, entry.Precedents, entry.Dynamic)
+        return entry
+
+    def _memberEntry(self, _key, _master):
+        """ A cell filled by a multi-cell array formula: its part of the array formula's result """
+        i = _key[1] - self.ArrayRanges[_master][0]
+        j = _key[2] - self.ArrayRanges[_master][1]
+        arrayResults = self._arrayResults
+
+        def member():
+            result = arrayResults.get(_master)
+            if not isMulti(result):
+                return 0.0 if result is None else result # One value fills the whole array
+            numRows, numCols = result.NumRows, result.NumCols
+            ii = 0 if numRows == 1 else i
+            jj = 0 if numCols == 1 else j
+            if ii >= numRows or jj >= numCols:
+                return ERR_NA
+            value = result.cell(ii, jj)
+            return 0.0 if value is None else value
+
+        return _XL_FormulaCell(_key, member, [(_master[0], _master[1], _master[2], _master[1], _master[2])])
+
+    def _cellFn(self, _fn, _context, _arrayKey):
+        """ The function giving a formula cell's value: the formula's result reduced to one value """
+        arrayResults = self._arrayResults
+        scalar = _context.scalar
+
+        if _arrayKey is not None:
+            def arrayCell():
+                result = _fn()
+                arrayResults[_arrayKey] = result
+                if isMulti(result):
+                    result = result.cell(0, 0)
+                return 0.0 if result is None else _normalize(result)
+            return arrayCell
+
+        def cell():
+            result = _fn()
+            if isMulti(result):
+                result = scalar(result)
+            if result is None:
+                return 0.0
+            if type(result) is float:
+                return result
+            return _normalize(result)
+        return cell
+
+    def _compile(self, _node, _context, _mode, _array):
+        """ A syntax tree --> a function of no arguments giving its value
+
+        Args:
+            _node (tuple): The (resolved) syntax tree, see idf2phpp.xl_formula
+            _context (_XL_Context): Where the formula is
+            _mode (str): 's', 'r' or 'f', how references are given (see idf2phpp.xl_functions)
+            _array (bool): True inside an array formula or SUMPRODUCT(), where operators work cell by cell
+        """
+        kind = _node[0]
+        if kind in ('num', 'str', 'bool'):
+            value = _node[1]
+            return lambda: value
+        if kind == 'err':
+            error = errorValue(_node[1])
+            return lambda: error
+        if kind == 'missing':
+            return lambda: None
+        if kind == 'array':
+            array = XL_Array([[errorValue(v[1]) if isinstance(v, tuple) else v for v in row] for row in _node[1]])
+            return lambda: array
+        if kind == 'ref':
+            return self._compileRef(_node[1], _context, _mode, _array)
+        if kind == 'range':
+            return self._compileRangeOp(_node, _context, _mode, _array)
+        if kind in ('neg', 'pct'):
+            return self._compileOperator(negate if kind == 'neg' else percent, [_node[1]], _context, _array)
+        if kind == 'bin':
+            return self._compileOperator(OPERATORS[_node[1]], _node[2:], _context, _array)
+        if kind == 'func':
+            return self._compileFunction(_node[1], _node[2], _context, _mode, _array)
+        raise XL_FormulaError(u'Unknown syntax: {}'.format(kind))
+
+    def _compileRef(self, _ref, _context, _mode, _array):
+        sheet = self._refSheet(_ref, _context)
+        if sheet is None:
+            return lambda: ERR_REF
+        getValue = self.cellValue
+        r1, c1, r2, c2 = _ref.FirstRow, _ref.FirstCol, _ref.LastRow, _ref.LastCol
+
+        if _mode == 's' and r1 == r2 and c1 == c2:
+            return lambda: getValue(sheet, r1, c1)
+        if _mode == 's' and not _array:
+            # Implicit intersection, known as soon as the formula's position is
+            if c1 == c2 and r1 <= _context.Row <= r2:
+                row = _context.Row
+                return lambda: getValue(sheet, row, c1)
+            if r1 == r2 and c1 <= _context.Col <= c2:
+                col = _context.Col
+                return lambda: getValue(sheet, r1, col)
+            return lambda: ERR_VALUE
+        rng = XL_Range(self, sheet, r1, c1, r2, c2)
+        return lambda: rng
+
+    def _compileRangeOp(self, _node, _context, _mode, _array):
+        left = self._compile(_node[1], _context, 'f', _array)
+        right = self._compile(_node[2], _context, 'f', _array)
+
+        def rangeOp():
+            a, b = left(), right()
+            for value in (a, b):
+                if isinstance(value, XL_Error):
+                    return value
+            if not (isinstance(a, XL_Range) and isinstance(b, XL_Range)) or a.Sheet != b.Sheet:
+                return ERR_VALUE
+            return XL_Range(self, a.Sheet, min(a.FirstRow, b.FirstRow), min(a.FirstCol, b.FirstCol),
+                            max(a.LastRow, b.LastRow), max(a.LastCol, b.LastCol))
+        return rangeOp
+
+    def _scalarArg(self, _fn, _node, _context):
+        """ Wraps an argument so that a multi-cell result (ie: from INDEX()) is reduced to one value """
+        if _node[0] in ('num', 'str', 'bool', 'err', 'missing', 'ref'):
+            return _fn
+        scalar = _context.scalar
+
+        def arg():
+            value = _fn()
+            return scalar(value) if isMulti(value) else value
+        return arg
+
+    def _compileOperator(self, _op, _operands, _context, _array):
+        mode = 'r' if _array else 's'
+        fns = [self._compile(node, _context, mode, _array) for node in _operands]
+        if not _array:
+            fns = [self._scalarArg(fn, node, _context) for fn, node in zip(fns, _operands)]
+        return _guarded(_op, fns, _array)
+
+    def _compileFunction(self, _name, _args, _context, _mode, _array):
+        if _name in (u'IF', u'IFERROR', u'IFNA', u'CHOOSE'):
+            return self._compileLazy(_name, _args, _context, _mode, _array)
+
+        spec = FUNCTIONS.get(_name)
+        if spec is None:
+            self._note(u'{}()'.format(_name))
+            return lambda: ERR_NAME
+        fn, modes = spec
+        inner = _array or _name == u'SUMPRODUCT'
+
+        argFns = []
+        for i, node in enumerate(_args):
+            mode = argMode(modes, i)
+            argFn = self._compile(node, _context, mode, inner)
+            if mode == 's' and not inner:
+                argFn = self._scalarArg(argFn, node, _context)
+            argFns.append( argFn )
+
+        liftable = inner and 'r' not in modes and 'f' not in modes
+        return _call(fn, _context, argFns, liftable)
+
+    def _compileLazy(self, _name, _args, _context, _mode, _array):
+        """ IF(), IFERROR(), IFNA() and CHOOSE() only evaluate the argument they need """
+        fns = [self._compile(node, _context, _mode if i else 's', _array) for i, node in enumerate(_args)]
+        if not _array:
+            fns[0] = self._scalarArg(fns[0], _args[0], _context)
+        fns = [(lambda: 0.0) if node[0] == 'missing' else fn for fn, node in zip(fns, _args)]
+
+        if _name == u'IF':
+            if len(fns) not in (2, 3):
+                return lambda: ERR_VALUE
+            test = fns[0]
+            ifTrue = fns[1]
+            ifFalse = fns[2] if len(fns) == 3 else (lambda: False)
+
+            def fnIf():
+                condition = test()
+                if isMulti(condition):
+                    return _elementwise(lambda c, t, f: _pickIf(c, t, f), [condition, ifTrue(), ifFalse()])
+                try:
+                    return ifTrue() if toBool(condition) else ifFalse()
+                except XL_Error as e:
+                    return e
+            return fnIf
+
+        if _name in (u'IFERROR', u'IFNA'):
+            if len(fns) != 2:
+                return lambda: ERR_VALUE
+            value, fallback = fns
+            catch = (lambda v: isinstance(v, XL_Error)) if _name == u'IFERROR' else (lambda v: v == ERR_NA)
+
+            def fnIfError():
+                result = value()
+                if isMulti(result) and _array:
+                    other = fallback()
+                    return _elementwise(lambda v, f: f if catch(v) else v, [result, other])
+                return fallback() if catch(result) else result
+            return fnIfError
+
+        if len(fns) < 2:
+            return lambda: ERR_VALUE
+        index, choices = fns[0], fns[1:]
+
+        def fnChoose():
+            try:
+                i = toInt(index())
+            except XL_Error as e:
+                return e
+            if i < 1 or i > len(choices):
+                return ERR_VALUE
+            return choices[i - 1]()
+        return fnChoose
+
+    #---------------------------------------------------------------------------
+    # Evaluating
+
+    def cellValue(self, _sheet, _row, _col):
+        """ The value of a cell, calculating it first if it is a formula which hasn't been """
+        key = (_sheet, _row, _col)
+        value = self._results.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key in self.Formulas or key in self._arrayMembers:
+            return self._evaluateNow(key)
+        return self.Values[_sheet].get((_row, _col))
+
+    def _evaluateNow(self, _key):
+        if _key in self._evaluating:
+            # Only reached through OFFSET() / INDIRECT(): a circular reference the graph didn't show
+            self.Circular.add(_key)
+            return self.Cached.get(_key, 0.0)
+        self.calculate([_key])
+        return self._results[_key]
+
+    def rangeRows(self, _range):
+        """ The values of an XL_Range, as rows. Whole-column / row references stop at the last used cell """
+        key = _range.Key
+        rows = self._rangeCache.get(key)
+        if rows is not None:
+            return rows
+
+        maxRow, maxCol = self._usedExtent()
+        sheet, r1, c1 = _range.Sheet, _range.FirstRow, _range.FirstCol
+        r2 = max(r1, min(_range.LastRow, maxRow))
+        c2 = max(c1, min(_range.LastCol, maxCol))
+
+        pending = [k for k in self.formulaCellsIn(sheet, r1, c1, r2, c2) if k not in self._results]
+        if pending:
+            self.calculate(pending)
+
+        results = self._results
+        values = self.Values[sheet]
+        rows = []
+        for row in range(r1, r2 + 1):
+            rowValues = []
+            for col in range(c1, c2 + 1):
+                value = results.get((sheet, row, col), _MISSING)
+                rowValues.append( values.get((row, col)) if value is _MISSING else value )
+            rows.append( rowValues )
+
+        if not self._evaluating.intersection(self.Circular):
+            self._rangeCache[key] = rows
+        return rows
+
+    def rangeNumbers(self, _range):
+        """ The numbers in an XL_Range (for SUM(), MIN(), ...), as a list or a NumPy array. Raises an XL_Error """
+        key = ('n',) + _range.Key
+        numbers = self._rangeCache.get(key)
+        if numbers is None:
+            numbers = []
+            for row in self.rangeRows(_range):
+                for value in row:
+                    if type(value) is float:
+                        numbers.append( value )
+                    elif isinstance(value, XL_Error):
+                        numbers = value
+                        break
+                if isinstance(numbers, XL_Error):
+                    break
+            if self.UseNumpy and isinstance(numbers, list) and len(numbers) >= NUMPY_MIN_CELLS:
+                numbers = numpy.array(numbers, dtype=float)
+            if key[1:] in self._rangeCache:
+                self._rangeCache[key] = numbers
+        if isinstance(numbers, XL_Error):
+            raise numbers
+        return numbers
+
+    def rangeMatrix(self, _range):
+        """ An XL_Range as a 2-D NumPy array, anything that isn't a number as 0 (for SUMPRODUCT()). Raises an XL_Error """
+        key = ('m',) + _range.Key
+        matrix = self._rangeCache.get(key)
+        if matrix is None:
+            rows = self.rangeRows(_range)
+            flat = []
+            for row in rows:
+                for value in row:
+                    if type(value) is float:
+                        flat.append( value )
+                    elif isinstance(value, XL_Error):
+                        flat = value
+                        break
+                    else:
+                        flat.append( 0.0 )
+                if isinstance(flat, XL_Error):
+                    break
+            matrix = flat if isinstance(flat, XL_Error) else numpy.array(flat, dtype=float).reshape((len(rows), len(rows[0])))
+            if _range.Key in self._rangeCache:
+                self._rangeCache[key] = matrix
+        if isinstance(matrix, XL_Error):
+            raise matrix
+        return matrix
+
+    def _edges(self, _key):
+        """ The formula cells a formula cell refers to (its precedents which are formulas) """
+        entry = self._entry(_key)
+        if entry.Edges is None:
+            edges = []
+            for sheet, r1, c1, r2, c2 in entry.Precedents:
+                edges.extend( self.formulaCellsIn(sheet, r1, c1, r2, c2) )
+            entry.Edges = edges
+        return entry.Edges
+
+    def evaluationOrder(self, _keys):
+        """ The formula cells needed for _keys which aren't calculated yet, in the order to calculate them
+
+        Returns:
+            groups (list): Lists of (sheet, row, col) keys, dependencies first. A group with more than
+                one cell (or one cell which refers to itself) is a circular reference.
+        """
+        isFormula = self.isFormula
+        return orderCells([key for key in _keys if isFormula(key)], self._edges, self._results, self._evaluating)
+
+    def _run(self, _key):
+        entry = self._entry(_key)
+        self._evaluating.add(_key)
+        try:
+            value = entry.Fn()
+        finally:
+            self._evaluating.discard(_key)
+        self._results[_key] = value
+        return value
+
+    def _iterateGroup(self, _group):
+        """ Calculates a circular reference the way Excel's iterative calculation does """
+        self.Circular.update(_group)
+        group = sorted(_group)
+        for key in group:
+            self._results[key] = self.Cached.get(key, 0.0)
+
+        maxIterations, maxChange = self.Iterate
+        for i in range(max(maxIterations, 1)):
+            self._rangeCache = {}
+            change = 0.0
+            for key in group:
+                old = self._results[key]
+                new = self._run(key)
+                if type(old) is float and type(new) is float:
+                    change = max(change, abs(new - old))
+                elif old != new:
+                    change = float('inf')
+            if change <= maxChange:
+                break
+        self._rangeCache = {}
+
+    def calculate(self, _cells=None):
+        """ Calculates the formulas the cells depend on (and the cells themselves)
+
+        Args:
+            _cells (iterable): <Optional> (Worksheet, Address) pairs, XL_ResultFields or (sheet, row, col)
+                keys. Default is the Verification results.
+        Returns:
+            numCalculated (int): The number of formula cells calculated
+        """
+        keys = _cellKeys(VERIFICATION_RESULTS if _cells is None else _cells)
+        keys = [(self._sheet(sheet) or sheet, row, col) for sheet, row, col in keys]
+        count = 0
+        for group in self.evaluationOrder(keys):
+            if len(group) == 1 and group[0] not in self._edges(group[0]):
+                self._run(group[0])
+            else:
+                self._iterateGroup(group)
+            count += len(group)
+        return count
+
+    def precedentCells(self, _cells=None):
+        """ All the formula cells the cells depend on, in calculation order (without calculating them) """
+        saved = self._results
+        self._results = {}
+        try:
+            keys = _cellKeys(VERIFICATION_RESULTS if _cells is None else _cells)
+            keys = [(self._sheet(sheet) or sheet, row, col) for sheet, row, col in keys]
+            return [key for group in self.evaluationOrder(keys) for key in group]
+        finally:
+            self._results = saved
+
+    def formulaPrecedents(self, _key, _formula):
+        """ The (sheet, firstRow, firstCol, lastRow, lastCol) rectangles a formula in a cell refers to,
+        and the sheets its OFFSET() / INDIRECT() can read (see _precedents()). Nothing is compiled """
+        sheet, row, col = _key
+        sheet = self._sheet(sheet) or sheet
+        try:
+            node = self._resolve(parseFormula(_formula[1:] if _formula.startswith(u'=') else _formula), sheet)
+            return self._precedents(node, _XL_Context(self, sheet, row, col))
+        except XL_FormulaError:
+            return [], False
+
+    def dependencyMap(self):
+        """ An XL_DependencyMap (see idf2phpp.xl_depends) of every formula in the workbook """
+        depends = XL_DependencyMap()
+        for key, text in self.Formulas.items():
+            precedents, dynamic = self.formulaPrecedents(key, text)
+            depends.add(key, precedents, dynamic)
+        for key, master in self._arrayMembers.items():
+            depends.add(key, [(master[0], master[1], master[2], master[1], master[2])])
+        return depends
+
+    def readRange(self, _sheetName, _address):
+        """ Returns the (calculated) values of a range as a list of rows, the same as XL_Workbook.readRange()
+
+        Errors are given as their text (ie: '#DIV/0!'), the same as reading a .xlsx file.
+        """
+        sheet = self._sheet(_sheetName)
+        r1, c1, r2, c2 = parseRange(_address)
+        self.calculate(self.formulaCellsIn(sheet, r1, c1, r2, c2))
+        rows = []
+        for row in range(r1, r2 + 1):
+            values = []
+            for col in range(c1, c2 + 1):
+                value = self.cellValue(sheet, row, col)
+                values.append( value.Code if isinstance(value, XL_Error) else value )
+            rows.append( values )
+        return rows
+
+    def check(self, _cells=None, _relTol=1e-9, _absTol=1e-9):
+        """ Calculates the cells and compares every formula result with the value Excel saved in the file
+
+        Args:
+            _cells (iterable): <Optional> The cells to check, as for calculate(). Default is the Verification results.
+            _relTol (float): The relative difference allowed between two numbers
+            _absTol (float): The difference allowed between two numbers near 0
+        Returns:
+            result (XL_CheckResult): The number of formula cells compared, the XL_Mismatches, the
+                Unsupported functions / names and the cells in circular references
+        """
+        self.invalidate()
+        self.calculate(_cells)
+
+        mismatches = []
+        checked = 0
+        for key in sorted(self._results):
+            if key not in self.Cached:
+                continue
+            checked += 1
+            computed = self._results[key]
+            if not _sameValue(computed, self.Cached[key], _relTol, _absTol):
+                mismatches.append( XL_Mismatch(key[0], formatAddress(key[1], key[2]), self.Cached[key],
+                                               computed.Code if isinstance(computed, XL_Error) else computed) )
+        circular = [(key[0], formatAddress(key[1], key[2])) for key in sorted(self.Circular)]
+        return XL_CheckResult(checked, mismatches, dict(self.Unsupported), circular)
+
+    def __unicode__(self):
+        return u'Formula Calculator: {} sheets, {} formulas'.format(len(self.SheetOrder), len(self.Formulas))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( _values=<{} sheets>, _formulas=<{} formulas>, _iterate={!r}, _useNumpy={!r} )".format(
+               self.__class__.__name__,
+               len(self.SheetOrder),
+               len(self.Formulas),
+               self.Iterate,
+               self.UseNumpy)
+
+#-------------------------------------------------------------------------------
+# Evaluation helpers
+
+def _pickIf(_condition, _ifTrue, _ifFalse):
+    return _ifTrue if toBool(_condition) else _ifFalse
+
+def _elementwise(_fn, _values):
+    """ Applies _fn cell by cell, the way an array formula does. Single rows / columns are repeated to fit """
+    rowsList = [valueRows(v) if isMulti(v) else [[v]] for v in _values]
+    numRows = max(len(rows) for rows in rowsList)
+    numCols = max(len(rows[0]) if rows else 0 for rows in rowsList)
+    out = []
+    for i in range(numRows):
+        row = []
+        for j in range(numCols):
+            args = []
+            for rows in rowsList:
+                ii = 0 if len(rows) == 1 else i
+                jj = 0 if len(rows[0]) == 1 else j
+                args.append( rows[ii][jj] if ii < len(rows) and jj < len(rows[ii]) else ERR_NA )
+            try:
+                row.append( _fn(*args) )
+            except XL_Error as e:
+                row.append( e )
+            except ZeroDivisionError:
+                row.append( ERR_DIV0 )
+            except (ValueError, OverflowError):
+                row.append( ERR_NUM )
+        out.append( row )
+    return XL_Array(out)
+
+def _guarded(_op, _fns, _array):
+    """ An operator, returning an error value instead of raising it """
+    if len(_fns) == 1:
+        a = _fns[0]
+
+        def unary():
+            value = a()
+            if _array and isMulti(value):
+                return _elementwise(_op, [value])
+            try:
+                return _op(value)
+            except XL_Error as e:
+                return e
+        return unary
+
+    a, b = _fns
+
+    def binary():
+        left, right = a(), b()
+        if _array and (isMulti(left) or isMulti(right)):
+            return _elementwise(_op, [left, right])
+        try:
+            return _op(left, right)
+        except XL_Error as e:
+            return e
+        except ZeroDivisionError:
+            return ERR_DIV0
+        except (ValueError, OverflowError):
+            return ERR_NUM
+    return binary
+
+def _call(_fn, _context, _argFns, _liftable):
+    """ A function call, returning an error value instead of raising it
+
+    In an array formula, a function of single values given a range is applied cell by cell (_liftable).
+    """
+    def call():
+        args = [f() for f in _argFns]
+        if _liftable and any(isMulti(a) for a in args):
+            return _elementwise(lambda *a: _fn(_context, *a), args)
+        try:
+            return _fn(_context, *args)
+        except XL_Error as e:
+            return e
+        except ZeroDivisionError:
+            return ERR_DIV0
+        except (ValueError, OverflowError):
+            return ERR_NUM
+    return call
+
+def main(_argv=None):
+    parser = argparse.ArgumentParser(prog='idf2phpp.xl_calc', description='Calculate the PHPP Verification results without Excel.')
+    parser.add_argument('workbook', help='The PHPP workbook (.xlsx or .xlsm)')
+    parser.add_argument('--check', action='store_true', help='Compare the results with the values saved in the workbook')
+    parser.add_argument('--no-numpy', action='store_true', help="Don't use NumPy for the range functions")
+    args = parser.parse_args(_argv)
+
+    t0 = time.time()
+    calculator = XL_Calculator.fromXLSX(args.workbook, not args.no_numpy)
+    t1 = time.time()
+    numCalculated = calculator.calculate()
+    t2 = time.time()
+
+    results = XL_ResultReader(VERIFICATION_RESULTS).read(calculator)
+    for label, value in results.items():
+        print(u'{}: {}'.format(label, value))
+    print(u'{} of {} formulas calculated in {:.3f}s (loading took {:.3f}s)'.format(
+          numCalculated, len(calculator.Formulas), t2 - t1, t1 - t0))
+
+    if not args.check:
+        return 0
+    check = calculator.check()
+    for mismatch in check.Mismatches[:50]:
+        print(u'MISMATCH {}!{}: saved {!r}, calculated {!r}'.format(*mismatch))
+    for item, count in sorted(check.Unsupported.items()):
+        print(u'UNSUPPORTED {} ({} formulas)'.format(item, count))
+    if check.Circular:
+        print(u'{} cells in circular references'.format(len(check.Circular)))
+    print(u'{} formula results checked, {} differ'.format(check.NumChecked, len(check.Mismatches)))
+    return 1 if check.Mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Which formulas depend on which cells, and what to recalculate after a write.
+
+XL_DependencyMap is a workbook's precedent map turned around: for each
+formula cell it keeps the rectangles of cells the formula refers to, indexed
+by worksheet and column, so the formulas which refer to a cell can be found
+without looking at every formula. dependents() follows them on to every
+formula downstream of a set of changed cells. The map for a whole workbook
+comes from idf2phpp.xl_calc (XL_Calculator.dependencyMap()).
+
+planRecalc() turns that into what a workbook has to recalculate after a
+write:
+    - nothing, if none of the changed cells feed a formula
+    - the ranges of downstream formula cells, each one after the cells it
+      depends on, so they can be calculated one at a time (Excel's
+      Range.Calculate)
+    - or, if there are too many ranges for that, the worksheets, if they can
+      be calculated one after the other
+    - or else everything (ie: a circular reference is downstream)
+
+Formulas with OFFSET() / INDIRECT() can read cells which aren't in their
+precedents, so they count as downstream of any change on a worksheet they can
+read from (any worksheet, if an INDIRECT() works out the sheet's name).
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from idf2phpp.xl_address import formatRange
+
+MAX_COLUMN_SPAN = 32   # Wider rectangles (ie: whole rows) aren't indexed by column, they're checked one by one
+MAX_RANGE_CALCS = 200  # With more ranges than this, the worksheets are calculated instead
+
+XL_RecalcPlan = namedtuple('XL_RecalcPlan', ['NumFormulas', 'Ranges', 'Sheets', 'Full'])
+
+def orderCells(_roots, _edges, _done=frozenset(), _skip=frozenset()):
+    """ Orders cells so each one comes after the cells it depends on
+
+    Uses Tarjan's strongly connected components, with an explicit stack
+    instead of recursion (the chains in a PHPP are too long for Python's
+    recursion limit).
+
+    Args:
+        _roots (iterable): The cells to start from
+        _edges (function): cell --> the cells it depends on
+        _done (container): <Optional> Cells to leave out, ie: ones already calculated
+        _skip (container): <Optional> More cells to leave out
+    Returns:
+        groups (list): Lists of cells, dependencies first. A group with more than one
+            cell (or one cell which depends on itself) is a circular reference.
+    """
+    index = {}
+    low = {}
+    stack = []
+    onStack = set()
+    groups = []
+    counter = [0]
+
+    def visit(_key):
+        index[_key] = low[_key] = counter[0]
+        counter[0] += 1
+        stack.append(_key)
+        onStack.add(_key)
+        return (_key, iter(_edges(_key)))
+
+    for root in _roots:
+        if root in index or root in _done or root in _skip:
+            continue
+        work = [visit(root)]
+        while work:
+            key, edges = work[-1]
+            pushed = False
+            for nxt in edges:
+                if nxt in _done or nxt in _skip:
+                    continue
+                if nxt not in index:
+                    work.append( visit(nxt) )
+                    pushed = True
+                    break
+                if nxt in onStack and index[nxt] < low[key]:
+                    low[key] = index[nxt]
+            if pushed:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[key] < low[parent]:
+                    low[parent] = low[key]
+            if low[key] == index[key]:
+                group = []
+                while True:
+                    member = stack.pop()
+                    onStack.discard(member)
+                    group.append( member )
+                    if member == key:
+                        break
+                groups.append( group )
+    return groups
+
+class XL_CellIndex(object):
+    """ A set of (sheet, row, col) cells which can be searched by rectangle """
+
+    def __init__(self, _cells=()):
+        self._byCol = {} # {sheet: {col: sorted rows}}
+        for sheet, row, col in _cells:
+            self._byCol.setdefault(sheet, {}).setdefault(col, []).append(row)
+        self._cols = {}
+        for sheet, cols in self._byCol.items():
+            for rows in cols.values():
+                rows.sort()
+            self._cols[sheet] = sorted(cols)
+
+    def cellsIn(self, _sheet, _firstRow, _firstCol, _lastRow, _lastCol):
+        """ The cells inside a rectangle """
+        cols = self._cols.get(_sheet)
+        if not cols:
+            return []
+        byCol = self._byCol[_sheet]
+        cells = []
+        for col in cols[bisect_left(cols, _firstCol):bisect_right(cols, _lastCol)]:
+            rows = byCol[col]
+            for row in rows[bisect_left(rows, _firstRow):bisect_right(rows, _lastRow)]:
+                cells.append( (_sheet, row, col) )
+        return cells
+
+    def __repr__(self):
+        return "{}( _cells=<{} sheets> )".format(self.__class__.__name__, len(self._byCol))
+
+class XL_DependencyMap(object):
+    """ For each formula cell, the cells it refers to, searchable the other way round """
+
+    def __init__(self):
+        self.Precedents = {}  # {(sheet, row, col): [(sheet, firstRow, firstCol, lastRow, lastCol), ...]}
+        self.Dynamic = {}     # {formula cell using OFFSET() / INDIRECT(): the sheets it can read, None for any}
+        self._single = {}     # {(sheet, row, col): set of formula cells} for one-cell precedents
+        self._columns = {}    # {(sheet, col): [(firstRow, lastRow, formula cell), ...]}
+        self._starts = {}     # {(sheet, col): the sorted firstRows of _columns[(sheet, col)]}
+        self._wide = {}       # {sheet: [(firstRow, firstCol, lastRow, lastCol, formula cell), ...]}
+
+    def add(self, _key, _precedents, _dynamic=False):
+        """ Adds (or replaces) a formula cell
+
+        Args:
+            _key (tuple): The formula's (sheet, row, col)
+            _precedents (list): The (sheet, firstRow, firstCol, lastRow, lastCol) rectangles it refers to
+            _dynamic: It uses OFFSET() / INDIRECT(), so can read other cells too: the sheets
+                it can read them on, or True if it could be any of them. False if it doesn't
+        """
+        if _key in self.Precedents:
+            self.remove(_key)
+        self.Precedents[_key] = list(_precedents)
+        if _dynamic:
+            self.Dynamic[_key] = None if _dynamic is True else frozenset(_dynamic)
+        for sheet, r1, c1, r2, c2 in _precedents:
+            if r1 == r2 and c1 == c2:
+                self._single.setdefault((sheet, r1, c1), set()).add(_key)
+            elif c2 - c1 < MAX_COLUMN_SPAN:
+                for col in range(c1, c2 + 1):
+                    self._columns.setdefault((sheet, col), []).append( (r1, r2, _key) )
+                    self._starts.pop((sheet, col), None)
+            else:
+                self._wide.setdefault(sheet, []).append( (r1, c1, r2, c2, _key) )
+
+    def remove(self, _key):
+        """ Removes a formula cell (ie: a value was written over it) """
+        precedents = self.Precedents.pop(_key, None)
+        if precedents is None:
+            return
+        self.Dynamic.pop(_key, None)
+        for sheet, r1, c1, r2, c2 in precedents:
+            if r1 == r2 and c1 == c2:
+                self._single.get((sheet, r1, c1), set()).discard(_key)
+            elif c2 - c1 < MAX_COLUMN_SPAN:
+                for col in range(c1, c2 + 1):
+                    spans = self._columns.get((sheet, col), [])
+                    if (r1, r2, _key) in spans:
+                        spans.remove( (r1, r2, _key) )
+                    self._starts.pop((sheet, col), None)
+            else:
+                wide = self._wide.get(sheet, [])
+                if (r1, c1, r2, c2, _key) in wide:
+                    wide.remove( (r1, c1, r2, c2, _key) )
+
+    def _spans(self, _colKey):
+        spans = self._columns[_colKey]
+        starts = self._starts.get(_colKey)
+        if starts is None:
+            spans.sort()
+            starts = self._starts[_colKey] = [span[0] for span in spans]
+        return spans, starts
+
+    def directDependents(self, _cells):
+        """ The formula cells which refer to any of the (sheet, row, col) cells directly """
+        found = set()
+        rowsByCol = {}
+        for sheet, row, col in _cells:
+            found.update( self._single.get((sheet, row, col), ()) )
+            rowsByCol.setdefault((sheet, col), []).append(row)
+
+        for colKey, rows in rowsByCol.items():
+            if colKey not in self._columns:
+                continue
+            rows.sort()
+            spans, starts = self._spans(colKey)
+            for r1, r2, key in spans[:bisect_right(starts, rows[-1])]:
+                i = bisect_left(rows, r1)
+                if i < len(rows) and rows[i] <= r2:
+                    found.add(key)
+
+        for sheet, wide in self._wide.items():
+            cells = [(row, col) for (s, col), rows in rowsByCol.items() if s == sheet for row in rows]
+            for r1, c1, r2, c2, key in wide:
+                if key not in found and any(r1 <= row <= r2 and c1 <= col <= c2 for row, col in cells):
+                    found.add(key)
+        return found
+
+    def dependents(self, _cells):
+        """ Every formula cell downstream of the (sheet, row, col) cells (not counting the cells themselves) """
+        frontier = set(_cells)
+        if not frontier:
+            return set()
+        result = set()
+        dynamic = dict(self.Dynamic) # The OFFSET() / INDIRECT() formulas not found yet
+        sheets = set()
+        while frontier:
+            found = self.directDependents(frontier)
+            newSheets = set(cell[0] for cell in frontier) - sheets
+            if dynamic and newSheets:
+                sheets.update(newSheets)
+                for key, reads in list(dynamic.items()):
+                    if reads is None or not newSheets.isdisjoint(reads):
+                        found.add(key)
+                        del dynamic[key]
+            frontier = found - result
+            result.update(frontier)
+        return result
+
+    def __contains__(self, _key):
+        return _key in self.Precedents
+
+    def __len__(self):
+        return len(self.Precedents)
+
+    def __unicode__(self):
+        return u'Dependency Map: {} formulas ({} with OFFSET / INDIRECT)'.format(len(self.Precedents), len(self.Dynamic))
+
+    def __str__(self):
+        return self.__unicode__()
+
+    def __repr__(self):
+        return "{}( <{} formulas> )".format(self.__class__.__name__, len(self.Precedents))
+
+def _columnRuns(_cells):
+    """ Cells in order --> (sheet, firstRow, col, lastRow) runs of consecutive cells down a column, in the same order """
+    runs = []
+    for sheet, row, col in _cells:
+        if runs and runs[-1][0] == sheet and runs[-1][2] == col and runs[-1][3] == row - 1:
+            runs[-1][3] = row
+        else:
+            runs.append( [sheet, row, col, row] )
+    return runs
+
+def planRecalc(_map, _changed, _maxRanges=MAX_RANGE_CALCS):
+    """ Works out what needs recalculating after some cells were written
+
+    Args:
+        _map (XL_DependencyMap): The workbook's formulas. None if it isn't known:
+            then everything is recalculated if anything changed.
+        _changed (iterable): The (sheet, row, col) cells written. Any of them which are formulas in
+            _map are calculated too.
+        _maxRanges (int): Calculate the worksheets instead if there would be more ranges than this
+    Returns:
+        plan (XL_RecalcPlan): NumFormulas is the number of formula cells downstream of the changes
+            (None if not known). Ranges is [(Worksheet, Address), ...] to calculate in that order,
+            or if empty, Sheets is the worksheets to calculate in that order, or if that is
+            empty too, Full is True if the whole workbook has to be calculated. All empty / False
+            if nothing needs to be.
+    """
+    changed = set(_changed)
+    if _map is None:
+        return XL_RecalcPlan(None, [], [], bool(changed))
+
+    dirty = _map.dependents(changed)
+    dirty.update( key for key in changed if key in _map ) # Formulas written are calculated too
+    if not dirty:
+        return XL_RecalcPlan(0, [], [], False)
+
+    index = XL_CellIndex(dirty)
+    edgeCache = {}
+    def edges(_key):
+        found = edgeCache.get(_key)
+        if found is None:
+            found = edgeCache[_key] = [cell for rect in _map.Precedents.get(_key, ()) for cell in index.cellsIn(*rect)]
+        return found
+
+    # Down each column first, so neighbouring cells end up in the same range
+    groups = orderCells(sorted(dirty, key=lambda k: (k[0], k[2], k[1])), edges)
+    if any(len(group) > 1 or group[0] in edges(group[0]) for group in groups):
+        return XL_RecalcPlan(len(dirty), [], [], True) # Circular references: leave the iterating to the workbook
+
+    runs = _columnRuns(group[0] for group in groups)
+    if len(runs) <= _maxRanges:
+        ranges = [(sheet, formatRange(r1, col, r2, col)) for sheet, r1, col, r2 in runs]
+        return XL_RecalcPlan(len(dirty), ranges, [], False)
+
+    sheets = []
+    for run in runs:
+        if not sheets or sheets[-1] != run[0]:
+            sheets.append( run[0] )
+    if len(sheets) == len(set(sheets)):
+        return XL_RecalcPlan(len(dirty), [], sheets, False)
+    return XL_RecalcPlan(len(dirty), [], [], True)
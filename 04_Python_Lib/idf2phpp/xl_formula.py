@@ -0,0 +1,381 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Parses Excel formulas into a small syntax tree, for idf2phpp.xl_calc.
+
+The text is the formula as it is stored in a .xlsx file (the <f> element),
+without the leading '='. parseFormula() returns nested tuples:
+
+    ('num', 1.5)            ('str', u'text')        ('bool', True)
+    ('err', u'#N/A')        ('ref', XL_Ref)         ('name', u'NAME', sheet or None)
+    ('func', u'SUM', [args])                        ('missing',) an empty argument
+    ('bin', u'+', left, right)                      ('neg', x)     ('pct', x)
+    ('range', left, right) the ':' operator between two references
+    ('array', [[values], ...]) an array constant, ie: {1,2;3,4}
+
+Operator precedence is Excel's, which isn't quite the usual one: negation
+binds tighter than '^' (so -2^2 is 4), and '^' is left associative.
+
+The reference forms supported are single cells, areas, whole columns and
+whole rows, each optionally on another worksheet ('Sheet Name'!A1). 3-D
+references, structured table references and the intersection (space) and
+union operators aren't, and raise an XL_FormulaError.
+
+shiftFormula() moves the relative references of a formula, the same way
+Excel fills a shared formula down or across.
+"""
+
+import re
+from collections import namedtuple
+
+from idf2phpp.xl_address import colToIndex, indexToCol
+
+MAX_ROW = 1048576
+MAX_COL = 16384
+
+# Kind is 'cell', 'area', 'cols' or 'rows'. Absolute is the '$' of (FirstRow, FirstCol, LastRow, LastCol)
+XL_Ref = namedtuple('XL_Ref', ['Sheet', 'FirstRow', 'FirstCol', 'LastRow', 'LastCol', 'Kind', 'Absolute'])
+
+ERROR_CODES = (u'#NULL!', u'#DIV/0!', u'#VALUE!', u'#REF!', u'#NAME?', u'#NUM!', u'#N/A', u'#GETTING_DATA')
+
+class XL_FormulaError(Exception):
+    """ The formula couldn't be parsed (or uses syntax which isn't supported) """
+    pass
+
+_SHEET = r"(?:'(?:[^']|'')+'|\[\d+\][^\s!'\"()\[\],;:{}]*|[^\W\d][\w.]*)!"
+_AREA = (r"(?:\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?"
+         r"|\$?[A-Za-z]{1,3}:\$?[A-Za-z]{1,3}"
+         r"|\$?\d+:\$?\d+"
+         r"|\#REF!)(?![\w.(!\[])")
+
+_reToken = re.compile(r"""
+      (?P<ws>\s+)
+    | (?P<str>"(?:[^"]|"")*")
+    | (?P<ref>(?P<sheet>""" + _SHEET + r""")?(?P<area>""" + _AREA + r"""))
+    | (?P<err>\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A|GETTING_DATA))
+    | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+    | (?P<bool>(?:TRUE|FALSE)(?![\w.(]))
+    | (?P<func>[^\W\d][\w.]*(?=\())
+    | (?P<name>(?:""" + _SHEET + r""")?[^\W\d][\w.?]*|\\[\w.?]*)
+    | (?P<op><>|<=|>=|[-+*/^&=<>%])
+    | (?P<punc>[(),;{}:])
+    """, re.X | re.U | re.I)
+
+_reCellPart = re.compile(r'^(\$?)([A-Za-z]{1,3})(\$?)(\d+)$')
+_reColPart = re.compile(r'^(\$?)([A-Za-z]{1,3})$')
+_reRowPart = re.compile(r'^(\$?)(\d+)$')
+
+def _sheetName(_prefix):
+    """ "'Sheet ''1'''!" --> "Sheet '1'" """
+    name = _prefix[:-1]
+    if name.startswith("'"):
+        name = name[1:-1].replace("''", "'")
+    return name
+
+def parseRef(_area, _sheet=None):
+    """ 'A1', '$B$2:C3', 'A:C' or '3:5' --> an XL_Ref. Raises XL_FormulaError if it isn't one """
+    parts = _area.split(':')
+    if len(parts) > 2:
+        raise XL_FormulaError("Not a reference: '{}'".format(_area))
+
+    cells = [_reCellPart.match(p) for p in parts]
+    if all(cells):
+        rows = [int(m.group(4)) for m in cells]
+        cols = [colToIndex(m.group(2)) for m in cells]
+        absolute = [(bool(m.group(3)), bool(m.group(1))) for m in cells]
+        kind = 'cell' if len(parts) == 1 else 'area'
+    elif len(parts) == 2 and all(_reColPart.match(p) for p in parts):
+        matches = [_reColPart.match(p) for p in parts]
+        rows = [1, MAX_ROW]
+        cols = [colToIndex(m.group(2)) for m in matches]
+        absolute = [(True, bool(m.group(1))) for m in matches]
+        kind = 'cols'
+    elif len(parts) == 2 and all(_reRowPart.match(p) for p in parts):
+        matches = [_reRowPart.match(p) for p in parts]
+        rows = [int(m.group(2)) for m in matches]
+        cols = [1, MAX_COL]
+        absolute = [(bool(m.group(1)), True) for m in matches]
+        kind = 'rows'
+    else:
+        raise XL_FormulaError("Not a reference: '{}'".format(_area))
+
+    if len(parts) == 1:
+        rows, cols, absolute = rows * 2, cols * 2, absolute * 2
+    if min(rows) < 1 or max(rows) > MAX_ROW or min(cols) < 1 or max(cols) > MAX_COL:
+        raise XL_FormulaError("Reference out of range: '{}'".format(_area))
+
+    # Excel keeps an area's corners in order, ie: B2:A1 is A1:B2
+    if rows[0] > rows[1]:
+        rows.reverse()
+        absolute = [(absolute[1][0], absolute[0][1]), (absolute[0][0], absolute[1][1])]
+    if cols[0] > cols[1]:
+        cols.reverse()
+        absolute = [(absolute[0][0], absolute[1][1]), (absolute[1][0], absolute[0][1])]
+
+    return XL_Ref(_sheet, rows[0], cols[0], rows[1], cols[1], kind,
+                  (absolute[0][0], absolute[0][1], absolute[1][0], absolute[1][1]))
+
+def formatRef(_ref):
+    """ An XL_Ref --> its A1 text (without the worksheet) """
+    r1, c1, r2, c2 = _ref.FirstRow, _ref.FirstCol, _ref.LastRow, _ref.LastCol
+    ar1, ac1, ar2, ac2 = ['$' if a else '' for a in _ref.Absolute]
+    if _ref.Kind == 'cols':
+        return u'{}{}:{}{}'.format(ac1, indexToCol(c1), ac2, indexToCol(c2))
+    if _ref.Kind == 'rows':
+        return u'{}{}:{}{}'.format(ar1, r1, ar2, r2)
+    first = u'{}{}{}{}'.format(ac1, indexToCol(c1), ar1, r1)
+    if _ref.Kind == 'cell':
+        return first
+    return u'{}:{}{}{}{}'.format(first, ac2, indexToCol(c2), ar2, r2)
+
+def tokenize(_text):
+    """ Splits a formula into (kind, value, text) tokens
+
+    kind is one of 'ws', 'str', 'ref', 'err', 'num', 'bool', 'func', 'name', 'op'
+    or 'punc'. For a 'ref' the value is an XL_Ref, or an ('err', u'#REF!') for a
+    reference which was already deleted (ie: Sheet1!#REF!).
+    """
+    tokens = []
+    pos = 0
+    while pos < len(_text):
+        match = _reToken.match(_text, pos)
+        if match is None:
+            raise XL_FormulaError(u"Can't read the formula at: '{}'".format(_text[pos:pos + 20]))
+        kind = match.lastgroup
+        text = match.group(0)
+        if kind in ('sheet', 'area'):
+            kind = 'ref'
+
+        if kind == 'ref':
+            sheet = match.group('sheet')
+            sheet = _sheetName(sheet) if sheet else None
+            area = match.group('area')
+            value = (u'err', u'#REF!') if area.upper() == u'#REF!' else parseRef(area, sheet)
+        elif kind == 'str':
+            value = text[1:-1].replace(u'""', u'"')
+        elif kind == 'num':
+            value = float(text)
+        elif kind == 'bool':
+            value = text.upper() == u'TRUE'
+        elif kind == 'err':
+            value = text.upper()
+        elif kind in ('func', 'name'):
+            value = text
+        else:
+            value = text
+        tokens.append( (kind, value, text) )
+        pos = match.end()
+    return tokens
+
+def shiftRef(_ref, _dRows, _dCols):
+    """ Moves the relative parts of an XL_Ref. Returns None if it moves off the worksheet """
+    ar1, ac1, ar2, ac2 = _ref.Absolute
+    r1 = _ref.FirstRow if ar1 else _ref.FirstRow + _dRows
+    c1 = _ref.FirstCol if ac1 else _ref.FirstCol + _dCols
+    r2 = _ref.LastRow if ar2 else _ref.LastRow + _dRows
+    c2 = _ref.LastCol if ac2 else _ref.LastCol + _dCols
+    if min(r1, r2) < 1 or max(r1, r2) > MAX_ROW or min(c1, c2) < 1 or max(c1, c2) > MAX_COL:
+        return None
+    return _ref._replace(FirstRow=r1, FirstCol=c1, LastRow=r2, LastCol=c2)
+
+def shiftFormula(_text, _dRows, _dCols):
+    """ The formula as it would be if copied _dRows down and _dCols across, ie: for a shared formula
+
+    'SUM(A1:B1)*$C$1', 2, 0 --> 'SUM(A3:B3)*$C$1'
+    """
+    if not _dRows and not _dCols:
+        return _text
+    out = []
+    for kind, value, text in tokenize(_text):
+        if kind == 'ref' and isinstance(value, XL_Ref):
+            sheetText = text[:len(text) - len(text.split('!')[-1])] if '!' in text else u''
+            moved = shiftRef(value, _dRows, _dCols)
+            text = sheetText + (formatRef(moved) if moved is not None else u'#REF!')
+        out.append( text )
+    return u''.join(out)
+
+def functionName(_name):
+    """ '_xlfn.IFNA' --> 'IFNA' """
+    name = _name.upper()
+    for prefix in (u'_XLFN.', u'_XLWS.'):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+    return name
+
+_BINARY = {
+    u'=': 10, u'<>': 10, u'<': 10, u'>': 10, u'<=': 10, u'>=': 10,
+    u'&': 20,
+    u'+': 30, u'-': 30,
+    u'*': 40, u'/': 40,
+    u'^': 50,
+    u':': 80,
+    }
+_PERCENT_BP = 60
+_PREFIX_BP = 70
+
+class _Parser(object):
+    def __init__(self, _tokens):
+        self.Tokens = [t for t in _tokens if t[0] != 'ws']
+        self.Pos = 0
+
+    def peek(self):
+        if self.Pos < len(self.Tokens):
+            return self.Tokens[self.Pos]
+        return (None, None, None)
+
+    def next(self):
+        token = self.peek()
+        self.Pos += 1
+        return token
+
+    def expect(self, _text):
+        kind, value, text = self.next()
+        if text != _text:
+            raise XL_FormulaError(u"Expected '{}' but found '{}'".format(_text, text))
+
+    def parse(self):
+        node = self.expression(0)
+        if self.Pos != len(self.Tokens):
+            raise XL_FormulaError(u"Unexpected '{}'".format(self.peek()[2]))
+        return node
+
+    def expression(self, _rbp):
+        left = self.prefix()
+        while True:
+            kind, value, text = self.peek()
+            if kind == 'op' and text == u'%':
+                if _PERCENT_BP <= _rbp:
+                    break
+                self.next()
+                left = ('pct', left)
+                continue
+
+            op = text if kind in ('op', 'punc') else None
+            bp = _BINARY.get(op)
+            if bp is None or bp <= _rbp:
+                break
+            self.next()
+            right = self.expression(bp) # Left associative, '^' included
+            left = ('range', left, right) if op == u':' else ('bin', op, left, right)
+        return left
+
+    def prefix(self):
+        kind, value, text = self.next()
+        if kind == 'num':
+            return ('num', value)
+        if kind == 'str':
+            return ('str', value)
+        if kind == 'bool':
+            return ('bool', value)
+        if kind == 'err':
+            return ('err', value)
+        if kind == 'ref':
+            return value if isinstance(value, tuple) and value[0] == u'err' else ('ref', value)
+        if kind == 'name':
+            if '!' in text:
+                sheetText, name = text.rsplit('!', 1)
+                return ('name', name.upper(), _sheetName(sheetText + '!'))
+            return ('name', text.upper(), None)
+        if kind == 'func':
+            return self.call(functionName(value))
+        if kind == 'op' and text in (u'-', u'+'):
+            operand = self.expression(_PREFIX_BP)
+            return ('neg', operand) if text == u'-' else operand
+        if text == u'(':
+            node = self.expression(0)
+            self.expect(u')')
+            return node
+        if text == u'{':
+            return self.array()
+        if kind is None:
+            raise XL_FormulaError(u'The formula ends too soon')
+        raise XL_FormulaError(u"Unexpected '{}'".format(text))
+
+    def call(self, _name):
+        self.expect(u'(')
+        args = []
+        if self.peek()[2] == u')':
+            self.next()
+            return ('func', _name, args)
+        while True:
+            if self.peek()[2] in (u',', u')'):
+                args.append( ('missing',) )
+            else:
+                args.append( self.expression(0) )
+            kind, value, text = self.next()
+            if text == u')':
+                return ('func', _name, args)
+            if text != u',':
+                raise XL_FormulaError(u"Expected ',' or ')' in {}() but found '{}'".format(_name, text))
+
+    def array(self):
+        rows = [[]]
+        while True:
+            kind, value, text = self.next()
+            sign = 1.0
+            if kind == 'op' and text in (u'-', u'+'):
+                sign = -1.0 if text == u'-' else 1.0
+                kind, value, text = self.next()
+            if kind == 'num':
+                rows[-1].append( sign * value )
+            elif kind in ('str', 'bool') and sign == 1.0:
+                rows[-1].append( value )
+            elif kind == 'err':
+                rows[-1].append( ('err', value) )
+            else:
+                raise XL_FormulaError(u"Unexpected '{}' in an array constant".format(text))
+
+            kind, value, text = self.next()
+            if text == u'}':
+                break
+            if text == u';':
+                rows.append( [] )
+            elif text != u',':
+                raise XL_FormulaError(u"Unexpected '{}' in an array constant".format(text))
+
+        if len(set(len(row) for row in rows)) != 1:
+            raise XL_FormulaError(u'The rows of an array constant must all be the same length')
+        return ('array', rows)
+
+def parseFormula(_text):
+    """ Parses a formula (without the '=') into a syntax tree. Raises XL_FormulaError """
+    text = _text[1:] if _text.startswith(u'=') else _text
+    if not text.strip():
+        raise XL_FormulaError(u'Empty formula')
+    return _Parser(tokenize(text)).parse()
+
+def walkRefs(_node):
+    """ Yields every ('ref', ...) and ('name', ...) node in a syntax tree """
+    stack = [_node]
+    while stack:
+        node = stack.pop()
+        kind = node[0]
+        if kind in ('ref', 'name'):
+            yield node
+        elif kind == 'func':
+            stack.extend( node[2] )
+        elif kind in ('bin',):
+            stack.extend( node[2:] )
+        elif kind in ('range',):
+            stack.extend( node[1:] )
+        elif kind in ('neg', 'pct'):
+            stack.append( node[1] )
@@ -0,0 +1,1204 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Excel's value rules and worksheet functions, for idf2phpp.xl_calc.
+
+Values are the same as a .xlsx file gives them (see idf2phpp.xlsx_read):
+float, bool, unicode text or None for an empty cell. Errors are XL_Error
+instances. A reference to more than one cell is an XL_Range, which reads
+the cells from the calculator only when it is used, and an array result
+(ie: A1:A3*2 in an array formula) is an XL_Array.
+
+XL_Error is also an exception: the conversion helpers raise it, and
+xl_calc catches it around each operator and function call, so an error
+in an argument comes out as the result the same way it does in Excel.
+
+FUNCTIONS maps each supported function name to (function, argument modes).
+The functions are called as fn(context, *args), where context is the
+calculator's context for the formula being evaluated. The modes string has
+one letter for each argument, the last one (or the letters in brackets)
+repeating:
+    - 's' scalar: a multi-cell reference is reduced to one value by
+      implicit intersection with the formula's row / column
+    - 'r' range: multi-cell references are passed as an XL_Range
+    - 'f' reference: every reference (even a single cell) is passed as an
+      XL_Range, ie: for ROW() or OFFSET()
+IF, IFERROR, IFNA and CHOOSE are compiled by xl_calc itself, so that only
+the argument which is used gets evaluated.
+
+When NumPy is installed, the calculator can hand the range functions
+(SUM, SUMPRODUCT, MIN, MAX, ...) the numbers of a range as an array.
+"""
+
+import math
+import re
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, InvalidOperation
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_TEXT = (str, type(u''))
+try:
+    _INT = (int, long)
+except NameError:
+    _INT = (int,)
+
+class XL_Error(Exception):
+    """ An Excel error value, ie: #DIV/0! """
+
+    def __init__(self, _code):
+        Exception.__init__(self, _code)
+        self.Code = _code
+
+    def __eq__(self, _other):
+        return isinstance(_other, XL_Error) and _other.Code == self.Code
+
+    def __ne__(self, _other):
+        return not self.__eq__(_other)
+
+    def __hash__(self):
+        return hash(self.Code)
+
+    def __unicode__(self):
+        return u'{}'.format(self.Code)
+
+    def __str__(self):
+        return '{}'.format(self.Code)
+
+    def __repr__(self):
+        return "{}( _code={!r} )".format(self.__class__.__name__, self.Code)
+
+ERR_NULL = XL_Error(u'#NULL!')
+ERR_DIV0 = XL_Error(u'#DIV/0!')
+ERR_VALUE = XL_Error(u'#VALUE!')
+ERR_REF = XL_Error(u'#REF!')
+ERR_NAME = XL_Error(u'#NAME?')
+ERR_NUM = XL_Error(u'#NUM!')
+ERR_NA = XL_Error(u'#N/A')
+ERRORS = dict( (e.Code, e) for e in (ERR_NULL, ERR_DIV0, ERR_VALUE, ERR_REF, ERR_NAME, ERR_NUM, ERR_NA) )
+
+def errorValue(_code):
+    """ u'#N/A' --> ERR_NA """
+    return ERRORS.get(_code) or XL_Error(_code)
+
+class XL_Array(object):
+    """ A computed 2-D array of values """
+
+    __slots__ = ('Rows',)
+
+    def __init__(self, _rows):
+        self.Rows = _rows
+
+    @property
+    def NumRows(self):
+        return len(self.Rows)
+
+    @property
+    def NumCols(self):
+        return len(self.Rows[0]) if self.Rows else 0
+
+    def rows(self):
+        return self.Rows
+
+    def cell(self, _i, _j):
+        return self.Rows[_i][_j]
+
+    def __repr__(self):
+        return "{}( _rows={!r} )".format(self.__class__.__name__, self.Rows)
+
+class XL_Range(object):
+    """ A rectangle of cells on one worksheet. The values are read from Book when they are needed """
+
+    __slots__ = ('Book', 'Sheet', 'FirstRow', 'FirstCol', 'LastRow', 'LastCol')
+
+    def __init__(self, _book, _sheet, _firstRow, _firstCol, _lastRow, _lastCol):
+        self.Book = _book
+        self.Sheet = _sheet
+        self.FirstRow = _firstRow
+        self.FirstCol = _firstCol
+        self.LastRow = _lastRow
+        self.LastCol = _lastCol
+
+    @property
+    def NumRows(self):
+        return self.LastRow - self.FirstRow + 1
+
+    @property
+    def NumCols(self):
+        return self.LastCol - self.FirstCol + 1
+
+    @property
+    def Key(self):
+        return (self.Sheet, self.FirstRow, self.FirstCol, self.LastRow, self.LastCol)
+
+    def rows(self):
+        """ The values, as a list of rows. Whole-column / row references stop at the workbook's last used cell """
+        return self.Book.rangeRows(self)
+
+    def cell(self, _i, _j):
+        return self.Book.cellValue(self.Sheet, self.FirstRow + _i, self.FirstCol + _j)
+
+    def __repr__(self):
+        return "{}( _sheet={!r}, _firstRow={!r}, _firstCol={!r}, _lastRow={!r}, _lastCol={!r} )".format(
+               self.__class__.__name__,
+               self.Sheet,
+               self.FirstRow,
+               self.FirstCol,
+               self.LastRow,
+               self.LastCol)
+
+def isMulti(_value):
+    return isinstance(_value, (XL_Range, XL_Array))
+
+#-------------------------------------------------------------------------------
+# Conversions
+
+def toNumber(_value):
+    """ A value as a float, the way arithmetic sees it. Raises an XL_Error """
+    if type(_value) is float:
+        return _value
+    if _value is None:
+        return 0.0
+    if isinstance(_value, bool):
+        return 1.0 if _value else 0.0
+    if isinstance(_value, _INT):
+        return float(_value)
+    if isinstance(_value, XL_Error):
+        raise _value
+    if isinstance(_value, _TEXT):
+        text = _value.strip()
+        try:
+            if text.endswith(u'%'):
+                return float(text[:-1]) / 100.0
+            return float(text)
+        except ValueError:
+            raise ERR_VALUE
+    raise ERR_VALUE
+
+def formatNumber(_number):
+    """ A number as Excel shows it in the 'General' format, up to 15 significant digits """
+    if _number == int(_number) and abs(_number) < 1e15:
+        return u'{}'.format(int(_number))
+    text = u'{:.15g}'.format(_number)
+    if u'e' in text:
+        mantissa, exponent = text.split(u'e')
+        text = u'{}E{}{:02d}'.format(mantissa, u'-' if int(exponent) < 0 else u'+', abs(int(exponent)))
+    return text
+
+def toText(_value):
+    """ A value as text, the way '&' sees it. Raises an XL_Error """
+    if _value is None:
+        return u''
+    if isinstance(_value, bool):
+        return u'TRUE' if _value else u'FALSE'
+    if isinstance(_value, _TEXT):
+        return _value if isinstance(_value, type(u'')) else _value.decode('utf-8')
+    if isinstance(_value, XL_Error):
+        raise _value
+    if isinstance(_value, (float,) + _INT):
+        return formatNumber(float(_value))
+    raise ERR_VALUE
+
+def toBool(_value):
+    """ A value as TRUE / FALSE, the way IF() sees it. Raises an XL_Error """
+    if isinstance(_value, bool):
+        return _value
+    if _value is None:
+        return False
+    if isinstance(_value, (float,) + _INT):
+        return _value != 0
+    if isinstance(_value, XL_Error):
+        raise _value
+    if isinstance(_value, _TEXT):
+        text = _value.strip().upper()
+        if text == u'TRUE':
+            return True
+        if text == u'FALSE':
+            return False
+    raise ERR_VALUE
+
+def toInt(_value):
+    """ A number argument truncated to an integer, ie: for INDEX() or LEFT() """
+    return int(toNumber(_value))
+
+def checkNumber(_number):
+    """ Turns inf / nan results into #NUM! """
+    if _number != _number or _number in (float('inf'), float('-inf')):
+        raise ERR_NUM
+    return _number
+
+def _round15(_number):
+    """ Excel compares numbers to 15 significant digits, so 0.1 + 0.2 = 0.3 """
+    if _number == 0.0:
+        return 0.0
+    return float(u'{:.15g}'.format(_number))
+
+def _typeRank(_value):
+    if isinstance(_value, bool):
+        return 2
+    if isinstance(_value, _TEXT):
+        return 1
+    return 0
+
+def compareValues(_a, _b):
+    """ Excel's ordering: -1, 0 or 1. Numbers < text < TRUE / FALSE, text ignores case. Raises an XL_Error """
+    if isinstance(_a, XL_Error):
+        raise _a
+    if isinstance(_b, XL_Error):
+        raise _b
+    if _a is None and _b is None:
+        return 0
+    if _a is None:
+        _a = u'' if isinstance(_b, _TEXT) else (False if isinstance(_b, bool) else 0.0)
+    if _b is None:
+        _b = u'' if isinstance(_a, _TEXT) else (False if isinstance(_a, bool) else 0.0)
+
+    rankA, rankB = _typeRank(_a), _typeRank(_b)
+    if rankA != rankB:
+        return -1 if rankA < rankB else 1
+    if rankA == 1:
+        _a, _b = toText(_a).upper(), toText(_b).upper()
+    elif rankA == 0:
+        _a, _b = _round15(float(_a)), _round15(float(_b))
+    return (_a > _b) - (_a < _b)
+
+#-------------------------------------------------------------------------------
+# Operators
+
+def _add(_a, _b):
+    return checkNumber(toNumber(_a) + toNumber(_b))
+
+def _sub(_a, _b):
+    return checkNumber(toNumber(_a) - toNumber(_b))
+
+def _mul(_a, _b):
+    return checkNumber(toNumber(_a) * toNumber(_b))
+
+def _div(_a, _b):
+    a, b = toNumber(_a), toNumber(_b)
+    if b == 0.0:
+        raise ERR_DIV0
+    return checkNumber(a / b)
+
+def _pow(_a, _b):
+    a, b = toNumber(_a), toNumber(_b)
+    if a == 0.0 and b == 0.0:
+        raise ERR_NUM
+    if a == 0.0 and b < 0.0:
+        raise ERR_DIV0
+    try:
+        result = a ** b
+    except (OverflowError, ValueError, ZeroDivisionError):
+        raise ERR_NUM
+    if isinstance(result, complex):
+        raise ERR_NUM
+    return checkNumber(result)
+
+def _concat(_a, _b):
+    return toText(_a) + toText(_b)
+
+OPERATORS = {
+    u'+': _add,
+    u'-': _sub,
+    u'*': _mul,
+    u'/': _div,
+    u'^': _pow,
+    u'&': _concat,
+    u'=': lambda a, b: compareValues(a, b) == 0,
+    u'<>': lambda a, b: compareValues(a, b) != 0,
+    u'<': lambda a, b: compareValues(a, b) < 0,
+    u'>': lambda a, b: compareValues(a, b) > 0,
+    u'<=': lambda a, b: compareValues(a, b) <= 0,
+    u'>=': lambda a, b: compareValues(a, b) >= 0,
+    }
+
+def negate(_a):
+    return -toNumber(_a)
+
+def percent(_a):
+    return toNumber(_a) / 100.0
+
+#-------------------------------------------------------------------------------
+# Helpers for the range functions
+
+def valueRows(_value):
+    """ Any value as a list of rows """
+    if isMulti(_value):
+        return _value.rows()
+    return [[_value]]
+
+def iterValues(_value):
+    for row in valueRows(_value):
+        for value in row:
+            yield value
+
+def _rangeNumbers(_context, _value):
+    """ The numbers in a range or array (text, TRUE / FALSE and empty cells are skipped). Raises an XL_Error """
+    if isinstance(_value, XL_Range):
+        return _context.Book.rangeNumbers(_value)
+    numbers = []
+    for value in iterValues(_value):
+        if type(value) is float:
+            numbers.append( value )
+        elif isinstance(value, XL_Error):
+            raise value
+    return numbers
+
+def collectNumbers(_context, _args):
+    """ The numbers of the arguments to SUM(), MIN(), etc... as a list of lists / arrays
+
+    Values given directly (not in a reference) are converted, so SUM("2", TRUE) is 3.
+    """
+    groups = []
+    direct = []
+    for arg in _args:
+        if isMulti(arg):
+            groups.append( _rangeNumbers(_context, arg) )
+        elif arg is not None:
+            direct.append( toNumber(arg) )
+    if direct:
+        groups.append( direct )
+    return groups
+
+def _groupSum(_group):
+    if numpy is not None and isinstance(_group, numpy.ndarray):
+        return float(_group.sum())
+    return float(sum(_group))
+
+def _groupLen(_group):
+    return len(_group)
+
+def shapeOf(_value):
+    return (_value.NumRows, _value.NumCols) if isMulti(_value) else (1, 1)
+
+def _sameShape(_values):
+    return len(set(shapeOf(v) for v in _values)) == 1
+
+def _readShape(_rowsList):
+    """ The size of the values actually read, for references cut off at the last used row / column """
+    return (max(len(rows) for rows in _rowsList),
+            max(max([len(row) for row in rows] or [0]) for rows in _rowsList))
+
+def _padRows(_rows, _numRows, _numCols):
+    """ Range rows stop at the last used row: fill them back out to the full size with empty cells """
+    if len(_rows) >= _numRows and all(len(row) >= _numCols for row in _rows):
+        return _rows
+    padded = [list(row) + [None] * (_numCols - len(row)) for row in _rows]
+    padded.extend( [None] * _numCols for i in range(_numRows - len(_rows)) )
+    return padded
+
+def _wildcardRegex(_pattern):
+    """ Excel wildcards: * any text, ? one character, ~ escapes the next one """
+    out = []
+    i = 0
+    while i < len(_pattern):
+        ch = _pattern[i]
+        if ch == u'~' and i + 1 < len(_pattern):
+            out.append( re.escape(_pattern[i + 1]) )
+            i += 2
+            continue
+        out.append( u'.*' if ch == u'*' else (u'.' if ch == u'?' else re.escape(ch)) )
+        i += 1
+    return re.compile(u'^' + u''.join(out) + u'$', re.I | re.S)
+
+_reCriterion = re.compile(r'^(<=|>=|<>|<|>|=)?(.*)$', re.S)
+
+def makeCriterion(_criterion):
+    """ The test for a SUMIF() / COUNTIF() criterion, ie: 5, '>=5', '<>x', 'a*' --> fn(value) -> bool """
+    if isinstance(_criterion, XL_Error):
+        return lambda v: isinstance(v, XL_Error) and v.Code == _criterion.Code
+    if isinstance(_criterion, bool):
+        return lambda v: isinstance(v, bool) and v == _criterion
+    if _criterion is None:
+        _criterion = 0.0
+    if not isinstance(_criterion, _TEXT):
+        number = float(_criterion)
+        return lambda v: type(v) is float and _round15(v) == _round15(number)
+
+    op, text = _reCriterion.match(_criterion).groups()
+    op = op or u'='
+    number = None
+    try:
+        number = float(text)
+    except ValueError:
+        pass
+
+    if text == u'':
+        if op == u'=':
+            return lambda v: v is None or v == u''
+        if op == u'<>':
+            return lambda v: not (v is None or v == u'')
+
+    if number is not None:
+        def test(v):
+            if type(v) is float:
+                n = v
+            elif isinstance(v, _TEXT) and op == u'=':
+                try:
+                    n = float(v)
+                except ValueError:
+                    return False
+            else:
+                return op == u'<>'
+            c = compareValues(n, number)
+            return {u'=': c == 0, u'<>': c != 0, u'<': c < 0, u'>': c > 0, u'<=': c <= 0, u'>=': c >= 0}[op]
+        return test
+
+    if text.upper() in (u'TRUE', u'FALSE'):
+        flag = text.upper() == u'TRUE'
+        if op == u'=':
+            return lambda v: isinstance(v, bool) and v == flag
+        if op == u'<>':
+            return lambda v: not (isinstance(v, bool) and v == flag)
+
+    if op in (u'=', u'<>'):
+        regex = _wildcardRegex(text)
+        if op == u'=':
+            return lambda v: isinstance(v, _TEXT) and regex.match(v) is not None
+        return lambda v: not (isinstance(v, _TEXT) and regex.match(v) is not None)
+
+    upper = text.upper()
+    def textTest(v):
+        if not isinstance(v, _TEXT):
+            return False
+        c = (v.upper() > upper) - (v.upper() < upper)
+        return {u'<': c < 0, u'>': c > 0, u'<=': c <= 0, u'>=': c >= 0}[op]
+    return textTest
+
+def _flatCells(_value):
+    """ (value, rowIndex, colIndex) for each cell of a range / array """
+    for i, row in enumerate(valueRows(_value)):
+        for j, value in enumerate(row):
+            yield value, i, j
+
+def _matchCells(_pairs):
+    """ The (i, j) positions where all of the (range, criterion) pairs match """
+    if not _sameShape([rng for rng, crit in _pairs]):
+        raise ERR_VALUE
+    rowsList = [valueRows(rng) for rng, crit in _pairs]
+    numRows, numCols = _readShape(rowsList)
+    tests = [(_padRows(rows, numRows, numCols), makeCriterion(crit)) for rows, (rng, crit) in zip(rowsList, _pairs)]
+
+    positions = []
+    for i in range(numRows):
+        for j in range(numCols):
+            if all(test(cells[i][j]) for cells, test in tests):
+                positions.append( (i, j) )
+    return positions
+
+def _at(_value, _i, _j):
+    if isMulti(_value):
+        if _i >= _value.NumRows or _j >= _value.NumCols:
+            return None
+        return _value.cell(_i, _j)
+    return _value if (_i, _j) == (0, 0) else None
+
+#-------------------------------------------------------------------------------
+# Math functions
+
+def fnSum(_ctx, *_args):
+    return checkNumber(sum(_groupSum(g) for g in collectNumbers(_ctx, _args)))
+
+def fnProduct(_ctx, *_args):
+    result = 1.0
+    found = False
+    for group in collectNumbers(_ctx, _args):
+        for n in group:
+            result *= n
+            found = True
+    return checkNumber(result) if found else 0.0
+
+def fnMin(_ctx, *_args):
+    values = [float(min(g)) for g in collectNumbers(_ctx, _args) if len(g)]
+    return min(values) if values else 0.0
+
+def fnMax(_ctx, *_args):
+    values = [float(max(g)) for g in collectNumbers(_ctx, _args) if len(g)]
+    return max(values) if values else 0.0
+
+def fnAverage(_ctx, *_args):
+    groups = collectNumbers(_ctx, _args)
+    count = sum(_groupLen(g) for g in groups)
+    if not count:
+        raise ERR_DIV0
+    return sum(_groupSum(g) for g in groups) / count
+
+def fnCount(_ctx, *_args):
+    count = 0
+    for arg in _args:
+        if isMulti(arg):
+            count += sum(1 for v in iterValues(arg) if type(v) is float)
+        elif arg is not None and not isinstance(arg, XL_Error):
+            try:
+                toNumber(arg)
+                count += 1
+            except XL_Error:
+                pass
+    return float(count)
+
+def fnCountA(_ctx, *_args):
+    count = 0
+    for arg in _args:
+        if isMulti(arg):
+            count += sum(1 for v in iterValues(arg) if v is not None)
+        elif arg is not None:
+            count += 1
+    return float(count)
+
+def fnCountBlank(_ctx, _range):
+    if not isMulti(_range):
+        return 1.0 if _range is None or _range == u'' else 0.0
+    rows = valueRows(_range)
+    numRead = sum(len(row) for row in rows)
+    blanks = sum(1 for row in rows for v in row if v is None or v == u'')
+    return float(blanks + _range.NumRows * _range.NumCols - numRead) # The cells past the last used row are empty
+
+def fnSumProduct(_ctx, *_args):
+    if not _args:
+        raise ERR_VALUE
+    if not _sameShape(_args):
+        raise ERR_VALUE
+    rowsList = [valueRows(arg) for arg in _args]
+    numRows, numCols = _readShape(rowsList)
+
+    if numpy is not None and _ctx.Book.UseNumpy:
+        total = None
+        for arg, rows in zip(_args, rowsList):
+            matrix = _ctx.Book.rangeMatrix(arg) if isinstance(arg, XL_Range) else _numericMatrix(rows)
+            matrix = _padMatrix(matrix, numRows, numCols)
+            total = matrix if total is None else total * matrix
+        return checkNumber(float(total.sum()))
+
+    total = None
+    for rows in rowsList:
+        rows = _padRows(rows, numRows, numCols)
+        flat = []
+        for row in rows:
+            for v in row:
+                if isinstance(v, XL_Error):
+                    raise v
+                flat.append( v if type(v) is float else 0.0 )
+        total = flat if total is None else [a * b for a, b in zip(total, flat)]
+    return checkNumber(float(sum(total)))
+
+def _numericMatrix(_rows):
+    """ A NumPy array of the numbers in the rows (anything else is 0). Raises an XL_Error """
+    flat = []
+    for row in _rows:
+        for v in row:
+            if type(v) is float:
+                flat.append( v )
+            elif isinstance(v, XL_Error):
+                raise v
+            else:
+                flat.append( 0.0 )
+    numCols = len(_rows[0]) if _rows else 0
+    return numpy.array(flat, dtype=float).reshape((len(_rows), numCols))
+
+def _padMatrix(_matrix, _numRows, _numCols):
+    if _matrix.shape == (_numRows, _numCols):
+        return _matrix
+    padded = numpy.zeros((_numRows, _numCols))
+    padded[:_matrix.shape[0], :_matrix.shape[1]] = _matrix
+    return padded
+
+def fnSumIf(_ctx, _range, _criterion, _sumRange=None):
+    if _sumRange is None:
+        _sumRange = _range
+    total = 0.0
+    for i, j in _matchCells([(_range, _criterion)]):
+        value = _at(_sumRange, i, j)
+        if isinstance(value, XL_Error):
+            raise value
+        if type(value) is float:
+            total += value
+    return total
+
+def fnSumIfs(_ctx, _sumRange, *_pairs):
+    if not _pairs or len(_pairs) % 2:
+        raise ERR_VALUE
+    pairs = list(zip(_pairs[0::2], _pairs[1::2]))
+    if isMulti(_sumRange) and isMulti(pairs[0][0]) and (
+            (_sumRange.NumRows, _sumRange.NumCols) != (pairs[0][0].NumRows, pairs[0][0].NumCols)):
+        raise ERR_VALUE
+    total = 0.0
+    for i, j in _matchCells(pairs):
+        value = _at(_sumRange, i, j)
+        if isinstance(value, XL_Error):
+            raise value
+        if type(value) is float:
+            total += value
+    return total
+
+def fnCountIf(_ctx, _range, _criterion):
+    return float(len(_matchCells([(_range, _criterion)])))
+
+def fnCountIfs(_ctx, *_pairs):
+    if not _pairs or len(_pairs) % 2:
+        raise ERR_VALUE
+    return float(len(_matchCells(list(zip(_pairs[0::2], _pairs[1::2])))))
+
+def fnAverageIf(_ctx, _range, _criterion, _averageRange=None):
+    if _averageRange is None:
+        _averageRange = _range
+    values = []
+    for i, j in _matchCells([(_range, _criterion)]):
+        value = _at(_averageRange, i, j)
+        if isinstance(value, XL_Error):
+            raise value
+        if type(value) is float:
+            values.append( value )
+    if not values:
+        raise ERR_DIV0
+    return sum(values) / len(values)
+
+def _decimalRound(_number, _digits, _mode):
+    """ Rounds the way Excel does: on the 15 digit decimal value, halves away from zero """
+    number = toNumber(_number)
+    digits = toInt(_digits)
+    try:
+        value = Decimal(u'{:.15g}'.format(number))
+        result = value.quantize(Decimal(1).scaleb(-digits), rounding=_mode)
+    except InvalidOperation:
+        raise ERR_NUM
+    return float(result) + 0.0
+
+def fnRound(_ctx, _number, _digits=None):
+    return _decimalRound(_number, _digits, ROUND_HALF_UP)
+
+def fnRoundUp(_ctx, _number, _digits=None):
+    return _decimalRound(_number, _digits, ROUND_UP)
+
+def fnRoundDown(_ctx, _number, _digits=None):
+    return _decimalRound(_number, _digits, ROUND_DOWN)
+
+def fnInt(_ctx, _number):
+    return float(math.floor(toNumber(_number)))
+
+def fnTrunc(_ctx, _number, _digits=None):
+    return fnRoundDown(_ctx, _number, _digits)
+
+def fnMod(_ctx, _number, _divisor):
+    n, d = toNumber(_number), toNumber(_divisor)
+    if d == 0.0:
+        raise ERR_DIV0
+    return n - d * math.floor(n / d)
+
+def fnPower(_ctx, _number, _power):
+    return _pow(_number, _power)
+
+def fnSqrt(_ctx, _number):
+    n = toNumber(_number)
+    if n < 0:
+        raise ERR_NUM
+    return math.sqrt(n)
+
+def fnLn(_ctx, _number):
+    n = toNumber(_number)
+    if n <= 0:
+        raise ERR_NUM
+    return math.log(n)
+
+def fnLog(_ctx, _number, _base=None):
+    n = toNumber(_number)
+    base = 10.0 if _base is None else toNumber(_base)
+    if n <= 0 or base <= 0:
+        raise ERR_NUM
+    if base == 1.0:
+        raise ERR_DIV0
+    return math.log(n) / math.log(base)
+
+def fnLog10(_ctx, _number):
+    return fnLog(_ctx, _number, 10.0)
+
+def fnSign(_ctx, _number):
+    n = toNumber(_number)
+    return (n > 0) - (n < 0) + 0.0
+
+def _multipleRound(_number, _significance, _up):
+    n = toNumber(_number)
+    s = 1.0 if _significance is None else toNumber(_significance)
+    if s == 0.0:
+        return 0.0
+    if n > 0 and s < 0:
+        raise ERR_NUM
+    q = _round15(n / s)
+    return (math.ceil(q) if _up else math.floor(q)) * s
+
+def fnCeiling(_ctx, _number, _significance=None):
+    return _multipleRound(_number, _significance, True)
+
+def fnFloor(_ctx, _number, _significance=None):
+    return _multipleRound(_number, _significance, False)
+
+def _math1(_fn):
+    def fn(_ctx, _number):
+        try:
+            return checkNumber(_fn(toNumber(_number)))
+        except (ValueError, OverflowError):
+            raise ERR_NUM
+    return fn
+
+def fnAtan2(_ctx, _x, _y):
+    x, y = toNumber(_x), toNumber(_y)
+    if x == 0.0 and y == 0.0:
+        raise ERR_DIV0
+    return math.atan2(y, x)
+
+#-------------------------------------------------------------------------------
+# Logic and information functions
+
+def _logicalValues(_args):
+    values = []
+    for arg in _args:
+        if isMulti(arg):
+            for v in iterValues(arg):
+                if isinstance(v, XL_Error):
+                    raise v
+                if isinstance(v, (bool, float)):
+                    values.append( bool(v) )
+        elif arg is not None:
+            values.append( toBool(arg) )
+    if not values:
+        raise ERR_VALUE
+    return values
+
+def fnAnd(_ctx, *_args):
+    return all(_logicalValues(_args))
+
+def fnOr(_ctx, *_args):
+    return any(_logicalValues(_args))
+
+def fnNot(_ctx, _value):
+    return not toBool(_value)
+
+def fnIsError(_ctx, _value):
+    return isinstance(_value, XL_Error)
+
+def fnIsErr(_ctx, _value):
+    return isinstance(_value, XL_Error) and _value.Code != u'#N/A'
+
+def fnIsNA(_ctx, _value):
+    return isinstance(_value, XL_Error) and _value.Code == u'#N/A'
+
+def fnIsNumber(_ctx, _value):
+    return type(_value) is float or (isinstance(_value, _INT) and not isinstance(_value, bool))
+
+def fnIsText(_ctx, _value):
+    return isinstance(_value, _TEXT)
+
+def fnIsNonText(_ctx, _value):
+    return not isinstance(_value, _TEXT)
+
+def fnIsBlank(_ctx, _value):
+    return _value is None
+
+def fnIsLogical(_ctx, _value):
+    return isinstance(_value, bool)
+
+def fnNA(_ctx):
+    raise ERR_NA
+
+def fnN(_ctx, _value):
+    if isinstance(_value, XL_Error):
+        raise _value
+    if isinstance(_value, bool):
+        return 1.0 if _value else 0.0
+    if type(_value) is float:
+        return _value
+    return 0.0
+
+def fnT(_ctx, _value):
+    if isinstance(_value, XL_Error):
+        raise _value
+    return _value if isinstance(_value, _TEXT) else u''
+
+#-------------------------------------------------------------------------------
+# Lookup and reference functions
+
+def fnRow(_ctx, _ref=None):
+    if _ref is None:
+        return float(_ctx.Row)
+    if not isinstance(_ref, XL_Range):
+        raise ERR_VALUE
+    return float(_ref.FirstRow)
+
+def fnColumn(_ctx, _ref=None):
+    if _ref is None:
+        return float(_ctx.Col)
+    if not isinstance(_ref, XL_Range):
+        raise ERR_VALUE
+    return float(_ref.FirstCol)
+
+def fnRows(_ctx, _ref):
+    return float(_ref.NumRows) if isMulti(_ref) else 1.0
+
+def fnColumns(_ctx, _ref):
+    return float(_ref.NumCols) if isMulti(_ref) else 1.0
+
+def fnIndex(_ctx, _ref, _row=None, _col=None):
+    if isinstance(_ref, XL_Error):
+        raise _ref
+    if not isMulti(_ref):
+        _ref = XL_Array([[_ref]])
+    row = 0 if _row is None else toInt(_row)
+    col = 0 if _col is None else toInt(_col)
+    if _col is None and _ref.NumRows == 1 and _ref.NumCols > 1:
+        row, col = 1, row # INDEX(A1:E1, 3) is the third column
+    elif _col is None and _ref.NumCols == 1:
+        col = 1
+    if row < 0 or col < 0 or row > _ref.NumRows or col > _ref.NumCols:
+        raise ERR_REF
+
+    if isinstance(_ref, XL_Range):
+        r1 = _ref.FirstRow + row - 1 if row else _ref.FirstRow
+        r2 = r1 if row else _ref.LastRow
+        c1 = _ref.FirstCol + col - 1 if col else _ref.FirstCol
+        c2 = c1 if col else _ref.LastCol
+        return XL_Range(_ref.Book, _ref.Sheet, r1, c1, r2, c2)
+
+    rows = _ref.Rows
+    if row and col:
+        return rows[row - 1][col - 1]
+    if row:
+        return XL_Array([list(rows[row - 1])])
+    if col:
+        return XL_Array([[r[col - 1]] for r in rows])
+    return _ref
+
+def _vector(_value):
+    """ A one-row or one-column range / array as a flat list. Raises #N/A if it is 2-D """
+    if not isMulti(_value):
+        return [_value]
+    rows = valueRows(_value)
+    if _value.NumRows == 1:
+        return list(rows[0]) if rows else []
+    if _value.NumCols == 1:
+        return [row[0] for row in rows]
+    raise ERR_NA
+
+def _lookupPosition(_value, _values, _matchType):
+    """ The 0-based position of _value in the list, the way MATCH() finds it. Raises #N/A """
+    if isinstance(_value, XL_Error):
+        raise _value
+    if _matchType == 0:
+        if isinstance(_value, _TEXT) and any(ch in _value for ch in u'*?~'):
+            regex = _wildcardRegex(_value)
+            for i, v in enumerate(_values):
+                if isinstance(v, _TEXT) and regex.match(v):
+                    return i
+            raise ERR_NA
+        for i, v in enumerate(_values):
+            if v is None or isinstance(v, XL_Error) or _typeRank(v) != _typeRank(_value):
+                continue
+            if compareValues(v, _value) == 0:
+                return i
+        raise ERR_NA
+
+    # Approximate match, the list is taken to be sorted (ascending for 1, descending for -1)
+    found = None
+    for i, v in enumerate(_values):
+        if v is None or isinstance(v, XL_Error) or _typeRank(v) != _typeRank(_value):
+            continue
+        c = compareValues(v, _value)
+        if c == 0:
+            return i
+        if (c < 0) == (_matchType > 0):
+            found = i
+        else:
+            break
+    if found is None:
+        raise ERR_NA
+    return found
+
+def fnMatch(_ctx, _value, _lookup, _matchType=None):
+    matchType = 1 if _matchType is None else toInt(_matchType)
+    matchType = (matchType > 0) - (matchType < 0)
+    return float(_lookupPosition(_value, _vector(_lookup), matchType) + 1)
+
+def _tableLookup(_value, _table, _index, _approximate, _byRow):
+    if isinstance(_table, XL_Error):
+        raise _table
+    if not isMulti(_table):
+        _table = XL_Array([[_table]])
+    index = toInt(_index)
+    approximate = True if _approximate is None else toBool(_approximate)
+    numRows, numCols = _table.NumRows, _table.NumCols
+    if index < 1:
+        raise ERR_VALUE
+    if index > (numRows if _byRow else numCols):
+        raise ERR_REF
+
+    rows = valueRows(_table)
+    if _byRow:
+        keys = list(rows[0]) if rows else []
+    else:
+        keys = [row[0] for row in rows]
+    i = _lookupPosition(_value, keys, 1 if approximate else 0)
+    return _at(_table, index - 1, i) if _byRow else _at(_table, i, index - 1)
+
+def fnVLookup(_ctx, _value, _table, _col, _approximate=None):
+    return _tableLookup(_value, _table, _col, _approximate, False)
+
+def fnHLookup(_ctx, _value, _table, _row, _approximate=None):
+    return _tableLookup(_value, _table, _row, _approximate, True)
+
+def fnLookup(_ctx, _value, _lookup, _result=None):
+    keys = _vector(_lookup)
+    i = _lookupPosition(_value, keys, 1)
+    results = keys if _result is None else _vector(_result)
+    if i >= len(results):
+        raise ERR_NA
+    return results[i]
+
+def fnOffset(_ctx, _ref, _rows, _cols, _height=None, _width=None):
+    if not isinstance(_ref, XL_Range):
+        raise ERR_VALUE
+    r1 = _ref.FirstRow + toInt(_rows)
+    c1 = _ref.FirstCol + toInt(_cols)
+    height = _ref.NumRows if _height is None else toInt(_height)
+    width = _ref.NumCols if _width is None else toInt(_width)
+    if height < 1 or width < 1 or r1 < 1 or c1 < 1:
+        raise ERR_REF
+    return XL_Range(_ref.Book, _ref.Sheet, r1, c1, r1 + height - 1, c1 + width - 1)
+
+def fnIndirect(_ctx, _text, _a1=None):
+    if _a1 is not None and not toBool(_a1):
+        raise ERR_REF # R1C1 references aren't supported
+    return _ctx.reference(toText(_text))
+
+#-------------------------------------------------------------------------------
+# Text functions
+
+def fnConcatenate(_ctx, *_args):
+    return u''.join(toText(a) for a in _args)
+
+def fnConcat(_ctx, *_args):
+    return u''.join(toText(v) for arg in _args for v in iterValues(arg))
+
+def fnLeft(_ctx, _text, _num=None):
+    num = 1 if _num is None else toInt(_num)
+    if num < 0:
+        raise ERR_VALUE
+    return toText(_text)[:num]
+
+def fnRight(_ctx, _text, _num=None):
+    num = 1 if _num is None else toInt(_num)
+    if num < 0:
+        raise ERR_VALUE
+    text = toText(_text)
+    return text[len(text) - num:] if num else u''
+
+def fnMid(_ctx, _text, _start, _num):
+    start, num = toInt(_start), toInt(_num)
+    if start < 1 or num < 0:
+        raise ERR_VALUE
+    return toText(_text)[start - 1:start - 1 + num]
+
+def fnLen(_ctx, _text):
+    return float(len(toText(_text)))
+
+def fnUpper(_ctx, _text):
+    return toText(_text).upper()
+
+def fnLower(_ctx, _text):
+    return toText(_text).lower()
+
+def fnTrim(_ctx, _text):
+    return re.sub(u' +', u' ', toText(_text).strip(u' '))
+
+def fnValue(_ctx, _text):
+    if type(_text) is float:
+        return _text
+    return toNumber(toText(_text))
+
+def fnExact(_ctx, _a, _b):
+    return toText(_a) == toText(_b)
+
+def fnRept(_ctx, _text, _num):
+    num = toInt(_num)
+    if num < 0:
+        raise ERR_VALUE
+    return toText(_text) * num
+
+def fnFind(_ctx, _find, _text, _start=None):
+    start = 1 if _start is None else toInt(_start)
+    text = toText(_text)
+    if start < 1 or start > len(text) + 1:
+        raise ERR_VALUE
+    i = text.find(toText(_find), start - 1)
+    if i < 0:
+        raise ERR_VALUE
+    return float(i + 1)
+
+def fnSearch(_ctx, _find, _text, _start=None):
+    start = 1 if _start is None else toInt(_start)
+    text = toText(_text)
+    if start < 1 or start > len(text) + 1:
+        raise ERR_VALUE
+    pattern = _wildcardRegex(toText(_find)).pattern[1:-1]
+    match = re.compile(pattern, re.I | re.S).search(text, start - 1)
+    if match is None:
+        raise ERR_VALUE
+    return float(match.start() + 1)
+
+def fnSubstitute(_ctx, _text, _old, _new, _instance=None):
+    text, old, new = toText(_text), toText(_old), toText(_new)
+    if not old:
+        return text
+    if _instance is None:
+        return text.replace(old, new)
+    instance = toInt(_instance)
+    if instance < 1:
+        raise ERR_VALUE
+    i = -1
+    for n in range(instance):
+        i = text.find(old, i + 1)
+        if i < 0:
+            return text
+    return text[:i] + new + text[i + len(old):]
+
+_reFixedFormat = re.compile(r'^(#,##)?0(\.0+)?(%)?$')
+
+def fnText(_ctx, _value, _format):
+    """ Only the plain number formats ('0', '0.00', '#,##0.0', '0%') are supported, others give the 'General' text """
+    fmt = toText(_format)
+    if not isinstance(_value, (float, bool)) and _value is not None:
+        try:
+            _value = toNumber(_value)
+        except XL_Error:
+            return toText(_value)
+    number = toNumber(_value)
+    match = _reFixedFormat.match(fmt)
+    if match is None:
+        return toText(_value)
+    if match.group(3):
+        number *= 100.0
+    decimals = len(match.group(2)) - 1 if match.group(2) else 0
+    rounded = _decimalRound(number, decimals, ROUND_HALF_UP)
+    text = u'{:,.{}f}'.format(rounded, decimals) if match.group(1) else u'{:.{}f}'.format(rounded, decimals)
+    return text + (u'%' if match.group(3) else u'')
+
+#-------------------------------------------------------------------------------
+
+FUNCTIONS = {
+    u'SUM': (fnSum, 'r'),
+    u'PRODUCT': (fnProduct, 'r'),
+    u'MIN': (fnMin, 'r'),
+    u'MAX': (fnMax, 'r'),
+    u'AVERAGE': (fnAverage, 'r'),
+    u'COUNT': (fnCount, 'r'),
+    u'COUNTA': (fnCountA, 'r'),
+    u'COUNTBLANK': (fnCountBlank, 'r'),
+    u'SUMPRODUCT': (fnSumProduct, 'r'),
+    u'SUMIF': (fnSumIf, 'rsr'),
+    u'SUMIFS': (fnSumIfs, 'r(rs)'),
+    u'COUNTIF': (fnCountIf, 'rs'),
+    u'COUNTIFS': (fnCountIfs, '(rs)'),
+    u'AVERAGEIF': (fnAverageIf, 'rsr'),
+    u'ROUND': (fnRound, 's'),
+    u'ROUNDUP': (fnRoundUp, 's'),
+    u'ROUNDDOWN': (fnRoundDown, 's'),
+    u'INT': (fnInt, 's'),
+    u'TRUNC': (fnTrunc, 's'),
+    u'MOD': (fnMod, 's'),
+    u'POWER': (fnPower, 's'),
+    u'SQRT': (fnSqrt, 's'),
+    u'EXP': (_math1(math.exp), 's'),
+    u'LN': (fnLn, 's'),
+    u'LOG': (fnLog, 's'),
+    u'LOG10': (fnLog10, 's'),
+    u'ABS': (_math1(abs), 's'),
+    u'SIGN': (fnSign, 's'),
+    u'CEILING': (fnCeiling, 's'),
+    u'FLOOR': (fnFloor, 's'),
+    u'PI': (lambda _ctx: math.pi, 's'),
+    u'SIN': (_math1(math.sin), 's'),
+    u'COS': (_math1(math.cos), 's'),
+    u'TAN': (_math1(math.tan), 's'),
+    u'ASIN': (_math1(math.asin), 's'),
+    u'ACOS': (_math1(math.acos), 's'),
+    u'ATAN': (_math1(math.atan), 's'),
+    u'ATAN2': (fnAtan2, 's'),
+    u'RADIANS': (_math1(math.radians), 's'),
+    u'DEGREES': (_math1(math.degrees), 's'),
+    u'AND': (fnAnd, 'r'),
+    u'OR': (fnOr, 'r'),
+    u'NOT': (fnNot, 's'),
+    u'TRUE': (lambda _ctx: True, 's'),
+    u'FALSE': (lambda _ctx: False, 's'),
+    u'ISERROR': (fnIsError, 's'),
+    u'ISERR': (fnIsErr, 's'),
+    u'ISNA': (fnIsNA, 's'),
+    u'ISNUMBER': (fnIsNumber, 's'),
+    u'ISTEXT': (fnIsText, 's'),
+    u'ISNONTEXT': (fnIsNonText, 's'),
+    u'ISBLANK': (fnIsBlank, 's'),
+    u'ISLOGICAL': (fnIsLogical, 's'),
+    u'NA': (fnNA, 's'),
+    u'N': (fnN, 's'),
+    u'T': (fnT, 's'),
+    u'ROW': (fnRow, 'f'),
+    u'COLUMN': (fnColumn, 'f'),
+    u'ROWS': (fnRows, 'r'),
+    u'COLUMNS': (fnColumns, 'r'),
+    u'INDEX': (fnIndex, 'fs'),
+    u'MATCH': (fnMatch, 'srs'),
+    u'VLOOKUP': (fnVLookup, 'srs'),
+    u'HLOOKUP': (fnHLookup, 'srs'),
+    u'LOOKUP': (fnLookup, 'srr'),
+    u'OFFSET': (fnOffset, 'fs'),
+    u'INDIRECT': (fnIndirect, 's'),
+    u'CONCATENATE': (fnConcatenate, 's'),
+    u'CONCAT': (fnConcat, 'r'),
+    u'LEFT': (fnLeft, 's'),
+    u'RIGHT': (fnRight, 's'),
+    u'MID': (fnMid, 's'),
+    u'LEN': (fnLen, 's'),
+    u'UPPER': (fnUpper, 's'),
+    u'LOWER': (fnLower, 's'),
+    u'TRIM': (fnTrim, 's'),
+    u'VALUE': (fnValue, 's'),
+    u'EXACT': (fnExact, 's'),
+    u'REPT': (fnRept, 's'),
+    u'FIND': (fnFind, 's'),
+    u'SEARCH': (fnSearch, 's'),
+    u'SUBSTITUTE': (fnSubstitute, 's'),
+    u'TEXT': (fnText, 's'),
+    }
+
+# Functions compiled by xl_calc, which only evaluate the argument they use
+LAZY_FUNCTIONS = frozenset([u'IF', u'IFERROR', u'IFNA', u'CHOOSE'])
+
+# Functions whose result can refer to cells that aren't in their arguments
+DYNAMIC_FUNCTIONS = frozenset([u'OFFSET', u'INDIRECT'])
+
+def argMode(_modes, _i):
+    """ The mode letter for argument _i. Letters in brackets repeat as a group, ie: 'r(rs)' for SUMIFS() """
+    if u'(' not in _modes:
+        return _modes[_i] if _i < len(_modes) else _modes[-1]
+    prefix, group = _modes.rstrip(u')').split(u'(')
+    if _i < len(prefix):
+        return prefix[_i]
+    return group[(_i - len(prefix)) % len(group)]
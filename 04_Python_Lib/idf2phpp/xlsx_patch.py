@@ -0,0 +1,593 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Writes cell values straight into a .xlsx / .xlsm file, without Excel.
+
+A .xlsx file is a zip of XML parts, one for each worksheet. patchXLSX()
+copies the workbook and only rewrites the XML of the worksheets which get new
+values. Inside those, only the <c> elements of the cells being written are
+changed, the rest of the text is passed through as-is. So the formulas,
+formatting, names, macros, etc... are all left alone.
+
+Values are written the same way Excel COM's Range.Value2 would take them:
+    - Numbers (and text that looks like a number) are stored as numbers
+    - Text starting with '=' is stored as a formula
+    - Other text is stored as an inline string (sharedStrings.xml isn't changed)
+    - None or '' clears the cell's value, but keeps its formatting
+The cell formatting is kept. With _highlight=True the cells also get the same
+fill as Interior.ColorIndex = 8 (cyan), using new cell styles added to
+styles.xml. patchXLSXSheets() does the same, but with the highlighting set
+cell by cell.
+
+The file is set to recalculate when Excel next opens it, since the cached
+results of the formulas are out of date. If a formula cell is overwritten,
+the calcChain.xml part is removed as well (Excel rebuilds it). If it was the
+first cell of a shared formula, the other cells get their own copy of it.
+An array formula can't be split up like that, so writing to only some of
+its cells raises an XLSX_PatchError (the same as Excel's "You can't change
+part of an array"). Writing all of its cells replaces it.
+"""
+
+import os
+import re
+from collections import OrderedDict
+import shutil
+import tempfile
+import zipfile
+
+from xml.sax.saxutils import escape, unescape
+
+from idf2phpp.xl_address import expandRange, formatAddress, indexToCol, parseAddress
+from idf2phpp.xl_formula import shiftFormula
+from idf2phpp.write_plan import _writeParts
+
+HIGHLIGHT_COLOR_INDEX = 8 # Same as the COM writer: Interior.ColorIndex = 8
+
+# Excel keeps the first two fills for itself (none and gray125), whatever they are set to
+_DEFAULT_FILLS = (u'<fill><patternFill patternType="none"/></fill>',
+                  u'<fill><patternFill patternType="gray125"/></fill>')
+
+# Use as the value to only highlight a cell, leaving its contents as they are
+KEEP_VALUE = object()
+
+_reNumber = re.compile(r'^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$')
+_reSheetData = re.compile(r'<sheetData\s*/>|<sheetData(?:\s[^>]*)?>(.*?)</sheetData>', re.S)
+_reRow = re.compile(r'<row(?=[\s/>])([^>]*?)(/>|>(.*?)</row>)', re.S)
+_reCell = re.compile(r'<c(?=[\s/>])([^>]*?)(/>|>(.*?)</c>)', re.S)
+_reAttr = re.compile(r'([\w:]+)\s*=\s*("[^"]*"|\'[^\']*\')')
+_reSharedMaster = re.compile(r'<f\b[^>]*\bt="shared"[^>]*\bref="')
+_reFormula = re.compile(r'<f\b([^>]*?)(?:/>|>(.*?)</f>)', re.S)
+_reIllegalXML = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+class XLSX_PatchError(Exception):
+    pass
+
+def _attrs(_text):
+    """ The attributes of a start tag, as an ordered list of [name, quoted value] """
+    return [[nm, val] for nm, val in _reAttr.findall(_text)]
+
+def _attrText(_attrs):
+    return u''.join(u' {}={}'.format(nm, val) for nm, val in _attrs)
+
+def _getAttr(_attrs, _name):
+    for nm, val in _attrs:
+        if nm == _name:
+            return val[1:-1]
+    return None
+
+def _setAttr(_attrs, _name, _value):
+    """ Sets (or with _value=None removes) an attribute, keeping the order of the others """
+    for i, (nm, val) in enumerate(_attrs):
+        if nm == _name:
+            if _value is None:
+                del _attrs[i]
+            else:
+                _attrs[i][1] = u'"{}"'.format(_value)
+            return
+    if _value is not None:
+        _attrs.append( [_name, u'"{}"'.format(_value)] )
+
+def _xmlText(_value):
+    return escape(_reIllegalXML.sub(u'', _value))
+
+def cellXML(_ref, _value, _attrs=None):
+    """ The <c> element for one cell value
+
+    Args:
+        _ref (str): The cell address, ie: 'M11'
+        _value: The value to write (see the module notes)
+        _attrs (list): <Optional> The existing cell's attributes, to keep its style
+    Returns:
+        xml (str): The new <c> element
+    """
+    attrs = [list(a) for a in (_attrs or []) if a[0] != 'r']
+    attrs.insert(0, ['r', u'"{}"'.format(_ref)])
+    _setAttr(attrs, 't', None)
+    _setAttr(attrs, 'cm', None)
+    _setAttr(attrs, 'vm', None)
+
+    if _value is None or _value == u'':
+        return u'<c{}/>'.format(_attrText(attrs))
+
+    if isinstance(_value, bool):
+        _setAttr(attrs, 't', 'b')
+        return u'<c{}><v>{}</v></c>'.format(_attrText(attrs), int(_value))
+
+    if isinstance(_value, (int, float)) or (not isinstance(_value, (str, type(u''))) and hasattr(_value, '__float__')):
+        number = float(_value)
+        if number != number or number in (float('inf'), float('-inf')):
+            _setAttr(attrs, 't', 'e')
+            return u'<c{}><v>#NUM!</v></c>'.format(_attrText(attrs))
+        text = repr(int(_value)) if isinstance(_value, int) else repr(number)
+        return u'<c{}><v>{}</v></c>'.format(_attrText(attrs), text.rstrip('L'))
+
+    if isinstance(_value, bytes):
+        _value = _value.decode('utf-8')
+    elif not isinstance(_value, type(u'')):
+        _value = type(u'')(_value)
+
+    if _value.startswith(u'=') and len(_value) > 1:
+        return u'<c{}><f>{}</f></c>'.format(_attrText(attrs), _xmlText(_value[1:]))
+
+    if _reNumber.match(_value):
+        return u'<c{}><v>{}</v></c>'.format(_attrText(attrs), repr(float(_value)))
+
+    _setAttr(attrs, 't', 'inlineStr')
+    space = u' xml:space="preserve"' if _value != _value.strip() or u'\n' in _value else u''
+    return u'<c{}><is><t{}>{}</t></is></c>'.format(_attrText(attrs), space, _xmlText(_value))
+
+class _SheetPatch(object):
+    """ The cells to write on one worksheet: {row: {col: (value, highlight)}} """
+
+    def __init__(self):
+        self.Rows = {}
+        self.HadFormula = False # True if a formula cell was overwritten
+
+    def add(self, _row, _col, _value, _highlight=False):
+        self.Rows.setdefault(_row, {})[_col] = (_value, _highlight)
+
+class _StyleTable(object):
+    """ Adds highlighted copies of cell styles (cellXfs) to styles.xml, as needed """
+
+    def __init__(self, _xml):
+        self.XML = _xml
+        self.NewXfs = []
+        self.Highlighted = {} # {old style index: new style index}
+        self.FillId = None
+
+        match = re.search(r'<cellXfs\b[^>]*?(?:/>|>(.*?)</cellXfs>)', _xml, re.S)
+        if not match:
+            raise XLSX_PatchError("The workbook's styles.xml doesn't have any cell styles (cellXfs)")
+        self.Xfs = re.findall(r'<xf\b[^>]*?(?:/>|>.*?</xf>)', match.group(1) or u'', re.S)
+
+        fills = re.search(r'<fills\b[^>]*?(?:/>|>(.*?)</fills>)', _xml, re.S)
+        self.HasFills = fills is not None
+        self.NumFills = len(re.findall(r'<fill\b', fills.group(1) or u'')) if fills else 0
+
+    def highlighted(self, _styleIndex):
+        """ Returns the index of a style like _styleIndex, but with the highlight fill """
+        if _styleIndex not in self.Highlighted:
+            if self.FillId is None:
+                self.FillId = max(self.NumFills, len(_DEFAULT_FILLS))
+            xf = self.Xfs[_styleIndex] if _styleIndex < len(self.Xfs) else u'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            start = re.match(r'<xf\b([^>]*?)(/?>)', xf)
+            attrs = _attrs(start.group(1))
+            _setAttr(attrs, 'fillId', self.FillId)
+            _setAttr(attrs, 'applyFill', '1')
+            self.NewXfs.append( u'<xf{}{}'.format(_attrText(attrs), xf[start.end(1):]) )
+            self.Highlighted[_styleIndex] = len(self.Xfs) + len(self.NewXfs) - 1
+        return self.Highlighted[_styleIndex]
+
+    def toXML(self):
+        """ The styles.xml text with the new fill and styles added """
+        if not self.NewXfs:
+            return self.XML
+
+        fill = u'<fill><patternFill patternType="solid"><fgColor indexed="{}"/><bgColor indexed="64"/></patternFill></fill>'.format(HIGHLIGHT_COLOR_INDEX)
+        fills = list(_DEFAULT_FILLS[self.NumFills:]) + [fill] # So the new fill is at self.FillId
+        if self.HasFills:
+            xml = _appendChildren(self.XML, u'fills', fills, self.FillId + 1)
+        else:
+            xml = _insertBefore(self.XML, (u'borders', u'cellStyleXfs', u'cellXfs'),
+                                u'<fills count="{}">{}</fills>'.format(self.FillId + 1, u''.join(fills)))
+        return _appendChildren(xml, u'cellXfs', self.NewXfs, len(self.Xfs) + len(self.NewXfs))
+
+def _insertBefore(_xml, _tags, _text):
+    """ Inserts the text before the first of the _tags elements found (they are in schema order) """
+    for tag in _tags:
+        match = re.search(r'<{}\b'.format(tag), _xml)
+        if match:
+            return _xml[:match.start()] + _text + _xml[match.start():]
+    return _xml
+
+def _appendChildren(_xml, _tag, _children, _count):
+    """ Adds the child elements to the end of the (first) <_tag> element, and updates its count="" """
+    match = re.search(r'<{0}\b([^>]*?)(/>|>(.*?)</{0}>)'.format(_tag), _xml, re.S)
+    if not match:
+        return _xml
+    attrs = _attrs(match.group(1))
+    _setAttr(attrs, 'count', _count)
+    body = (match.group(3) or u'') + u''.join(_children)
+    return u'{}<{}{}>{}</{}>{}'.format(_xml[:match.start()], _tag, _attrText(attrs), body, _tag, _xml[match.end():])
+
+def _patchRowCells(_rowBody, _rowNum, _updates, _styles, _patch):
+    """ Rewrites the cells of one row. _updates is {col: value} """
+    out = []
+    pending = sorted(_updates.items())
+    pos = 0
+    col = 0
+    i = 0
+
+    for match in _reCell.finditer(_rowBody):
+        attrs = _attrs(match.group(1))
+        ref = _getAttr(attrs, 'r')
+        col = parseAddress(ref)[1] if ref else col + 1
+
+        # New cells which go before this one
+        while i < len(pending) and pending[i][0] < col:
+            out.append( _rowBody[pos:match.start()] )
+            pos = match.start()
+            out.append( _newCell(_rowNum, pending[i][0], pending[i][1], None, None, _styles) )
+            i += 1
+
+        if i < len(pending) and pending[i][0] == col:
+            inner = match.group(3) or u''
+            if u'<f' in inner and pending[i][1][0] is not KEEP_VALUE:
+                _patch.HadFormula = True
+            out.append( _rowBody[pos:match.start()] )
+            out.append( _newCell(_rowNum, col, pending[i][1], attrs, match.group(3), _styles) )
+            pos = match.end()
+            i += 1
+
+    out.append( _rowBody[pos:] )
+    for col, update in pending[i:]:
+        out.append( _newCell(_rowNum, col, update, None, None, _styles) )
+    return u''.join(out)
+
+def _newCell(_row, _col, _update, _attrs, _inner, _styles):
+    """ The new <c> element. _update is (value, highlight), _attrs / _inner are from the existing cell (if any) """
+    value, highlight = _update
+    attrs = [list(a) for a in (_attrs or [])]
+    if highlight and _styles is not None:
+        _setAttr(attrs, 's', _styles.highlighted(int(_getAttr(attrs, 's') or 0)))
+
+    ref = u'{}{}'.format(indexToCol(_col), _row)
+    if value is KEEP_VALUE:
+        if not attrs:
+            attrs = [['r', u'"{}"'.format(ref)]]
+        elif _getAttr(attrs, 'r') is None:
+            attrs.insert(0, ['r', u'"{}"'.format(ref)])
+        return u'<c{}>{}</c>'.format(_attrText(attrs), _inner) if _inner else u'<c{}/>'.format(_attrText(attrs))
+    return cellXML(ref, value, attrs)
+
+def _newRow(_rowNum, _updates, _styles):
+    cells = u''.join(_newCell(_rowNum, col, update, None, None, _styles) for col, update in sorted(_updates.items()))
+    return u'<row r="{}">{}</row>'.format(_rowNum, cells)
+
+def _sharedMasters(_body, _patch):
+    """ {si: (formula, row, col)} of the shared formulas whose first cell (the one with the text) is overwritten """
+    masters = {}
+    if u't="shared"' not in _body:
+        return masters
+
+    rowNum = 0
+    for rowMatch in _reRow.finditer(_body):
+        r = _getAttr(_attrs(rowMatch.group(1)), 'r')
+        rowNum = int(r) if r else rowNum + 1
+        updates = _patch.Rows.get(rowNum)
+        rowBody = rowMatch.group(3) or u''
+        if not updates or u'<f' not in rowBody:
+            continue
+
+        col = 0
+        for match in _reCell.finditer(rowBody):
+            ref = _getAttr(_attrs(match.group(1)), 'r')
+            col = parseAddress(ref)[1] if ref else col + 1
+            inner = match.group(3) or u''
+            if col in updates and updates[col][0] is not KEEP_VALUE and _reSharedMaster.search(inner):
+                formula = _reFormula.search(inner)
+                si = _getAttr(_attrs(formula.group(1)), 'si')
+                masters[si] = (unescape(formula.group(2) or u''), rowNum, col)
+    return masters
+
+def _expandShared(_body, _masters):
+    """ Gives each cell sharing one of the _masters' formulas its own copy of it (see xl_formula.shiftFormula)
+
+    The cells which only had <f t="shared" si=".."/> would otherwise lose their
+    formula when the first cell of the group is overwritten.
+    """
+    def expand(_match):
+        inner = _match.group(3)
+        if not inner or u'<f' not in inner:
+            return _match.group(0)
+        formula = _reFormula.search(inner)
+        fAttrs = _attrs(formula.group(1))
+        si = _getAttr(fAttrs, 'si')
+        ref = _getAttr(_attrs(_match.group(1)), 'r')
+        if _getAttr(fAttrs, 't') != 'shared' or si not in _masters or not ref:
+            return _match.group(0)
+
+        text, masterRow, masterCol = _masters[si]
+        row, col = parseAddress(ref)
+        newFormula = u'<f>{}</f>'.format(escape(shiftFormula(text, row - masterRow, col - masterCol)))
+        return u'<c{}>{}{}{}</c>'.format(_match.group(1), inner[:formula.start()], newFormula, inner[formula.end():])
+
+    return _reCell.sub(expand, _body)
+
+def _checkArrayFormulas(_body, _patch):
+    """ Raises an XLSX_PatchError if only some of the cells of an array formula are written
+
+    The cells of an array formula share the one formula in its first cell, and
+    unlike a shared formula it can't be split up into a formula for each cell.
+    Writing every cell of the range is fine, that replaces the whole array.
+    """
+    if u't="array"' not in _body:
+        return
+
+    for match in _reCell.finditer(_body):
+        inner = match.group(3)
+        formula = _reFormula.search(inner) if inner and u'<f' in inner else None
+        if formula is None:
+            continue
+        fAttrs = _attrs(formula.group(1))
+        ref = _getAttr(fAttrs, 'ref')
+        if _getAttr(fAttrs, 't') != 'array' or not ref:
+            continue
+
+        cells = expandRange(ref)
+        written = [(row, col) for row, col in cells
+                   if _patch.Rows.get(row, {}).get(col, (KEEP_VALUE,))[0] is not KEEP_VALUE]
+        if written and len(written) < len(cells):
+            raise XLSX_PatchError("Can't write to {} on its own, it's part of the array formula in {}. "
+                                  "Write all of its cells, or none".format(formatAddress(*written[0]), ref))
+
+def patchSheetXML(_xml, _patch, _styles=None):
+    """ Writes the new cell values into one worksheet's XML
+
+    Only the <c> elements being written are changed (and the <row> elements
+    they are added to). Everything else is copied through as it was, except
+    that overwriting the first cell of a shared formula gives the other cells
+    their own copy of the formula. Writing to only part of an array formula
+    raises an XLSX_PatchError.
+
+    Args:
+        _xml (str): The worksheet XML (ie: 'xl/worksheets/sheet1.xml')
+        _patch (_SheetPatch): The cells to write
+        _styles (_StyleTable): <Optional> To highlight the cells written
+    Returns:
+        xml (str): The new worksheet XML
+    """
+    sheetData = _reSheetData.search(_xml)
+    if not sheetData:
+        raise XLSX_PatchError("The worksheet doesn't have a <sheetData> element")
+
+    body = sheetData.group(1) or u''
+    _checkArrayFormulas(body, _patch)
+    masters = _sharedMasters(body, _patch)
+    if masters:
+        body = _expandShared(body, masters)
+        _patch.HadFormula = True
+    pending = sorted(_patch.Rows)
+    out = []
+    pos = 0
+    rowNum = 0
+    i = 0
+
+    for match in _reRow.finditer(body):
+        attrs = _attrs(match.group(1))
+        r = _getAttr(attrs, 'r')
+        rowNum = int(r) if r else rowNum + 1
+
+        while i < len(pending) and pending[i] < rowNum:
+            out.append( body[pos:match.start()] )
+            pos = match.start()
+            out.append( _newRow(pending[i], _patch.Rows[pending[i]], _styles) )
+            i += 1
+
+        if i < len(pending) and pending[i] == rowNum:
+            out.append( body[pos:match.start()] )
+            cells = _patchRowCells(match.group(3) or u'', rowNum, _patch.Rows[rowNum], _styles, _patch)
+            _setAttr(attrs, 'spans', None) # Optional, and may no longer be right
+            out.append( u'<row{}>{}</row>'.format(_attrText(attrs), cells) )
+            pos = match.end()
+            i += 1
+
+    out.append( body[pos:] )
+    for rowNum in pending[i:]:
+        out.append( _newRow(rowNum, _patch.Rows[rowNum], _styles) )
+
+    newBody = u''.join(out)
+    if sheetData.group(1) is None:
+        newSheetData = u'<sheetData>{}</sheetData>'.format(newBody)
+        return _xml[:sheetData.start()] + newSheetData + _xml[sheetData.end():]
+    return _xml[:sheetData.start(1)] + newBody + _xml[sheetData.end(1):]
+
+def _resolvePath(_base, _target):
+    """ A relationship Target, relative to the part's folder --> the zip entry name """
+    if _target.startswith('/'):
+        return _target.lstrip('/')
+    parts = _base.split('/')[:-1] + _target.split('/')
+    resolved = []
+    for part in parts:
+        if part == '..':
+            if resolved:
+                resolved.pop()
+        elif part and part != '.':
+            resolved.append(part)
+    return '/'.join(resolved)
+
+def _readText(_zip, _name):
+    return _zip.read(_name).decode('utf-8')
+
+def getWorksheetParts(_zip):
+    """ Returns {worksheet name: zip entry name} for the worksheets in the workbook, in tab order """
+    workbook = _readText(_zip, 'xl/workbook.xml')
+    rels = _readText(_zip, 'xl/_rels/workbook.xml.rels')
+
+    targets = {}
+    for rel in re.findall(r'<Relationship\b[^>]*>', rels):
+        attrs = _attrs(rel)
+        targets[_getAttr(attrs, 'Id')] = _resolvePath('xl/workbook.xml', unescape(_getAttr(attrs, 'Target') or ''))
+
+    parts = OrderedDict()
+    for sheet in re.findall(r'<sheet\b[^>]*>', workbook):
+        attrs = _attrs(sheet)
+        relId = None
+        for nm, val in attrs:
+            if nm == 'r:id' or nm.endswith(':id'):
+                relId = val[1:-1]
+        name = unescape(_getAttr(attrs, 'name') or '', {'&quot;': '"', '&apos;': "'"})
+        if relId in targets:
+            parts[name] = targets[relId]
+    return parts
+
+def _setFullCalcOnLoad(_workbookXML):
+    """ Makes Excel recalculate everything when the workbook is next opened """
+    match = re.search(r'<calcPr\b([^>]*?)/?>', _workbookXML)
+    if match:
+        attrs = _attrs(match.group(1))
+        _setAttr(attrs, 'fullCalcOnLoad', '1')
+        return u'{}<calcPr{}/>{}'.format(_workbookXML[:match.start()], _attrText(attrs), _workbookXML[match.end():])
+
+    # calcPr goes before any of these, or at the end
+    for tag in ('oleSize', 'customWorkbookViews', 'pivotCaches', 'smartTagPr', 'smartTagTypes',
+                'webPublishing', 'fileRecoveryPr', 'webPublishObjects', 'extLst', '/workbook'):
+        i = _workbookXML.find(u'<{}'.format(tag))
+        if i != -1:
+            return _workbookXML[:i] + u'<calcPr fullCalcOnLoad="1"/>' + _workbookXML[i:]
+    return _workbookXML
+
+def _removeCalcChain(_texts, _names):
+    """ Drops calcChain.xml and the references to it, after formula cells were overwritten """
+    _names.discard('xl/calcChain.xml')
+    rels = _texts['xl/_rels/workbook.xml.rels']
+    _texts['xl/_rels/workbook.xml.rels'] = re.sub(r'<Relationship\b[^>]*Target="/?(?:xl/)?calcChain\.xml"[^>]*/>', u'', rels)
+    types = _texts['[Content_Types].xml']
+    _texts['[Content_Types].xml'] = re.sub(r'<Override\b[^>]*PartName="/xl/calcChain\.xml"[^>]*/>', u'', types)
+
+
+def patchXLSX(_srcPath, _outPath, _cells, _highlight=False):
+    """ Writes cell values into a copy of an .xlsx / .xlsm workbook, without Excel
+
+    Args:
+        _srcPath (str): The workbook to start from
+        _outPath (str): Where to save the result. Can be the same as _srcPath to change the file in place.
+        _cells (iterable): PHPP_XL_Objs, PHPP_Cells or (Worksheet, Range, Value) tuples. If
+            a cell is given more than once, the last value is used.
+        _highlight (bool): Set True to highlight the cells written (like Interior.ColorIndex = 8)
+    Returns:
+        (numWritten, missingSheets): The number of cells written, and the names of
+            any worksheets which weren't found in the workbook (those cells are skipped)
+    """
+    sheetCells = OrderedDict()
+    for cell in _cells:
+        try:
+            sheetName, addresses, value = _writeParts(cell)
+        except ValueError as e:
+            raise XLSX_PatchError(str(e))
+        cells = sheetCells.setdefault(sheetName, {})
+        for rowCol in addresses:
+            cells[rowCol] = (value, _highlight)
+
+    missing = patchXLSXSheets(_srcPath, _outPath, sheetCells)
+    numWritten = sum(len(cells) for sheetName, cells in sheetCells.items() if sheetName not in missing)
+    return numWritten, missing
+
+def patchXLSXSheets(_srcPath, _outPath, _sheetCells):
+    """ Writes cell values into a copy of a workbook, highlighting cells one by one
+
+    Args:
+        _srcPath (str): The workbook to start from
+        _outPath (str): Where to save the result. Can be the same as _srcPath to change the file in place.
+        _sheetCells (dict): {worksheet name: {(row, col): (value, highlight)}}. Use KEEP_VALUE
+            as the value to only highlight the cell.
+    Returns:
+        missingSheets (list): The names of any worksheets which weren't found in the workbook
+    """
+    patches = {}
+    missing = []
+    anyHighlight = False
+
+    with zipfile.ZipFile(_srcPath, 'r') as src:
+        sheetParts = getWorksheetParts(src)
+
+        for sheetName, cells in _sheetCells.items():
+            part = sheetParts.get(sheetName)
+            if part is None:
+                missing.append(sheetName)
+                continue
+            patch = patches.setdefault(part, _SheetPatch())
+            for (row, col), (value, highlight) in cells.items():
+                patch.add(row, col, value, highlight)
+                anyHighlight = anyHighlight or highlight
+
+        names = set(src.namelist())
+        texts = {}
+        styles = None
+        if anyHighlight:
+            styles = _StyleTable(_readText(src, 'xl/styles.xml'))
+
+        for part, patch in patches.items():
+            try:
+                texts[part] = patchSheetXML(_readText(src, part), patch, styles)
+            except XLSX_PatchError as e:
+                sheetName = [nm for nm, p in sheetParts.items() if p == part][0]
+                raise XLSX_PatchError(u"Worksheet '{}': {}".format(sheetName, e))
+
+        if patches:
+            texts['xl/workbook.xml'] = _setFullCalcOnLoad(_readText(src, 'xl/workbook.xml'))
+            if styles is not None:
+                texts['xl/styles.xml'] = styles.toXML()
+            if any(p.HadFormula for p in patches.values()) and 'xl/calcChain.xml' in names:
+                for name in ('xl/_rels/workbook.xml.rels', '[Content_Types].xml'):
+                    texts[name] = _readText(src, name)
+                _removeCalcChain(texts, names)
+
+        # Write to a temp file first, so _outPath can be the same as _srcPath
+        outDir = os.path.dirname(os.path.abspath(_outPath))
+        fd, tempPath = tempfile.mkstemp(suffix='.xlsx', dir=outDir)
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tempPath, 'w') as out:
+                for info in src.infolist():
+                    if info.filename not in names:
+                        continue
+                    if info.filename in texts:
+                        out.writestr(info, texts[info.filename].encode('utf-8'))
+                    else:
+                        out.writestr(info, src.read(info.filename))
+        except Exception:
+            os.remove(tempPath)
+            raise
+
+    # mkstemp() makes the file readable by its owner only. Give it the permissions
+    # of the file it replaces (or of the source workbook) instead.
+    try:
+        shutil.copymode(_outPath if os.path.exists(_outPath) else _srcPath, tempPath)
+    except EnvironmentError:
+        pass
+
+    if os.path.exists(_outPath):
+        os.remove(_outPath)
+    shutil.move(tempPath, _outPath)
+
+    return missing
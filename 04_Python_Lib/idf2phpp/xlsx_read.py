@@ -0,0 +1,221 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Reads cell values out of a .xlsx / .xlsm file, without Excel.
+
+The values are the ones Excel saved with the file: for formula cells that is
+the result of the last calculation (files written by idf2phpp.xlsx_patch
+haven't been recalculated yet). They come back the same way as Excel COM's
+Range.Value2:
+    - Numbers as float, TRUE / FALSE as bool
+    - Text (shared, inline or formula results) as unicode
+    - Errors as their text, ie: '#DIV/0!'
+    - Empty cells as None
+
+readSheetCells() also gives the formulas (with the shared formulas filled
+in for each cell), and readDefinedNames() / readCalcSettings() the parts of
+workbook.xml which idf2phpp.xl_calc needs to evaluate them.
+"""
+
+import re
+import zipfile
+from collections import namedtuple
+
+from xml.sax.saxutils import unescape
+
+from idf2phpp.xl_address import parseAddress
+from idf2phpp.xl_formula import shiftFormula
+from idf2phpp.xlsx_patch import _attrs, _getAttr, _reCell, _reRow, _reSheetData, _readText, getWorksheetParts
+
+_reSharedItem = re.compile(r'<si\b[^>]*?(?:/>|>(.*?)</si>)', re.S)
+_reText = re.compile(r'<t\b[^>]*?(?:/>|>(.*?)</t>)', re.S)
+_rePhonetic = re.compile(r'<rPh\b.*?</rPh>', re.S)
+_reValue = re.compile(r'<v\b[^>]*?(?:/>|>(.*?)</v>)', re.S)
+_reInline = re.compile(r'<is\b[^>]*?(?:/>|>(.*?)</is>)', re.S)
+_reFormula = re.compile(r'<f\b([^>]*?)(?:/>|>(.*?)</f>)', re.S)
+_reSheet = re.compile(r'<sheet\b([^>]*?)/?>', re.S)
+_reDefinedName = re.compile(r'<definedName\b([^>]*)>(.*?)</definedName>', re.S)
+_reCalcPr = re.compile(r'<calcPr\b([^>]*?)/?>', re.S)
+
+# Type is 'normal', 'array' (Ref is the range the array formula fills) or 'dataTable'
+XL_CellFormula = namedtuple('XL_CellFormula', ['Text', 'Type', 'Ref'])
+
+_ENTITIES = {'&quot;': '"', '&apos;': "'"}
+
+def _joinText(_xml):
+    """ The text of all the <t> runs in a string item (phonetic hints left out) """
+    return unescape(u''.join(t or u'' for t in _reText.findall(_rePhonetic.sub(u'', _xml))), _ENTITIES)
+
+def readSharedStrings(_zip):
+    """ Returns the workbook's shared strings table, as a list """
+    if 'xl/sharedStrings.xml' not in _zip.namelist():
+        return []
+    xml = _zip.read('xl/sharedStrings.xml').decode('utf-8')
+    return [_joinText(item or u'') for item in _reSharedItem.findall(xml)]
+
+def decodeCell(_attrText, _inner, _sharedStrings):
+    """ The value of one <c> element, given its attributes text and contents """
+    if not _inner:
+        return None
+    cellType = _getAttr(_attrs(_attrText), 't') or 'n'
+
+    if cellType == 'inlineStr':
+        inline = _reInline.search(_inner)
+        return _joinText(inline.group(1) or u'') if inline else u''
+
+    value = _reValue.search(_inner)
+    if value is None or value.group(1) is None:
+        return None
+    text = value.group(1)
+
+    if cellType == 's':
+        return _sharedStrings[int(text)]
+    if cellType == 'b':
+        return text.strip() == '1'
+    if cellType in ('str', 'e'):
+        return unescape(text, _ENTITIES)
+    try:
+        return float(text)
+    except ValueError:
+        return unescape(text, _ENTITIES)
+
+def _iterCells(_xml):
+    """ Yields (row, col, attributes text, contents) for each <c> element of a worksheet's XML """
+    sheetData = _reSheetData.search(_xml)
+    if not sheetData or not sheetData.group(1):
+        return
+
+    rowNum = 0
+    for row in _reRow.finditer(sheetData.group(1)):
+        r = _getAttr(_attrs(row.group(1)), 'r')
+        rowNum = int(r) if r else rowNum + 1
+        col = 0
+        for cell in _reCell.finditer(row.group(3) or u''):
+            ref = _getAttr(_attrs(cell.group(1)), 'r')
+            col = parseAddress(ref)[1] if ref else col + 1
+            yield rowNum, col, cell.group(1), cell.group(3)
+
+def readSheetValues(_zip, _part, _sharedStrings):
+    """ Returns {(row, col): value} for every cell with a value on one worksheet
+
+    Args:
+        _zip (zipfile.ZipFile): The open workbook
+        _part (str): The worksheet's zip entry, ie: 'xl/worksheets/sheet3.xml'
+        _sharedStrings (list): From readSharedStrings()
+    Returns:
+        values (dict): The cell values, by (row, col) from 1
+    """
+    values = {}
+    for row, col, attrText, inner in _iterCells(_zip.read(_part).decode('utf-8')):
+        value = decodeCell(attrText, inner, _sharedStrings)
+        if value is not None:
+            values[(row, col)] = value
+    return values
+
+def readSheetCells(_zip, _part, _sharedStrings):
+    """ Returns the values and the formulas of one worksheet
+
+    Args:
+        _zip (zipfile.ZipFile): The open workbook
+        _part (str): The worksheet's zip entry, ie: 'xl/worksheets/sheet3.xml'
+        _sharedStrings (list): From readSharedStrings()
+    Returns:
+        (values, formulas): values is the same as readSheetValues() gives (for a formula
+            cell, its result the last time Excel calculated it). formulas is
+            {(row, col): XL_CellFormula}, the text without the '='.
+    """
+    values = {}
+    formulas = {}
+    shared = {} # {si: (text, row, col)} of the shared formula masters
+
+    for row, col, attrText, inner in _iterCells(_zip.read(_part).decode('utf-8')):
+        value = decodeCell(attrText, inner, _sharedStrings)
+        if value is not None:
+            values[(row, col)] = value
+
+        formula = _reFormula.search(inner) if inner and u'<f' in inner else None
+        if formula is None:
+            continue
+        fAttrs = _attrs(formula.group(1))
+        fType = _getAttr(fAttrs, 't') or 'normal'
+        text = unescape(formula.group(2) or u'', _ENTITIES)
+
+        if fType == 'shared':
+            si = _getAttr(fAttrs, 'si')
+            if text:
+                shared[si] = (text, row, col)
+            elif si in shared:
+                master, masterRow, masterCol = shared[si]
+                text = shiftFormula(master, row - masterRow, col - masterCol)
+            fType = 'normal'
+        if fType == 'dataTable':
+            formulas[(row, col)] = XL_CellFormula(u'', fType, _getAttr(fAttrs, 'ref'))
+        elif text:
+            formulas[(row, col)] = XL_CellFormula(text, fType, _getAttr(fAttrs, 'ref') if fType == 'array' else None)
+    return values, formulas
+
+def _sheetOrder(_workbookXML):
+    """ The names of all the sheets (chart sheets too), in tab order """
+    return [unescape(_getAttr(_attrs(m.group(1)), 'name') or u'', _ENTITIES) for m in _reSheet.finditer(_workbookXML)]
+
+def readDefinedNames(_zip):
+    """ Returns the workbook's defined names as [(name, worksheet, formula text)]
+
+    worksheet is None for a name which applies to the whole workbook. Excel's
+    own names (ie: '_xlnm.Print_Area') are left out.
+    """
+    xml = _readText(_zip, 'xl/workbook.xml')
+    sheets = _sheetOrder(xml)
+    names = []
+    for match in _reDefinedName.finditer(xml):
+        attrs = _attrs(match.group(1))
+        name = unescape(_getAttr(attrs, 'name') or u'', _ENTITIES)
+        if not name or name.startswith(u'_xlnm.'):
+            continue
+        localId = _getAttr(attrs, 'localSheetId')
+        sheet = None
+        if localId is not None and int(localId) < len(sheets):
+            sheet = sheets[int(localId)]
+        names.append( (name, sheet, unescape(match.group(2), _ENTITIES)) )
+    return names
+
+def readCalcSettings(_zip):
+    """ The workbook's calculation settings (the <calcPr> attributes), ie: {'iterate': '1', 'iterateCount': '100'} """
+    match = _reCalcPr.search(_readText(_zip, 'xl/workbook.xml'))
+    if match is None:
+        return {}
+    return dict( (nm, val[1:-1]) for nm, val in _attrs(match.group(1)) )
+
+def readXLSX(_path, _sheetNames=None):
+    """ Reads the cell values of a workbook's worksheets
+
+    Args:
+        _path (str): The .xlsx / .xlsm file
+        _sheetNames (iterable): <Optional> Only read these worksheets. Default is all of them.
+    Returns:
+        sheets (dict): {worksheet name: {(row, col): value}}
+    """
+    with zipfile.ZipFile(_path) as z:
+        parts = getWorksheetParts(z)
+        sharedStrings = readSharedStrings(z)
+        names = parts.keys() if _sheetNames is None else [nm for nm in _sheetNames if nm in parts]
+        return dict( (nm, readSheetValues(z, parts[nm], sharedStrings)) for nm in names )
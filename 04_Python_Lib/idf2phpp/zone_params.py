@@ -0,0 +1,149 @@
+#
+# IDF2PHPP: A Plugin for exporting an EnergyPlus IDF file to the Passive House Planning Package (PHPP). Created by blgdtyp, llc
+#
+# This component is part of IDF2PHPP.
+#
+# Copyright (c) 2020, bldgtyp, llc <info@bldgtyp.com>
+# IDF2PHPP is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation; either version 3 of the License,
+# or (at your option) any later version.
+#
+# IDF2PHPP is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# For a copy of the GNU General Public License
+# see <http://www.gnu.org/licenses/>.
+#
+# @license GPL-3.0+ <http://spdx.org/licenses/GPL-3.0+>
+#
+"""
+Zone infiltration, volume and floor area for the IDF->PHPP conversion.
+
+Everything is looked up through dicts keyed by name, built once at the start:
+the infiltration objects by their ZoneList name, the IDF zones and the
+Honeybee zones by zone name, and the PHPP rooms by their HostZoneName. Each
+zone is then resolved with a few dict lookups, so the time grows linearly
+with the number of zones and rooms.
+
+The objects passed in only need the attributes listed in calcZoneParams, so
+this works the same on the Grasshopper objects (IDF_Zone, IDF_ZoneList,
+Honeybee zones, PHPP_Sys_Room...) and on plain stand-ins (see
+benchmarks/bench_zone_params.py).
+"""
+
+import math
+from collections import defaultdict
+
+BLOWER_PRESSURE = 50 # Pa - for calc'ing the tested/input ACH
+INFILTRATION_REF_PRESSURE = 4 # Pa - Pressure the EnergyPlus infiltration rates are at
+
+def groupByName(_objs, _attrName):
+    """ Returns {name: [objs, in order], ...} using each obj's _attrName as the key """
+    groups = defaultdict(list)
+    for obj in _objs:
+        groups[getattr(obj, _attrName)].append(obj)
+    return groups
+
+def calcACH50(_infilObj, _floorArea, _exposedArea, _volume, _blowerPressure=BLOWER_PRESSURE):
+    """ Converts an EnergyPlus infiltration rate into a PHPP ACH50
+
+    Uses the rate per floor area if the infiltration object has one, otherwise
+    the rate per exterior surface area.
+
+    Args:
+        _infilObj: The infiltration object, with 'FlowRatePerFloorArea' and 'FlowRatePerSurfaceArea' (m3/s-m2)
+        _floorArea (float): The zone's floor area (m2)
+        _exposedArea (float): The zone's exposed (outdoor) surface area (m2)
+        _volume (float): The zone's reference volume (m3)
+        _blowerPressure (int): The test pressure (Pa)
+    Returns:
+        ach50 (float): The air changes per hour at the test pressure, or None if it can't be calculated
+    """
+    # The original component divided two ints under IronPython, so 50 / 4 Pa gave
+    # 12, not 12.5. Kept the same here so the ACH50 written to the PHPP doesn't change.
+    pressureFactor = math.pow(_blowerPressure // INFILTRATION_REF_PRESSURE, 0.63)
+
+    for rate, area in ((_infilObj.FlowRatePerFloorArea, _floorArea),
+                       (_infilObj.FlowRatePerSurfaceArea, _exposedArea)):
+        try:
+            zoneInfilRate = rate * area * 60 * 60 # sec/min * min/hour
+            return (pressureFactor * zoneInfilRate) / _volume
+        except (TypeError, ZeroDivisionError):
+            continue
+
+    return None
+
+def calcZoneParams(_zoneLists, _infiltrationRates, _zoneObjs, _rooms, _HBZoneObjs,
+                   _blowerPressure=BLOWER_PRESSURE):
+    """ Sets the infiltration (ACH50), volume and floor area attributes on the IDF zones
+
+    For each zone in a ZoneList with an infiltration object, the floor area,
+    exposed area and volume come from the matching Honeybee zone. The volume
+    is replaced with the sum of the rooms' net volumes if the zone has any
+    PHPP rooms. After that, every zone with PHPP rooms has its 'TFA' and
+    'Volume_Vn50' set from the sum of its rooms.
+
+    Args:
+        _zoneLists (list): ZoneList objects, with 'Name' and 'ZoneNames'
+        _infiltrationRates (list): Infiltration objects, with 'ZoneName' (the ZoneList
+            name), 'FlowRatePerFloorArea' and 'FlowRatePerSurfaceArea'
+        _zoneObjs (list): The IDF zone objects, with 'ZoneName'. These get the new attributes.
+        _rooms (list): PHPP rooms, with 'HostZoneName', 'FloorArea_TFA' and 'RoomNetClearVolume'
+        _HBZoneObjs (list): Honeybee zones, with 'name', getExposedArea(), getFloorArea() and getZoneVolume()
+        _blowerPressure (int): The test pressure (Pa)
+    Returns:
+        missing (list): The names of any zones the infiltration rate couldn't be calculated for
+    """
+    infilByZoneList = dict( (infilObj.ZoneName, infilObj) for infilObj in _infiltrationRates )
+    HBZonesByName = dict( (HBZone.name, HBZone) for HBZone in _HBZoneObjs )
+    zonesByName = groupByName(_zoneObjs, 'ZoneName')
+    roomsByZone = groupByName(_rooms, 'HostZoneName')
+
+    missing = []
+
+    # Get the Infiltration Rate, Volume, Floor Area from the IDF File
+    for zoneList in _zoneLists:
+        zoneInfilObj = infilByZoneList.get(zoneList.Name)
+        if zoneInfilObj is None:
+            continue
+
+        for zoneName in zoneList.ZoneNames:
+            thisHBZone = HBZonesByName.get(zoneName)
+            if thisHBZone is None:
+                continue
+
+            for zoneObj in zonesByName.get(zoneName, ()):
+                zoneExposedFacadeArea = thisHBZone.getExposedArea()
+                zoneRefFloorArea = thisHBZone.getFloorArea()
+
+                # Zone Volume, but use Room Vn50s if there are any
+                roomVn50s = [room.RoomNetClearVolume for room in roomsByZone.get(zoneName, ())]
+                zoneRefVolume = sum(roomVn50s) if roomVn50s else thisHBZone.getZoneVolume()
+
+                zoneACH50 = calcACH50(zoneInfilObj, zoneRefFloorArea, zoneExposedFacadeArea, zoneRefVolume, _blowerPressure)
+                if zoneACH50 is None:
+                    missing.append(zoneName)
+
+                # Set the attributes on the Zone Objects
+                setattr(zoneObj, 'InfiltrationACH50', zoneACH50)
+                setattr(zoneObj, 'Volume_Gross', zoneRefVolume)
+                setattr(zoneObj, 'FloorArea_Gross', zoneRefFloorArea)
+                setattr(zoneObj, 'Volume_Vn50', zoneRefVolume)
+                setattr(zoneObj, 'TFA', zoneRefFloorArea)
+
+    # Try and get the room Vn50 and TFA from the PHPP_Roooms in the HB Zone
+    for zoneName, zoneObjs in zonesByName.items():
+        rooms = roomsByZone.get(zoneName)
+        if not rooms:
+            continue
+
+        zoneTFA = sum(room.FloorArea_TFA for room in rooms)
+        zoneVn50 = sum(room.RoomNetClearVolume for room in rooms)
+        for zoneObj in zoneObjs:
+            setattr(zoneObj, 'TFA', zoneTFA)
+            setattr(zoneObj, 'Volume_Vn50', zoneVn50)
+
+    return missing